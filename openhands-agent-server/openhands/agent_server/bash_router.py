@@ -12,6 +12,7 @@ from fastapi import (
     Query,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from openhands.agent_server.bash_service import BashEventService
 from openhands.agent_server.dependencies import get_bash_event_service
@@ -108,6 +109,24 @@ async def start_bash_command(
     return command
 
 
+@bash_router.post("/stream_bash_command")
+async def stream_bash_command(
+    request: ExecuteBashRequest,
+    bash_event_service: BashEventService = Depends(get_bash_event_service),
+) -> StreamingResponse:
+    """Execute a bash command and stream its events as newline-delimited JSON:
+    the BashCommand, then each BashOutput as it is produced, ending with the one
+    carrying the exit code."""
+    update_last_execution_time()
+    events = bash_event_service.stream_bash_command(request)
+
+    async def ndjson():
+        async for event in events:
+            yield event.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @bash_router.post("/execute_bash_command")
 async def execute_bash_command(
     request: ExecuteBashRequest,
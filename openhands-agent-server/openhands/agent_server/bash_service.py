@@ -1,8 +1,12 @@
 import asyncio
+import bisect
 import glob
 import json
 import os
+import shutil
 import signal
+import threading
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,13 +20,41 @@ from openhands.agent_server.models import (
     BashOutput,
     ExecuteBashRequest,
 )
-from openhands.agent_server.pub_sub import PubSub, Subscriber
+from openhands.agent_server.pub_sub import MaxSubscribersError, PubSub, Subscriber
 from openhands.sdk.logger import get_logger
 from openhands.sdk.utils import sanitized_env, utc_now
+from openhands.sdk.utils.paging import page_iterator
 
 
 logger = get_logger(__name__)
 MAX_CONTENT_CHAR_LENGTH = 1024 * 1024
+# BashOutput events are appended to one log per command in this subdirectory of
+# the bash events directory. The leading dot keeps it out of event file globs.
+OUTPUT_LOG_DIR = ".outputs"
+
+# Where an indexed event is stored: its own file, a (log, offset, length) record
+# in a command's output log, or the event itself while its record is queued.
+type _EventLocation = Path | tuple[Path, int, int] | BashEventBase
+
+
+def _insort(names: list[str], name: str) -> None:
+    # Events are mostly indexed in timestamp order, so appending is the norm.
+    if not names or names[-1] <= name:
+        names.append(name)
+    else:
+        bisect.insort(names, name)
+
+
+@dataclass
+class _CommandOutputQueue(Subscriber[BashEventBase]):
+    """Queues the ``BashOutput`` events of one command as they are published."""
+
+    queue: asyncio.Queue[BashOutput | None] = field(default_factory=asyncio.Queue)
+    command_id: UUID | None = None
+
+    async def __call__(self, event: BashEventBase):
+        if isinstance(event, BashOutput) and event.command_id == self.command_id:
+            self.queue.put_nowait(event)
 
 
 @dataclass
@@ -50,6 +82,32 @@ class BashEventService:
         init=False,
         repr=False,
     )
+    # In-memory index of every stored event, keyed by the name its file has (or
+    # would have, for output log records), so searches filter and order by name
+    # without listing the directory and page ids keep their format. The names
+    # are also kept sorted overall, per kind and per command, with a map from
+    # event id to name. Loaded from disk once, on entering the service or on
+    # first use, then kept up to date by writes and retention deletes. Searches
+    # read it from worker threads, hence the lock.
+    _index: dict[str, _EventLocation] | None = field(
+        default=None, init=False, repr=False
+    )
+    _index_names: list[str] = field(default_factory=list, init=False, repr=False)
+    _names_by_id: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _names_by_command: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _names_by_kind: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _index_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    # Output events waiting for the background writer, and the writer itself.
+    _pending_outputs: list[tuple[str, BashOutput]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _output_writer: asyncio.Task | None = field(default=None, init=False, repr=False)
 
     def _ensure_bash_events_dir(self) -> None:
         """Ensure the bash events directory exists."""
@@ -80,6 +138,178 @@ class BashEventService:
             # Use model_dump with mode='json' to handle UUID serialization
             data = event.model_dump(mode="json")
             f.write(json.dumps(data, indent=2))
+        with self._index_lock:
+            self._index_event(filename, filepath)
+
+    def _output_log_path(self, command_id: UUID) -> Path:
+        return self.bash_events_dir / OUTPUT_LOG_DIR / f"{command_id.hex}.log"
+
+    def _persist_output(self, event: BashOutput) -> None:
+        """Index an output event and queue it for the background log writer.
+
+        The event is searchable at once; it is served from memory until its
+        record is written.
+        """
+        name = self._get_event_filename(event)
+        with self._index_lock:
+            self._index_event(name, event)
+        self._pending_outputs.append((name, event))
+        if self._output_writer is None or self._output_writer.done():
+            self._output_writer = asyncio.create_task(self._write_pending_outputs())
+
+    async def _write_pending_outputs(self) -> None:
+        """Append queued output events to their command logs until none are left.
+
+        Everything queued while one batch is written goes into the next, so a
+        flood of output costs one write per batch rather than one file per event,
+        and serialization and I/O both stay off the event loop.
+        """
+        while self._pending_outputs:
+            batch, self._pending_outputs = self._pending_outputs, []
+            try:
+                await asyncio.to_thread(self._append_outputs_sync, batch)
+            except Exception as e:
+                logger.error(f"Error writing bash output log: {e}")
+
+    def _append_outputs_sync(self, batch: list[tuple[str, BashOutput]]) -> None:
+        """Sync: append records to the output logs, then point the index at them.
+
+        Each record is a ``<name> <length>`` header line followed by the event's
+        JSON and a newline, so the index can be rebuilt by reading headers only.
+        """
+        (self.bash_events_dir / OUTPUT_LOG_DIR).mkdir(parents=True, exist_ok=True)
+        by_command: dict[UUID, list[tuple[str, BashOutput]]] = {}
+        for name, event in batch:
+            by_command.setdefault(event.command_id, []).append((name, event))
+
+        written: list[tuple[str, tuple[Path, int, int]]] = []
+        for command_id, records in by_command.items():
+            log_path = self._output_log_path(command_id)
+            with open(log_path, "ab") as f:
+                offset = f.tell()
+                chunks: list[bytes] = []
+                for name, event in records:
+                    payload = event.model_dump_json().encode()
+                    header = f"{name} {len(payload)}\n".encode()
+                    offset += len(header)
+                    written.append((name, (log_path, offset, len(payload))))
+                    offset += len(payload) + 1
+                    chunks += (header, payload, b"\n")
+                f.write(b"".join(chunks))
+
+        with self._index_lock:
+            index = self._ensure_index()
+            for name, location in written:
+                # Skip events cleared while their record was being written.
+                if name in index:
+                    index[name] = location
+
+    async def _flush_outputs(self) -> None:
+        """Wait until every queued output event is written to its log."""
+        while (writer := self._output_writer) is not None and not writer.done():
+            await asyncio.shield(writer)
+
+    def _ensure_index(self) -> dict[str, _EventLocation]:
+        """Return the event index, loading it from disk on first use.
+
+        The caller must hold ``_index_lock``.
+        """
+        if self._index is None:
+            self._index = {}
+            self._load_index()
+        return self._index
+
+    def _load_index(self) -> None:
+        self._ensure_bash_events_dir()
+        entries: list[tuple[str, _EventLocation]] = []
+        with os.scandir(self.bash_events_dir) as it:
+            for entry in it:
+                if not entry.name.startswith("."):
+                    entries.append((entry.name, Path(entry.path)))
+        log_dir = self.bash_events_dir / OUTPUT_LOG_DIR
+        if log_dir.is_dir():
+            for log_path in log_dir.glob("*.log"):
+                for name, offset, length in self._read_log_headers(log_path):
+                    entries.append((name, (log_path, offset, length)))
+        entries.sort(key=lambda entry: entry[0])
+        for name, location in entries:
+            self._index_event(name, location)
+
+    @staticmethod
+    def _read_log_headers(log_path: Path) -> list[tuple[str, int, int]]:
+        """Sync: list the (name, offset, length) of every record in an output log.
+
+        Reading stops at a record cut short, e.g. by a crash during a write.
+        """
+        records: list[tuple[str, int, int]] = []
+        try:
+            with open(log_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                while header := f.readline():
+                    try:
+                        name, length_str = header.decode().split(" ")
+                        length = int(length_str)
+                    except ValueError:
+                        break
+                    offset = f.tell()
+                    if offset + length > size:
+                        break
+                    records.append((name, offset, length))
+                    f.seek(length + 1, os.SEEK_CUR)
+        except OSError as e:
+            logger.error(f"Error reading output log {log_path}: {e}")
+        return records
+
+    def _index_event(self, name: str, location: _EventLocation) -> None:
+        """Add or update an event in the index. The caller must hold the lock."""
+        index = self._ensure_index()
+        if name not in index:
+            _insort(self._index_names, name)
+            parts = name.split("_")
+            self._names_by_id[parts[-1]] = name
+            _insort(self._names_by_kind.setdefault(parts[1], []), name)
+            # Only BashOutput names (4 segments) carry a command_id.
+            if len(parts) == 4:
+                _insort(self._names_by_command.setdefault(parts[2], []), name)
+        index[name] = location
+
+    def _unindex_events(self, names: set[str]) -> None:
+        """Remove events from the index. The caller must hold the lock."""
+        index = self._ensure_index()
+        kinds = set()
+        commands = set()
+        for name in names:
+            index.pop(name, None)
+            parts = name.split("_")
+            self._names_by_id.pop(parts[-1], None)
+            kinds.add(parts[1])
+            if len(parts) == 4:
+                commands.add(parts[2])
+        self._index_names = [n for n in self._index_names if n not in names]
+        for lists, keys in (
+            (self._names_by_kind, kinds),
+            (self._names_by_command, commands),
+        ):
+            for key in keys:
+                remaining = [n for n in lists.get(key, []) if n not in names]
+                if remaining:
+                    lists[key] = remaining
+                else:
+                    lists.pop(key, None)
+
+    def _load_indexed_event(self, location: _EventLocation) -> BashEventBase | None:
+        if isinstance(location, BashEventBase):
+            return location
+        if isinstance(location, Path):
+            return self._load_event_from_file(location)
+        log_path, offset, length = location
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(offset)
+                return BashEventBase.model_validate_json(f.read(length))
+        except Exception as e:
+            logger.error(f"Error loading event from {log_path}: {e}")
+            return None
 
     def _load_event_from_file(self, filepath: Path) -> BashEventBase | None:
         """Load an event from a file."""
@@ -102,18 +332,18 @@ class BashEventService:
             return await asyncio.to_thread(self._get_bash_event_sync, event_id)
 
     def _get_bash_event_sync(self, event_id: str) -> BashEventBase | None:
-        """Sync: find the event file whose name ends with ``_<event_id>``.
+        """Sync: look up the event whose name ends with ``_<event_id>``.
 
-        Scans the events directory in a single ``os.scandir`` pass (one readdir,
-        no per-entry stat or regex) and returns the first matching file.
+        Runs in a worker thread because the first lookup may load the index
+        and reading the event is file I/O.
         """
-        self._ensure_bash_events_dir()
-        suffix = f"_{event_id}"
-        with os.scandir(self.bash_events_dir) as it:
-            for entry in it:
-                if entry.name.endswith(suffix):
-                    return self._load_event_from_file(Path(entry.path))
-        return None
+        with self._index_lock:
+            index = self._ensure_index()
+            name = self._names_by_id.get(event_id)
+            location = index.get(name) if name else None
+        if location is None:
+            return None
+        return self._load_indexed_event(location)
 
     async def batch_get_bash_events(
         self, event_ids: list[str]
@@ -167,63 +397,60 @@ class BashEventService:
         page_id: str | None,
         limit: int,
     ) -> BashEventPage:
-        """Sync search: one ``os.scandir`` pass + cheap segment filter.
-
-        Splits each filename on ``_`` and compares the fixed segments
-        (kind, command_id) directly rather than matching with regexes. Filenames
-        are ``<timestamp>_<kind>[_<command_id>]_<event_id>`` with a 20-digit
-        timestamp prefix, so a lexicographic name comparison is a timestamp
-        comparison and is used both to pre-filter by the time window and to sort.
+        """Sync search over the in-memory index of event names.
+
+        Names are ``<timestamp>_<kind>[_<command_id>]_<event_id>`` with a
+        20-digit timestamp prefix and are kept sorted, per command and per kind
+        as well as overall. A search picks the narrowest list, bisects it for
+        the time window and the ``page_id`` (the name of the page's first
+        event), and slices one page, so it costs O(log N) plus the page reads
+        however many events are stored.
         """
-        self._ensure_bash_events_dir()
         gte_str = self._timestamp_to_str(timestamp__gte) if timestamp__gte else None
         lt_str = self._timestamp_to_str(timestamp__lt) if timestamp__lt else None
         kind_filter = kind__eq
         cmd_filter = command_id__eq.hex if command_id__eq else None
         reverse = sort_order == BashEventSortOrder.TIMESTAMP_DESC
 
-        matched: list[str] = []
-        with os.scandir(self.bash_events_dir) as it:
-            for entry in it:
-                name = entry.name
-                # Timestamp-prefix pre-filter: filenames sort lexicographically
-                # by timestamp, so a string compare on the whole name bounds
-                # the time window without parsing the timestamp.
-                if gte_str is not None and name < gte_str:
-                    continue
-                if lt_str is not None and name >= lt_str:
-                    continue
-                # Segment filter: [timestamp, kind, (command_id), event_id].
-                # Cheaper than fnmatch and avoids matching unrelated files.
-                if kind_filter is not None or cmd_filter is not None:
-                    parts = name.split("_")
-                    if kind_filter is not None:
-                        if len(parts) < 2 or parts[1] != kind_filter:
-                            continue
-                    if cmd_filter is not None:
-                        # Only BashOutput (4 segments) carries a command_id.
-                        if len(parts) < 4 or parts[2] != cmd_filter:
-                            continue
-                matched.append(name)
-
-        matched.sort(reverse=reverse)
-
-        # Resolve page_id to a starting index.
-        start_index = 0
-        if page_id:
-            for i, name in enumerate(matched):
-                if name == page_id:
-                    start_index = i
-                    break
-
-        page_slice = matched[start_index : start_index + limit]
-        next_page_id = None
-        if start_index + limit < len(matched):
-            next_page_id = matched[start_index + limit]
+        with self._index_lock:
+            index = self._ensure_index()
+            if cmd_filter is not None:
+                names = self._names_by_command.get(cmd_filter, [])
+                # A command's events are all BashOutputs, so the first name
+                # tells whether they match the kind filter.
+                if names and kind_filter not in (None, names[0].split("_")[1]):
+                    names = []
+            elif kind_filter is not None:
+                names = self._names_by_kind.get(kind_filter, [])
+            else:
+                names = self._index_names
+            lo = bisect.bisect_left(names, gte_str) if gte_str is not None else 0
+            hi = bisect.bisect_left(names, lt_str) if lt_str is not None else len(names)
+
+            # An unknown page_id starts from the first page, as it always has.
+            if page_id:
+                i = bisect.bisect_left(names, page_id, lo, hi)
+                if i < hi and names[i] == page_id:
+                    if reverse:
+                        hi = i + 1
+                    else:
+                        lo = i
+            # One event past the page, to tell whether there is a next page.
+            if reverse:
+                window = names[max(lo, hi - limit - 1) : hi][::-1]
+            else:
+                window = names[lo : min(hi, lo + limit + 1)]
+
+        page_slice = window[:limit]
+        next_page_id = window[limit] if len(window) > limit else None
 
         page_events: list[BashEventBase] = []
         for name in page_slice:
-            event = self._load_event_from_file(self.bash_events_dir / name)
+            location = index.get(name)
+            if location is None:
+                # Deleted since the names were matched.
+                continue
+            event = self._load_indexed_event(location)
             if event is None:
                 continue
             # Filter by order if specified (only applies to BashOutput events)
@@ -264,6 +491,47 @@ class BashEventService:
 
         return command, task
 
+    async def stream_bash_command(
+        self, request: ExecuteBashRequest
+    ) -> AsyncIterator[BashEventBase]:
+        """Execute a bash command, yielding it and then its output as published.
+
+        Ends after the output that carries the exit code. Output is delivered
+        by subscription rather than read back from disk, so the caller waits
+        no longer than the command itself. If every subscriber slot is taken,
+        the output is read back from disk once the command finishes.
+        """
+        outputs = _CommandOutputQueue()
+        try:
+            subscriber_id = self._pub_sub.subscribe(outputs)
+        except MaxSubscribersError:
+            subscriber_id = None
+        try:
+            command, task = await self.start_bash_command(request)
+            # No await since the task was created, so it has not published yet.
+            outputs.command_id = command.id
+            yield command
+
+            if subscriber_id is None:
+                await task
+                async for event in page_iterator(
+                    self.search_bash_events,
+                    kind__eq="BashOutput",
+                    command_id__eq=command.id,
+                ):
+                    yield event
+                return
+
+            # Wake the loop below should the task end without an exit code.
+            task.add_done_callback(lambda _: outputs.queue.put_nowait(None))
+            while (output := await outputs.queue.get()) is not None:
+                yield output
+                if output.exit_code is not None:
+                    return
+        finally:
+            if subscriber_id is not None:
+                self._pub_sub.unsubscribe(subscriber_id)
+
     async def _execute_bash_command(self, command: BashCommand) -> None:
         """Execute the bash event and create an observation event."""
         try:
@@ -320,7 +588,7 @@ class BashEventService:
                                 stderr=chunk if is_stderr else None,
                             )
 
-                            self._save_event_to_file(output_event)
+                            self._persist_output(output_event)
                             await self._pub_sub(output_event)
                             output_order += 1
 
@@ -383,7 +651,9 @@ class BashEventService:
                     stderr=final_stderr,
                 )
 
-                self._save_event_to_file(final_output)
+                # The command's output is all on disk once its exit code is out.
+                self._persist_output(final_output)
+                await self._flush_outputs()
                 await self._pub_sub(final_output)
 
         except Exception as e:
@@ -400,38 +670,55 @@ class BashEventService:
                 stderr=f"Error executing command: {str(e)}",
             )
 
-            self._save_event_to_file(error_output)
+            self._persist_output(error_output)
+            await self._flush_outputs()
             await self._pub_sub(error_output)
 
     def delete_events_older_than(self, cutoff: datetime) -> int:
-        """Delete bash event files with a recorded timestamp older than ``cutoff``.
+        """Delete bash events with a recorded timestamp older than ``cutoff``.
 
         This is a synchronous method — all operations are blocking filesystem
         I/O. Callers on the asyncio event loop should use
         ``await asyncio.to_thread(service.delete_events_older_than, cutoff)``
         to avoid stalling the loop.
 
-        File names are prefixed with ``YYYYMMDDHHMMSS`` in ascending sort order,
-        so scanning stops as soon as a file at or after the cutoff is reached.
+        Event names are prefixed with ``YYYYMMDDHHMMSSffffff`` and the index
+        keeps them sorted, so the old events are a prefix of it. A command's
+        output log is deleted as a whole, once its newest event is older than
+        ``cutoff``.
 
         Returns:
-            int: The number of event files deleted.
+            int: The number of events deleted.
         """
         cutoff_str = self._timestamp_to_str(cutoff)
-        files = self._get_event_files_by_pattern("*")  # ascending chronological order
-        count = 0
-        for path in files:
-            if path.name >= cutoff_str:
-                break  # remaining files are at or newer than cutoff
+        paths: list[Path] = []
+        with self._index_lock:
+            index = self._ensure_index()
+            old = self._index_names[: bisect.bisect_left(self._index_names, cutoff_str)]
+            deleted: set[str] = set()
+            for name in old:
+                location = index[name]
+                if isinstance(location, Path):
+                    paths.append(location)
+                    deleted.add(name)
+                elif isinstance(location, tuple):
+                    command = name.split("_")[2]
+                    command_names = self._names_by_command[command]
+                    if command not in deleted and command_names[-1] < cutoff_str:
+                        paths.append(location[0])
+                        deleted.add(command)
+                        deleted.update(command_names)
+            deleted.intersection_update(index)
+            self._unindex_events(deleted)
+
+        for path in paths:
             try:
                 path.unlink(missing_ok=True)
-                count += 1
             except Exception as e:
                 logger.warning("Failed to delete bash event file %s: %s", path, e)
+        count = len(deleted)
         if count:
-            logger.info(
-                "Deleted %d bash event file(s) older than %s", count, cutoff_str
-            )
+            logger.info("Deleted %d bash event(s) older than %s", count, cutoff_str)
         return count
 
     async def run_retention_cleanup_loop(
@@ -490,32 +777,41 @@ class BashEventService:
             int: The number of events that were cleared.
         """
         self._ensure_bash_events_dir()
-
-        # Get all event files
-        files = self._get_event_files_by_pattern("*")
-
-        # Count files before deletion
-        count = len(files)
-
-        # Remove all event files
-        for file_path in files:
+        await self._flush_outputs()
+
+        with self._index_lock:
+            count = len(self._ensure_index())
+            self._index = {}
+            self._index_names = []
+            self._names_by_id = {}
+            self._names_by_command = {}
+            self._names_by_kind = {}
+
+        # Remove all event files and output logs
+        for file_path in self._get_event_files_by_pattern("*"):
             try:
                 file_path.unlink()
             except Exception as e:
                 logger.error(f"Error deleting event file {file_path}: {e}")
+        shutil.rmtree(self.bash_events_dir / OUTPUT_LOG_DIR, ignore_errors=True)
 
         logger.info(f"Cleared {count} bash events from storage")
         return count
 
     async def close(self):
         """Close the bash event service and clean up resources."""
+        await self._flush_outputs()
         await self._pub_sub.close()
 
     async def __aenter__(self):
         """Start using this task service"""
-        # No special initialization needed for bash event service
+        await asyncio.to_thread(self._load_index_locked)
         return self
 
+    def _load_index_locked(self) -> None:
+        with self._index_lock:
+            self._ensure_index()
+
     async def __aexit__(self, exc_type, exc_value, traceback):
         """Finish using this task service"""
         await self.close()
@@ -14,6 +14,7 @@ from openhands.agent_server.env_parser import (
     get_env_parser,
     merge,
 )
+from openhands.agent_server.pub_sub import BackpressurePolicy
 from openhands.agent_server.telemetry_types import DeploymentKind
 from openhands.sdk.marketplace.registration import MarketplaceRegistration
 from openhands.sdk.utils.cipher import Cipher
@@ -393,6 +394,27 @@ class Config(BaseModel):
             "they are deleted or the server restarts."
         ),
     )
+    websocket_send_queue_size: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Number of events buffered per websocket client. Each event is "
+            "serialized once for all clients and written to every socket by a "
+            "task of its own, so a slow client neither delays the others nor "
+            "the agent. Set to 0 to send to each socket directly from the "
+            "publishing coroutine instead."
+        ),
+    )
+    websocket_backpressure_policy: BackpressurePolicy = Field(
+        default="coalesce",
+        description=(
+            "What to do when a websocket client's send queue is full: "
+            "'drop_oldest' discards its oldest queued event, 'disconnect' closes "
+            "the socket so the client reconnects and catches up over REST, and "
+            "'coalesce' merges streaming deltas queued for a lagging client and "
+            "disconnects it once nothing more can be merged."
+        ),
+    )
     telemetry: TelemetrySpec = Field(
         default_factory=TelemetrySpec,
         description=(
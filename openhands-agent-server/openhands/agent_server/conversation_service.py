@@ -3,10 +3,13 @@ import importlib
 import json
 import logging
 import os
-from collections.abc import Awaitable, Callable
+import tempfile
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Awaitable, Callable, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID, uuid4
@@ -599,6 +602,60 @@ def _read_execution_status_sync(
     return None
 
 
+# Catalog index: per conversation directory, the ``execution_status`` last read
+# from ``base_state.json`` and that file's signature at the time. Startup then
+# only stats each base state and parses the ones that changed since.
+CATALOG_INDEX_FILE = ".catalog_index.json"
+
+
+def _read_catalog_index(
+    path: Path,
+) -> dict[str, tuple[tuple[int, int], ConversationExecutionStatus]]:
+    """Load the catalog index; a missing or unreadable one is simply empty."""
+    index: dict[str, tuple[tuple[int, int], ConversationExecutionStatus]] = {}
+    try:
+        entries = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return index
+    if not isinstance(entries, dict):
+        return index
+    for name, entry in entries.items():
+        with suppress(ValueError, TypeError):
+            mtime_ns, size, status = entry
+            index[name] = (
+                (int(mtime_ns), int(size)),
+                ConversationExecutionStatus(status),
+            )
+    return index
+
+
+def _write_catalog_index(
+    path: Path,
+    index: dict[str, tuple[tuple[int, int], ConversationExecutionStatus]],
+) -> None:
+    """Atomically replace the catalog index; failures only cost a slower start."""
+    tmp_name: str | None = None
+    try:
+        payload = json.dumps(
+            {
+                name: [signature[0], signature[1], status.value]
+                for name, (signature, status) in index.items()
+            },
+            separators=(",", ":"),
+        )
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f"{CATALOG_INDEX_FILE}.", suffix=".tmp", dir=path.parent
+        )
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError):
+        logger.warning("Could not write conversation catalog index", exc_info=True)
+        if tmp_name is not None:
+            with suppress(OSError):
+                os.unlink(tmp_name)
+
+
 @dataclass
 class _ConversationRecord:
     stored: StoredConversation
@@ -618,6 +675,181 @@ class _ConversationRecord:
     # invalidate it.
     stored_signature: int | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # ``stored`` is often reassigned the same, mutated-in-place object
+        # (live conversations bump ``updated_at``), so any assignment counts.
+        rekey = name == "stored" or (
+            name == "execution_status" and self.__dict__.get(name) is not value
+        )
+        super().__setattr__(name, value)
+        if rekey:
+            entry = self.__dict__.get("_catalog_entry")
+            if entry is not None:
+                entry[0].touch(entry[1])
+
+
+# (timestamp, id hex, id): unique, and ordered by timestamp with the id as a
+# stable tie-break.
+_SortKey = tuple[datetime, str, UUID]
+
+
+def _sort_field(sort_order: ConversationSortOrder) -> str:
+    if sort_order in (
+        ConversationSortOrder.CREATED_AT,
+        ConversationSortOrder.CREATED_AT_DESC,
+    ):
+        return "created_at"
+    return "updated_at"
+
+
+class _ConversationCatalog(dict[UUID, _ConversationRecord]):
+    """Conversation records plus sorted indexes for paginated search.
+
+    For each sort field, overall and per execution status, the catalog keeps
+    the records' sort keys in a sorted list, so a page is a bisect to the
+    cursor plus ``limit`` steps instead of a sort of the whole catalog.
+
+    Indexes are maintained lazily: inserting, removing or replacing a record,
+    or assigning its ``stored`` or ``execution_status``, marks its id dirty,
+    and dirty ids are re-keyed before the next read. A ``StoredConversation``
+    mutated in place (live conversations bump ``updated_at`` directly) is not
+    observed; callers :meth:`touch` such conversations before reading.
+    """
+
+    def __init__(
+        self, records: Mapping[UUID, _ConversationRecord] | None = None
+    ) -> None:
+        super().__init__()
+        self._keys: dict[
+            UUID, tuple[_SortKey, _SortKey, ConversationExecutionStatus]
+        ] = {}
+        self._sorted: dict[
+            tuple[str, ConversationExecutionStatus | None], list[_SortKey]
+        ] = {}
+        self._dirty: set[UUID] = set()
+        if records:
+            self.update(records)
+
+    def __setitem__(self, conversation_id: UUID, record: _ConversationRecord) -> None:
+        super().__setitem__(conversation_id, record)
+        with suppress(AttributeError, TypeError):
+            # Test doubles that refuse attributes simply are not re-keyed on
+            # field assignment.
+            object.__setattr__(record, "_catalog_entry", (self, conversation_id))
+        self._dirty.add(conversation_id)
+
+    def __delitem__(self, conversation_id: UUID) -> None:
+        super().__delitem__(conversation_id)
+        self._dirty.add(conversation_id)
+
+    def pop(self, conversation_id: UUID, *default: Any) -> Any:
+        self._dirty.add(conversation_id)
+        return super().pop(conversation_id, *default)
+
+    def popitem(self) -> tuple[UUID, _ConversationRecord]:
+        item = super().popitem()
+        self._dirty.add(item[0])
+        return item
+
+    def setdefault(  # type: ignore[override]
+        self, conversation_id: UUID, record: _ConversationRecord
+    ) -> _ConversationRecord:
+        if conversation_id not in self:
+            self[conversation_id] = record
+        return self[conversation_id]
+
+    def update(  # type: ignore[override]
+        self, records: Mapping[UUID, _ConversationRecord], /
+    ) -> None:
+        for conversation_id, record in records.items():
+            self[conversation_id] = record
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+        self._sorted.clear()
+        self._dirty.clear()
+
+    def touch(self, conversation_id: UUID) -> None:
+        """Mark ``conversation_id`` for re-keying before the next read."""
+        self._dirty.add(conversation_id)
+
+    def count(self, execution_status: ConversationExecutionStatus | None) -> int:
+        self._flush()
+        if execution_status is None:
+            return len(self)
+        return len(self._sorted.get(("created_at", execution_status), ()))
+
+    def sort_key(
+        self, conversation_id: UUID, sort_order: ConversationSortOrder
+    ) -> _SortKey | None:
+        """Indexed sort key of ``conversation_id``, or None if not in the catalog."""
+        self._flush()
+        keys = self._keys.get(conversation_id)
+        if keys is None:
+            return None
+        return keys[0] if _sort_field(sort_order) == "created_at" else keys[1]
+
+    def range(
+        self,
+        sort_order: ConversationSortOrder,
+        execution_status: ConversationExecutionStatus | None,
+        count: int,
+        start: _SortKey | None = None,
+        inclusive: bool = True,
+    ) -> list[_SortKey]:
+        """Up to ``count`` keys in ``sort_order`` from ``start`` (the cursor).
+
+        ``start`` need not be in the index: keyset pagination continues from
+        its position even after the record at the cursor changed or left.
+        """
+        self._flush()
+        keys = self._sorted.get((_sort_field(sort_order), execution_status), [])
+        if sort_order in (
+            ConversationSortOrder.CREATED_AT_DESC,
+            ConversationSortOrder.UPDATED_AT_DESC,
+        ):
+            if start is None:
+                end = len(keys)
+            elif inclusive:
+                end = bisect_right(keys, start)
+            else:
+                end = bisect_left(keys, start)
+            return keys[max(0, end - count) : end][::-1]
+        if start is None:
+            begin = 0
+        elif inclusive:
+            begin = bisect_left(keys, start)
+        else:
+            begin = bisect_right(keys, start)
+        return keys[begin : begin + count]
+
+    def _flush(self) -> None:
+        while self._dirty:
+            self._rekey(self._dirty.pop())
+
+    def _rekey(self, conversation_id: UUID) -> None:
+        old = self._keys.pop(conversation_id, None)
+        if old is not None:
+            created, updated, status = old
+            for field_name, key in (("created_at", created), ("updated_at", updated)):
+                for bucket in (None, status):
+                    keys = self._sorted[(field_name, bucket)]
+                    i = bisect_left(keys, key)
+                    if i < len(keys) and keys[i] == key:
+                        del keys[i]
+        record = self.get(conversation_id)
+        if record is None:
+            return
+        stored = record.stored
+        created = (stored.created_at, conversation_id.hex, conversation_id)
+        updated = (stored.updated_at, conversation_id.hex, conversation_id)
+        status = record.execution_status
+        self._keys[conversation_id] = (created, updated, status)
+        for field_name, key in (("created_at", created), ("updated_at", updated)):
+            for bucket in (None, status):
+                insort(self._sorted.setdefault((field_name, bucket), []), key)
+
 
 @dataclass
 class ConversationService:
@@ -642,7 +874,7 @@ class ConversationService:
     )
     _event_services: dict[UUID, EventService] | None = field(default=None, init=False)
     _conversation_records: dict[UUID, _ConversationRecord] = field(
-        default_factory=dict, init=False
+        default_factory=_ConversationCatalog, init=False
     )
     _lifecycle_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
     _conversation_webhook_subscribers: list["ConversationWebhookSubscriber"] = field(
@@ -656,46 +888,100 @@ class ConversationService:
     )
 
     def _load_catalog_sync(self) -> dict[UUID, _ConversationRecord]:
+        """Load a record for every persisted conversation.
+
+        Entries are independent, so they load on a thread pool, which overlaps
+        their file I/O. ``base_state.json`` is only parsed when it changed
+        since the catalog index last saw it.
+        """
+        index_path = self.conversations_dir / CATALOG_INDEX_FILE
+        index = _read_catalog_index(index_path)
+        conversation_dirs = list(self.conversations_dir.iterdir())
         records: dict[UUID, _ConversationRecord] = {}
-        for conversation_dir in self.conversations_dir.iterdir():
-            meta_file = conversation_dir / "meta.json"
-            if not meta_file.exists():
-                continue
-            try:
-                stored = StoredConversation.model_validate_json(
-                    meta_file.read_text(),
-                    context={"cipher": self.cipher},
+        fresh_index: dict[str, tuple[tuple[int, int], ConversationExecutionStatus]] = {}
+        if conversation_dirs:
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="conversation-catalog",
+            ) as executor:
+                loaded = executor.map(
+                    lambda conversation_dir: self._load_catalog_entry_sync(
+                        conversation_dir, index.get(conversation_dir.name)
+                    ),
+                    conversation_dirs,
                 )
-                execution_status = ConversationExecutionStatus.IDLE
-                base_state_file = conversation_dir / BASE_STATE
-                base_state_path = str(base_state_file)
-                # Signature before read, so a racing write leaves a stale
-                # signature and the next query re-reads rather than trusting it.
-                signature = _state_signature(base_state_path)
-                if base_state_file.exists():
+                for conversation_dir, record in zip(
+                    conversation_dirs, loaded, strict=True
+                ):
+                    if record is None:
+                        continue
+                    records[record.stored.id] = record
+                    if record.state_signature is not None:
+                        fresh_index[conversation_dir.name] = (
+                            record.state_signature,
+                            record.execution_status,
+                        )
+        if fresh_index != index:
+            _write_catalog_index(index_path, fresh_index)
+        return records
+
+    def _load_catalog_entry_sync(
+        self,
+        conversation_dir: Path,
+        indexed: tuple[tuple[int, int], ConversationExecutionStatus] | None,
+    ) -> _ConversationRecord | None:
+        meta_file = conversation_dir / "meta.json"
+        try:
+            meta_json = meta_file.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        try:
+            stored = StoredConversation.model_validate_json(
+                meta_json,
+                context={"cipher": self.cipher},
+            )
+            execution_status = ConversationExecutionStatus.IDLE
+            base_state_path = str(conversation_dir / BASE_STATE)
+            # Signature before read, so a racing write leaves a stale
+            # signature and the next query re-reads rather than trusting it.
+            signature = _state_signature(base_state_path)
+            if signature is not None:
+                if indexed is not None and indexed[0] == signature:
+                    execution_status = indexed[1]
+                else:
                     # Strict on purpose: a corrupt base state still drops the
                     # conversation from the catalog and logs below.
-                    payload = json.loads(base_state_file.read_text())
+                    with open(base_state_path, "rb") as f:
+                        payload = json.loads(f.read())
                     execution_status = ConversationExecutionStatus(
                         payload.get(
                             "execution_status", ConversationExecutionStatus.IDLE.value
                         )
                     )
-                else:
-                    signature = None
-                records[stored.id] = _ConversationRecord(
-                    stored=stored,
-                    execution_status=execution_status,
-                    state_signature=signature,
-                    base_state_path=base_state_path,
-                )
-            except Exception:
-                logger.exception(
-                    "error_loading_conversation_catalog:%s",
-                    conversation_dir,
-                    stack_info=True,
+            return _ConversationRecord(
+                stored=stored,
+                execution_status=execution_status,
+                state_signature=signature,
+                base_state_path=base_state_path,
+            )
+        except Exception:
+            logger.exception(
+                "error_loading_conversation_catalog:%s",
+                conversation_dir,
+                stack_info=True,
+            )
+            return None
+
+    def _save_catalog_index_sync(self) -> None:
+        """Persist verified statuses so the next startup can skip parsing them."""
+        index: dict[str, tuple[tuple[int, int], ConversationExecutionStatus]] = {}
+        for conversation_id, record in list(self._conversation_records.items()):
+            if record.state_signature is not None:
+                index[conversation_id.hex] = (
+                    record.state_signature,
+                    record.execution_status,
                 )
-        return records
+        _write_catalog_index(self.conversations_dir / CATALOG_INDEX_FILE, index)
 
     def _base_state_path(
         self, conversation_id: UUID, record: _ConversationRecord
@@ -728,6 +1014,20 @@ class ConversationService:
         state = self._load_persisted_state_sync(conversation_id)
         return state.agent if state is not None else None
 
+    def _catalog(self) -> _ConversationCatalog:
+        """The records as a :class:`_ConversationCatalog`, with live rows re-keyed."""
+        records = self._conversation_records
+        if not isinstance(records, _ConversationCatalog):
+            # Embedders and tests may assign a plain dict.
+            records = _ConversationCatalog(records)
+            self._conversation_records = records
+        # Live conversations bump ``updated_at`` on their shared
+        # ``StoredConversation`` in place, which the catalog cannot observe.
+        for conversation_id in self._event_services or ():
+            if conversation_id in records:
+                records.touch(conversation_id)
+        return records
+
     def _children_index(self) -> dict[UUID, list[UUID]]:
         """Reverse map parent_id -> child ids; rebuilt per call because the
         catalog is mutated from several places and a cache could go stale."""
@@ -1173,44 +1473,44 @@ class ConversationService:
             # only for the page items.
             await self._refresh_execution_statuses()
 
-        records = [
-            (conversation_id, record)
-            for conversation_id, record in self._conversation_records.items()
-            if execution_status is None or record.execution_status == execution_status
-        ]
-        if sort_order in (
-            ConversationSortOrder.CREATED_AT,
-            ConversationSortOrder.CREATED_AT_DESC,
-        ):
-            records.sort(
-                key=lambda item: item[1].stored.created_at,
-                reverse=sort_order == ConversationSortOrder.CREATED_AT_DESC,
-            )
-        else:
-            records.sort(
-                key=lambda item: item[1].stored.updated_at,
-                reverse=sort_order == ConversationSortOrder.UPDATED_AT_DESC,
-            )
-
-        start_index = 0
+        catalog = self._catalog()
+        # Keyset pagination: resume at the sort key of the conversation named
+        # by ``page_id``; an unknown one restarts from the beginning.
+        start: _SortKey | None = None
         if page_id:
-            for i, (conversation_id, _) in enumerate(records):
-                if conversation_id.hex == page_id:
-                    start_index = i
-                    break
+            with suppress(ValueError):
+                start = catalog.sort_key(UUID(hex=page_id), sort_order)
+        inclusive = True
 
         items: list[ConversationInfo] = []
         next_page_id = None
         children_index = self._children_index()
-        for conversation_id, record in records[start_index:]:
-            if len(items) >= limit:
-                next_page_id = conversation_id.hex
-                break
-            conversation_info = await self._conversation_info(
-                conversation_id, record, children_index
+        while next_page_id is None:
+            # One key past the page tells whether there is a next one.
+            keys = catalog.range(
+                sort_order,
+                execution_status,
+                limit + 1 - len(items),
+                start=start,
+                inclusive=inclusive,
             )
-            if conversation_info is not None:
-                items.append(conversation_info)
+            if not keys:
+                break
+            for _, _, conversation_id in keys:
+                if len(items) >= limit:
+                    next_page_id = conversation_id.hex
+                    break
+                record = catalog.get(conversation_id)
+                if record is None:
+                    continue
+                conversation_info = await self._conversation_info(
+                    conversation_id, record, children_index
+                )
+                if conversation_info is not None:
+                    items.append(conversation_info)
+            # Rows that failed to load leave the page short; continue past
+            # the last key seen rather than re-reading from the cursor.
+            start, inclusive = keys[-1], False
 
         return items, next_page_id
 
@@ -1233,11 +1533,7 @@ class ConversationService:
             return len(self._conversation_records)
 
         await self._refresh_execution_statuses()
-        return sum(
-            1
-            for record in self._conversation_records.values()
-            if record.execution_status == execution_status
-        )
+        return self._catalog().count(execution_status)
 
     async def batch_get_conversations(
         self, conversation_ids: list[UUID]
@@ -1954,7 +2250,9 @@ class ConversationService:
             thread_name_prefix="conversation-run",
         )
         self._event_services = {}
-        self._conversation_records = await asyncio.to_thread(self._load_catalog_sync)
+        self._conversation_records = _ConversationCatalog(
+            await asyncio.to_thread(self._load_catalog_sync)
+        )
 
         # Initialize conversation webhook subscribers
         self._conversation_webhook_subscribers = [
@@ -2096,6 +2394,7 @@ class ConversationService:
             event_services = self._event_services
             if event_services is None:
                 return
+            await asyncio.to_thread(self._save_catalog_index_sync)
             services = tuple(event_services.items())
             results = await asyncio.gather(
                 *[
@@ -2118,11 +2417,15 @@ class ConversationService:
                     for conversation_id, event_service in services
                     if conversation_id in failed_ids
                 }
-                self._conversation_records = {
-                    conversation_id: record
-                    for conversation_id, record in self._conversation_records.items()
-                    if conversation_id in failed_ids
-                }
+                self._conversation_records = _ConversationCatalog(
+                    {
+                        conversation_id: record
+                        for conversation_id, record in (
+                            self._conversation_records.items()
+                        )
+                        if conversation_id in failed_ids
+                    }
+                )
                 self._credential_bindings = {
                     conversation_id: bindings
                     for conversation_id, bindings in self._credential_bindings.items()
@@ -2130,7 +2433,7 @@ class ConversationService:
                 }
             else:
                 self._event_services = None
-                self._conversation_records = {}
+                self._conversation_records = _ConversationCatalog()
                 self._credential_bindings = {}
         if self._run_executor is not None:
             self._run_executor.shutdown(wait=False)
@@ -98,6 +98,13 @@ async def search_conversation_events(
         datetime | None,
         Query(title="Filter: event timestamp < this datetime"),
     ] = None,
+    after_event_id: Annotated[
+        str | None,
+        Query(
+            title="Optional id of an event to start after, in the requested order "
+            "(ignored when page_id is given)"
+        ),
+    ] = None,
     event_service: EventService = Depends(get_event_service),
 ) -> JSONResponse:
     """Search / List local events"""
@@ -115,7 +122,15 @@ async def search_conversation_events(
     )
 
     page = await event_service.search_events(
-        page_id, limit, kind, source, body, sort_order, normalized_gte, normalized_lt
+        page_id,
+        limit,
+        kind,
+        source,
+        body,
+        sort_order,
+        normalized_gte,
+        normalized_lt,
+        after_event_id,
     )
     if isinstance(page, dict):
         items = cast(list[Any], page.get("items", []))
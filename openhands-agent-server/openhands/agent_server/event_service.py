@@ -1,6 +1,6 @@
 import asyncio
 import time
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext, suppress
 from dataclasses import dataclass, field
@@ -30,6 +30,8 @@ from openhands.sdk.agent.acp_file_credentials import (
     is_valid_codex_auth,
 )
 from openhands.sdk.conversation.base import BaseConversation
+from openhands.sdk.conversation.event_index import event_search_text
+from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.events_list_base import EventsListBase
 from openhands.sdk.conversation.exceptions import ConversationRunError
 from openhands.sdk.conversation.goal import (
@@ -441,6 +443,53 @@ class EventService:
             return False
         return True
 
+    def _index_prefilter(
+        self,
+        events: EventsListBase,
+        kind: str | None,
+        source: str | None,
+        body: str | None,
+        timestamp_gte_str: str | None,
+        timestamp_lt_str: str | None,
+    ) -> Callable[[int], bool | None] | None:
+        """Build a check that answers filters from the EventLog search index.
+
+        The returned callable maps an event index to False (cannot match),
+        True (matches; no need to read the event) or None (read the event and
+        apply ``_event_matches_filters``), the latter for events without an
+        index row and for ``body`` candidates, which the token index narrows
+        but cannot confirm. Returns None when ``events`` has no index.
+        """
+        if not isinstance(events, EventLog):
+            return None
+        try:
+            index = events.search_index
+        except Exception:
+            logger.warning(
+                "Event search index unavailable for conversation %s",
+                self.stored.id,
+                exc_info=True,
+            )
+            return None
+        candidates = index.body_candidates(body) if body is not None else None
+
+        def check(i: int) -> bool | None:
+            matched = index.matches(
+                i, kind, source, timestamp_gte_str, timestamp_lt_str
+            )
+            if not matched:
+                return matched
+            if body is None:
+                return True
+            row = index.get(i)
+            if row is None or not row.searchable:
+                return False
+            if candidates is not None and i not in candidates:
+                return False
+            return None
+
+        return check
+
     def _get_searchable_event(self, events: EventsListBase, index: int) -> Event | None:
         try:
             return events[index]
@@ -453,6 +502,24 @@ class EventService:
             )
             return None
 
+    def _find_event_index(self, events: EventsListBase, event_id: str) -> int | None:
+        """Index of ``event_id`` in ``events``, or None if it is not there.
+
+        Prefers the EventLog's O(1) id-to-index map; falls back to a linear
+        scan for plain sequences (e.g. in tests).
+        """
+        get_index = getattr(events, "get_index", None)
+        if get_index is not None:
+            try:
+                return get_index(event_id)
+            except KeyError:
+                return None
+        for i in range(len(events)):
+            event = self._get_searchable_event(events, i)
+            if event is not None and event.id == event_id:
+                return i
+        return None
+
     def _search_events_sync(
         self,
         page_id: str | None = None,
@@ -463,6 +530,7 @@ class EventService:
         sort_order: EventSortOrder = EventSortOrder.TIMESTAMP,
         timestamp__gte: datetime | None = None,
         timestamp__lt: datetime | None = None,
+        after_event_id: str | None = None,
     ) -> EventPage:
         """Private sync function to search events.
 
@@ -470,6 +538,11 @@ class EventService:
         EventLog reads are safe without the FIFOLock because events are
         append-only and immutable once written.
 
+        ``after_event_id`` starts the search just past that event in the
+        requested order, so a client that already holds a prefix of the log
+        fetches only what follows it. ``page_id`` takes precedence when both
+        are given.
+
         Performance:
             Events are appended in chronological order and never reordered,
             so the on-disk index order matches the timestamp sort order.
@@ -494,24 +567,16 @@ class EventService:
 
         reverse = sort_order == EventSortOrder.TIMESTAMP_DESC
 
-        # Resolve page_id to a starting index. Prefer the EventLog's O(1)
-        # id-to-index map; fall back to a linear scan for plain sequences
-        # (e.g. in tests). An unknown page_id falls back to the natural
-        # start of the iteration order, matching prior behavior.
+        # Resolve page_id, or else after_event_id, to a starting index. An
+        # unknown id falls back to the natural start of the iteration order,
+        # matching prior behavior.
         start_index: int | None = None
         if page_id:
-            get_index = getattr(events, "get_index", None)
-            if get_index is not None:
-                try:
-                    start_index = get_index(page_id)
-                except KeyError:
-                    start_index = None
-            else:
-                for i in range(total):
-                    event = self._get_searchable_event(events, i)
-                    if event is not None and event.id == page_id:
-                        start_index = i
-                        break
+            start_index = self._find_event_index(events, page_id)
+        elif after_event_id:
+            start_index = self._find_event_index(events, after_event_id)
+            if start_index is not None:
+                start_index += -1 if reverse else 1
         if start_index is None:
             start_index = total - 1 if reverse else 0
 
@@ -520,13 +585,20 @@ class EventService:
         else:
             indices = range(start_index, total)
 
+        prefilter = self._index_prefilter(
+            events, kind, source, body, timestamp_gte_str, timestamp_lt_str
+        )
+
         items: list[Event] = []
         next_page_id: str | None = None
         for i in indices:
+            indexed = prefilter(i) if prefilter is not None else None
+            if indexed is False:
+                continue
             event = self._get_searchable_event(events, i)
             if event is None:
                 continue
-            if not self._event_matches_filters(
+            if indexed is None and not self._event_matches_filters(
                 event, kind, source, body, timestamp_gte_str, timestamp_lt_str
             ):
                 continue
@@ -547,6 +619,7 @@ class EventService:
         sort_order: EventSortOrder = EventSortOrder.TIMESTAMP,
         timestamp__gte: datetime | None = None,
         timestamp__lt: datetime | None = None,
+        after_event_id: str | None = None,
     ) -> EventPage:
         if not self._conversation:
             raise ValueError("inactive_service")
@@ -562,6 +635,7 @@ class EventService:
             sort_order,
             timestamp__gte,
             timestamp__lt,
+            after_event_id,
         )
 
     def _count_events_sync(
@@ -598,8 +672,18 @@ class EventService:
         timestamp_gte_str = timestamp__gte.isoformat() if timestamp__gte else None
         timestamp_lt_str = timestamp__lt.isoformat() if timestamp__lt else None
 
+        # Kind/source/timestamp filters are answered from the search index;
+        # only unindexed events and ``body`` candidates are read from disk.
+        prefilter = self._index_prefilter(
+            events, kind, source, body, timestamp_gte_str, timestamp_lt_str
+        )
+
         count = 0
         for i in range(len(events)):
+            indexed = prefilter(i) if prefilter is not None else None
+            if indexed is not None:
+                count += indexed
+                continue
             event = self._get_searchable_event(events, i)
             if event is None:
                 continue
@@ -691,28 +775,11 @@ class EventService:
 
     def _event_matches_body(self, event: Event, body: str) -> bool:
         """Check if event's message content matches body filter (case-insensitive)."""
-        # Import here to avoid circular imports
-        from openhands.sdk.event.llm_convertible.message import MessageEvent
-        from openhands.sdk.llm.message import content_to_str
-
-        # Only check MessageEvent instances for body content
-        if not isinstance(event, MessageEvent):
+        # Only MessageEvent content (message, extended and reasoning content)
+        # is searchable; the search index tokenizes the same text.
+        full_text = event_search_text(event)
+        if full_text is None:
             return False
-
-        # Extract text content from the message
-        text_parts = content_to_str(event.llm_message.content)
-
-        # Also check extended content if present
-        if event.extended_content:
-            extended_text_parts = content_to_str(event.extended_content)
-            text_parts.extend(extended_text_parts)
-
-        # Also check reasoning content if present
-        if event.reasoning_content:
-            text_parts.append(event.reasoning_content)
-
-        # Combine all text content and perform case-insensitive substring match
-        full_text = " ".join(text_parts).lower()
         return body.lower() in full_text
 
     async def batch_get_events(self, event_ids: list[str]) -> list[Event | None]:
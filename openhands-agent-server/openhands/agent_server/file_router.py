@@ -1,5 +1,5 @@
 import asyncio
-import fnmatch
+import hashlib
 import io
 import json
 import os
@@ -18,6 +18,7 @@ from fastapi import (
     File,
     HTTPException,
     Query,
+    Request,
     UploadFile,
     status,
 )
@@ -38,6 +39,19 @@ from openhands.sdk.git.utils import (
     validate_git_repository,
 )
 from openhands.sdk.logger import get_logger
+from openhands.sdk.workspace.sync import (
+    SyncBlocksRequest,
+    SyncDownloadRequest,
+    SyncManifest,
+    SyncManifestRequest,
+    SyncStats,
+    apply_sync_archive,
+    block_hashes,
+    build_manifest,
+    path_is_excluded,
+    resolve_sync_path,
+    write_sync_archive,
+)
 
 
 class SubdirectoryEntry(BaseModel):
@@ -61,9 +75,18 @@ class HomeResponse(BaseModel):
     locations: list[FileBrowserEntry] = []
 
 
+class FileChecksum(BaseModel):
+    size: int
+    sha256: str
+
+
 logger = get_logger(__name__)
 file_router = APIRouter(prefix="/file", tags=["Files"])
 
+# Ranged uploads arrive in small pieces; buffer them to this size before each
+# write so one upload does not cost a worker thread hop per piece.
+_UPLOAD_WRITE_SIZE = 1024 * 1024
+
 
 async def _upload_file(path: str, file: UploadFile) -> Success:
     """Internal helper to upload a file to the workspace."""
@@ -139,6 +162,70 @@ async def _download_file(path: str) -> FileResponse:
         )
 
 
+def _absolute_file_path(path: str) -> Path:
+    target_path = Path(path)
+    if not target_path.is_absolute():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path must be absolute",
+        )
+    return target_path
+
+
+async def _upload_file_range(
+    path: str, offset: int, size: int, request: Request
+) -> Success:
+    """Internal helper to write a byte range of a file in the workspace.
+
+    The file is created if needed and truncated or extended to ``size`` before
+    the request body is written at ``offset``, so the ranges of one file can
+    arrive in any order, concurrently, or again after a dropped connection.
+    """
+    update_last_execution_time()
+    target_path = _absolute_file_path(path)
+    try:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = await asyncio.to_thread(
+            os.open, target_path, os.O_WRONLY | os.O_CREAT, 0o666
+        )
+        try:
+            await asyncio.to_thread(os.ftruncate, fd, size)
+            position = offset
+            buffer = bytearray()
+            async for piece in request.stream():
+                if position + len(buffer) + len(piece) > size:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Range extends past the file size",
+                    )
+                buffer += piece
+                if len(buffer) >= _UPLOAD_WRITE_SIZE:
+                    await asyncio.to_thread(os.pwrite, fd, bytes(buffer), position)
+                    position += len(buffer)
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(os.pwrite, fd, bytes(buffer), position)
+        finally:
+            os.close(fd)
+        return Success()
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to upload file range: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to upload file range: {str(e)}",
+        )
+
+
+def _file_checksum(path: Path) -> FileChecksum:
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+    return FileChecksum(size=size, sha256=sha256)
+
+
 def _create_zip_from_directory(source_dir: Path, output_path: Path) -> None:
     """Create a zip archive for source_dir using only Python stdlib APIs.
 
@@ -305,7 +392,7 @@ def _excludes_to_git_pathspecs(excludes: list[str]) -> list[str]:
     A trailing ``/`` marks a directory-only pattern: we emit only the
     contents form (``.../**``) and NOT the bare entry form, so a regular file
     that happens to share the name (e.g. an authored file literally named
-    ``build``) is kept — matching ``_path_is_excluded``'s dir-only carve-out.
+    ``build``) is kept — matching ``path_is_excluded``'s dir-only carve-out.
     Emitting the bare entry too would silently drop such files from the
     git-delta while the tar.gz keeps them.
     """
@@ -446,53 +533,6 @@ def _create_git_delta(
         return ""
 
 
-def _path_is_excluded(rel: PurePosixPath, patterns: list[str], is_dir: bool) -> bool:
-    """True if ``rel`` is excluded by any glob in ``patterns``.
-
-    Mirrors the git-delta path's gitignore semantics so the two formats agree:
-
-    - A trailing ``/`` marks a directory-only pattern: it matches a directory but
-      never a file's own name, so a ``build/`` pattern prunes a ``build``
-      directory while keeping a file literally named ``build``.
-    - A multi-segment pattern (one containing ``/``, e.g. ``secrets/prod``)
-      matches the full relative path or any prefix of it, so it drops both
-      ``secrets/prod`` and everything beneath it.
-    - A bare-name pattern (no ``/``, e.g. ``node_modules`` or ``*.pyc``) matches
-      any single path component, at any depth.
-
-    Dependency-free so no new package is pulled in.
-    """
-    parts = rel.parts
-    for raw in patterns:
-        pattern = raw.rstrip("/")
-        dir_only = raw.endswith("/")
-        if "/" in pattern:
-            # Multi-segment: anchor against the relative path root and match
-            # per-segment so a ``*`` does NOT cross ``/`` (gitignore semantics,
-            # matching the git-delta path). The pattern matches the path itself
-            # or anything nested under it: ``secrets/prod`` drops ``secrets/prod``
-            # and ``secrets/prod/key``; ``*/test`` drops ``a/test`` but not
-            # ``a/b/test``; ``a/*/c`` drops ``a/x/c``.
-            pattern_parts = pattern.split("/")
-            if len(parts) >= len(pattern_parts) and all(
-                fnmatch.fnmatch(part, pat) for part, pat in zip(parts, pattern_parts)
-            ):
-                # A dir-only pattern matches the directory and anything nested
-                # under it, but not a file whose own path equals the pattern.
-                if dir_only and not is_dir and len(parts) == len(pattern_parts):
-                    continue
-                return True
-        else:
-            # Bare name: match any single component. For a dir-only pattern on a
-            # file, skip the basename so a file sharing a directory exclude's
-            # name is not dropped.
-            candidates = parts if (is_dir or not dir_only) else parts[:-1]
-            for part in candidates:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-    return False
-
-
 def _build_archive_manifest(
     source: str, file_count: int, total_bytes: int, excludes: list[str]
 ) -> bytes:
@@ -587,7 +627,7 @@ def _create_tar_gz_archive(root: Path, output_path: Path, excludes: list[str]) -
                 dirnames[:] = [
                     d
                     for d in dirnames
-                    if not _path_is_excluded(base / d, excludes, is_dir=True)
+                    if not path_is_excluded(base / d, excludes, is_dir=True)
                     and not _is_sensitive_git_internal(base / d)
                 ]
                 # Emit a directory member for every surviving directory so empty
@@ -607,7 +647,7 @@ def _create_tar_gz_archive(root: Path, output_path: Path, excludes: list[str]) -
                         logger.warning(f"Skipping unreadable directory {dirpath}: {e}")
                 for name in filenames:
                     rel = base / name
-                    if _path_is_excluded(
+                    if path_is_excluded(
                         rel, excludes, is_dir=False
                     ) or _is_sensitive_git_internal(rel):
                         continue
@@ -659,10 +699,51 @@ async def upload_file_query(
 async def download_file_query(
     path: Annotated[str, Query(description="Absolute file path")],
 ) -> FileResponse:
-    """Download a file from the workspace using query parameter (preferred method)."""
+    """Download a file from the workspace using query parameter (preferred method).
+
+    Honors ``Range`` (and ``If-Range``) headers, so large files can be fetched
+    in parts, in parallel, or resumed from where a dropped connection left off.
+    """
     return await _download_file(path)
 
 
+@file_router.put("/upload_range")
+async def upload_file_range(
+    request: Request,
+    path: Annotated[str, Query(description="Absolute file path")],
+    offset: Annotated[
+        int, Query(ge=0, description="Byte offset to write the request body at")
+    ],
+    size: Annotated[int, Query(ge=0, description="Size of the whole file in bytes")],
+) -> Success:
+    """Write the raw request body into a workspace file at a byte offset."""
+    return await _upload_file_range(path, offset, size, request)
+
+
+@file_router.get("/checksum")
+async def get_file_checksum(
+    path: Annotated[str, Query(description="Absolute file path")],
+) -> FileChecksum:
+    """Get the size and SHA-256 of a workspace file.
+
+    Lets clients skip transferring a file that is already identical.
+    """
+    update_last_execution_time()
+    target_path = _absolute_file_path(path)
+    if not target_path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+        )
+    try:
+        return await asyncio.to_thread(_file_checksum, target_path)
+    except Exception as e:
+        logger.error(f"Failed to checksum file: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to checksum file: {str(e)}",
+        )
+
+
 @file_router.post("/create_directory")
 async def create_directory(
     path: Annotated[str, Query(description="Absolute directory path to create")],
@@ -1063,3 +1144,126 @@ async def archive_directory(
         headers=headers,
         background=BackgroundTask(output_path.unlink, missing_ok=True),
     )
+
+
+def _sync_directory_path(path: str) -> Path:
+    target = _absolute_file_path(path)
+    if target.exists() and not target.is_dir():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path is not a directory",
+        )
+    return target
+
+
+@file_router.post("/sync/manifest")
+async def get_sync_manifest(request: SyncManifestRequest) -> SyncManifest:
+    """List the regular files of a workspace directory for an incremental sync.
+
+    Each entry has the file's size, modification time and permission bits. A
+    missing directory has no files, so the first sync into it sends everything.
+    """
+    update_last_execution_time()
+    target = _sync_directory_path(request.path)
+    try:
+        entries = await asyncio.to_thread(build_manifest, target, request.excludes)
+    except Exception as e:
+        logger.error(f"Failed to list {target} for sync: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list directory: {str(e)}",
+        )
+    return SyncManifest(entries=entries)
+
+
+@file_router.post("/sync/blocks")
+async def get_sync_block_hashes(request: SyncBlocksRequest) -> dict[str, list[str]]:
+    """Hash the blocks of changed files of a workspace directory, by path.
+
+    The sender compares these with its own blocks to send only those that
+    differ. Files that cannot be read are left out, and so are sent whole.
+    """
+    update_last_execution_time()
+    target = _sync_directory_path(request.path)
+    try:
+        return await asyncio.to_thread(
+            block_hashes, target, request.paths, request.block_size
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@file_router.post("/sync/upload")
+async def upload_sync_archive(
+    path: Annotated[str, Query(description="Absolute path of the directory")],
+    file: Annotated[UploadFile, File()],
+) -> SyncStats:
+    """Apply a stream of changes from an incremental sync to a workspace directory.
+
+    The stream is a tar.gz written by ``write_sync_archive`` against this
+    directory's manifest. Each file is written beside its target and renamed
+    over it, so an interrupted sync never leaves a half-written file.
+    """
+    update_last_execution_time()
+    target = _sync_directory_path(path)
+    try:
+        stats = await asyncio.to_thread(apply_sync_archive, file.file, target)
+    except (ValueError, tarfile.TarError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sync stream: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(f"Failed to apply sync to {target}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to apply sync: {str(e)}",
+        )
+    logger.info(
+        f"Synced {stats.files_written} files to {target}, deleted {stats.files_deleted}"
+    )
+    return stats
+
+
+@file_router.post("/sync/download")
+async def download_sync_archive(request: SyncDownloadRequest) -> FileResponse:
+    """Stream the requested files of a workspace directory for an incremental sync.
+
+    Returns a tar.gz for ``apply_sync_archive``. Files given with block hashes
+    carry only their differing blocks; excluded and vanished files are left out.
+    """
+    update_last_execution_time()
+    target = _sync_directory_path(request.path)
+    files = []
+    for file in request.files:
+        try:
+            resolve_sync_path(target, file.path)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        rel = PurePosixPath(file.path)
+        if not path_is_excluded(rel, request.excludes, is_dir=False):
+            files.append(file)
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".tar.gz")
+    output_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            await asyncio.to_thread(write_sync_archive, f, target, files)
+    except Exception as e:
+        output_path.unlink(missing_ok=True)
+        logger.error(f"Failed to write sync stream for {target}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to write sync stream: {str(e)}",
+        )
+    return FileResponse(
+        path=output_path,
+        media_type=_ARCHIVE_MEDIA_TYPE["tar.gz"],
+        background=BackgroundTask(output_path.unlink, missing_ok=True),
+    )
@@ -1,7 +1,10 @@
 import asyncio
+import contextlib
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import TypeVar
+from typing import Any, Literal, TypeVar
 from uuid import UUID, uuid4
 
 from openhands.sdk.logger import get_logger
@@ -21,6 +24,158 @@ class Subscriber[T](ABC):
         """Clean up this subscriber"""
 
 
+BackpressurePolicy = Literal["drop_oldest", "coalesce", "disconnect"]
+"""What a QueuedSubscriber does with an event that arrives when its queue is full.
+
+- ``drop_oldest``: discard the oldest queued event to make room.
+- ``coalesce``: merge the event into the last queued one where the subscriber
+  knows how (streaming deltas); when nothing can be merged, disconnect.
+- ``disconnect``: stop delivering and disconnect the subscriber.
+"""
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Delivery metrics of a QueuedSubscriber."""
+
+    depth: int
+    max_depth: int
+    dropped: int
+    coalesced: int
+    disconnected: bool
+
+
+@dataclass(kw_only=True)
+class QueuedSubscriber[T](Subscriber[T]):
+    """Subscriber that delivers events from its own writer task.
+
+    PubSub encodes each event once per distinct ``encode`` function and pushes
+    the payload into every queued subscriber's bounded queue without awaiting
+    delivery, so the number of subscribers does not multiply serialization
+    cost and a slow consumer cannot hold up the publisher or its siblings.
+    What happens when the queue is full is decided by ``policy``. ``close``
+    delivers what is still queued, giving up after ``close_timeout`` seconds.
+    """
+
+    max_queue_size: int = 1024
+    policy: BackpressurePolicy = "coalesce"
+    close_timeout: float = 1.0
+    _queue: deque[tuple[T, Any]] = field(default_factory=deque, init=False)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _writer: asyncio.Task | None = field(default=None, init=False)
+    _max_depth: int = field(default=0, init=False)
+    _dropped: int = field(default=0, init=False)
+    _coalesced: int = field(default=0, init=False)
+    _disconnected: bool = field(default=False, init=False)
+
+    @staticmethod
+    @abstractmethod
+    def encode(event: T) -> Any:
+        """Encode an event into the payload handed to ``send``."""
+
+    @abstractmethod
+    async def send(self, event: T, payload: Any) -> None:
+        """Deliver one encoded event."""
+
+    async def disconnect(self) -> None:
+        """Disconnect a consumer that fell too far behind."""
+
+    def coalesce(self, _queued: T, _event: T) -> T | None:
+        """Merge ``event`` into the ``queued`` event not yet sent, if possible."""
+        return None
+
+    async def __call__(self, event: T):
+        self.offer(event, self.encode(event))
+
+    def offer(self, event: T, payload: Any) -> None:
+        """Queue an already-encoded event for delivery without waiting for it."""
+        if self._disconnected:
+            return
+        queue = self._queue
+        if queue and self.policy == "coalesce":
+            # A non-empty queue means the consumer is lagging: merging saves
+            # it frames without losing content.
+            merged = self.coalesce(queue[-1][0], event)
+            if merged is not None:
+                queue[-1] = (merged, self.encode(merged))
+                self._coalesced += 1
+                return
+        if len(queue) >= self.max_queue_size:
+            if self.policy != "drop_oldest":
+                self._disconnect()
+                return
+            queue.popleft()
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 100 == 0:
+                logger.warning(
+                    f"Subscriber queue full: dropped {self._dropped} event(s) so far"
+                )
+        queue.append((event, payload))
+        self._max_depth = max(self._max_depth, len(queue))
+        self._ready.set()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write())
+
+    @property
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            depth=len(self._queue),
+            max_depth=self._max_depth,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            disconnected=self._disconnected,
+        )
+
+    async def _write(self) -> None:
+        queue = self._queue
+        while True:
+            if not queue:
+                if self._disconnected:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            event, payload = queue.popleft()
+            try:
+                await self.send(event, payload)
+            except Exception as e:
+                logger.error(f"Error delivering queued event: {e}", exc_info=True)
+
+    def _disconnect(self) -> None:
+        logger.warning(
+            f"Subscriber queue full ({self.max_queue_size} events): disconnecting "
+            "slow consumer"
+        )
+        self._disconnected = True
+        self._queue.clear()
+        writer = self._writer
+        self._writer = asyncio.create_task(self._stop(writer))
+
+    async def _stop(self, writer: asyncio.Task | None) -> None:
+        # The writer is most likely stuck sending to the slow consumer.
+        if writer is not None:
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writer
+        await self.disconnect()
+
+    async def close(self):
+        writer, self._writer = self._writer, None
+        self._disconnected = True
+        if writer is not None and writer is not asyncio.current_task():
+            # Let the writer send what is queued (e.g. a final state update)
+            # and exit, but do not let a stuck consumer hold up shutdown.
+            self._ready.set()
+            try:
+                await asyncio.wait({writer}, timeout=self.close_timeout)
+            finally:
+                if not writer.done():
+                    writer.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await writer
+        self._queue.clear()
+
+
 class MaxSubscribersError(Exception):
     """Raised when a PubSub instance has reached its subscriber limit."""
 
@@ -78,15 +233,40 @@ class PubSub[T]:
         """Return the ids of all currently-registered subscribers."""
         return set(self._subscribers.keys())
 
+    def queue_stats(self) -> dict[UUID, QueueStats]:
+        """Return the delivery metrics of every queued subscriber."""
+        return {
+            subscriber_id: subscriber.stats
+            for subscriber_id, subscriber in self._subscribers.items()
+            if isinstance(subscriber, QueuedSubscriber)
+        }
+
     async def __call__(self, event: T) -> None:
         """Invoke all registered callbacks with the given event.
         Subscribers are notified concurrently so a slow client cannot
         block delivery to others.  Each callback runs in its own
-        error-handling wrapper to preserve fault isolation.
+        error-handling wrapper to preserve fault isolation.  Queued
+        subscribers are handed the event encoded once per encoder and are
+        not awaited.
         Args:
             event: The event to pass to all callbacks
         """
-        subscribers = list(self._subscribers.items())
+        subscribers = []
+        encoded: dict[Callable[[T], Any], Any] = {}
+        for subscriber_id, subscriber in list(self._subscribers.items()):
+            if not isinstance(subscriber, QueuedSubscriber):
+                subscribers.append((subscriber_id, subscriber))
+                continue
+            encode = type(subscriber).encode
+            try:
+                if encode not in encoded:
+                    encoded[encode] = encode(event)
+                subscriber.offer(event, encoded[encode])
+            except Exception as e:
+                logger.error(
+                    f"Error in subscriber {subscriber_id}: {e}",
+                    exc_info=True,
+                )
         if not subscribers:
             return
 
@@ -46,8 +46,13 @@ from openhands.agent_server.models import (
     ExecuteBashRequest,
     ServerErrorEvent,
 )
-from openhands.agent_server.pub_sub import MaxSubscribersError, Subscriber
+from openhands.agent_server.pub_sub import (
+    MaxSubscribersError,
+    QueuedSubscriber,
+    Subscriber,
+)
 from openhands.sdk import Event, Message
+from openhands.sdk.event import StreamingDeltaEvent
 from openhands.sdk.utils.paging import page_iterator
 
 
@@ -294,10 +299,9 @@ async def events_socket(
         await websocket.close(code=4004, reason="Conversation not found")
         return
 
+    subscriber = _event_subscriber(websocket)
     try:
-        subscriber_id = await event_service.subscribe_to_events(
-            _WebSocketSubscriber(websocket)
-        )
+        subscriber_id = await event_service.subscribe_to_events(subscriber)
     except MaxSubscribersError:
         logger.warning(f"Subscriber limit reached for conversation {conversation_id}")
         await websocket.close(
@@ -381,6 +385,7 @@ async def events_socket(
                     return
     finally:
         await event_service.unsubscribe_from_events(subscriber_id)
+        await subscriber.close()
 
 
 @sockets_router.websocket("/bash-events")
@@ -420,10 +425,9 @@ async def bash_events_socket(
 
     bash_service = _get_bash_event_service(websocket)
     logger.info("Bash Websocket Connected")
+    subscriber = _bash_event_subscriber(websocket)
     try:
-        subscriber_id = await bash_service.subscribe_to_events(
-            _BashWebSocketSubscriber(websocket)
-        )
+        subscriber_id = await bash_service.subscribe_to_events(subscriber)
     except MaxSubscribersError:
         logger.warning("Subscriber limit reached for bash events")
         await websocket.close(code=1013, reason="Too many bash event connections")
@@ -477,16 +481,21 @@ async def bash_events_socket(
                     return
     finally:
         await bash_service.unsubscribe_from_events(subscriber_id)
+        await subscriber.close()
 
 
-async def _send_event(event: Event, websocket: WebSocket):
+async def _send_event(event: Event, websocket: WebSocket, payload: str | None = None):
+    """Send an event, or its already-encoded ``payload``, over the websocket."""
     if not _is_websocket_connected(websocket):
         # Client already disconnected; the pub/sub callback was racing with
         # cleanup. Avoid noisy tracebacks from starlette refusing to send.
         logger.debug("skip_sending_event_socket_disconnected: %r", event)
         return
     try:
-        await websocket.send_json(event.model_dump(mode="json", exclude_none=True))
+        if payload is None:
+            await websocket.send_json(event.model_dump(mode="json", exclude_none=True))
+        else:
+            await websocket.send_text(payload)
     except (RuntimeError, WebSocketDisconnect) as e:
         # Expected race: client disconnected between our state check and send.
         logger.debug("error_sending_event_disconnected: %r (%s)", event, e)
@@ -545,7 +554,60 @@ class _WebSocketSubscriber(Subscriber):
         await _send_event(event, self.websocket)
 
 
-async def _send_bash_event(event: BashEventBase, websocket: WebSocket):
+@dataclass
+class _QueuedWebSocketSubscriber(QueuedSubscriber[Event]):
+    """WebSocket subscriber for conversation events, written from its own task."""
+
+    websocket: WebSocket
+
+    @staticmethod
+    def encode(event: Event) -> str:
+        return event.model_dump_json(exclude_none=True)
+
+    async def send(self, event: Event, payload: str) -> None:
+        await _send_event(event, self.websocket, payload)
+
+    async def disconnect(self) -> None:
+        await _safe_close_websocket(
+            self.websocket, code=1013, reason="Client too slow to keep up"
+        )
+
+    def coalesce(self, queued: Event, event: Event) -> Event | None:
+        if not (
+            isinstance(queued, StreamingDeltaEvent)
+            and isinstance(event, StreamingDeltaEvent)
+        ):
+            return None
+        return queued.model_copy(
+            update={
+                "content": _concat(queued.content, event.content),
+                "reasoning_content": _concat(
+                    queued.reasoning_content, event.reasoning_content
+                ),
+            }
+        )
+
+
+def _concat(first: str | None, second: str | None) -> str | None:
+    if first is None:
+        return second
+    return first + (second or "")
+
+
+def _event_subscriber(websocket: WebSocket) -> Subscriber[Event]:
+    config = _get_config(websocket)
+    if not config.websocket_send_queue_size:
+        return _WebSocketSubscriber(websocket)
+    return _QueuedWebSocketSubscriber(
+        websocket,
+        max_queue_size=config.websocket_send_queue_size,
+        policy=config.websocket_backpressure_policy,
+    )
+
+
+async def _send_bash_event(
+    event: BashEventBase, websocket: WebSocket, payload: str | None = None
+):
     metadata: dict[str, str | int | None] = {
         "kind": event.kind,
         "event_id": str(event.id),
@@ -564,8 +626,10 @@ async def _send_bash_event(event: BashEventBase, websocket: WebSocket):
         logger.debug("skip_sending_bash_event_socket_disconnected: %s", metadata)
         return
     try:
-        dumped = event.model_dump(mode="json")
-        await websocket.send_json(dumped)
+        if payload is None:
+            await websocket.send_json(event.model_dump(mode="json"))
+        else:
+            await websocket.send_text(payload)
     except (RuntimeError, WebSocketDisconnect) as e:
         logger.debug(
             "error_sending_bash_event_disconnected: %s (error_type=%s)",
@@ -589,3 +653,33 @@ class _BashWebSocketSubscriber(Subscriber[BashEventBase]):
 
     async def __call__(self, event: BashEventBase):
         await _send_bash_event(event, self.websocket)
+
+
+@dataclass
+class _QueuedBashWebSocketSubscriber(QueuedSubscriber[BashEventBase]):
+    """WebSocket subscriber for bash events, written from its own task."""
+
+    websocket: WebSocket
+
+    @staticmethod
+    def encode(event: BashEventBase) -> str:
+        return event.model_dump_json()
+
+    async def send(self, event: BashEventBase, payload: str) -> None:
+        await _send_bash_event(event, self.websocket, payload)
+
+    async def disconnect(self) -> None:
+        await _safe_close_websocket(
+            self.websocket, code=1013, reason="Client too slow to keep up"
+        )
+
+
+def _bash_event_subscriber(websocket: WebSocket) -> Subscriber[BashEventBase]:
+    config = _get_config(websocket)
+    if not config.websocket_send_queue_size:
+        return _BashWebSocketSubscriber(websocket)
+    return _QueuedBashWebSocketSubscriber(
+        websocket,
+        max_queue_size=config.websocket_send_queue_size,
+        policy=config.websocket_backpressure_policy,
+    )
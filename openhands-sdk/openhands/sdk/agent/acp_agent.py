@@ -75,6 +75,7 @@ from openhands.sdk.agent.acp_models import ACPModelInfo
 from openhands.sdk.agent.acp_tracing import ACPTurnTrace
 from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.context import AgentContext
+from openhands.sdk.conversation.secret_masker import StreamingSecretMasker
 from openhands.sdk.conversation.state import ConversationExecutionStatus
 from openhands.sdk.credential import (
     CredentialBindingError,
@@ -1152,6 +1153,12 @@ class _OpenHandsACPBridge:
         # injected credential never lands in the (persisted, network-relayed)
         # event stream in cleartext. ``None`` ⇒ no-op (bridge used standalone).
         self.mask: Callable[[str], str] | None = None
+        # Factory for the turn's ``StreamingSecretMasker`` — bound with
+        # ``mask``. The live ``on_token`` relay runs through it so a secret
+        # split across two chunks is masked there too. ``None`` ⇒ chunks are
+        # relayed as masked by ``mask`` alone.
+        self.stream_masker: Callable[[], StreamingSecretMasker] | None = None
+        self._token_stream: StreamingSecretMasker | None = None
         self.before_mask: Callable[[], None] | None = None
         self._masking_error: CredentialBindingError | None = None
         self._last_activity_signal: float = float("-inf")
@@ -1184,6 +1191,7 @@ class _OpenHandsACPBridge:
         self._turn_usage_updates.clear()
         self._usage_received.clear()
         self._masking_error = None
+        self._token_stream = None
         # Note: telemetry state (_last_cost, _context_window, _last_activity_signal,
         # etc.) is intentionally NOT cleared — it accumulates across turns.
 
@@ -1246,6 +1254,43 @@ class _OpenHandsACPBridge:
             logger.debug("secret masking failed", exc_info=True)
             return value
 
+    def _stream_mask(self, text: str) -> str:
+        """Pass a (chunk-masked) token through the turn's stream masker.
+
+        Returns the text that is safe to relay now, which may be empty while
+        the masker holds back a possible secret prefix. Falls back to *text*
+        on failure, like ``_mask_value``.
+        """
+        if self.stream_masker is None:
+            return text
+        try:
+            if self._token_stream is None:
+                self._token_stream = self.stream_masker()
+            return self._token_stream.feed(text)
+        except Exception:
+            logger.debug("streaming secret masking failed", exc_info=True)
+            return text
+
+    def flush_token_stream(self) -> None:
+        """Relay the text the stream masker held back, at the end of a turn."""
+        stream, self._token_stream = self._token_stream, None
+        if stream is None or self.on_token is None:
+            return
+        try:
+            text = stream.flush()
+        except Exception:
+            logger.debug("streaming secret masking failed", exc_info=True)
+            return
+        self._relay_token(text)
+
+    def _relay_token(self, text: str) -> None:
+        if not text or self.on_token is None:
+            return
+        try:
+            self.on_token(text)
+        except Exception:
+            logger.debug("on_token callback failed", exc_info=True)
+
     def _mask_tool_call_entry(self, entry: dict[str, Any]) -> None:
         """Mask title / raw_input / raw_output / content of a tool-call entry.
 
@@ -1297,16 +1342,14 @@ class _OpenHandsACPBridge:
             if isinstance(update.content, TextContentBlock):
                 # Mask once, then use the masked chunk for both the persisted
                 # accumulation and the live ``on_token`` relay. A secret split
-                # across two chunks slips through here (each piece alone won't
-                # match); the joined response is re-masked at the persistence
-                # boundary in ``_finalize_successful_turn`` to catch that.
+                # across two chunks slips through the per-chunk mask (each piece
+                # alone won't match): the relay catches it in the stream masker,
+                # and the joined response is re-masked at the persistence
+                # boundary in ``_finalize_successful_turn``.
                 text = self._mask_value(update.content.text)
                 self.accumulated_text.append(text)
                 if self.on_token is not None:
-                    try:
-                        self.on_token(text)
-                    except Exception:
-                        logger.debug("on_token callback failed", exc_info=True)
+                    self._relay_token(self._stream_mask(text))
             self._maybe_signal_activity()
         elif isinstance(update, AgentThoughtChunk):
             if isinstance(update.content, TextContentBlock):
@@ -2596,6 +2639,7 @@ class ACPAgent(AgentBase):
         # session updates AND for ask_agent() forks, which run on the shared
         # client and may fire while no step()/astep() turn is active.
         client.mask = state.secret_registry.mask_secrets_in_output
+        client.stream_masker = state.secret_registry.streaming_masker
         self._bind_file_credential_masking()
 
         # Build the subprocess environment. Precedence, highest first:
@@ -3395,6 +3439,7 @@ class ACPAgent(AgentBase):
         # server opened but never terminated so every ``started`` has its
         # matching terminal observation before the turn's FinishAction lands.
         self._flush_inflight_tool_calls_as_completed()
+        self._client.flush_token_stream()
 
         # Re-mask the joined text at this persistence boundary: the chunks were
         # already masked individually as they streamed, but a secret split
@@ -678,7 +678,10 @@ class Agent(CriticMixin, ResponseDispatchMixin, AgentBase):
         # Prepare LLM messages from the cached, incrementally-maintained view.
         # See https://github.com/OpenHands/software-agent-sdk/issues/3053.
         _messages_or_condensation = prepare_llm_messages(
-            state.view, condenser=self.condenser, llm=self.llm
+            state.view,
+            condenser=self.condenser,
+            llm=self.llm,
+            message_cache=state.message_projection,
         )
 
         # Process condensation event before agent sampels another action
@@ -872,7 +875,10 @@ class Agent(CriticMixin, ResponseDispatchMixin, AgentBase):
         # Prepare LLM messages from the cached, incrementally-maintained view.
         # See https://github.com/OpenHands/software-agent-sdk/issues/3053.
         _messages_or_condensation = await aprepare_llm_messages(
-            state.view, condenser=self.condenser, llm=self.llm
+            state.view,
+            condenser=self.condenser,
+            llm=self.llm,
+            message_cache=state.message_projection,
         )
 
         if isinstance(_messages_or_condensation, Condensation):
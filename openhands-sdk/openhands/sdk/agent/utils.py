@@ -26,7 +26,7 @@ from pydantic import BaseModel
 from openhands.sdk.context.condenser.base import CondenserBase
 from openhands.sdk.context.view import View
 from openhands.sdk.conversation.types import ConversationTokenCallbackType
-from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.event.base import LLMConvertibleEvent, MessageProjectionCache
 from openhands.sdk.event.condenser import Condensation
 from openhands.sdk.llm import LLM, LLMResponse, Message
 from openhands.sdk.tool import ToolDefinition
@@ -574,6 +574,7 @@ def prepare_llm_messages(
     condenser: None = None,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    message_cache: MessageProjectionCache | None = None,
 ) -> list[Message]: ...
 
 
@@ -583,6 +584,7 @@ def prepare_llm_messages(
     condenser: CondenserBase,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    message_cache: MessageProjectionCache | None = None,
 ) -> list[Message] | Condensation: ...
 
 
@@ -591,6 +593,7 @@ def prepare_llm_messages(
     condenser: CondenserBase | None = None,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    message_cache: MessageProjectionCache | None = None,
 ) -> list[Message] | Condensation:
     """Prepare LLM messages from a conversation view.
 
@@ -610,6 +613,9 @@ def prepare_llm_messages(
         additional_messages: Optional additional messages to append
         llm: Optional LLM instance from the agent, passed to condenser for
             token counting or other LLM features
+        message_cache: Optional per-conversation cache (usually
+            `ConversationState.message_projection`) that lets unchanged events
+            reuse the Messages converted on earlier steps
 
     Returns:
         List of messages ready for LLM completion, or a Condensation event
@@ -632,7 +638,9 @@ def prepare_llm_messages(
                 return condensation_result
 
     # Convert events to messages
-    messages = LLMConvertibleEvent.events_to_messages(llm_convertible_events)
+    messages = LLMConvertibleEvent.events_to_messages(
+        llm_convertible_events, cache=message_cache
+    )
 
     # Add any additional messages (e.g., user question for ask_agent)
     if additional_messages:
@@ -702,6 +710,7 @@ async def aprepare_llm_messages(
     condenser: CondenserBase | None = None,
     additional_messages: list[Message] | None = None,
     llm: LLM | None = None,
+    message_cache: MessageProjectionCache | None = None,
 ) -> list[Message] | Condensation:
     """Async variant of :func:`prepare_llm_messages`.
 
@@ -719,7 +728,9 @@ async def aprepare_llm_messages(
             case Condensation():
                 return condensation_result
 
-    messages = LLMConvertibleEvent.events_to_messages(llm_convertible_events)
+    messages = LLMConvertibleEvent.events_to_messages(
+        llm_convertible_events, cache=message_cache
+    )
 
     if additional_messages:
         messages.extend(additional_messages)
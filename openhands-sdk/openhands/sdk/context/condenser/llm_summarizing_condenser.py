@@ -3,17 +3,14 @@ from collections.abc import Sequence
 from enum import Enum
 from typing import Final
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from openhands.sdk.context.condenser.base import (
     CondensationRequirement,
     NoCondensationAvailableException,
     RollingCondenser,
 )
-from openhands.sdk.context.condenser.utils import (
-    get_suffix_length_for_token_reduction,
-    get_total_token_count,
-)
+from openhands.sdk.context.condenser.token_accounting import TokenAccounting
 from openhands.sdk.context.prompts import render_template
 from openhands.sdk.context.view import View
 from openhands.sdk.event.base import LLMConvertibleEvent
@@ -70,6 +67,8 @@ class LLMSummarizingCondenser(RollingCondenser):
     size of each event string by this factor and retry.
     """
 
+    _token_accounting: TokenAccounting | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_keep_first_vs_max_size(self):
         events_from_tail = self.max_size // 2 - self.keep_first - 1
@@ -114,6 +113,17 @@ class LLMSummarizingCondenser(RollingCondenser):
         ]
         return min(limits) if limits else None
 
+    def _token_accounting_for(self, agent_llm: LLM) -> TokenAccounting:
+        """Return the token accounting for the agent LLM's tokenizer.
+
+        Per-event counts survive across steps, so each check only tokenizes the
+        events added since the previous one.
+        """
+        accounting = self._token_accounting
+        if accounting is None or not accounting.matches(agent_llm):
+            accounting = self._token_accounting = TokenAccounting(agent_llm)
+        return accounting
+
     def get_condensation_reasons(
         self, view: View, agent_llm: LLM | None = None
     ) -> set[Reason]:
@@ -136,7 +146,7 @@ class LLMSummarizingCondenser(RollingCondenser):
         # Reason 2: Token limit is provided and exceeded.
         max_tokens = self._effective_max_tokens(agent_llm)
         if max_tokens is not None and agent_llm is not None:
-            total_tokens = get_total_token_count(view.events, agent_llm)
+            total_tokens = self._token_accounting_for(agent_llm).total(view.events)
             if total_tokens > max_tokens:
                 logger.info(
                     "Condenser token limit exceeded: total_tokens=%d max_tokens=%d "
@@ -282,13 +292,13 @@ class LLMSummarizingCondenser(RollingCondenser):
             assert max_tokens is not None
             assert agent_llm is not None
 
-            total_tokens = get_total_token_count(view.events, agent_llm)
+            accounting = self._token_accounting_for(agent_llm)
+            total_tokens = accounting.total(view.events)
             tokens_to_reduce = total_tokens - (max_tokens // 2)
 
             suffix_events_to_keep.add(
-                get_suffix_length_for_token_reduction(
+                accounting.suffix_length_for_reduction(
                     events=view.events[self.keep_first :],
-                    llm=agent_llm,
                     token_reduction=tokens_to_reduce,
                     base_events=view.events[: self.keep_first],
                 )
@@ -0,0 +1,149 @@
+"""Incremental token accounting for condenser context-size checks.
+
+``get_total_token_count`` re-tokenizes the whole view on every call, and the
+prefix search in ``get_shortest_prefix_above_token_count`` re-tokenizes
+``O(log n)`` prefixes on top of that. ``TokenAccounting`` instead tokenizes
+every event once, in isolation, and keeps prefix sums over the last view it
+saw. Later views that share a prefix with it (a view that grew by a few
+events, or one that was condensed) only pay for the events that are new.
+
+The count of an event is the token count of its messages minus the fixed
+per-request overhead (reply priming, chat-template preamble) measured on an
+empty request, and tool schemas are counted once per system prompt. The
+resulting totals approximate the whole-list count: they differ by what the
+tokenizer does across message boundaries, which is negligible next to the
+condensation thresholds.
+"""
+
+import threading
+from bisect import bisect_right
+from collections.abc import Sequence
+
+from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.event.llm_convertible.system import SystemPromptEvent
+from openhands.sdk.event.types import EventID
+from openhands.sdk.llm import LLM
+
+
+class TokenAccounting:
+    """Per-event token counts and running totals for one LLM.
+
+    The LLM instance pins the model and tokenizer the counts are valid for.
+    Counts are cached by event id (events are immutable) and tool schema
+    counts by the id of the system prompt event that declares them.
+    """
+
+    def __init__(self, llm: LLM):
+        self.llm = llm
+        self._overhead: int | None = None
+        self._event_tokens: dict[EventID, int] = {}
+        self._tools_tokens: dict[EventID, int] = {}
+        # Prefix sums over the last sequence of events seen:
+        # ``_prefix_sums[i]`` is the token count of ``_sequence[:i]``.
+        self._sequence: list[EventID] = []
+        self._prefix_sums: list[int] = [0]
+        self._lock = threading.Lock()
+
+    def matches(self, llm: LLM) -> bool:
+        """Whether the cached counts are valid for ``llm``."""
+        return llm is self.llm
+
+    def __len__(self) -> int:
+        return len(self._event_tokens)
+
+    def total(self, events: Sequence[LLMConvertibleEvent]) -> int:
+        """Token count of ``events``, tool schemas included."""
+        with self._lock:
+            prefix_sums = self._sync(events)
+            return (
+                self._request_overhead() + self._tools_count(events) + prefix_sums[-1]
+            )
+
+    def shortest_prefix_above(
+        self,
+        events: Sequence[LLMConvertibleEvent],
+        token_count: int,
+        base_events: Sequence[LLMConvertibleEvent] | None = None,
+    ) -> int:
+        """Prefix-sum version of ``get_shortest_prefix_above_token_count``."""
+        if not events:
+            return 0
+        base_events = base_events or []
+        start = len(base_events)
+        with self._lock:
+            prefix_sums = self._sync([*base_events, *events])
+            target = prefix_sums[start] + token_count
+            end = bisect_right(prefix_sums, target, lo=start + 1)
+        return min(end - start, len(events))
+
+    def suffix_length_for_reduction(
+        self,
+        events: Sequence[LLMConvertibleEvent],
+        token_reduction: int,
+        base_events: Sequence[LLMConvertibleEvent] | None = None,
+    ) -> int:
+        """Prefix-sum version of ``get_suffix_length_for_token_reduction``."""
+        if not events:
+            return 0
+        if token_reduction <= 0:
+            return len(events)
+        return len(events) - self.shortest_prefix_above(
+            events, token_reduction, base_events=base_events
+        )
+
+    def _sync(self, events: Sequence[LLMConvertibleEvent]) -> list[int]:
+        """Make the prefix sums describe ``events`` and return them.
+
+        The prefix shared with the previous sequence is kept; only the sums
+        after the first differing event are recomputed.
+        """
+        shared = 0
+        limit = min(len(events), len(self._sequence))
+        while shared < limit and events[shared].id == self._sequence[shared]:
+            shared += 1
+        del self._sequence[shared:]
+        del self._prefix_sums[shared + 1 :]
+        for event in events[shared:]:
+            self._sequence.append(event.id)
+            self._prefix_sums.append(self._prefix_sums[-1] + self._event_count(event))
+        return self._prefix_sums
+
+    def _request_overhead(self) -> int:
+        if self._overhead is None:
+            self._overhead = self.llm.get_token_count([])
+        return self._overhead
+
+    def _event_count(self, event: LLMConvertibleEvent) -> int:
+        count = self._event_tokens.get(event.id)
+        if count is None:
+            messages = LLMConvertibleEvent.events_to_messages([event])
+            count = max(
+                0, self.llm.get_token_count(messages) - self._request_overhead()
+            )
+            self._event_tokens[event.id] = count
+        return count
+
+    def _tools_count(self, events: Sequence[LLMConvertibleEvent]) -> int:
+        # Like ``get_total_token_count``, only the first system prompt's tools
+        # are sent with the request.
+        system = next(
+            (event for event in events if isinstance(event, SystemPromptEvent)),
+            None,
+        )
+        if system is None or not system.tools:
+            return 0
+        count = self._tools_tokens.get(system.id)
+        if count is None:
+            message = system.to_llm_message()
+            count = max(
+                0,
+                self.llm.get_token_count(
+                    [message],
+                    tools=system.tools,
+                    # Security-risk tokens are always included in real tool requests.
+                    add_security_risk_prediction=True,
+                )
+                - self.llm.get_token_count([message]),
+            )
+            self._tools_tokens[system.id] = count
+        return count
@@ -1,7 +1,7 @@
 from openhands.sdk.conversation.base import BaseConversation
 from openhands.sdk.conversation.cancellation import CancellationToken
 from openhands.sdk.conversation.conversation import Conversation
-from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.event_store import EventLog, EventLogFormat
 from openhands.sdk.conversation.events_list_base import EventsListBase
 from openhands.sdk.conversation.exceptions import WebSocketConnectionError
 from openhands.sdk.conversation.impl.local_conversation import LocalConversation
@@ -15,6 +15,7 @@ from openhands.sdk.conversation.secret_registry import SecretRegistry
 from openhands.sdk.conversation.state import (
     ConversationExecutionStatus,
     ConversationState,
+    StatePersistenceMode,
 )
 from openhands.sdk.conversation.stuck_detector import StuckDetector
 from openhands.sdk.conversation.types import (
@@ -34,6 +35,7 @@ __all__ = [
     "BaseConversation",
     "ConversationState",
     "ConversationExecutionStatus",
+    "StatePersistenceMode",
     "ConversationCallbackType",
     "ConversationTags",
     "ConversationTokenCallbackType",
@@ -42,6 +44,7 @@ __all__ = [
     "SecretRegistry",
     "StuckDetector",
     "EventLog",
+    "EventLogFormat",
     "ResourceLockManager",
     "ResourceLockTimeout",
     "LocalConversation",
@@ -0,0 +1,150 @@
+"""Bounded cache of deserialized events for :class:`EventLog`.
+
+Events are persisted on disk, so the cache only saves re-reading and
+re-validating them. It is bounded both by entry count and by the size of the
+events' serialized payloads (a cheap proxy for their in-memory footprint,
+which is dominated by large observation text and images). Evicted events are
+hydrated lazily from disk on their next access.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from openhands.sdk.event import Event
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+EVENT_CACHE_MAX_EVENTS_ENV = "OPENHANDS_EVENT_CACHE_MAX_EVENTS"
+EVENT_CACHE_MAX_BYTES_ENV = "OPENHANDS_EVENT_CACHE_MAX_BYTES"
+DEFAULT_EVENT_CACHE_MAX_EVENTS = 2048
+DEFAULT_EVENT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_EVENT_CACHE_PIN_RECENT = 64
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Invalid %s=%r; using %d", name, value, default)
+        return default
+
+
+class EventCacheStats(NamedTuple):
+    """Counters describing an :class:`EventCache`, for sizing deployments."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class EventCache:
+    """LRU cache of events keyed by log index, bounded by count and bytes.
+
+    The ``pin_recent`` highest indices seen so far are never evicted, so the
+    tail of the conversation (what the agent loop and clients read most) stays
+    resident however large older events are. An event whose payload alone
+    exceeds ``max_bytes`` is not cached.
+    """
+
+    def __init__(
+        self,
+        max_events: int | None = None,
+        max_bytes: int | None = None,
+        pin_recent: int = DEFAULT_EVENT_CACHE_PIN_RECENT,
+    ) -> None:
+        self.max_events = max(
+            1,
+            max_events
+            if max_events is not None
+            else _env_int(EVENT_CACHE_MAX_EVENTS_ENV, DEFAULT_EVENT_CACHE_MAX_EVENTS),
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else _env_int(EVENT_CACHE_MAX_BYTES_ENV, DEFAULT_EVENT_CACHE_MAX_BYTES)
+        )
+        self.pin_recent = pin_recent
+        self._entries: OrderedDict[int, tuple[Event, int]] = OrderedDict()
+        self._bytes = 0
+        self._newest = -1
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> EventCacheStats:
+        with self._lock:
+            return EventCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def get(self, idx: int) -> Event | None:
+        """Return the cached event at ``idx`` (marking it recently used)."""
+        with self._lock:
+            entry = self._entries.get(idx)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(idx)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, idx: int, event: Event, nbytes: int) -> None:
+        """Cache ``event`` at ``idx``; ``nbytes`` is its serialized size."""
+        if nbytes > self.max_bytes:
+            logger.debug(
+                f"Event {idx} too large for cache ({nbytes} bytes > "
+                f"{self.max_bytes} bytes), skipping cache"
+            )
+            return
+        with self._lock:
+            old = self._entries.pop(idx, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[idx] = (event, nbytes)
+            self._bytes += nbytes
+            self._newest = max(self._newest, idx)
+            self._evict()
+
+    def __setitem__(self, idx: int, event: Event) -> None:
+        self.put(idx, event, len(event.model_dump_json(exclude_none=True)))
+
+    def __contains__(self, idx: object) -> bool:
+        return idx in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries; the hit/miss/eviction counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._newest = -1
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self.max_events and self._bytes <= self.max_bytes:
+            return
+        pinned_from = self._newest - self.pin_recent + 1
+        for idx in list(self._entries):
+            if len(self._entries) <= self.max_events and self._bytes <= self.max_bytes:
+                return
+            if idx >= pinned_from:
+                continue
+            _, nbytes = self._entries.pop(idx)
+            self._bytes -= nbytes
+            self._evictions += 1
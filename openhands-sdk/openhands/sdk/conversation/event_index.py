@@ -0,0 +1,242 @@
+"""Persistent secondary index over an :class:`EventLog` for search and count.
+
+Each event gets one JSON line in a sidecar file recording its log index, kind
+(``module.ClassName``), source and timestamp, plus, for message events, the
+lowercase word tokens of their searchable text. Filters on kind, source and
+timestamp and their counts are answered from these rows without reading or
+validating event payloads; the tokens form an inverted index that narrows
+``body`` searches to a few candidate events, which the caller still verifies
+against the full text.
+
+The index is opt-in: ``EventLog`` only records rows on append once its
+``search_index`` has been used (or the sidecar already exists when the log is
+opened), so conversations that are never searched pay nothing for it. Rows are
+then appended under the log's lock, so the sidecar grows incrementally; events
+written before it existed are backfilled once.
+"""
+
+import json
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from openhands.sdk.event import Event
+from openhands.sdk.io import FileStore
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def event_kind(event: Event) -> str:
+    """Fully qualified class name, the ``kind`` used by event search filters."""
+    return f"{event.__class__.__module__}.{event.__class__.__name__}"
+
+
+def event_search_text(event: Event) -> str | None:
+    """Lowercase text a ``body`` search matches against, or None if not searchable.
+
+    Only message events are searchable: their message content, extended
+    content and reasoning content.
+    """
+    # Import here to avoid circular imports
+    from openhands.sdk.event.llm_convertible.message import MessageEvent
+    from openhands.sdk.llm.message import content_to_str
+
+    if not isinstance(event, MessageEvent):
+        return None
+    text_parts = content_to_str(event.llm_message.content)
+    if event.extended_content:
+        text_parts.extend(content_to_str(event.extended_content))
+    if event.reasoning_content:
+        text_parts.append(event.reasoning_content)
+    return " ".join(text_parts).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class EventIndexRow(NamedTuple):
+    """Indexed attributes of one event."""
+
+    kind: str
+    source: str
+    timestamp: str
+    searchable: bool
+
+
+class EventSearchIndex:
+    """Append-only sidecar of per-event search attributes.
+
+    The caller (``EventLog``) serializes writers with its file lock; readers
+    pick up rows written by other processes via :meth:`refresh`, which only
+    reads the unread tail of the sidecar. The in-memory rows are guarded by a
+    lock of their own, since searches read them from other threads than the
+    one appending events.
+    """
+
+    def __init__(self, fs: FileStore, path: str, index_body: bool = True) -> None:
+        self._fs = fs
+        self._path = path
+        self.index_body = index_body
+        self._rows: dict[int, EventIndexRow] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._pos = 0
+        # Until first read, appends go straight to disk without loading rows.
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, idx: object) -> bool:
+        return idx in self._rows
+
+    def get(self, idx: int) -> EventIndexRow | None:
+        return self._rows.get(idx)
+
+    def refresh(self) -> None:
+        """Load rows appended to the sidecar since the last refresh."""
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        self._loaded = True
+        try:
+            data = self._fs.read_range(self._path, self._pos)
+        except FileNotFoundError:
+            return
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+        self._pos += end
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            try:
+                entry = json.loads(line)
+                idx = int(entry["i"])
+                row = EventIndexRow(
+                    kind=entry["k"],
+                    source=entry["s"],
+                    timestamp=entry["t"],
+                    searchable=bool(entry.get("b")),
+                )
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Skipping malformed event index line: %r", line)
+                continue
+            self._add(idx, row, entry.get("w") or ())
+
+    def record(self, idx: int, event: Event) -> None:
+        """Append the row for ``event`` at ``idx``; caller must hold the log lock."""
+        self.record_many([(idx, event)])
+
+    def record_many(self, items: Iterable[tuple[int, Event]]) -> None:
+        """Append rows for several events with a single write."""
+        with self._lock:
+            self._record_many(items)
+
+    def _record_many(self, items: Iterable[tuple[int, Event]]) -> None:
+        if self._loaded:
+            # Catch up first so rows other processes wrote are not skipped.
+            self._refresh()
+        lines: list[str] = []
+        for idx, event in items:
+            if idx in self._rows:
+                continue
+            kind = event_kind(event)
+            entry: dict[str, object] = {
+                "i": idx,
+                "k": kind,
+                "s": event.source,
+                "t": event.timestamp,
+            }
+            tokens: list[str] = []
+            text = event_search_text(event)
+            if text is not None:
+                entry["b"] = 1
+                if self.index_body:
+                    tokens = sorted(set(tokenize(text)))
+                    entry["w"] = tokens
+            lines.append(json.dumps(entry, separators=(",", ":")) + "\n")
+            row = EventIndexRow(kind, event.source, event.timestamp, text is not None)
+            if self._loaded:
+                self._add(idx, row, tokens)
+        if lines:
+            data = "".join(lines).encode("utf-8")
+            offset = self._fs.append(self._path, data)
+            if self._loaded:
+                self._pos = offset + len(data)
+
+    def matches(
+        self,
+        idx: int,
+        kind: str | None = None,
+        source: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+    ) -> bool | None:
+        """Whether the event at ``idx`` passes the filters; None if not indexed."""
+        row = self._rows.get(idx)
+        if row is None:
+            return None
+        if kind is not None and row.kind != kind:
+            return False
+        if source is not None and row.source != source:
+            return False
+        if timestamp_gte is not None and row.timestamp < timestamp_gte:
+            return False
+        if timestamp_lt is not None and row.timestamp >= timestamp_lt:
+            return False
+        return True
+
+    def body_candidates(self, body: str) -> set[int] | None:
+        """Indices whose text may contain ``body`` (case-insensitive substring).
+
+        A superset of the true matches among token-indexed events, or None
+        when the query cannot be narrowed (body indexing disabled, or a query
+        without word characters). Inner query tokens must appear exactly; the
+        first and last ones may be cut mid-word, so they only need to end/start
+        an indexed token (or, for a single-token query, occur inside one).
+        """
+        if not self.index_body:
+            return None
+        query = body.lower()
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+
+        def containing(predicate) -> set[int]:
+            found: set[int] = set()
+            for token, postings in self._postings.items():
+                if predicate(token):
+                    found |= postings
+            return found
+
+        with self._lock:
+            if len(tokens) == 1:
+                only = tokens[0]
+                return containing(lambda t: only in t)
+
+            first, *inner, last = tokens
+            candidates = containing(lambda t: t.endswith(first))
+            for token in inner:
+                candidates &= self._postings.get(token, set())
+                if not candidates:
+                    return candidates
+            return candidates & containing(lambda t: t.startswith(last))
+
+    def searchable(self) -> Iterator[int]:
+        """Indices of indexed events a body search can match."""
+        with self._lock:
+            indices = [idx for idx, row in self._rows.items() if row.searchable]
+        return iter(indices)
+
+    def _add(self, idx: int, row: EventIndexRow, tokens: Iterable[str]) -> None:
+        if idx in self._rows:
+            return
+        self._rows[idx] = row
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(idx)
@@ -0,0 +1,225 @@
+"""Segmented append-only storage backend for :class:`EventLog`.
+
+Instead of one ``event-{idx}-{id}.json`` file per event, events are appended
+as JSON lines to rolling ``segment-NNNNN.jsonl`` files. A tab-separated
+offset index sidecar (``segments.idx``) records, per event, its index, id,
+segment number, byte offset and length, so opening a conversation reads one
+small file instead of listing the whole events directory, and reading an
+event is a single ranged read.
+
+Index lines are only ever appended, after the event payload they describe,
+so a crash can at worst leave unreferenced bytes at the end of a segment or a
+torn last index line; both are ignored on load.
+"""
+
+from typing import NamedTuple
+
+from openhands.sdk.conversation.persistence_const import (
+    EVENT_NAME_RE,
+    EVENT_SEGMENT_INDEX,
+    EVENT_SEGMENT_PATTERN,
+)
+from openhands.sdk.event import EventID
+from openhands.sdk.io import FileStore
+from openhands.sdk.logger import get_logger
+from openhands.sdk.utils.path import posix_path_name
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+
+
+class SegmentEntry(NamedTuple):
+    """Location of one serialized event inside a segment file."""
+
+    event_id: EventID
+    segment: int
+    offset: int
+    length: int
+
+
+class SegmentedEventStorage:
+    """Rolling segment files plus an offset index sidecar.
+
+    The caller (``EventLog``) is responsible for serializing writers with its
+    file lock; readers may run concurrently and only ever observe fully
+    written index lines.
+    """
+
+    def __init__(
+        self,
+        fs: FileStore,
+        dir_path: str,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> None:
+        self._fs = fs
+        self._dir = dir_path
+        self._index_path = f"{dir_path}/{EVENT_SEGMENT_INDEX}"
+        self._max_segment_bytes = max_segment_bytes
+        self._entries: dict[int, SegmentEntry] = {}
+        # Bytes of the index sidecar consumed so far (always at a line end).
+        self._index_pos = 0
+        # True when the index ends in a partial line left behind by a crash.
+        self._torn_tail = False
+        self._segment = 0
+        self._segment_size = 0
+
+    @staticmethod
+    def exists(fs: FileStore, dir_path: str) -> bool:
+        """Whether ``dir_path`` holds a segmented event log."""
+        return fs.exists(f"{dir_path}/{EVENT_SEGMENT_INDEX}")
+
+    def load(self) -> dict[int, EventID]:
+        """(Re)read the whole index sidecar and return ``{idx: event_id}``."""
+        self._entries.clear()
+        self._index_pos = 0
+        self._torn_tail = False
+        self._segment = 0
+        self._segment_size = 0
+        return self.refresh()
+
+    def refresh(self) -> dict[int, EventID]:
+        """Read index lines appended since the last load/refresh.
+
+        Only the unread tail of the sidecar is fetched, so polling for writes
+        from other processes costs O(new entries).
+        """
+        try:
+            data = self._fs.read_range(self._index_path, self._index_pos)
+        except FileNotFoundError:
+            return {}
+        end = data.rfind(b"\n") + 1
+        self._torn_tail = end < len(data)
+        if end == 0:
+            return {}
+        self._index_pos += end
+
+        new: dict[int, EventID] = {}
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            entry = self._parse_line(line)
+            if entry is None:
+                continue
+            idx, parsed = entry
+            if idx in self._entries:
+                logger.warning(
+                    "Duplicate segment index entry %d; keeping the first", idx
+                )
+                continue
+            self._entries[idx] = parsed
+            new[idx] = parsed.event_id
+            end_offset = parsed.offset + parsed.length + 1
+            if parsed.segment > self._segment:
+                self._segment = parsed.segment
+                self._segment_size = end_offset
+            elif parsed.segment == self._segment:
+                self._segment_size = max(self._segment_size, end_offset)
+        return new
+
+    def read(self, idx: int) -> bytes:
+        """Return the serialized event stored at ``idx``."""
+        entry = self._entries[idx]
+        data = self._fs.read_range(
+            self._segment_path(entry.segment),
+            entry.offset,
+            entry.offset + entry.length,
+        )
+        if len(data) != entry.length:
+            raise FileNotFoundError(
+                f"Truncated event record {idx} in {self._segment_path(entry.segment)}"
+            )
+        return data
+
+    def append(self, idx: int, event_id: EventID, payload: str) -> None:
+        """Append ``payload`` as event ``idx``; caller must hold the log lock."""
+        data = payload.encode("utf-8")
+        if (
+            self._segment_size > 0
+            and self._segment_size + len(data) + 1 > self._max_segment_bytes
+        ):
+            self._segment += 1
+            self._segment_size = 0
+        offset = self._fs.append(self._segment_path(self._segment), data + b"\n")
+        self._segment_size = offset + len(data) + 1
+
+        entry = SegmentEntry(event_id, self._segment, offset, len(data))
+        line = (
+            f"{idx}\t{entry.segment}\t{entry.offset}\t{entry.length}\t{event_id}\n"
+        ).encode()
+        if self._torn_tail:
+            # Terminate the partial line so it is skipped as malformed.
+            line = b"\n" + line
+        index_offset = self._fs.append(self._index_path, line)
+        self._index_pos = index_offset + len(line)
+        self._torn_tail = False
+        self._entries[idx] = entry
+
+    def _segment_path(self, segment: int) -> str:
+        return f"{self._dir}/{EVENT_SEGMENT_PATTERN.format(segment=segment)}"
+
+    @staticmethod
+    def _parse_line(line: str) -> tuple[int, SegmentEntry] | None:
+        if not line:
+            return None
+        try:
+            idx, segment, offset, length, event_id = line.split("\t", 4)
+            return int(idx), SegmentEntry(
+                event_id, int(segment), int(offset), int(length)
+            )
+        except ValueError:
+            logger.warning("Skipping malformed segment index line: %r", line)
+            return None
+
+
+def migrate_to_segments(
+    fs: FileStore,
+    dir_path: str,
+    max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    delete_legacy: bool = True,
+) -> int:
+    """Convert a per-file event directory into the segmented layout.
+
+    Events are copied in index order up to the first gap (the same prefix
+    ``EventLog`` would load). Legacy ``event-*.json`` files are deleted only
+    after the segmented index is complete, so an interrupted migration leaves
+    the old layout readable; rerunning it starts over.
+
+    Returns:
+        The number of migrated events.
+    """
+    if SegmentedEventStorage.exists(fs, dir_path):
+        raise ValueError(f"{dir_path} already holds a segmented event log")
+
+    legacy: dict[int, tuple[str, EventID]] = {}
+    for path in fs.list(dir_path):
+        m = EVENT_NAME_RE.match(posix_path_name(path))
+        if m:
+            legacy[int(m.group("idx"))] = (path, m.group("event_id"))
+
+    storage = SegmentedEventStorage(fs, dir_path, max_segment_bytes)
+    # Clear leftovers of an interrupted earlier attempt before rewriting.
+    for path in fs.list(dir_path):
+        name = posix_path_name(path)
+        if name.startswith("segment-") and name.endswith(".jsonl"):
+            fs.delete(path)
+    staging_index = f"{dir_path}/{EVENT_SEGMENT_INDEX}.tmp"
+    fs.delete(staging_index)
+    storage._index_path = staging_index
+
+    n = 0
+    while n in legacy:
+        path, event_id = legacy[n]
+        storage.append(n, event_id, fs.read(path))
+        n += 1
+
+    # Publishing the index is the commit point of the migration.
+    fs.write(
+        f"{dir_path}/{EVENT_SEGMENT_INDEX}",
+        fs.read_range(staging_index) if n else b"",
+    )
+    fs.delete(staging_index)
+    if delete_legacy:
+        for path, _ in legacy.values():
+            fs.delete(path)
+    logger.info("Migrated %d events in %s to segmented storage", n, dir_path)
+    return n
@@ -1,13 +1,23 @@
 # state.py
 import operator
+import os
+import sys
 from collections.abc import Callable, Iterator
 from contextlib import AbstractContextManager, nullcontext
+from enum import StrEnum
 from typing import SupportsIndex, overload
 
+from openhands.sdk.conversation.event_cache import EventCache, EventCacheStats
+from openhands.sdk.conversation.event_index import EventSearchIndex
+from openhands.sdk.conversation.event_segments import (
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentedEventStorage,
+)
 from openhands.sdk.conversation.events_list_base import EventsListBase
 from openhands.sdk.conversation.persistence_const import (
     EVENT_FILE_PATTERN,
     EVENT_NAME_RE,
+    EVENT_SEARCH_INDEX,
     EVENTS_DIR,
 )
 from openhands.sdk.event import Event, EventID
@@ -20,13 +30,35 @@ from openhands.sdk.utils.path import posix_path_name
 logger = get_logger(__name__)
 
 LOCK_FILE_NAME = ".eventlog.lock"
+# Number of events committed to the per-file layout, bumped under the lock by
+# every writer so other processes can detect foreign appends without listing.
+SEQUENCE_FILE_NAME = ".eventlog.seq"
 LOCK_TIMEOUT_SECONDS = 30
+EVENT_LOG_FORMAT_ENV = "OPENHANDS_EVENT_LOG_FORMAT"
 
 # ROOT_PARENT_ID now lives in event.types (single source of truth); it is used
 # below in _effective_parent_id and re-exported here so existing
 # ``from event_store import ROOT_PARENT_ID`` importers keep working.
 
 
+class EventLogFormat(StrEnum):
+    """On-disk layout used for newly created event logs."""
+
+    FILES = "files"
+    """One ``event-{idx}-{id}.json`` file per event (the original layout)."""
+    SEGMENTED = "segmented"
+    """Rolling append-only segment files plus an offset index sidecar."""
+
+
+def _default_log_format() -> EventLogFormat:
+    value = os.getenv(EVENT_LOG_FORMAT_ENV, EventLogFormat.FILES.value)
+    try:
+        return EventLogFormat(value.strip().lower())
+    except ValueError:
+        logger.warning("Unknown %s=%r; using %r", EVENT_LOG_FORMAT_ENV, value, "files")
+        return EventLogFormat.FILES
+
+
 class EventLog(EventsListBase):
     """Persistent event log with locking for concurrent writes.
 
@@ -34,6 +66,30 @@ class EventLog(EventsListBase):
     the FileStore's locking mechanism. Events are persisted to disk and
     can be accessed by index or event ID.
 
+    The on-disk layout of an existing log is detected when it is opened, so
+    per-file and segmented directories are both readable regardless of
+    ``log_format``; ``log_format`` (default: the ``OPENHANDS_EVENT_LOG_FORMAT``
+    environment variable, else ``files``) only selects the layout of logs
+    that have no events yet. Use ``migrate_to_segments`` to convert an
+    existing per-file directory.
+
+    Deserialized events are kept in a bounded LRU cache (``cache_max_events``
+    entries and ``cache_max_bytes`` of serialized payload; defaults from the
+    ``OPENHANDS_EVENT_CACHE_MAX_EVENTS`` / ``OPENHANDS_EVENT_CACHE_MAX_BYTES``
+    environment variables) that always retains the most recent events;
+    evicted events are re-read from disk on access. Over a store that is not
+    ``durable`` (e.g. ``InMemoryFileStore``, which evicts files itself) the
+    cache may hold the only copy of an event, so it is left unbounded.
+
+    The ``search_index`` sidecar is opt-in: appends only record index rows
+    once ``search_index`` has been accessed on this instance or when the
+    sidecar already exists at open, so a log that is never searched does no
+    indexing work. Rows missed before that are backfilled on access.
+
+    Writers record the committed event count in a ``.eventlog.seq`` sidecar
+    under the lock, so an append only lists the events directory when another
+    process has written since this instance last did.
+
     Note:
         For LocalFileStore, file locking via flock() does NOT work reliably
         on NFS mounts or network filesystems. Users deploying with shared
@@ -44,17 +100,96 @@ class EventLog(EventsListBase):
     _dir: str
     _length: int
     _lock_path: str
+    _seq_path: str
     _write_guard: Callable[[], AbstractContextManager[None]] | None
+    _segments: SegmentedEventStorage | None
 
-    def __init__(self, fs: FileStore, dir_path: str = EVENTS_DIR) -> None:
+    def __init__(
+        self,
+        fs: FileStore,
+        dir_path: str = EVENTS_DIR,
+        *,
+        log_format: EventLogFormat | None = None,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        cache_max_events: int | None = None,
+        cache_max_bytes: int | None = None,
+        index_body: bool = True,
+    ) -> None:
         self._fs = fs
         self._dir = dir_path
         self._id_to_idx: dict[EventID, int] = {}
         self._idx_to_id: dict[int, EventID] = {}
-        self._event_cache: dict[int, Event] = {}
+        if not fs.durable:
+            cache_max_events = cache_max_bytes = sys.maxsize
+        self._event_cache = EventCache(cache_max_events, cache_max_bytes)
+        index_path = f"{dir_path}/{EVENT_SEARCH_INDEX}"
+        self._search_index = EventSearchIndex(fs, index_path, index_body=index_body)
+        self._search_index_enabled = fs.exists(index_path)
+        self._unindexable: set[int] = set()
         self._lock_path = f"{dir_path}/{LOCK_FILE_NAME}"
+        self._seq_path = f"{dir_path}/{SEQUENCE_FILE_NAME}"
         self._write_guard = None
+        self._segments = None
+        self._max_segment_bytes = max_segment_bytes
         self._length = self._scan_and_build_index()
+        if (
+            self._segments is None
+            and self._length == 0
+            and (log_format or _default_log_format()) == EventLogFormat.SEGMENTED
+        ):
+            self._segments = SegmentedEventStorage(fs, dir_path, max_segment_bytes)
+
+    @property
+    def cache_stats(self) -> EventCacheStats:
+        """Hit/miss/eviction counters and current size of the event cache."""
+        return self._event_cache.stats
+
+    @property
+    def search_index(self) -> EventSearchIndex:
+        """Per-event kind/source/timestamp (and body token) index for search.
+
+        Loads the sidecar on first use and backfills rows for events that have
+        none, e.g. in logs written before the index existed. From then on,
+        ``append`` keeps the index up to date.
+        """
+        self._search_index_enabled = True
+        index = self._search_index
+        index.refresh()
+        if len(index) < self._length:
+            missing = [
+                i
+                for i in range(self._length)
+                if i not in index and i not in self._unindexable
+            ]
+            if missing:
+                self._backfill_search_index(missing)
+        return index
+
+    def _backfill_search_index(self, missing: list[int]) -> None:
+        # Batched so a large legacy log is never hydrated all at once.
+        for start in range(0, len(missing), 1000):
+            items: list[tuple[int, Event]] = []
+            for i in missing[start : start + 1000]:
+                try:
+                    items.append((i, self._get_single_item(i)))
+                except Exception as e:
+                    logger.warning("Cannot index event %d in %s: %s", i, self._dir, e)
+                    self._unindexable.add(i)
+            write_guard = (
+                nullcontext() if self._write_guard is None else self._write_guard()
+            )
+            with (
+                self._fs.lock(self._lock_path, timeout=LOCK_TIMEOUT_SECONDS),
+                write_guard,
+            ):
+                self._search_index.record_many(items)
+
+    @property
+    def log_format(self) -> EventLogFormat:
+        """The on-disk layout this log reads and writes."""
+        if self._segments is not None:
+            return EventLogFormat.SEGMENTED
+        return EventLogFormat.FILES
 
     def set_write_guard(
         self,
@@ -157,20 +292,26 @@ class EventLog(EventsListBase):
             if i >= self._length:
                 raise IndexError("Event index out of range")
             path = self._path(i)
-        txt = self._fs.read(path)
+        txt = self._read_payload(i, path)
         if not txt:
             raise FileNotFoundError(f"Missing event file: {path}")
         evt = Event.model_validate_json(txt)
-        self._event_cache[i] = evt
+        self._event_cache.put(i, evt, len(txt))
         return evt
 
+    def _read_payload(self, idx: int, path: str | None = None) -> str | bytes:
+        """Read the serialized event at ``idx`` from the active layout."""
+        if self._segments is not None:
+            return self._segments.read(idx)
+        return self._fs.read(path or self._path(idx))
+
     def __iter__(self) -> Iterator[Event]:
         for i in range(self._length):
             cached = self._event_cache.get(i)
             if cached is not None:
                 yield cached
                 continue
-            txt = self._fs.read(self._path(i))
+            txt = self._read_payload(i)
             if not txt:
                 continue
             evt = Event.model_validate_json(txt)
@@ -178,7 +319,7 @@ class EventLog(EventsListBase):
             if i not in self._idx_to_id:
                 self._idx_to_id[i] = evt_id
                 self._id_to_idx.setdefault(evt_id, i)
-            self._event_cache[i] = evt
+            self._event_cache.put(i, evt, len(txt))
             yield evt
 
     def append(self, event: Event) -> None:
@@ -194,9 +335,10 @@ class EventLog(EventsListBase):
         try:
             with self._fs.lock(self._lock_path, timeout=LOCK_TIMEOUT_SECONDS):
                 # Sync with disk in case another process wrote while we waited
-                disk_length = self._count_events_on_disk()
-                if disk_length > self._length:
-                    self._sync_from_disk(disk_length)
+                if self._segments is not None or not self._is_up_to_date():
+                    disk_length = self._count_events_on_disk()
+                    if disk_length > self._length:
+                        self._sync_from_disk(disk_length)
 
                 if evt_id in self._id_to_idx:
                     existing_idx = self._id_to_idx[evt_id]
@@ -219,11 +361,25 @@ class EventLog(EventsListBase):
                     nullcontext() if self._write_guard is None else self._write_guard()
                 )
                 with write_guard:
-                    target_path = self._path(self._length, event_id=evt_id)
-                    self._fs.write(target_path, payload)
+                    if self._segments is not None:
+                        self._segments.append(self._length, evt_id, payload)
+                    else:
+                        target_path = self._path(self._length, event_id=evt_id)
+                        # Publish the new count before the event file: a crash
+                        # in between leaves the count ahead of the files, which
+                        # only costs the next writer one directory listing.
+                        self._write_sequence(self._length + 1)
+                        self._fs.write(target_path, payload)
+                    if self._search_index_enabled:
+                        try:
+                            self._search_index.record(self._length, event)
+                        except Exception as e:
+                            # Best effort: a missing row is backfilled on next
+                            # search.
+                            logger.warning("Failed to index event %s: %s", evt_id, e)
                 self._idx_to_id[self._length] = evt_id
                 self._id_to_idx[evt_id] = self._length
-                self._event_cache[self._length] = event
+                self._event_cache.put(self._length, event, len(payload))
                 self._length += 1
         except TimeoutError:
             logger.error(
@@ -232,8 +388,46 @@ class EventLog(EventsListBase):
             )
             raise
 
+    def _is_up_to_date(self) -> bool:
+        """Whether no other writer appended since our last write or scan.
+
+        Reads the small sequence file instead of listing the events directory,
+        keeping single-writer appends O(1). A missing or unreadable sequence
+        file (e.g. a log written by an older SDK) reports False so the caller
+        falls back to the directory listing.
+        """
+        try:
+            raw = self._fs.read_range(self._seq_path)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning("Error reading event sequence %s: %s", self._seq_path, e)
+            return False
+        try:
+            return int(raw) == self._length
+        except ValueError:
+            return False
+
+    def _write_sequence(self, length: int) -> None:
+        # Bytes bypass LocalFileStore's read cache, which would otherwise hide
+        # updates made by other processes.
+        self._fs.write(self._seq_path, str(length).encode())
+
     def _count_events_on_disk(self) -> int:
         """Count event files on disk."""
+        if self._segments is not None:
+            try:
+                new = self._segments.refresh()
+            except Exception as e:
+                logger.warning("Error reading segment index in %s: %s", self._dir, e)
+                return self._length
+            for idx, evt_id in new.items():
+                self._idx_to_id.setdefault(idx, evt_id)
+                self._id_to_idx.setdefault(evt_id, idx)
+            n = self._length
+            while n in self._idx_to_id:
+                n += 1
+            return n
         try:
             paths = self._fs.list(self._dir)
         except FileNotFoundError:
@@ -253,6 +447,11 @@ class EventLog(EventsListBase):
 
         Preserves existing index mappings and only scans new events.
         """
+        if self._segments is not None:
+            # _count_events_on_disk already merged the new index entries.
+            self._length = disk_length
+            return
+
         # Preserve existing mappings
         existing_idx_to_id = dict(self._idx_to_id)
 
@@ -280,6 +479,17 @@ class EventLog(EventsListBase):
         }"
 
     def _scan_and_build_index(self) -> int:
+        if self._segments is None and SegmentedEventStorage.exists(self._fs, self._dir):
+            self._segments = SegmentedEventStorage(
+                self._fs, self._dir, self._max_segment_bytes
+            )
+        if self._segments is not None:
+            try:
+                return self._build_index(self._segments.load())
+            except Exception as e:
+                logger.warning("Error reading segment index in %s: %s", self._dir, e)
+                return self._build_index({})
+
         try:
             paths = self._fs.list(self._dir)
         except Exception:
@@ -296,9 +506,12 @@ class EventLog(EventsListBase):
                 idx = int(m.group("idx"))
                 evt_id = m.group("event_id")
                 by_idx[idx] = evt_id
-            else:
+            elif not name.startswith("."):
                 logger.warning(f"Unrecognized event file name: {name}")
+        return self._build_index(by_idx)
 
+    def _build_index(self, by_idx: dict[int, EventID]) -> int:
+        """Rebuild the id/index maps from the contiguous prefix of ``by_idx``."""
         if not by_idx:
             self._id_to_idx.clear()
             self._idx_to_id.clear()
@@ -2809,7 +2809,9 @@ class LocalConversation(BaseConversation):
         )
 
         messages = prepare_llm_messages(
-            self.state.view, additional_messages=[user_message]
+            self.state.view,
+            additional_messages=[user_message],
+            message_cache=self.state.message_projection,
         )
 
         # Get or create the specialized ask-agent LLM
@@ -5,9 +5,9 @@ import os
 import threading
 import time
 import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from queue import Empty, Queue
-from typing import TYPE_CHECKING, Final, SupportsIndex, overload
+from typing import TYPE_CHECKING, Any, Final, SupportsIndex, overload
 from urllib.parse import urlparse
 
 import httpx
@@ -298,6 +298,7 @@ class RemoteEventsList(EventsListBase):
     _events_base_path: str
     _cached_events: list[Event]
     _cached_event_ids: set[str]
+    _sync_cursor: str | None
     _lock: threading.RLock
 
     def __init__(
@@ -311,22 +312,30 @@ class RemoteEventsList(EventsListBase):
         self._events_base_path = events_base_path
         self._cached_events: list[Event] = []
         self._cached_event_ids: set[str] = set()
+        # Id of the last event of the server's log up to which this cache is
+        # known to hold every event. Only REST pages advance it: they cover
+        # the log without gaps, whereas WebSocket delivery can skip events
+        # around a reconnect.
+        self._sync_cursor = None
         self._acp_tool_call_id_to_event_id: dict[str, str] = {}
         self._lock = threading.RLock()
         # Initial fetch to sync existing events
         self._do_full_sync()
 
-    def _do_full_sync(self) -> None:
-        """Perform a full sync with the remote API."""
-        logger.debug(f"Performing full sync for conversation {self._conversation_id}")
+    def _iter_event_pages(self, after_event_id: str | None) -> Iterator[list[dict]]:
+        """Yield the raw items of each page of events after ``after_event_id``.
 
-        events = []
+        With no cursor, pages cover the whole log. A server that does not
+        know the cursor (or predates it) returns the whole log too; callers
+        deduplicate by id, so that only costs the transfer.
+        """
         page_id = None
-
         while True:
-            params = {"limit": 100}
+            params: dict[str, Any] = {"limit": 100}
             if page_id:
                 params["page_id"] = page_id
+            elif after_event_id:
+                params["after_event_id"] = after_event_id
 
             resp = _send_request(
                 self._client,
@@ -335,24 +344,38 @@ class RemoteEventsList(EventsListBase):
                 params=params,
             )
             data = resp.json()
-
-            events.extend([Event.model_validate(item) for item in data["items"]])
+            yield data["items"]
 
             if not data.get("next_page_id"):
                 break
             page_id = data["next_page_id"]
 
+    def _do_full_sync(self) -> None:
+        """Perform a full sync with the remote API."""
+        logger.debug(f"Performing full sync for conversation {self._conversation_id}")
+
+        events = []
+        cursor = None
+        for items in self._iter_event_pages(None):
+            events.extend([Event.model_validate(item) for item in items])
+            if items:
+                cursor = items[-1]["id"]
+
         self._cached_events = events
         self._cached_event_ids.update(e.id for e in events)
+        self._sync_cursor = cursor
         logger.debug(f"Full sync completed, {len(events)} events cached")
 
     def reconcile(self) -> int:
         """Reconcile local cache with server by fetching and merging events.
 
-        This method fetches all events from the server and merges them with
-        the local cache, deduplicating by event ID. This ensures no events
-        are missed due to race conditions between REST sync and WebSocket
-        subscription.
+        This method fetches the events the server logged after the last
+        event this cache is known to hold in full, and merges them with the
+        local cache, deduplicating by event ID. This ensures no events are
+        missed due to race conditions between REST sync and WebSocket
+        subscription, without downloading the whole history on every
+        reconnect. Items already cached (typically delivered over the
+        WebSocket) are not validated again.
 
         Returns:
             Number of new events added during reconciliation.
@@ -361,31 +384,23 @@ class RemoteEventsList(EventsListBase):
             f"Performing reconciliation sync for conversation {self._conversation_id}"
         )
 
-        events = []
-        page_id = None
-
-        while True:
-            params = {"limit": 100}
-            if page_id:
-                params["page_id"] = page_id
-
-            try:
-                resp = _send_request(
-                    self._client,
-                    "GET",
-                    f"{self._events_base_path}/{self._conversation_id}/events/search",
-                    params=params,
+        new_items: list[dict] = []
+        cursor = self._sync_cursor
+        try:
+            for items in self._iter_event_pages(cursor):
+                # Unlocked membership checks only skip validation; the merge
+                # below checks again under the lock.
+                new_items.extend(
+                    item
+                    for item in items
+                    if item.get("id") not in self._cached_event_ids
                 )
-                data = resp.json()
-            except Exception as e:
-                logger.warning(f"Failed to fetch events during reconciliation: {e}")
-                break  # Return partial results rather than failing completely
-
-            events.extend([Event.model_validate(item) for item in data["items"]])
-
-            if not data.get("next_page_id"):
-                break
-            page_id = data["next_page_id"]
+                if items:
+                    cursor = items[-1]["id"]
+        except Exception as e:
+            logger.warning(f"Failed to fetch events during reconciliation: {e}")
+            # Merge partial results rather than failing completely
+        events = [Event.model_validate(item) for item in new_items]
 
         # Merge events into cache, acquiring lock once for all events
         added_count = 0
@@ -394,6 +409,7 @@ class RemoteEventsList(EventsListBase):
                 if event.id not in self._cached_event_ids:
                     self._add_event_unsafe(event)
                     added_count += 1
+            self._sync_cursor = cursor
 
         logger.debug(
             f"Reconciliation completed, {added_count} new events added "
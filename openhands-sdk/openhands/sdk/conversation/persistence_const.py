@@ -2,9 +2,19 @@ import re
 
 
 BASE_STATE = "base_state.json"
+# Journal of field deltas layered over BASE_STATE (journal persistence mode).
+BASE_STATE_JOURNAL = "base_state.journal"
 EVENTS_DIR = "events"
 # Accept 5+ digits: the writer pads to a 5-digit minimum but does not cap width.
 EVENT_NAME_RE = re.compile(
     r"^event-(?P<idx>\d{5,})-(?P<event_id>[0-9a-fA-F\-]{8,})\.json$"
 )
 EVENT_FILE_PATTERN = "event-{idx:05d}-{event_id}.json"
+
+# Segmented event log layout: events are appended as JSON lines to rolling
+# segment files, and an offset index sidecar maps event index -> location.
+EVENT_SEGMENT_INDEX = "segments.idx"
+EVENT_SEGMENT_PATTERN = "segment-{segment:05d}.jsonl"
+
+# Secondary search index sidecar (kind/source/timestamp/body tokens per event).
+EVENT_SEARCH_INDEX = ".search.jsonl"
@@ -7,6 +7,10 @@ from typing import Final
 
 from pydantic import Field, PrivateAttr, SecretStr
 
+from openhands.sdk.conversation.secret_masker import (
+    SecretMatcher,
+    StreamingSecretMasker,
+)
 from openhands.sdk.logger import get_logger
 from openhands.sdk.secret import SecretSource, SecretValue, StaticSecret
 from openhands.sdk.utils.models import OpenHandsModel
@@ -40,6 +44,8 @@ class SecretRegistry(OpenHandsModel):
     _exported_values: dict[str, str] = PrivateAttr(default_factory=dict)
     _exported_values_lock: RLock = PrivateAttr(default_factory=RLock)
     _failed_lookups: dict[str, float] = PrivateAttr(default_factory=dict)
+    _matcher: SecretMatcher = PrivateAttr(default_factory=lambda: SecretMatcher(()))
+    _matcher_values: tuple[str, ...] = PrivateAttr(default=())
 
     def track_exported_values(self, values: Mapping[str, str]) -> None:
         """Track values for output masking."""
@@ -68,11 +74,8 @@ class SecretRegistry(OpenHandsModel):
         Returns:
             Set of secret keys found in the text
         """
-        found_keys = set()
-        for key in self.secret_sources.keys():
-            if key.lower() in text.lower():
-                found_keys.add(key)
-        return found_keys
+        lowered = text.lower()
+        return {key for key in self.secret_sources if key.lower() in lowered}
 
     def get_secrets_as_env_vars(self, command: str) -> dict[str, str]:
         """Get secrets that should be exported as environment variables for a command.
@@ -156,7 +159,24 @@ class SecretRegistry(OpenHandsModel):
         """
         if not text:
             return text
+        return self._current_matcher().mask(text)
 
+    def streaming_masker(self) -> StreamingSecretMasker:
+        """Return a masker for text that arrives in chunks.
+
+        Unlike calling :meth:`mask_secrets_in_output` on each chunk, the
+        masker also catches a secret split across two chunks. It holds back
+        up to one secret length of text until the next chunk; call ``flush``
+        at the end of the stream for the rest.
+        """
+        return StreamingSecretMasker(self._current_matcher)
+
+    def _current_matcher(self) -> SecretMatcher:
+        """Resolve uncached sources and return the matcher for their values.
+
+        The matcher is kept on the registry and only rebuilt when the
+        resolved values change; it never outlives the registry's secrets.
+        """
         # Resolve uncached sources, backing off on failure: get_value() may do
         # blocking network I/O and masking runs per output and per ACP chunk.
         now = time.monotonic()
@@ -169,14 +189,12 @@ class SecretRegistry(OpenHandsModel):
             if not self.get_secret_value(key):
                 self._failed_lookups[key] = now
 
-        masked_text = text
         with self._exported_values_lock:
-            exported_values = tuple(self._exported_values.values())
-        for value in exported_values:
-            if value:
-                masked_text = masked_text.replace(value, "<secret-hidden>")
-
-        return masked_text
+            values = tuple(self._exported_values.values())
+            if values != self._matcher_values:
+                self._matcher = SecretMatcher(values)
+                self._matcher_values = values
+            return self._matcher
 
     def get_secret_infos(self) -> list[dict[str, str | None]]:
         """Get secret information (name and description) for prompt inclusion.
@@ -1,9 +1,11 @@
 # state.py
+import hashlib
 import json
+import os
 import threading
 from collections.abc import Callable, Sequence
-from contextlib import AbstractContextManager
-from enum import Enum
+from contextlib import AbstractContextManager, nullcontext
+from enum import Enum, StrEnum
 from pathlib import Path
 from typing import Any, Self
 
@@ -14,7 +16,11 @@ from openhands.sdk.context.view import View
 from openhands.sdk.conversation.conversation_stats import ConversationStats
 from openhands.sdk.conversation.event_store import ROOT_PARENT_ID, EventLog
 from openhands.sdk.conversation.fifo_lock import FIFOLock
-from openhands.sdk.conversation.persistence_const import BASE_STATE, EVENTS_DIR
+from openhands.sdk.conversation.persistence_const import (
+    BASE_STATE,
+    BASE_STATE_JOURNAL,
+    EVENTS_DIR,
+)
 from openhands.sdk.conversation.secret_registry import SecretRegistry
 from openhands.sdk.conversation.types import (
     ConversationCallbackType,
@@ -27,7 +33,7 @@ from openhands.sdk.event import (
     ObservationEvent,
     UserRejectObservation,
 )
-from openhands.sdk.event.base import Event
+from openhands.sdk.event.base import Event, MessageProjectionCache
 from openhands.sdk.event.types import EventID
 from openhands.sdk.hooks import HookConfig
 from openhands.sdk.io import FileStore, InMemoryFileStore, LocalFileStore
@@ -44,6 +50,56 @@ from openhands.sdk.workspace.base import BaseWorkspace
 
 logger = get_logger(__name__)
 
+STATE_PERSISTENCE_ENV = "OPENHANDS_STATE_PERSISTENCE"
+# Fields mutated in place (not reassigned), so ``__setattr__`` never sees their
+# changes. Journal flushes re-check them and record them when they differ.
+_IN_PLACE_FIELDS = frozenset({"stats", "secret_registry"})
+
+
+class StatePersistenceMode(StrEnum):
+    """How ``ConversationState`` persists field changes to ``base_state.json``."""
+
+    SNAPSHOT = "snapshot"
+    """Rewrite the full ``base_state.json`` on every flush (the original mode)."""
+    JOURNAL = "journal"
+    """Append changed fields to ``base_state.journal``; compact periodically."""
+
+
+def _default_persistence_mode() -> StatePersistenceMode:
+    value = os.getenv(STATE_PERSISTENCE_ENV, StatePersistenceMode.SNAPSHOT.value)
+    try:
+        return StatePersistenceMode(value.strip().lower())
+    except ValueError:
+        logger.warning(
+            "Unknown %s=%r; using %r", STATE_PERSISTENCE_ENV, value, "snapshot"
+        )
+        return StatePersistenceMode.SNAPSHOT
+
+
+def _snapshot_digest(payload: str | bytes) -> str:
+    data = payload.encode("utf-8") if isinstance(payload, str) else payload
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _apply_journal(base: dict[str, Any], journal: str, digest: str) -> int:
+    """Merge journaled deltas recorded against snapshot ``digest`` into ``base``.
+
+    Lines written against an older snapshot (left behind by a crash during
+    compaction) and a torn trailing line are ignored. Returns the number of
+    deltas applied.
+    """
+    applied = 0
+    for line in journal.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(entry, dict) or entry.get("base") != digest:
+            continue
+        base.update(entry.get("delta") or {})
+        applied += 1
+    return applied
+
 
 class ConversationExecutionStatus(str, Enum):
     """Enum representing the current execution state of the conversation."""
@@ -240,6 +296,11 @@ class ConversationState(OpenHandsModel):
     _view: View = PrivateAttr(default_factory=View)
     _view_branch_leaf: EventID | None = PrivateAttr(default=None)
     _view_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    # Messages built from the view's events, reused across steps. Derived
+    # state — never persisted.
+    _message_projection: MessageProjectionCache = PrivateAttr(
+        default_factory=MessageProjectionCache
+    )
     _cipher: Cipher | None = PrivateAttr(default=None)  # cipher for secret encryption
     _autosave_enabled: bool = PrivateAttr(
         default=False
@@ -255,6 +316,16 @@ class ConversationState(OpenHandsModel):
     )  # FIFO lock for thread safety
     _save_depth: int = PrivateAttr(default=0)  # context-manager nesting depth
     _dirty: bool = PrivateAttr(default=False)  # pending unsaved field changes
+    _dirty_fields: set[str] = PrivateAttr(default_factory=set)
+    _persistence_mode: StatePersistenceMode = PrivateAttr(
+        default=StatePersistenceMode.SNAPSHOT
+    )
+    # Journal mode bookkeeping: digest/size of the snapshot the journal extends,
+    # bytes journaled since, and digests of the last persisted in-place fields.
+    _snapshot_digest: str | None = PrivateAttr(default=None)
+    _snapshot_bytes: int = PrivateAttr(default=0)
+    _journal_bytes: int = PrivateAttr(default=0)
+    _in_place_digests: dict[str, str] = PrivateAttr(default_factory=dict)
 
     @property
     def events(self) -> EventLog:
@@ -333,6 +404,11 @@ class ConversationState(OpenHandsModel):
                 self.head_is_empty = False
         return event
 
+    @property
+    def message_projection(self) -> MessageProjectionCache:
+        """Per-conversation cache for ``LLMConvertibleEvent.events_to_messages``."""
+        return self._message_projection
+
     @property
     def view(self) -> View:
         """Lazily-maintained ``View`` of the active branch (``path_to_root(leaf)``).
@@ -435,11 +511,66 @@ class ConversationState(OpenHandsModel):
                 "preserve secrets."
             )
         payload = self.model_dump_json(exclude_none=True, context=context)
-        if self._write_guard is None:
-            fs.write(BASE_STATE, payload)
-        else:
-            with self._write_guard():
-                fs.write(BASE_STATE, payload)
+        journal = self._persistence_mode == StatePersistenceMode.JOURNAL
+        guard = self._write_guard() if self._write_guard is not None else nullcontext()
+        with guard:
+            fs.write_atomic(BASE_STATE, payload)
+            if journal:
+                # The new snapshot supersedes the journal; a crash before the
+                # delete is harmless as its entries name the old snapshot.
+                fs.delete(BASE_STATE_JOURNAL)
+        if journal:
+            self._snapshot_digest = _snapshot_digest(payload)
+            self._snapshot_bytes = len(payload)
+            self._journal_bytes = 0
+            self._in_place_digests = {
+                name: self._field_digest(name, context) for name in _IN_PLACE_FIELDS
+            }
+
+    def _persist_fields(self, fs: FileStore, fields: set[str]) -> None:
+        """Persist a batch of changed fields according to the persistence mode.
+
+        In journal mode the changed fields (plus any in-place-mutated field
+        whose serialization changed) are appended as one delta line. Once the
+        journal outgrows the snapshot it extends, a full snapshot is written
+        instead, keeping write amplification bounded.
+        """
+        if (
+            self._persistence_mode != StatePersistenceMode.JOURNAL
+            or self._snapshot_digest is None
+            or self._journal_bytes >= self._snapshot_bytes
+        ):
+            self._save_base_state(fs)
+            return
+
+        context = {"cipher": self._cipher} if self._cipher else None
+        changed = set(fields)
+        in_place_digests: dict[str, str] = {}
+        for name in _IN_PLACE_FIELDS:
+            digest = self._field_digest(name, context)
+            if digest != self._in_place_digests.get(name):
+                changed.add(name)
+                in_place_digests[name] = digest
+        if not changed:
+            return
+
+        delta = self.model_dump(
+            mode="json", include=changed, exclude_none=True, context=context
+        )
+        # exclude_none drops fields that were reset to None; record them.
+        for name in changed:
+            delta.setdefault(name, None)
+        line = json.dumps({"base": self._snapshot_digest, "delta": delta}) + "\n"
+        guard = self._write_guard() if self._write_guard is not None else nullcontext()
+        with guard:
+            fs.append(BASE_STATE_JOURNAL, line)
+        self._journal_bytes += len(line)
+        self._in_place_digests.update(in_place_digests)
+
+    def _field_digest(self, name: str, context: dict[str, Any] | None) -> str:
+        return _snapshot_digest(
+            self.model_dump_json(include={name}, exclude_none=True, context=context)
+        )
 
     # ===== Factory: open-or-create (no load/save methods needed) =====
     @classmethod
@@ -454,6 +585,7 @@ class ConversationState(OpenHandsModel):
         cipher: Cipher | None = None,
         tags: dict[str, str] | None = None,
         file_store: FileStore | None = None,
+        persistence_mode: StatePersistenceMode | None = None,
     ) -> "ConversationState":
         """Create a new conversation state or resume from persistence.
 
@@ -489,6 +621,15 @@ class ConversationState(OpenHandsModel):
             file_store: Optional FileStore to use for state and EventLog
                 persistence. If provided, this takes precedence over
                 persistence_dir for state and EventLog storage.
+            persistence_mode: How field changes are persisted. ``snapshot``
+                rewrites ``base_state.json`` on every flush; ``journal``
+                appends the changed fields to ``base_state.journal`` and
+                compacts it into ``base_state.json`` once it outgrows the
+                snapshot, so external readers of ``base_state.json`` alone may
+                see state as of the last compaction. Defaults to the
+                ``OPENHANDS_STATE_PERSISTENCE`` environment variable, else
+                ``snapshot``. A journal left by either mode is always replayed
+                on resume.
 
         Returns:
             ConversationState ready for use
@@ -514,11 +655,23 @@ class ConversationState(OpenHandsModel):
         except FileNotFoundError:
             base_text = None
 
+        persistence_mode = persistence_mode or _default_persistence_mode()
+
         # ---- Resume path ----
         if base_text:
+            base_data = json.loads(base_text)
+            try:
+                journal_text = file_store.read(BASE_STATE_JOURNAL)
+            except FileNotFoundError:
+                journal_text = ""
+            digest = _snapshot_digest(base_text)
+            applied = (
+                _apply_journal(base_data, journal_text, digest) if journal_text else 0
+            )
+
             # Use cipher context for decrypting secrets if provided
             context = {"cipher": cipher} if cipher else None
-            state = cls.model_validate(json.loads(base_text), context=context)
+            state = cls.model_validate(base_data, context=context)
 
             # Restore the conversation with the same id
             if state.id != id:
@@ -531,6 +684,15 @@ class ConversationState(OpenHandsModel):
             state._fs = file_store
             state._events = EventLog(file_store, dir_path=EVENTS_DIR)
             state._cipher = cipher
+            state._persistence_mode = persistence_mode
+            if persistence_mode == StatePersistenceMode.JOURNAL:
+                state._snapshot_digest = digest
+                state._snapshot_bytes = len(base_text)
+                state._journal_bytes = len(journal_text) if applied else 0
+                state._in_place_digests = {
+                    name: state._field_digest(name, context)
+                    for name in _IN_PLACE_FIELDS
+                }
 
             # Cold-load: rebuild the cached view with full property
             # enforcement — persisted events may come from an older code
@@ -576,6 +738,7 @@ class ConversationState(OpenHandsModel):
         state._fs = file_store
         state._events = EventLog(file_store, dir_path=EVENTS_DIR)
         state._cipher = cipher
+        state._persistence_mode = persistence_mode
         state.stats = ConversationStats()
 
         state._save_base_state(file_store)  # initial snapshot
@@ -605,9 +768,10 @@ class ConversationState(OpenHandsModel):
             # so that multiple field mutations produce a single I/O write.
             if getattr(self, "_save_depth", 0) > 0:
                 self._dirty = True
+                self._dirty_fields.add(name)
             else:
                 try:
-                    self._save_base_state(fs)
+                    self._persist_fields(fs, {name})
                 except Exception as e:
                     logger.exception("Auto-persist base_state failed", exc_info=True)
                     raise e
@@ -749,8 +913,9 @@ class ConversationState(OpenHandsModel):
                 fs = getattr(self, "_fs", None)
                 autosave_enabled = getattr(self, "_autosave_enabled", False)
                 if autosave_enabled and fs is not None:
-                    self._save_base_state(fs)
+                    self._persist_fields(fs, self._dirty_fields)
                 self._dirty = False
+                self._dirty_fields = set()
         finally:
             self._lock.release()
 
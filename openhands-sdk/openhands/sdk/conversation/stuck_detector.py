@@ -9,6 +9,7 @@ from openhands.sdk.event import (
     ObservationBaseEvent,
     ObservationEvent,
 )
+from openhands.sdk.event.types import EventID
 from openhands.sdk.logger import get_logger
 
 
@@ -20,6 +21,11 @@ logger = get_logger(__name__)
 # (4 repeats × 2 events per cycle = 8 events minimum, plus buffer for user messages)
 MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION: int = 20
 
+# Branch events fetched to extend the cached window on a later check. Enough
+# for a step's action/observation pairs; anything longer (or a branch switch)
+# refetches the full window.
+_WINDOW_PROBE_EVENTS: int = 8
+
 
 class StuckDetector:
     """Detects when an agent is stuck in repetitive or unproductive patterns.
@@ -46,6 +52,11 @@ class StuckDetector:
         # (e.g. an empty/reasoning-only response that adds no new action)
         # doesn't re-emit the same nudge every iteration.
         self._last_nudged_error_event_id: str | None = None
+        # The last MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION events of the active
+        # branch as of the last check, and memoized _event_eq results for
+        # pairs of events in it, keyed by event ids.
+        self._window: list[Event] = []
+        self._eq_cache: dict[tuple[EventID, EventID], bool] = {}
 
     @property
     def action_observation_threshold(self) -> int:
@@ -63,13 +74,52 @@ class StuckDetector:
     def alternating_pattern_threshold(self) -> int:
         return self.thresholds.alternating_pattern
 
+    def _branch_window(self) -> list[Event]:
+        """The last ``MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION`` branch events.
+
+        The window is kept between checks. A later check fetches only the last
+        few branch events: if they contain the previous window's last event,
+        the branch grew by the events after it. Otherwise (a long step, or
+        navigation to another branch) the window is refetched. The same event
+        id always denotes the same event, so this never mixes branches.
+        """
+        if self._window:
+            tail = self.state.active_branch(limit=_WINDOW_PROBE_EVENTS)
+            last_id = self._window[-1].id
+            position = next(
+                (i for i in reversed(range(len(tail))) if tail[i].id == last_id),
+                -1,
+            )
+            if position != -1:
+                new_events = tail[position + 1 :]
+                if new_events:
+                    self._window = (self._window + new_events)[
+                        -MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION:
+                    ]
+                    self._prune_eq_cache()
+                return self._window
+
+        self._window = self.state.active_branch(
+            limit=MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION
+        )
+        self._prune_eq_cache()
+        return self._window
+
+    def _prune_eq_cache(self) -> None:
+        ids = {event.id for event in self._window}
+        self._eq_cache = {
+            pair: equal
+            for pair, equal in self._eq_cache.items()
+            if pair[0] in ids and pair[1] in ids
+        }
+
     def _events_since_last_user_message(self) -> list[Event]:
         """Events in the scan window, after the last user message (if any).
 
         Windowed rather than full-history to avoid materializing large
         file-backed event logs.
         """
-        events = self.state.active_branch(limit=MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION)
+        events = self._branch_window()
 
         last_user_msg_index = next(
             (
@@ -166,11 +216,11 @@ class StuckDetector:
                 f"{len(last_observations)} observations, checking for equality"
             )
             actions_equal = all(
-                self._event_eq(last_actions[0], action)
+                self._events_equal(last_actions[0], action)
                 for action in last_actions[:threshold]
             )
             observations_equal = all(
-                self._event_eq(last_observations[0], observation)
+                self._events_equal(last_observations[0], observation)
                 for observation in last_observations[:threshold]
             )
             logger.debug(
@@ -198,7 +248,7 @@ class StuckDetector:
         reference = last_actions[0]
         streak = 0
         for action, observation in zip(last_actions, last_observations):
-            if not self._event_eq(reference, action):
+            if not self._events_equal(reference, action):
                 break
             if not isinstance(observation, AgentErrorEvent):
                 break
@@ -297,11 +347,11 @@ class StuckDetector:
         if len(last_actions) == threshold and len(last_observations) == threshold:
             # Check alternating pattern: [A, B, A, B, A, B] where even/odd match
             actions_equal = all(
-                self._event_eq(last_actions[i], last_actions[i + 2])
+                self._events_equal(last_actions[i], last_actions[i + 2])
                 for i in range(threshold - 2)
             )
             observations_equal = all(
-                self._event_eq(last_observations[i], last_observations[i + 2])
+                self._events_equal(last_observations[i], last_observations[i + 2])
                 for i in range(threshold - 2)
             )
 
@@ -322,6 +372,16 @@ class StuckDetector:
         # TODO: blocked by https://github.com/OpenHands/agent-sdk/issues/282
         return False
 
+    def _events_equal(self, event1: Event, event2: Event) -> bool:
+        """``_event_eq``, computed once per pair of events in the window."""
+        if event1.id == event2.id:
+            return True
+        key = (event1.id, event2.id)
+        equal = self._eq_cache.get(key)
+        if equal is None:
+            equal = self._eq_cache[key] = self._event_eq(event1, event2)
+        return equal
+
     def _event_eq(self, event1: Event, event2: Event) -> bool:
         """
         Compare two events for equality, ignoring irrelevant
@@ -1,5 +1,9 @@
 from openhands.sdk.event.acp_tool_call import ACPToolCallEvent
-from openhands.sdk.event.base import Event, LLMConvertibleEvent
+from openhands.sdk.event.base import (
+    Event,
+    LLMConvertibleEvent,
+    MessageProjectionCache,
+)
 from openhands.sdk.event.condenser import (
     Condensation,
     CondensationRequest,
@@ -32,6 +36,7 @@ __all__ = [
     "ACPToolCallEvent",
     "Event",
     "LLMConvertibleEvent",
+    "MessageProjectionCache",
     "SystemPromptEvent",
     "ActionEvent",
     "TokenEvent",
@@ -1,5 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, ClassVar
 
@@ -8,6 +9,7 @@ from rich.text import Text
 
 from openhands.sdk.event.types import ROOT_PARENT_ID, EventID, SourceType
 from openhands.sdk.llm import ImageContent, Message, TextContent
+from openhands.sdk.llm.utils.message_cache import freeze_message
 from openhands.sdk.utils.models import DiscriminatedUnionMixin
 
 
@@ -105,16 +107,34 @@ class LLMConvertibleEvent(Event, ABC):
             return base_str
 
     @staticmethod
-    def events_to_messages(events: list["LLMConvertibleEvent"]) -> list[Message]:
+    def events_to_messages(
+        events: list["LLMConvertibleEvent"],
+        cache: "MessageProjectionCache | None" = None,
+    ) -> list[Message]:
         """Convert event stream to LLM message stream, handling multi-action batches.
 
         This is a read-only projection over the event log: events are
-        immutable once created and appended, so merges build new content
-        lists rather than mutating the events' own messages.
+        immutable once created and appended, so merges build new messages
+        rather than mutating the events' own messages.
+
+        With a ``cache``, messages converted by an earlier call are reused and
+        only events new since then are converted.
         """
         from openhands.sdk.event.llm_convertible import ActionEvent
 
-        messages = []
+        previous = cache._messages if cache is not None else {}
+        projected: dict[tuple[EventID, ...], Message] = {}
+
+        def convert(key: tuple[EventID, ...], build: Callable[[], Message]) -> Message:
+            if cache is None:
+                return build()
+            msg = previous.get(key)
+            if msg is None:
+                msg = freeze_message(build())
+            projected[key] = msg
+            return msg
+
+        messages: list[Message] = []
         i = 0
 
         while i < len(events):
@@ -137,28 +157,46 @@ class LLMConvertibleEvent(Event, ABC):
                     j += 1
 
                 # Create combined message for the response
-                msg = _combine_action_events(batch_events)
-                if messages and _can_merge_user_messages(messages[-1], msg):
-                    messages[-1].content = list(messages[-1].content) + list(
-                        msg.content
-                    )
-                else:
-                    messages.append(msg)
+                msg = convert(
+                    tuple(e.id for e in batch_events),
+                    lambda: _combine_action_events(batch_events),
+                )
                 i = j
             else:
                 # Regular event - direct conversion
-                msg = event.to_llm_message()
-                if messages and _can_merge_user_messages(messages[-1], msg):
-                    messages[-1].content = list(messages[-1].content) + list(
-                        msg.content
-                    )
-                else:
-                    messages.append(msg)
+                msg = convert((event.id,), event.to_llm_message)
                 i += 1
 
+            if messages and _can_merge_user_messages(messages[-1], msg):
+                messages[-1] = messages[-1].model_copy(
+                    update={"content": list(messages[-1].content) + list(msg.content)}
+                )
+            else:
+                messages.append(msg)
+
+        if cache is not None:
+            cache._messages = projected
         return messages
 
 
+class MessageProjectionCache:
+    """Memo of the Messages ``events_to_messages`` builds for one conversation.
+
+    The Message converted from an event, or from a batch of ActionEvents that
+    share one LLM response, never changes. The cache keeps the Messages of the
+    latest projection keyed by their events' ids, so each step converts only
+    the events appended since the previous one. The Messages are frozen
+    (``freeze_message``), which lets ``LLM.format_messages_for_llm`` reuse
+    their serialized form as well.
+    """
+
+    def __init__(self) -> None:
+        self._messages: dict[tuple[EventID, ...], Message] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+
 def _is_plain_user_message(message: Message) -> bool:
     """A plain user turn with no tool-call metadata — safe to coalesce."""
     return (
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
+from typing import ClassVar
 
 
 class FileStore(ABC):
@@ -13,6 +14,13 @@ class FileStore(ABC):
     manager for thread/process-safe operations.
     """
 
+    durable: ClassVar[bool] = False
+    """Whether written files stay readable until they are deleted.
+
+    Stores that may drop files on their own, such as a bounded in-memory store,
+    leave this False so callers keep their own copy of what they must re-read.
+    """
+
     @abstractmethod
     def write(self, path: str, contents: str | bytes) -> None:
         """Write contents to a file at the specified path.
@@ -63,6 +71,55 @@ class FileStore(ABC):
             True if the path exists, False otherwise.
         """
 
+    def append(self, path: str, contents: str | bytes) -> int:
+        """Append contents to the end of a file, creating it if needed.
+
+        The default implementation rewrites the whole file; backends with
+        native append support should override it.
+
+        Args:
+            path: The file path to append to.
+            contents: The data to append, either as string or bytes.
+
+        Returns:
+            The byte offset at which ``contents`` starts in the file.
+        """
+        try:
+            existing = self.read(path).encode("utf-8")
+        except FileNotFoundError:
+            existing = b""
+        data = contents.encode("utf-8") if isinstance(contents, str) else contents
+        self.write(path, existing + data)
+        return len(existing)
+
+    def read_range(self, path: str, start: int = 0, end: int | None = None) -> bytes:
+        """Read a byte range of a file without loading the rest of it.
+
+        The default implementation reads the whole file; backends with
+        seekable storage should override it.
+
+        Args:
+            path: The file path to read from.
+            start: Byte offset of the first byte to read.
+            end: Byte offset one past the last byte to read, or None for EOF.
+
+        Returns:
+            The requested bytes (shorter than requested at end of file).
+        """
+        return self.read(path).encode("utf-8")[start:end]
+
+    def write_atomic(self, path: str, contents: str | bytes) -> None:
+        """Write a file so readers observe either the old or the new contents.
+
+        The default implementation is a plain ``write``; backends where a
+        crash mid-write can leave a truncated file should override it.
+
+        Args:
+            path: The file path to write to.
+            contents: The data to write, either as string or bytes.
+        """
+        self.write(path, contents)
+
     @abstractmethod
     def get_absolute_path(self, path: str) -> str:
         """Get the absolute filesystem path for a given relative path.
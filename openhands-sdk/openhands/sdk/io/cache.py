@@ -39,7 +39,7 @@ class MemoryLRUCache(LRUCache):
             # For strings, len() gives character count which is what we care about
             # This is much more accurate than sys.getsizeof for our use case
             return len(value)
-        elif isinstance(value, bytes):
+        elif isinstance(value, (bytes, bytearray)):
             return len(value)
         else:
             # For other types, fall back to sys.getsizeof
@@ -1,7 +1,11 @@
+import contextlib
 import os
 import shutil
+import stat
+import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
+from typing import ClassVar
 
 from filelock import FileLock, Timeout
 
@@ -15,7 +19,22 @@ from .base import FileStore
 logger = get_logger(__name__)
 
 
+def _fsync_directory(path: str) -> None:
+    """Persist a rename in ``path``; a no-op where directories can't be opened."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 class LocalFileStore(FileStore):
+    durable: ClassVar[bool] = True
     root: str
     cache: MemoryLRUCache
 
@@ -71,6 +90,54 @@ class LocalFileStore(FileStore):
             # Don't cache binary content - LocalFileStore is meant for JSON data
             # If binary data is written and then read, it will error on read
 
+    def write_atomic(self, path: str, contents: str | bytes) -> None:
+        full_path = self.get_full_path(path)
+        dir_name = os.path.dirname(full_path)
+        os.makedirs(dir_name, exist_ok=True)
+        data = contents.encode("utf-8") if isinstance(contents, str) else contents
+        tmp_path = os.path.join(
+            dir_name, f".{os.path.basename(full_path)}.{uuid.uuid4().hex}.tmp"
+        )
+        # Created like a plain write would (0o666 less the umask), unlike
+        # mkstemp's owner-only file; an existing file keeps its mode.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                with contextlib.suppress(FileNotFoundError):
+                    os.chmod(tmp_path, stat.S_IMODE(os.stat(full_path).st_mode))
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        _fsync_directory(dir_name)
+        if isinstance(contents, str):
+            self.cache[full_path] = contents
+        else:
+            self.cache.pop(full_path, None)
+
+    def append(self, path: str, contents: str | bytes) -> int:
+        full_path = self.get_full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        data = contents.encode("utf-8") if isinstance(contents, str) else contents
+        with open(full_path, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        self.cache.pop(full_path, None)
+        return offset
+
+    def read_range(self, path: str, start: int = 0, end: int | None = None) -> bytes:
+        full_path = self.get_full_path(path)
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(path)
+        with open(full_path, "rb") as f:
+            f.seek(start)
+            return f.read() if end is None else f.read(max(0, end - start))
+
     def read(self, path: str) -> str:
         full_path = self.get_full_path(path)
 
@@ -109,7 +176,7 @@ class LocalFileStore(FileStore):
 
             if os.path.isfile(full_path):
                 os.remove(full_path)
-                del self.cache[full_path]
+                self.cache.pop(full_path, None)
                 logger.debug(f"Removed local file: {full_path}")
             elif os.path.isdir(full_path):
                 shutil.rmtree(full_path)
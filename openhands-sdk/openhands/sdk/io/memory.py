@@ -43,7 +43,36 @@ class InMemoryFileStore(FileStore):
     def read(self, path: str) -> str:
         if path not in self.files:
             raise FileNotFoundError(path)
-        return self.files[path]
+        contents = self.files[path]
+        if isinstance(contents, bytearray):
+            return contents.decode("utf-8")
+        return contents
+
+    def append(self, path: str, contents: str | bytes) -> int:
+        # Appended files are kept as a bytearray that grows in place, so a
+        # run of appends costs O(total size) rather than a rewrite per call.
+        # The caller (e.g. ``EventLog``) may already hold ``lock()``.
+        data = contents.encode("utf-8") if isinstance(contents, str) else contents
+        existing = self.files.pop(path, None)
+        if existing is None:
+            buffer = bytearray()
+        elif isinstance(existing, bytearray):
+            buffer = existing
+        else:
+            buffer = bytearray(existing.encode("utf-8"))
+        offset = len(buffer)
+        buffer += data
+        # Re-inserted so the cache accounts for the grown size.
+        self.files[path] = buffer
+        return offset
+
+    def read_range(self, path: str, start: int = 0, end: int | None = None) -> bytes:
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        contents = self.files[path]
+        if isinstance(contents, str):
+            contents = contents.encode("utf-8")
+        return bytes(contents[start:end])
 
     def list(self, path: str) -> list[str]:
         files = []
@@ -117,6 +117,7 @@ from openhands.sdk.llm.utils.image_inline import (
 )
 from openhands.sdk.llm.utils.image_resize import maybe_resize_messages_for_provider
 from openhands.sdk.llm.utils.litellm_provider import LLMProvider
+from openhands.sdk.llm.utils.message_cache import cached_chat_dict, is_frozen
 from openhands.sdk.llm.utils.metrics import Metrics
 from openhands.sdk.llm.utils.model_features import ModelFeatures, get_features
 from openhands.sdk.llm.utils.openhands_provider import (
@@ -1256,7 +1257,8 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
 
         # 2) choose function-calling strategy
         use_native_fc = self.native_tool_calling
-        original_fncall_msgs = copy.deepcopy(formatted_messages)
+        # pre_request_prompt_mock works on a deep copy, so this list is left as-is.
+        original_fncall_msgs = formatted_messages
 
         # Convert Tool objects to ChatCompletionToolParam once here
         cc_tools: list[ChatCompletionToolParam] = []
@@ -1313,7 +1315,7 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
                 }
             )
             if tools and not use_native_fc:
-                telemetry_ctx["raw_messages"] = original_fncall_msgs
+                telemetry_ctx["raw_messages"] = copy.deepcopy(original_fncall_msgs)
 
         return (
             formatted_messages,
@@ -2687,28 +2689,48 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
            If there are two blocks (static + dynamic), only the first is marked
            to enable cross-conversation cache sharing.
         2. Last user/tool message: Mark for caching to extend the cache prefix.
+
+        The marked messages are replaced in ``messages`` by copies carrying the
+        flags; the ``Message`` objects passed in are never modified.
         """
         if len(messages) > 0 and messages[0].role == "system":
             sys_content = messages[0].content
             if len(sys_content) >= 2:
                 # Two-block structure: static (index 0) + dynamic (index 1)
                 # Mark only the static block; ensure dynamic is unmarked
-                sys_content[0].cache_prompt = True
-                sys_content[1].cache_prompt = False
+                messages[0] = self._with_cache_flags(messages[0], {0: True, 1: False})
             elif len(sys_content) == 1:
                 # Single block: mark it for caching
-                sys_content[0].cache_prompt = True
+                messages[0] = self._with_cache_flags(messages[0], {0: True})
 
         # Second breakpoint: mark the last user/tool message so the cached prefix
         # extends every turn. Anthropic-only; Gemini is excluded from
         # PROMPT_CACHE_MODELS because its cache can't extend this way.
-        for message in reversed(messages):
-            if message.role in ("user", "tool"):
-                message.content[
-                    -1
-                ].cache_prompt = True  # Last item inside the message content
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].role in ("user", "tool"):
+                # Last item inside the message content
+                messages[i] = self._with_cache_flags(messages[i], {-1: True})
                 break
 
+    @staticmethod
+    def _with_cache_flags(message: Message, flags: dict[int, bool]) -> Message:
+        """``message`` with ``cache_prompt`` set on the given content blocks.
+
+        Returns a shallow copy that shares everything but the changed blocks,
+        or ``message`` itself if every flag already has the requested value.
+        """
+        content = list(message.content)
+        changed = False
+        for index, flag in flags.items():
+            if content[index].cache_prompt != flag:
+                content[index] = content[index].model_copy(
+                    update={"cache_prompt": flag}
+                )
+                changed = True
+        if not changed:
+            return message
+        return message.model_copy(update={"content": content})
+
     def _inline_required(self) -> bool:
         """Resolve whether http(s) image URLs must be downloaded and inlined."""
         if self.inline_image_urls is not None:
@@ -2718,20 +2740,25 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     def _begin_chat_messages(
         self, messages: list[Message]
     ) -> tuple[list[Message], bool]:
-        """Deepcopy ``messages`` and apply prompt-caching flags.
+        """Copy the ``messages`` list and apply prompt-caching flags.
+
+        Shared by the sync and async chat-formatting paths. Returns the new
+        message list and the resolved ``vision_enabled`` flag so callers can
+        plug in their own (sync or async) inline-image pass without
+        duplicating the boilerplate.
 
-        Shared by the sync and async chat-formatting paths. Returns the
-        detached message list and the resolved ``vision_enabled`` flag so
-        callers can plug in their own (sync or async) inline-image pass
-        without duplicating the boilerplate.
+        Messages are not deep-copied: every pass (prompt caching, inline,
+        resize) replaces the messages it changes with shallow copies and
+        leaves the caller's messages untouched, so unchanged messages and
+        content (including base64 image data) are shared with the input.
         """
-        messages = copy.deepcopy(messages)
+        messages = list(messages)
         if self.is_caching_prompt_active():
             self._apply_prompt_caching(messages)
         return messages, self.vision_is_active()
 
     def _prepare_chat_messages(self, messages: list[Message]) -> list[Message]:
-        """Apply the cache+inline+resize passes, returning detached messages."""
+        """Apply the cache+inline+resize passes, returning a new message list."""
         messages, vision_enabled = self._begin_chat_messages(messages)
         # Inline first (URL → data:), then resize (data: → smaller data:).
         # The resize pass only operates on ``data:image/*`` URLs, so chaining
@@ -2748,31 +2775,80 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         )
         return messages
 
-    def _to_chat_dicts(self, messages: list[Message]) -> list[dict]:
+    def _chat_dict_options(self) -> dict[str, bool]:
         model_features = self._model_features()
-        cache_enabled = self.is_caching_prompt_active()
-        vision_enabled = self.vision_is_active()
-        function_calling_enabled = self.native_tool_calling
-        force_string_serializer = (
-            self.force_string_serializer
-            if self.force_string_serializer is not None
-            else model_features.force_string_serializer
+        return {
+            "cache_enabled": self.is_caching_prompt_active(),
+            "vision_enabled": self.vision_is_active(),
+            "function_calling_enabled": self.native_tool_calling,
+            "force_string_serializer": (
+                self.force_string_serializer
+                if self.force_string_serializer is not None
+                else model_features.force_string_serializer
+            ),
+            "send_reasoning_content": model_features.send_reasoning_content,
+        }
+
+    def _to_chat_dicts(self, messages: list[Message]) -> list[dict]:
+        options = self._chat_dict_options()
+        return [message.to_chat_dict(**options) for message in messages]
+
+    def _reuse_chat_dicts(
+        self, messages: list[Message]
+    ) -> tuple[list[dict | None], list[Message]]:
+        """Serve frozen messages from the chat-dict cache.
+
+        Returns one entry per message (the reused dict, or None) and the
+        messages that still need the full preparation passes. Those are the
+        first message and the last user/tool message (prompt-caching
+        breakpoints), messages with images (inline/resize passes) and any
+        message not frozen by the event projection. Keeping the first and
+        last user/tool message in the pending list makes the prompt-caching
+        pass mark the same blocks it would mark on the full list.
+        """
+        last_user_or_tool = next(
+            (
+                i
+                for i in range(len(messages) - 1, -1, -1)
+                if messages[i].role in ("user", "tool")
+            ),
+            -1,
         )
-        send_reasoning_content = model_features.send_reasoning_content
-        return [
-            message.to_chat_dict(
-                cache_enabled=cache_enabled,
-                vision_enabled=vision_enabled,
-                function_calling_enabled=function_calling_enabled,
-                force_string_serializer=force_string_serializer,
-                send_reasoning_content=send_reasoning_content,
-            )
-            for message in messages
-        ]
+        options = self._chat_dict_options()
+        key = tuple(options.values())
+        reused: list[dict | None] = []
+        pending: list[Message] = []
+        for i, message in enumerate(messages):
+            if (
+                i == 0
+                or i == last_user_or_tool
+                or message.contains_image
+                or not is_frozen(message)
+            ):
+                reused.append(None)
+                pending.append(message)
+            else:
+                reused.append(
+                    cached_chat_dict(message, key, lambda m: m.to_chat_dict(**options))
+                )
+        return reused, pending
+
+    @staticmethod
+    def _merge_chat_dicts(
+        reused: list[dict | None], formatted: list[dict]
+    ) -> list[dict]:
+        pending = iter(formatted)
+        return [d if d is not None else next(pending) for d in reused]
 
     def format_messages_for_llm(self, messages: list[Message]) -> list[dict]:
-        """Formats Message objects for LLM consumption."""
-        return self._to_chat_dicts(self._prepare_chat_messages(messages))
+        """Formats Message objects for LLM consumption.
+
+        Messages frozen by the event projection are serialized once per set of
+        formatting options and reused on later calls.
+        """
+        reused, pending = self._reuse_chat_dicts(messages)
+        formatted = self._to_chat_dicts(self._prepare_chat_messages(pending))
+        return self._merge_chat_dicts(reused, formatted)
 
     async def aformat_messages_for_llm(self, messages: list[Message]) -> list[dict]:
         """Async variant that runs the blocking inline/resize pass off-loop.
@@ -2782,6 +2858,7 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         ``aformat_messages_for_responses``), because ``await`` cannot be
         used inside the synchronous helper.
         """
+        reused, messages = self._reuse_chat_dicts(messages)
         messages, vision_enabled = self._begin_chat_messages(messages)
         messages = await amaybe_inline_image_urls(
             messages,
@@ -2793,20 +2870,24 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             provider=self._infer_model_info_provider(),
             vision_enabled=vision_enabled,
         )
-        return self._to_chat_dicts(messages)
+        return self._merge_chat_dicts(reused, self._to_chat_dicts(messages))
 
     def _prepare_responses_messages(self, messages: list[Message]) -> list[Message]:
-        """Detach messages and optionally strip reasoning items."""
-        msgs = copy.deepcopy(messages)
+        """Copy the message list and optionally strip reasoning items.
 
+        Like the chat path, messages are only copied (shallowly) when changed.
+        """
         # Subscription mode (store=false): strip reasoning items from prior
         # assistant turns. The Codex endpoint doesn't persist items, so
         # referencing their IDs in follow-up requests causes a 404.
         if self.is_subscription:
-            for m in msgs:
-                if m.role == "assistant" and m.responses_reasoning_item is not None:
-                    m.responses_reasoning_item = None
-        return msgs
+            return [
+                m.model_copy(update={"responses_reasoning_item": None})
+                if m.role == "assistant" and m.responses_reasoning_item is not None
+                else m
+                for m in messages
+            ]
+        return list(messages)
 
     def _build_responses_payload(
         self, msgs: list[Message]
@@ -2995,8 +3076,13 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
 
     @staticmethod
     def _messages_for_chat_template(messages: list[dict]) -> list[dict]:
-        template_messages = copy.deepcopy(messages)
-        for message in template_messages:
+        """Reshape chat dicts for ``apply_chat_template``.
+
+        Only the dicts that are reshaped are copied (shallowly, along the
+        changed path); the input dicts are not modified.
+        """
+        template_messages: list[dict] = []
+        for message in messages:
             content = message.get("content")
             if isinstance(content, list):
                 text_parts: list[str] = []
@@ -3006,21 +3092,29 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
                         break
                     text_parts.append(str(block.get("text", "")))
                 if text_parts:
-                    message["content"] = "".join(text_parts)
+                    message = {**message, "content": "".join(text_parts)}
 
-            for tool_call in message.get("tool_calls") or []:
+            tool_calls = message.get("tool_calls") or []
+            new_tool_calls: list[Any] = []
+            for tool_call in tool_calls:
                 function = tool_call.get("function")
-                if not isinstance(function, dict):
-                    continue
-                arguments = function.get("arguments")
-                if not isinstance(arguments, str):
-                    continue
-                try:
-                    parsed_arguments = json.loads(arguments)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(parsed_arguments, dict):
-                    function["arguments"] = parsed_arguments
+                arguments = (
+                    function.get("arguments") if isinstance(function, dict) else None
+                )
+                if isinstance(arguments, str):
+                    try:
+                        parsed_arguments = json.loads(arguments)
+                    except json.JSONDecodeError:
+                        parsed_arguments = None
+                    if isinstance(parsed_arguments, dict):
+                        tool_call = {
+                            **tool_call,
+                            "function": {**function, "arguments": parsed_arguments},
+                        }
+                new_tool_calls.append(tool_call)
+            if any(a is not b for a, b in zip(new_tool_calls, tool_calls)):
+                message = {**message, "tool_calls": new_tool_calls}
+            template_messages.append(message)
         return template_messages
 
     @staticmethod
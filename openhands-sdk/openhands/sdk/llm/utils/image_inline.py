@@ -8,7 +8,9 @@ leaves the SDK.
 
 Failures are non-fatal: the original URL is preserved and the upstream is
 allowed to produce its native error. We also keep a small in-memory cache so
-the same image is not re-downloaded on every conversation turn.
+the same image is not re-downloaded on every conversation turn. The cache is
+shared with the provider resize pass in ``image_resize``, so both stay under
+one memory budget.
 
 Security: requests are validated against an SSRF block-list of loopback,
 private, link-local, multicast and otherwise reserved IP ranges, and
@@ -91,10 +93,10 @@ _ALLOWED_IMAGE_MIMES = frozenset(
 
 
 class _DataUrlCache:
-    """Bounded LRU cache mapping URL → ``data:`` URL.
+    """Bounded LRU cache mapping URL (or another string key) → ``data:`` URL.
 
-    Size is bounded by the total encoded size of cached entries so a few
-    very large images can't push everything else out.
+    Size is bounded by the total encoded size of cached keys and values so a
+    few very large images can't push everything else out.
     """
 
     def __init__(self, max_bytes: int) -> None:
@@ -111,7 +113,7 @@ class _DataUrlCache:
             return value
 
     def put(self, url: str, data_url: str) -> None:
-        encoded_size = len(data_url)
+        encoded_size = len(url) + len(data_url)
         if encoded_size > self._max_bytes:
             # A single image larger than the cache budget: skip caching it.
             logger.debug(
@@ -125,12 +127,12 @@ class _DataUrlCache:
         with self._lock:
             existing = self._entries.pop(url, None)
             if existing is not None:
-                self._size_bytes -= len(existing)
+                self._size_bytes -= len(url) + len(existing)
             self._entries[url] = data_url
             self._size_bytes += encoded_size
             while self._size_bytes > self._max_bytes and self._entries:
-                _, evicted = self._entries.popitem(last=False)
-                self._size_bytes -= len(evicted)
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted_key) + len(evicted)
 
     def clear(self) -> None:
         with self._lock:
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import base64
 import copy
+import hashlib
 import io
 
 from PIL import Image
 
 from openhands.sdk.llm.message import ImageContent, Message
+from openhands.sdk.llm.utils.image_inline import _CACHE
 from openhands.sdk.logger import get_logger
 
 
@@ -24,7 +26,11 @@ ANTHROPIC_STANDARD_IMAGE_MAX_DIMENSION = 8000
 def maybe_resize_messages_for_provider(
     messages: list[Message], *, provider: str | None, vision_enabled: bool
 ) -> list[Message]:
-    """Return a detached message list with provider-specific image resizing."""
+    """Return a detached message list with provider-specific image resizing.
+
+    Input messages are never mutated: messages whose images change are
+    replaced by copies, and the input list is returned when nothing changes.
+    """
     max_dimension = _get_image_max_dimension(
         messages=messages,
         provider=provider,
@@ -33,15 +39,29 @@ def maybe_resize_messages_for_provider(
     if max_dimension is None:
         return messages
 
-    resized_messages = copy.deepcopy(messages)
-    for message in resized_messages:
-        for content_item in message.content:
-            if isinstance(content_item, ImageContent):
-                content_item.image_urls = [
-                    _resize_base64_data_url(url, max_dimension=max_dimension)
-                    for url in content_item.image_urls
-                ]
-    return resized_messages
+    out: list[Message] | None = None
+    for msg_index, message in enumerate(messages):
+        new_content_items: list | None = None
+        for item_index, item in enumerate(message.content):
+            if not isinstance(item, ImageContent):
+                continue
+            new_urls = [
+                _resize_base64_data_url(url, max_dimension=max_dimension)
+                for url in item.image_urls
+            ]
+            if new_urls == item.image_urls:
+                continue
+            if new_content_items is None:
+                new_content_items = list(message.content)
+            new_content_items[item_index] = item.model_copy(
+                update={"image_urls": new_urls}
+            )
+        if new_content_items is None:
+            continue
+        if out is None:
+            out = copy.copy(messages)
+        out[msg_index] = message.model_copy(update={"content": new_content_items})
+    return out if out is not None else messages
 
 
 def _get_image_max_dimension(
@@ -65,6 +85,13 @@ def _get_image_max_dimension(
 
 
 def _resize_base64_data_url(url: str, *, max_dimension: int) -> str:
+    """Return ``url`` scaled down to ``max_dimension``, or ``url`` itself.
+
+    Results are kept in the shared image cache, keyed by the image's content
+    hash and the limit, so each image is decoded and resized once rather
+    than on every request that carries it. Images that need no resizing are
+    cached as an empty string.
+    """
     if not url.startswith("data:image/"):
         return url
 
@@ -72,13 +99,28 @@ def _resize_base64_data_url(url: str, *, max_dimension: int) -> str:
     if not sep:
         return url
 
+    digest = hashlib.sha256(url.encode("utf-8", "surrogatepass")).hexdigest()
+    key = f"resize:{max_dimension}:{digest}"
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached or url
+
+    resized = _resize_base64_image(header, encoded, max_dimension=max_dimension)
+    _CACHE.put(key, resized or "")
+    return resized or url
+
+
+def _resize_base64_image(
+    header: str, encoded: str, *, max_dimension: int
+) -> str | None:
+    """Decode, resize and re-encode one image; None when it is left as is."""
     mime_type = header.removeprefix("data:")
 
     try:
         raw_bytes = base64.b64decode(encoded)
         with Image.open(io.BytesIO(raw_bytes)) as image:
             if max(image.size) <= max_dimension:
-                return url
+                return None
 
             image.thumbnail(
                 (max_dimension, max_dimension),
@@ -100,7 +142,7 @@ def _resize_base64_data_url(url: str, *, max_dimension: int) -> str:
             "Failed to resize base64 data image for outgoing LLM request",
             exc_info=True,
         )
-        return url
+        return None
 
     resized_encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
     return f"data:{mime_type};base64,{resized_encoded}"
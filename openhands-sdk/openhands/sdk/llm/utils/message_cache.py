@@ -0,0 +1,83 @@
+"""Reuse of chat-completion dicts for messages that are never mutated.
+
+``LLM.format_messages_for_llm`` normally deep-copies every message and
+serializes it again on each call. Messages registered with
+``freeze_message`` promise not to change after registration (the event
+projection in ``LLMConvertibleEvent.events_to_messages`` registers the
+messages it memoizes), so their serialized form can be kept and reused for
+as long as the message object is alive.
+
+Registration is tracked by object identity, with a weak reference so the
+entry goes away with the message. Copies of a frozen message (``deepcopy``,
+``model_copy``) are not frozen.
+"""
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from openhands.sdk.llm.message import Message
+
+
+class _FrozenMessage:
+    __slots__ = ("ref", "chat_dicts")
+
+    def __init__(self, ref: weakref.ref[Message]):
+        self.ref = ref
+        self.chat_dicts: dict[Hashable, dict[str, Any]] = {}
+
+
+_frozen: dict[int, _FrozenMessage] = {}
+_frozen_lock = threading.Lock()
+
+
+def _forget(key: int, ref: weakref.ref[Message]) -> None:
+    with _frozen_lock:
+        entry = _frozen.get(key)
+        if entry is not None and entry.ref is ref:
+            del _frozen[key]
+
+
+def freeze_message(message: Message) -> Message:
+    """Register ``message`` as immutable from now on and return it."""
+    key = id(message)
+    with _frozen_lock:
+        entry = _frozen.get(key)
+        if entry is None or entry.ref() is not message:
+            ref = weakref.ref(message, lambda r: _forget(key, r))
+            _frozen[key] = _FrozenMessage(ref)
+    return message
+
+
+def is_frozen(message: Message) -> bool:
+    """Whether ``message`` itself (not a copy) was passed to ``freeze_message``."""
+    entry = _frozen.get(id(message))
+    return entry is not None and entry.ref() is message
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def cached_chat_dict(
+    message: Message,
+    key: Hashable,
+    render: Callable[[Message], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return ``render(message)`` for a frozen message, computed once per ``key``.
+
+    ``key`` identifies the serialization options. Each call returns a fresh
+    copy, so callers may mutate the result.
+    """
+    entry = _frozen.get(id(message))
+    if entry is None or entry.ref() is not message:
+        return render(message)
+    chat_dict = entry.chat_dicts.get(key)
+    if chat_dict is None:
+        chat_dict = entry.chat_dicts[key] = render(message)
+    return _copy_json(chat_dict)
@@ -12,8 +12,10 @@ Copies / consumers (keep in sync when changing):
 
 import copy
 import re
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Callable, Iterator, Mapping
+from functools import lru_cache
+from itertools import islice
+from typing import Any, NamedTuple
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import httpx
@@ -79,13 +81,147 @@ def is_secret_key(key: str) -> bool:
     return any(pattern in key_upper for pattern in SECRET_KEY_PATTERNS)
 
 
-def _redact_all_values(value: Any) -> Any:
-    """Recursively redact all values while preserving structure (key names)."""
-    if isinstance(value, Mapping):
-        return {k: _redact_all_values(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_redact_all_values(item) for item in value]
-    return "<redacted>"
+# Marks list items and the root value, which have no key to check.
+_NO_KEY: Any = object()
+
+# A visitor maps ``(key, value)`` to ``(new_value, child_visitor)``; a child
+# visitor that is not None means ``new_value`` is a container to walk with it.
+type _Visitor = Callable[[Any, Any], tuple[Any, _Visitor | None]]
+
+# JSON scalar types, checked by exact type before the (much slower)
+# ``isinstance(value, Mapping)`` ABC check.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_container(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return True
+    if value_type in _SCALAR_TYPES:
+        return False
+    return isinstance(value, (Mapping, list))
+
+
+class _Frame:
+    """A container being rebuilt by ``_rebuild``.
+
+    Entries are copied into ``out`` only once one of them changes, so an
+    unchanged container is returned as is.
+    """
+
+    __slots__ = ("node", "visit", "is_map", "entries", "index", "out", "pending")
+
+    def __init__(self, node: Any, visit: _Visitor):
+        self.node = node
+        self.visit = visit
+        self.entries: Iterator[Any]
+        # Exact dict/list checks first: they are much cheaper than the ABC check.
+        if type(node) is dict or (type(node) is not list and isinstance(node, Mapping)):
+            self.is_map = True
+            self.entries = iter(node.items())
+        else:
+            self.is_map = False
+            self.entries = iter(node)
+        self.index = 0
+        self.out: Any = None
+        self.pending: tuple[Any, Any] = (_NO_KEY, None)
+
+    def put(self, key: Any, old: Any, new: Any) -> None:
+        if self.out is None:
+            if new is old:
+                self.index += 1
+                return
+            if self.is_map:
+                self.out = dict(islice(self.node.items(), self.index))
+            else:
+                self.out = list(islice(self.node, self.index))
+        if self.is_map:
+            self.out[key] = new
+        else:
+            self.out.append(new)
+
+    def result(self) -> Any:
+        if self.out is not None:
+            return self.out
+        if type(self.node) is (dict if self.is_map else list):
+            return self.node
+        return dict(self.node) if self.is_map else list(self.node)
+
+
+def _rebuild(root: Any, visit: _Visitor) -> Any:
+    """Apply ``visit`` to a nested dict/list structure without recursion.
+
+    Containers whose entries are all returned unchanged are shared with the
+    input rather than copied; other mappings and lists are rebuilt as plain
+    ``dict`` and ``list``.
+    """
+    value, child_visit = visit(_NO_KEY, root)
+    if child_visit is None:
+        return value
+    stack = [_Frame(value, child_visit)]
+    while True:
+        frame = stack[-1]
+        frame_visit = frame.visit
+        if frame.is_map:
+            for key, old in frame.entries:
+                new, child_visit = frame_visit(key, old)
+                if child_visit is not None:
+                    frame.pending = (key, old)
+                    stack.append(_Frame(new, child_visit))
+                    break
+                if new is old and frame.out is None:
+                    frame.index += 1
+                else:
+                    frame.put(key, old, new)
+            else:
+                child_visit = None
+        else:
+            for old in frame.entries:
+                new, child_visit = frame_visit(_NO_KEY, old)
+                if child_visit is not None:
+                    frame.pending = (_NO_KEY, old)
+                    stack.append(_Frame(new, child_visit))
+                    break
+                if new is old and frame.out is None:
+                    frame.index += 1
+                else:
+                    frame.put(_NO_KEY, old, new)
+            else:
+                child_visit = None
+        if child_visit is not None:
+            continue
+        result = frame.result()
+        stack.pop()
+        if not stack:
+            return result
+        stack[-1].put(*stack[-1].pending, result)
+
+
+def _redact_all_visit(_key: Any, value: Any) -> tuple[Any, _Visitor | None]:
+    """Redact all values while preserving structure (key names)."""
+    if _is_container(value):
+        return value, _redact_all_visit
+    return "<redacted>", None
+
+
+@lru_cache(maxsize=1024)
+def _key_redaction(key: str) -> int:
+    """0: keep the value, 1: redact it, 2: redact all values nested in it."""
+    if key.lower() in REDACT_ALL_VALUES_KEYS:
+        return 2
+    return 1 if is_secret_key(key) else 0
+
+
+def _sanitize_visit(key: Any, value: Any) -> tuple[Any, _Visitor | None]:
+    if key is not _NO_KEY:
+        redaction = _key_redaction(key if type(key) is str else str(key))
+        if redaction == 2:
+            return _redact_all_visit(key, value)
+        if redaction == 1:
+            return "<redacted>", None
+    if _is_container(value):
+        return value, _sanitize_visit
+    return value, None
 
 
 def sanitize_dict(content: Any) -> Any:
@@ -96,27 +232,16 @@ def sanitize_dict(content: Any) -> Any:
     - Redacts ALL nested values for keys in REDACT_ALL_VALUES_KEYS
     - Leaves other values unchanged
 
+    Dicts and lists in which nothing was redacted are returned as they are
+    rather than copied, so treat the result as read-only.
+
     Args:
         content: A dict, list, or scalar value to sanitize
 
     Returns:
-        A sanitized copy with secrets replaced by '<redacted>'
+        The content with secrets replaced by '<redacted>'
     """
-    if isinstance(content, Mapping):
-        sanitized = {}
-        for key, value in content.items():
-            key_str = str(key)
-            key_lower = key_str.lower()
-            if key_lower in REDACT_ALL_VALUES_KEYS:
-                sanitized[key] = _redact_all_values(value)
-            elif is_secret_key(key_str):
-                sanitized[key] = "<redacted>"
-            else:
-                sanitized[key] = sanitize_dict(value)
-        return sanitized
-    if isinstance(content, list):
-        return [sanitize_dict(item) for item in content]
-    return content
+    return _rebuild(content, _sanitize_visit)
 
 
 def http_error_log_content(response: httpx.Response) -> str | dict:
@@ -249,15 +374,17 @@ def redact_url_params(url: str) -> str:
     return urlunparse(parsed._replace(query=redacted_query))
 
 
+def _redact_urls_visit(_key: Any, value: Any) -> tuple[Any, _Visitor | None]:
+    if isinstance(value, (dict, list)):
+        return value, _redact_urls_visit
+    if isinstance(value, str) and "?" in value:
+        return redact_url_params(value), None
+    return value, None
+
+
 def _walk_redact_urls(obj: Any) -> Any:
-    """Recursively walk a nested dict/list, applying URL param redaction to strings."""
-    if isinstance(obj, dict):
-        return {k: _walk_redact_urls(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_walk_redact_urls(item) for item in obj]
-    if isinstance(obj, str) and "?" in obj:
-        return redact_url_params(obj)
-    return obj
+    """Walk a nested dict/list, applying URL param redaction to strings."""
+    return _rebuild(obj, _redact_urls_visit)
 
 
 def sanitize_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -279,6 +406,73 @@ def sanitize_config(config: dict[str, Any]) -> dict[str, Any]:
     return config
 
 
+class _TextPass(NamedTuple):
+    """One substitution of ``redact_text_secrets``.
+
+    The pass only runs when ``marker`` occurs in the text and, if
+    ``keywords`` is not empty, one of them occurs in the case-folded text.
+    Case folding (unlike ``lower``) maps every character that
+    ``re.IGNORECASE`` matches to a keyword letter onto that letter, e.g. the
+    long s in "ſecret".
+    """
+
+    pattern: re.Pattern[str]
+    replacement: str
+    marker: str
+    keywords: tuple[str, ...] = ()
+
+
+# Applied in order. A pass only ever inserts ``<redacted>``, which contains no
+# marker or keyword, so checking the input text once is exact for every pass.
+_TEXT_PASSES = (
+    # api_key='...' patterns (single or double quotes)
+    _TextPass(re.compile(r"api_key='[^']*'"), "api_key='<redacted>'", "api_key='"),
+    _TextPass(re.compile(r'api_key="[^"]*"'), 'api_key="<redacted>"', 'api_key="'),
+    # Dict entries with sensitive key names (case-insensitive, like is_secret_key)
+    _TextPass(
+        re.compile(
+            r"('[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*':\s*')[^']*(')",
+            re.IGNORECASE,
+        ),
+        r"\g<1><redacted>\2",
+        "':",
+        ("key", "secret", "token", "password"),
+    ),
+    _TextPass(
+        re.compile(
+            r'("[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*":\s*")[^"]*(")',
+            re.IGNORECASE,
+        ),
+        r"\g<1><redacted>\2",
+        '":',
+        ("key", "secret", "token", "password"),
+    ),
+    # URL query params
+    _TextPass(
+        re.compile(
+            r"((?:tavilyApiKey|apiKey|api_key|token|access_token|secret|key)=)"
+            r"[^&\s'\")\]]+",
+            re.IGNORECASE,
+        ),
+        r"\g<1><redacted>",
+        "=",
+        ("key=", "token=", "secret="),
+    ),
+    # Authorization header values
+    _TextPass(
+        re.compile(r"('Authorization':\s*')[^']*(')"),
+        r"\g<1><redacted>\2",
+        "'Authorization':",
+    ),
+    # X-Session-API-Key header values
+    _TextPass(
+        re.compile(r"('X-Session-API-Key':\s*')[^']*(')"),
+        r"\g<1><redacted>\2",
+        "'X-Session-API-Key':",
+    ),
+)
+
+
 def redact_text_secrets(text: str) -> str:
     """Redact secrets from a string representation of a config object.
 
@@ -292,57 +486,28 @@ def redact_text_secrets(text: str) -> str:
     - URL query params matching common secret names
     - Authorization and X-Session-API-Key header values
 
+    Substitutions whose trigger substrings do not occur in the text are
+    skipped, so text without secrets costs a few substring searches.
+
     Args:
         text: The string to redact.
 
     Returns:
         The string with secrets replaced by ``<redacted>``.
     """
-    # api_key='...' patterns (single or double quotes)
-    text = re.sub(r"api_key='[^']*'", "api_key='<redacted>'", text)
-    text = re.sub(r'api_key="[^"]*"', 'api_key="<redacted>"', text)
-
-    # Dict entries with sensitive key names (case-insensitive, like is_secret_key)
-    text = re.sub(
-        r"('[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*':\s*')[^']*(')",
-        r"\g<1><redacted>\2",
-        text,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(
-        r'("[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*":\s*")[^"]*(")',
-        r"\g<1><redacted>\2",
-        text,
-        flags=re.IGNORECASE,
-    )
-
-    # URL query params
-    text = re.sub(
-        r"((?:tavilyApiKey|apiKey|api_key|token|access_token|secret|key)=)"
-        r"[^&\s'\")\]]+",
-        r"\g<1><redacted>",
-        text,
-        flags=re.IGNORECASE,
-    )
-
-    # Authorization header values
-    text = re.sub(
-        r"('Authorization':\s*')[^']*(')",
-        r"\g<1><redacted>\2",
-        text,
-    )
-
-    # X-Session-API-Key header values
-    text = re.sub(
-        r"('X-Session-API-Key':\s*')[^']*(')",
-        r"\g<1><redacted>\2",
-        text,
-    )
+    folded: str | None = None
+    for text_pass in _TEXT_PASSES:
+        if text_pass.marker not in text:
+            continue
+        if text_pass.keywords:
+            if folded is None:
+                folded = text.casefold()
+            if not any(keyword in folded for keyword in text_pass.keywords):
+                continue
+        text = text_pass.pattern.sub(text_pass.replacement, text)
 
     # Bare API key literals (common provider formats)
-    text = redact_api_key_literals(text)
-
-    return text
+    return redact_api_key_literals(text)
 
 
 # Compiled pattern for bare API key literals from common providers.
@@ -370,6 +535,25 @@ _API_KEY_LITERAL_RE = re.compile(
     r")"
 )
 
+# Literal prefixes of the branches above; a text containing none of them
+# cannot match.
+_API_KEY_LITERAL_PREFIXES = (
+    "sk-",  # also covers sk-or-v1, sk-proj, sk-ant, sk-oh, ctx7sk
+    "gsk_",
+    "hf_",
+    "tgp_v1_",
+    "ghp_",
+    "github_pat_",
+    "cla_",
+    "sntryu_",
+    "lin_api_",
+    "tvly-",
+    "ATATT3x",
+    "xoxb-",
+    "xoxp-",
+    "Bearer",
+)
+
 
 def redact_api_key_literals(text: str) -> str:
     """Replace bare API key literals from common providers with ``<redacted>``.
@@ -384,4 +568,6 @@ def redact_api_key_literals(text: str) -> str:
     Returns:
         The string with matching key literals replaced.
     """
+    if not any(prefix in text for prefix in _API_KEY_LITERAL_PREFIXES):
+        return text
     return _API_KEY_LITERAL_RE.sub("<redacted>", text)
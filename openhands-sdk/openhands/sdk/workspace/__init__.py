@@ -1,6 +1,12 @@
 from .base import BaseWorkspace
 from .local import LocalWorkspace
-from .models import CommandResult, FileOperationResult, PlatformType, TargetType
+from .models import (
+    CommandResult,
+    FileOperationResult,
+    PlatformType,
+    SyncResult,
+    TargetType,
+)
 from .remote import AsyncRemoteWorkspace, RemoteWorkspace
 from .repo import CloneResult, GitProvider, RepoMapping, RepoSource
 from .workspace import Workspace
@@ -18,6 +24,7 @@ __all__ = [
     "RemoteWorkspace",
     "RepoMapping",
     "RepoSource",
+    "SyncResult",
     "TargetType",
     "Workspace",
 ]
@@ -11,7 +11,11 @@ from openhands.sdk.event.conversation_error import ConversationErrorEvent
 from openhands.sdk.git.models import GitChange, GitDiff
 from openhands.sdk.logger import get_logger
 from openhands.sdk.utils.models import DiscriminatedUnionMixin
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandResult,
+    FileOperationResult,
+    SyncResult,
+)
 
 
 logger = get_logger(__name__)
@@ -258,6 +262,64 @@ class BaseWorkspace(DiscriminatedUnionMixin, ABC):
             Exception: If path is not a git repository or getting diff failed
         """
 
+    def sync_upload(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a directory on the system match a local directory.
+
+        Only files whose size or modification time differ are sent, and of a
+        large changed file only the blocks that differ.
+
+        Args:
+            source_dir: Path to the local source directory
+            destination_dir: Path to the directory on the system
+            excludes: Glob patterns of paths to leave alone on both sides, with
+                the archive endpoint's gitignore-like semantics
+            delete: Whether to delete files the source directory does not have
+
+        Returns:
+            SyncResult: Result containing success status and transfer counts
+
+        Raises:
+            NotImplementedError: If the workspace type does not support syncing.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support sync_upload()"
+        )
+
+    def sync_download(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a local directory match a directory on the system.
+
+        Only files whose size or modification time differ are sent, and of a
+        large changed file only the blocks that differ.
+
+        Args:
+            source_dir: Path to the source directory on the system
+            destination_dir: Path to the local destination directory
+            excludes: Glob patterns of paths to leave alone on both sides, with
+                the archive endpoint's gitignore-like semantics
+            delete: Whether to delete files the source directory does not have
+
+        Returns:
+            SyncResult: Result containing success status and transfer counts
+
+        Raises:
+            NotImplementedError: If the workspace type does not support syncing.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support sync_download()"
+        )
+
     def pause(self) -> None:
         """Pause the workspace to conserve resources.
 
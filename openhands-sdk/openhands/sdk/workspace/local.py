@@ -8,7 +8,12 @@ from openhands.sdk.git.models import GitChange, GitDiff
 from openhands.sdk.logger import get_logger
 from openhands.sdk.utils.command import execute_command
 from openhands.sdk.workspace.base import BaseWorkspace
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandResult,
+    FileOperationResult,
+    SyncResult,
+)
+from openhands.sdk.workspace.sync import sync_directories
 
 
 logger = get_logger(__name__)
@@ -169,6 +174,88 @@ class LocalWorkspace(BaseWorkspace):
                 error=str(e),
             )
 
+    def sync_upload(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Sync a directory locally.
+
+        Only files whose size or modification time differ are copied, and of a
+        large changed file only the blocks that differ.
+
+        Args:
+            source_dir: Path to the source directory
+            destination_dir: Path to the directory to make match the source
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete files the source directory does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        return self._sync(source_dir, destination_dir, excludes, delete)
+
+    def sync_download(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Sync a directory locally.
+
+        Only files whose size or modification time differ are copied, and of a
+        large changed file only the blocks that differ.
+
+        Args:
+            source_dir: Path to the source directory
+            destination_dir: Path to the directory to make match the source
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete files the source directory does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        return self._sync(source_dir, destination_dir, excludes, delete)
+
+    def _sync(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None,
+        delete: bool,
+    ) -> SyncResult:
+        source = Path(source_dir)
+        destination = Path(destination_dir)
+
+        logger.debug(f"Local directory sync: {source} -> {destination}")
+
+        try:
+            if not source.is_dir():
+                raise NotADirectoryError(f"Not a directory: {source}")
+            stats, size = sync_directories(
+                source, destination, excludes or [], delete=delete
+            )
+            return SyncResult(
+                success=True,
+                source_path=str(source),
+                destination_path=str(destination),
+                files_transferred=stats.files_written,
+                files_deleted=stats.files_deleted,
+                bytes_transferred=size,
+            )
+
+        except Exception as e:
+            logger.error(f"Local directory sync failed: {e}")
+            return SyncResult(
+                success=False,
+                source_path=str(source),
+                destination_path=str(destination),
+                error=str(e),
+            )
+
     def git_changes(self, path: str | Path) -> list[GitChange]:
         """Get the git changes for the repository at the path given.
 
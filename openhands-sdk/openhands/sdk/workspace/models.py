@@ -41,3 +41,21 @@ class FileOperationResult(BaseModel):
     error: str | None = Field(
         default=None, description="Error message (if operation failed)"
     )
+
+
+class SyncResult(BaseModel):
+    """Result of an incremental directory sync."""
+
+    success: bool = Field(description="Whether the sync was successful")
+    source_path: str = Field(description="Path to the source directory")
+    destination_path: str = Field(description="Path to the destination directory")
+    files_transferred: int = Field(
+        default=0, description="Number of files created or updated"
+    )
+    files_deleted: int = Field(default=0, description="Number of files deleted")
+    bytes_transferred: int = Field(
+        default=0, description="Size in bytes of the compressed stream of changes"
+    )
+    error: str | None = Field(
+        default=None, description="Error message (if operation failed)"
+    )
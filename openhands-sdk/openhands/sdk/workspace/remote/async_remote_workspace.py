@@ -1,13 +1,18 @@
+import asyncio
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from urllib.request import urlopen
 
 import httpx
 from pydantic import PrivateAttr
 
 from openhands.sdk.git.models import GitChange, GitDiff
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandResult,
+    FileOperationResult,
+    SyncResult,
+)
 from openhands.sdk.workspace.remote.remote_workspace_mixin import RemoteWorkspaceMixin
 
 
@@ -45,15 +50,38 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
             self._client = client
         return client
 
-    async def _execute(self, generator: Generator[dict[str, Any], httpx.Response, Any]):
+    async def _execute(self, generator: Generator[Any, Any, Any]):
         try:
             kwargs = next(generator)
             while True:
-                response = await self.client.request(**kwargs)
+                if isinstance(kwargs, list):
+                    # Sent in parallel; each request's exception is returned
+                    # in place of its response.
+                    response = await asyncio.gather(
+                        *(self.client.request(**request) for request in kwargs),
+                        return_exceptions=True,
+                    )
+                elif "stream_to" in kwargs:
+                    response = await self._request_streaming(**kwargs)
+                else:
+                    response = await self.client.request(**kwargs)
                 kwargs = generator.send(response)
         except StopIteration as e:
             return e.value
 
+    async def _request_streaming(
+        self, stream_to: IO[bytes], **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, writing a successful response's body to ``stream_to``
+        as it arrives instead of holding it in memory."""
+        async with self.client.stream(**kwargs) as response:
+            if not response.is_success:
+                await response.aread()
+                return response
+            async for chunk in response.aiter_bytes():
+                stream_to.write(chunk)
+        return response
+
     async def execute_command(
         self,
         command: str,
@@ -117,6 +145,62 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
         result = await self._execute(generator)
         return result
 
+    async def sync_upload(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a directory on the remote system match a local directory.
+
+        Exchanges file manifests with the remote system and sends only the files
+        whose size or modification time differ, and of a large changed file only
+        the blocks that differ, as one compressed stream.
+
+        Args:
+            source_dir: Path to the local source directory
+            destination_dir: Path to the directory on the remote system
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete remote files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        generator = self._sync_upload_generator(
+            source_dir, destination_dir, excludes, delete
+        )
+        result = await self._execute(generator)
+        return result
+
+    async def sync_download(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a local directory match a directory on the remote system.
+
+        Exchanges file manifests with the remote system and fetches only the files
+        whose size or modification time differ, and of a large changed file only
+        the blocks that differ, as one compressed stream.
+
+        Args:
+            source_dir: Path to the source directory on the remote system
+            destination_dir: Path to the local destination directory
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete local files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        generator = self._sync_download_generator(
+            source_dir, destination_dir, excludes, delete
+        )
+        result = await self._execute(generator)
+        return result
+
     async def git_changes(self, path: str | Path) -> list[GitChange]:
         """Get the git changes for the repository at the path given.
 
@@ -1,8 +1,9 @@
 import json
 import os
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 from urllib.parse import quote
 from urllib.request import urlopen
 
@@ -15,7 +16,11 @@ from openhands.sdk.logger import get_logger
 from openhands.sdk.mcp.config import MCPServer
 from openhands.sdk.settings import SecretsListResponse, SettingsResponse
 from openhands.sdk.workspace.base import BaseWorkspace
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandResult,
+    FileOperationResult,
+    SyncResult,
+)
 from openhands.sdk.workspace.remote.remote_workspace_mixin import RemoteWorkspaceMixin
 from openhands.sdk.workspace.repo import (
     CloneResult,
@@ -106,15 +111,49 @@ class RemoteWorkspace(RemoteWorkspaceMixin, BaseWorkspace):
             self._client = client
         return client
 
-    def _execute(self, generator: Generator[dict[str, Any], httpx.Response, Any]):
+    def _execute(self, generator: Generator[Any, Any, Any]):
         try:
             kwargs = next(generator)
             while True:
-                response = self.client.request(**kwargs)
+                if isinstance(kwargs, list):
+                    response = self._request_concurrently(kwargs)
+                elif "stream_to" in kwargs:
+                    response = self._request_streaming(**kwargs)
+                else:
+                    response = self.client.request(**kwargs)
                 kwargs = generator.send(response)
         except StopIteration as e:
             return e.value
 
+    def _request_streaming(self, stream_to: IO[bytes], **kwargs: Any) -> httpx.Response:
+        """Send a request, writing a successful response's body to ``stream_to``
+        as it arrives instead of holding it in memory."""
+        with self.client.stream(**kwargs) as response:
+            if not response.is_success:
+                response.read()
+                return response
+            for chunk in response.iter_bytes():
+                stream_to.write(chunk)
+        return response
+
+    def _request_concurrently(
+        self, requests: list[dict[str, Any]]
+    ) -> list[httpx.Response | Exception]:
+        """Send requests in parallel, returning each response or the exception
+        its request raised."""
+        client = self.client
+
+        def request(kwargs: dict[str, Any]) -> httpx.Response | Exception:
+            try:
+                return client.request(**kwargs)
+            except Exception as e:
+                return e
+
+        if len(requests) == 1:
+            return [request(requests[0])]
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            return list(executor.map(request, requests))
+
     def get_server_info(self) -> dict[str, Any]:
         """Return server metadata from the agent-server.
 
@@ -193,6 +232,62 @@ class RemoteWorkspace(RemoteWorkspaceMixin, BaseWorkspace):
         result = self._execute(generator)
         return result
 
+    def sync_upload(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a directory on the remote system match a local directory.
+
+        Exchanges file manifests with the remote system and sends only the files
+        whose size or modification time differ, and of a large changed file only
+        the blocks that differ, as one compressed stream.
+
+        Args:
+            source_dir: Path to the local source directory
+            destination_dir: Path to the directory on the remote system
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete remote files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        generator = self._sync_upload_generator(
+            source_dir, destination_dir, excludes, delete
+        )
+        result = self._execute(generator)
+        return result
+
+    def sync_download(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> SyncResult:
+        """Make a local directory match a directory on the remote system.
+
+        Exchanges file manifests with the remote system and fetches only the files
+        whose size or modification time differ, and of a large changed file only
+        the blocks that differ, as one compressed stream.
+
+        Args:
+            source_dir: Path to the source directory on the remote system
+            destination_dir: Path to the local destination directory
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete local files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        generator = self._sync_download_generator(
+            source_dir, destination_dir, excludes, delete
+        )
+        result = self._execute(generator)
+        return result
+
     def git_changes(self, path: str | Path) -> list[GitChange]:
         """Get the git changes for the repository at the path given.
 
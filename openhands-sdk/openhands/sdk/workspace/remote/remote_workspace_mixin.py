@@ -1,19 +1,57 @@
+import hashlib
+import json
 import logging
+import os
+import tempfile
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path, PureWindowsPath
-from typing import Any
+from typing import IO, Any
 
 import httpx
-from pydantic import BaseModel, Field, TypeAdapter
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 
 from openhands.sdk.git.models import GitChange, GitDiff
 from openhands.sdk.utils.path import to_posix_path
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandResult,
+    FileOperationResult,
+    SyncResult,
+)
+from openhands.sdk.workspace.sync import (
+    SYNC_BLOCK_SIZE,
+    SYNC_SPOOL_SIZE,
+    SyncBlocksRequest,
+    SyncDownloadRequest,
+    SyncFile,
+    SyncManifest,
+    SyncManifestRequest,
+    SyncStats,
+    apply_sync_archive,
+    block_hashes,
+    build_manifest,
+    delete_synced_file,
+    plan_sync,
+    write_sync_archive,
+)
 
 
 _logger = logging.getLogger(__name__)
 
+# Each byte range of a large file transfer is attempted this many times before
+# a dropped connection or server error fails the whole transfer.
+_TRANSFER_ATTEMPTS = 3
+
+
+class _RangeUploadUnsupportedError(Exception):
+    """The server has no ranged upload endpoint."""
+
+
+def _is_transient(response: httpx.Response | BaseException) -> bool:
+    if isinstance(response, BaseException):
+        return isinstance(response, httpx.TransportError)
+    return response.status_code >= 500
+
 
 def _remote_path(path: str | Path) -> str:
     return to_posix_path(path)
@@ -51,6 +89,22 @@ class RemoteWorkspaceMixin(BaseModel):
         description="Maximum number of connections for httpx.Client. "
         "None means no limit, useful for running many conversations in parallel.",
     )
+    transfer_chunk_size: int = Field(
+        default=8 * 1024 * 1024,
+        gt=0,
+        description="Files larger than this many bytes are uploaded and downloaded "
+        "as byte ranges of this size, each retried on its own if its connection "
+        "drops, and skipped altogether when the remote copy has the same SHA-256.",
+    )
+    transfer_streams: int = Field(
+        default=1,
+        ge=1,
+        description="Number of byte ranges of a large file transferred in parallel.",
+    )
+
+    # Cleared once the server turns out not to offer command streaming, so
+    # later commands go straight to polling.
+    _command_streaming: bool = PrivateAttr(default=True)
 
     def model_post_init(self, context: Any) -> None:
         # Set up remote host
@@ -72,8 +126,10 @@ class RemoteWorkspaceMixin(BaseModel):
     ) -> Generator[dict[str, Any], httpx.Response, CommandResult]:
         """Execute a bash command on the remote system.
 
-        This method starts a bash command via the remote agent server API,
-        then polls for the output until the command completes.
+        This method runs the command through the agent server's streaming
+        endpoint, which answers with the command's output once it completes,
+        so no polling interval is added to its run time. Servers without that
+        endpoint get the command started and polled instead.
 
         Args:
             command: The bash command to execute
@@ -84,21 +140,109 @@ class RemoteWorkspaceMixin(BaseModel):
             CommandResult: Result with stdout, stderr, exit_code, and other metadata
         """
         _logger.debug("Executing remote command")
+        if not self._command_streaming:
+            return (yield from self._poll_command_generator(command, cwd, timeout))
+
+        start_time = time.time()
+        try:
+            response: httpx.Response = yield {
+                "method": "POST",
+                "url": f"{self.host}/api/bash/stream_bash_command",
+                "json": self._command_payload(command, cwd, timeout),
+                "headers": self._headers,
+                "timeout": timeout + 5.0,  # Add buffer to HTTP timeout
+            }
+            if response.status_code in (404, 405):
+                _logger.debug("Command streaming unavailable, falling back to polling")
+                self._command_streaming = False
+                return (yield from self._poll_command_generator(command, cwd, timeout))
+            response.raise_for_status()
+
+            command_id = None
+            outputs = []
+            for line in response.text.splitlines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get("kind") == "BashCommand":
+                    command_id = event["id"]
+                elif event.get("kind") == "BashOutput":
+                    outputs.append(event)
+        except Exception as e:
+            _logger.error(
+                "Remote command execution failed (error_type=%s)",
+                type(e).__name__,
+            )
+            return CommandResult(
+                command=command,
+                exit_code=-1,
+                stdout="",
+                stderr=f"Remote execution error: {str(e)}",
+                timeout_occurred=False,
+            )
+
+        if outputs and outputs[-1].get("exit_code") is not None:
+            exit_code = outputs[-1]["exit_code"]
+            stderr = "".join(event.get("stderr") or "" for event in outputs)
+            # The server reports a command it killed at the timeout as -1.
+            timed_out = exit_code == -1 and time.time() - start_time >= timeout
+            if timed_out:
+                _logger.warning(
+                    "Command timed out after %s seconds (command_id=%s)",
+                    timeout,
+                    command_id,
+                )
+                stderr += f"Command timed out after {timeout} seconds"
+            return CommandResult(
+                command=command,
+                exit_code=exit_code,
+                stdout="".join(event.get("stdout") or "" for event in outputs),
+                stderr=stderr,
+                timeout_occurred=timed_out,
+            )
+        if command_id is None:
+            return CommandResult(
+                command=command,
+                exit_code=-1,
+                stdout="",
+                stderr="Remote execution error: empty command stream",
+                timeout_occurred=False,
+            )
+        # The stream ended early; collect the rest of the output by polling.
+        return (
+            yield from self._poll_command_output_generator(
+                command, command_id, timeout, outputs
+            )
+        )
 
-        # Step 1: Start the bash command
-        payload = {
+    def _command_payload(
+        self, command: str, cwd: str | Path | None, timeout: float
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
             "command": command,
             "timeout": int(timeout),
         }
         if cwd is not None:
             payload["cwd"] = _remote_path(cwd)
+        return payload
 
+    def _poll_command_generator(
+        self,
+        command: str,
+        cwd: str | Path | None,
+        timeout: float,
+    ) -> Generator[dict[str, Any], httpx.Response, CommandResult]:
+        """Execute a bash command on the remote system by polling its output.
+
+        This method starts a bash command via the remote agent server API,
+        then polls for the output until the command completes.
+        """
         try:
             # Start the command
             response: httpx.Response = yield {
                 "method": "POST",
                 "url": f"{self.host}/api/bash/start_bash_command",
-                "json": payload,
+                "json": self._command_payload(command, cwd, timeout),
                 "headers": self._headers,
                 "timeout": timeout + 5.0,  # Add buffer to HTTP timeout
             }
@@ -107,13 +251,45 @@ class RemoteWorkspaceMixin(BaseModel):
             command_id = bash_command["id"]
 
             _logger.debug(f"Started command with ID: {command_id}")
+        except Exception as e:
+            _logger.error(
+                "Remote command execution failed (error_type=%s)",
+                type(e).__name__,
+            )
+            return CommandResult(
+                command=command,
+                exit_code=-1,
+                stdout="",
+                stderr=f"Remote execution error: {str(e)}",
+                timeout_occurred=False,
+            )
+
+        return (
+            yield from self._poll_command_output_generator(
+                command, command_id, timeout, []
+            )
+        )
+
+    def _poll_command_output_generator(
+        self,
+        command: str,
+        command_id: str,
+        timeout: float,
+        received: list[dict[str, Any]],
+    ) -> Generator[dict[str, Any], httpx.Response, CommandResult]:
+        """Poll for the output of a started command until it completes.
 
-            # Step 2: Poll for output until command completes
+        ``received`` holds ``BashOutput`` events already seen for the command;
+        polling resumes after the highest order among them.
+        """
+        try:
+            # Poll for output until command completes
             start_time = time.time()
-            stdout_parts = []
-            stderr_parts = []
+            stdout_parts = [e["stdout"] for e in received if e.get("stdout")]
+            stderr_parts = [e["stderr"] for e in received if e.get("stderr")]
             exit_code = None
-            last_order = -1  # Track highest order seen to fetch only new events
+            # Track highest order seen to fetch only new events
+            last_order = max((e.get("order", -1) for e in received), default=-1)
             seen_event_ids: set[str] = set()  # Track seen IDs to detect duplicates
 
             while time.time() - start_time < timeout:
@@ -210,10 +386,14 @@ class RemoteWorkspaceMixin(BaseModel):
         self,
         source_path: str | Path,
         destination_path: str | Path,
-    ) -> Generator[dict[str, Any], httpx.Response, FileOperationResult]:
+    ) -> Generator[Any, Any, FileOperationResult]:
         """Upload a file to the remote system.
 
-        Reads the local file and sends it to the remote system via HTTP API.
+        A file of up to ``transfer_chunk_size`` bytes is sent in one request. A
+        larger one is skipped if the remote file already has the same SHA-256,
+        and otherwise sent as byte ranges read from disk as they go out, so
+        memory use does not grow with the file. Servers without ranged uploads
+        get the file streamed in one request instead.
 
         Args:
             source_path: Path to the local source file
@@ -229,32 +409,50 @@ class RemoteWorkspaceMixin(BaseModel):
         _logger.debug(f"Remote file upload: {source} -> {destination}")
 
         try:
-            # Read the file content
             with open(source, "rb") as f:
-                file_content = f.read()
-
-            # Prepare the upload
-            files = {"file": (source.name, file_content)}
-
-            # Make HTTP call using query parameter for path
-            response: httpx.Response = yield {
-                "method": "POST",
-                "url": f"{self.host}/api/file/upload",
-                "params": {"path": destination_remote},
-                "files": files,
-                "headers": self._headers,
-                "timeout": 60.0,
-            }
-            response.raise_for_status()
-            result_data = response.json()
+                file_content = f.read(self.transfer_chunk_size + 1)
+                if len(file_content) <= self.transfer_chunk_size:
+                    # Prepare the upload
+                    files = {"file": (source.name, file_content)}
+
+                    # Make HTTP call using query parameter for path
+                    response: httpx.Response = yield {
+                        "method": "POST",
+                        "url": f"{self.host}/api/file/upload",
+                        "params": {"path": destination_remote},
+                        "files": files,
+                        "headers": self._headers,
+                        "timeout": 60.0,
+                    }
+                    response.raise_for_status()
+                    result_data = response.json()
+
+                    # Convert the API response to our model
+                    return FileOperationResult(
+                        success=result_data.get("success", True),
+                        source_path=str(source),
+                        destination_path=destination_remote,
+                        file_size=result_data.get("file_size"),
+                        error=result_data.get("error"),
+                    )
+
+                del file_content
+                size = os.fstat(f.fileno()).st_size
+                up_to_date = yield from self._remote_file_matches_generator(
+                    destination_remote, f, size
+                )
+                if up_to_date:
+                    _logger.debug(f"Remote file is up to date: {destination}")
+                else:
+                    yield from self._upload_ranges_generator(
+                        f, size, source.name, destination_remote
+                    )
 
-            # Convert the API response to our model
             return FileOperationResult(
-                success=result_data.get("success", True),
+                success=True,
                 source_path=str(source),
                 destination_path=destination_remote,
-                file_size=result_data.get("file_size"),
-                error=result_data.get("error"),
+                file_size=size,
             )
 
         except Exception as e:
@@ -266,14 +464,55 @@ class RemoteWorkspaceMixin(BaseModel):
                 error=str(e),
             )
 
+    def _upload_ranges_generator(
+        self, f: IO[bytes], size: int, name: str, destination_remote: str
+    ) -> Generator[Any, Any]:
+        """Upload an open file as byte ranges through ``/api/file/upload_range``."""
+
+        def request(start: int, end: int) -> dict[str, Any]:
+            f.seek(start)
+            return {
+                "method": "PUT",
+                "url": f"{self.host}/api/file/upload_range",
+                "params": {"path": destination_remote, "offset": start, "size": size},
+                "content": f.read(end - start),
+                "headers": self._headers,
+                "timeout": 60.0,
+            }
+
+        def check(_start: int, _end: int, response: httpx.Response) -> None:
+            if response.status_code in (404, 405):
+                raise _RangeUploadUnsupportedError
+            response.raise_for_status()
+
+        try:
+            yield from self._transfer_ranges_generator(size, 0, request, check)
+        except _RangeUploadUnsupportedError:
+            _logger.debug("Ranged uploads unavailable, streaming the whole file")
+            f.seek(0)
+            response: httpx.Response = yield {
+                "method": "POST",
+                "url": f"{self.host}/api/file/upload",
+                "params": {"path": destination_remote},
+                "files": {"file": (name, f)},
+                "headers": self._headers,
+                "timeout": 60.0,
+            }
+            response.raise_for_status()
+
     def _file_download_generator(
         self,
         source_path: str | Path,
         destination_path: str | Path,
-    ) -> Generator[dict[str, Any], httpx.Response, FileOperationResult]:
+    ) -> Generator[Any, Any, FileOperationResult]:
         """Download a file from the remote system.
 
-        Requests the file from the remote system via HTTP API and saves it locally.
+        The first ``transfer_chunk_size`` bytes are requested as a byte range.
+        If the file is larger, the rest follows as further ranges written to a
+        temporary file beside the destination as they arrive, which then
+        replaces it, so memory use does not grow with the file. A local file
+        larger than ``transfer_chunk_size`` with the same SHA-256 as the remote
+        one is kept without downloading it again.
 
         Args:
             source_path: Path to the source file on remote system
@@ -289,28 +528,63 @@ class RemoteWorkspaceMixin(BaseModel):
         _logger.debug(f"Remote file download: {source} -> {destination}")
 
         try:
+            if (
+                destination.is_file()
+                and destination.stat().st_size > self.transfer_chunk_size
+            ):
+                with open(destination, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    up_to_date = yield from self._remote_file_matches_generator(
+                        source_remote, f, size
+                    )
+                    if up_to_date:
+                        _logger.debug(f"Local file is up to date: {destination}")
+                        return FileOperationResult(
+                            success=True,
+                            source_path=source_remote,
+                            destination_path=str(destination),
+                            file_size=size,
+                        )
+
             # Make HTTP call using query parameter for path
             response = yield {
                 "method": "GET",
                 "url": "/api/file/download",
                 "params": {"path": source_remote},
-                "headers": self._headers,
+                "headers": {
+                    **self._headers,
+                    "Range": f"bytes=0-{self.transfer_chunk_size - 1}",
+                },
                 "timeout": 60.0,
             }
-            response.raise_for_status()
-
             # Ensure destination directory exists
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write the file content
-            with open(destination, "wb") as f:
-                f.write(response.content)
+            # An empty file has no satisfiable range.
+            content_range = response.headers.get("content-range", "")
+            if response.status_code == 416 and content_range.endswith("/0"):
+                destination.write_bytes(b"")
+                size = 0
+            elif response.status_code != 206:
+                # The server sent the whole file.
+                response.raise_for_status()
+                with open(destination, "wb") as f:
+                    f.write(response.content)
+                size = len(response.content)
+            else:
+                size = int(content_range.rpartition("/")[2])
+                if size <= len(response.content):
+                    destination.write_bytes(response.content)
+                else:
+                    yield from self._download_ranges_generator(
+                        source_remote, destination, size, response
+                    )
 
             return FileOperationResult(
                 success=True,
                 source_path=source_remote,
                 destination_path=str(destination),
-                file_size=len(response.content),
+                file_size=size,
             )
 
         except Exception as e:
@@ -322,6 +596,312 @@ class RemoteWorkspaceMixin(BaseModel):
                 error=str(e),
             )
 
+    def _download_ranges_generator(
+        self,
+        source_remote: str,
+        destination: Path,
+        size: int,
+        first: httpx.Response,
+    ) -> Generator[Any, Any]:
+        """Download the rest of a file whose first byte range is ``first``."""
+        headers = dict(self._headers)
+        # Make the server send the whole file instead of a range if it changed
+        # since the first range, rather than mixing two versions.
+        if etag := first.headers.get("etag"):
+            headers["If-Range"] = etag
+
+        def request(start: int, end: int) -> dict[str, Any]:
+            return {
+                "method": "GET",
+                "url": "/api/file/download",
+                "params": {"path": source_remote},
+                "headers": {**headers, "Range": f"bytes={start}-{end - 1}"},
+                "timeout": 60.0,
+            }
+
+        def write(start: int, end: int, response: httpx.Response) -> None:
+            response.raise_for_status()
+            if response.status_code != 206 or len(response.content) != end - start:
+                raise RuntimeError(f"{source_remote} changed during the download")
+            f.seek(start)
+            f.write(response.content)
+
+        part = destination.with_name(f".{destination.name}.part")
+        try:
+            with open(part, "wb") as f:
+                f.write(first.content)
+                yield from self._transfer_ranges_generator(
+                    size, len(first.content), request, write
+                )
+            os.replace(part, destination)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+
+    def _transfer_ranges_generator(
+        self,
+        size: int,
+        start: int,
+        request: Callable[[int, int], dict[str, Any]],
+        handle: Callable[[int, int, httpx.Response], None],
+    ) -> Generator[list[dict[str, Any]], list[httpx.Response | Exception]]:
+        """Send a request per ``transfer_chunk_size`` byte range of ``[start, size)``.
+
+        Ranges are yielded ``transfer_streams`` at a time as a list of requests,
+        which the workspace sends concurrently, getting back each response or
+        the exception its request raised. A range that fails with a transport
+        error or a 5xx status is sent again, up to ``_TRANSFER_ATTEMPTS`` times,
+        so a dropped connection costs that range rather than the transfer.
+        """
+        step = self.transfer_chunk_size
+        pending = [
+            (offset, min(offset + step, size)) for offset in range(start, size, step)
+        ]
+        failures: dict[tuple[int, int], int] = {}
+        while pending:
+            batch = pending[: self.transfer_streams]
+            del pending[: self.transfer_streams]
+            responses = yield [request(*byte_range) for byte_range in batch]
+            retries = []
+            for byte_range, response in zip(batch, responses, strict=True):
+                if _is_transient(response):
+                    failures[byte_range] = failures.get(byte_range, 0) + 1
+                    if failures[byte_range] < _TRANSFER_ATTEMPTS:
+                        _logger.debug(f"Retrying byte range {byte_range}: {response}")
+                        retries.append(byte_range)
+                        continue
+                if isinstance(response, BaseException):
+                    raise response
+                handle(*byte_range, response)
+            pending[:0] = retries
+
+    def _remote_file_matches_generator(
+        self, remote_path: str, f: IO[bytes], size: int
+    ) -> Generator[dict[str, Any], httpx.Response, bool]:
+        """Whether the remote file has the size and SHA-256 of the open file."""
+        response = yield {
+            "method": "GET",
+            "url": f"{self.host}/api/file/checksum",
+            "params": {"path": remote_path},
+            "headers": self._headers,
+            # The server reads the whole file before it answers.
+            "timeout": self.read_timeout,
+        }
+        # A missing file, or a server without checksums.
+        if response.status_code != 200:
+            return False
+        checksum = response.json()
+        if checksum.get("size") != size:
+            return False
+        f.seek(0)
+        digest = hashlib.sha256()
+        while chunk := f.read(SYNC_BLOCK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest() == checksum.get("sha256")
+
+    def _sync_upload_generator(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> Generator[dict[str, Any], httpx.Response, SyncResult]:
+        """Make a remote directory match a local directory.
+
+        Compares the local manifest with the remote one, asks the remote side
+        for the block hashes of large changed files, and sends the changed files
+        and blocks as one compressed stream.
+
+        Args:
+            source_dir: Path to the local source directory
+            destination_dir: Path to the directory on the remote system
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete remote files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        source = Path(source_dir)
+        destination_remote = _join_remote_path(self.working_dir, destination_dir)
+        excludes = excludes or []
+
+        _logger.debug(f"Remote directory sync: {source} -> {destination_remote}")
+
+        try:
+            if not source.is_dir():
+                raise NotADirectoryError(f"Not a directory: {source}")
+            manifest = yield from self._sync_manifest_generator(
+                destination_remote, excludes
+            )
+            plan = plan_sync(
+                build_manifest(source, excludes),
+                manifest.entries,
+                delete=delete,
+                block_size=manifest.block_size,
+            )
+            existing: dict[str, list[str]] = {}
+            if plan.delta_paths:
+                existing = yield from self._sync_block_hashes_generator(
+                    destination_remote, plan.delta_paths, manifest.block_size
+                )
+            files = [
+                SyncFile(path=e.path, blocks=existing.get(e.path)) for e in plan.send
+            ]
+
+            stats = SyncStats()
+            size = 0
+            if files or plan.delete:
+                with tempfile.SpooledTemporaryFile(max_size=SYNC_SPOOL_SIZE) as archive:
+                    write_sync_archive(
+                        archive, source, files, plan.delete, manifest.block_size
+                    )
+                    size = archive.tell()
+                    archive.seek(0)
+                    response = yield {
+                        "method": "POST",
+                        "url": f"{self.host}/api/file/sync/upload",
+                        "params": {"path": destination_remote},
+                        "files": {"file": ("sync.tar.gz", archive, "application/gzip")},
+                        "headers": self._headers,
+                        # The server writes every file before it answers.
+                        "timeout": self.read_timeout,
+                    }
+                response.raise_for_status()
+                stats = SyncStats.model_validate(response.json())
+
+            return SyncResult(
+                success=True,
+                source_path=str(source),
+                destination_path=destination_remote,
+                files_transferred=stats.files_written,
+                files_deleted=stats.files_deleted,
+                bytes_transferred=size,
+            )
+
+        except Exception as e:
+            _logger.error(f"Remote directory sync failed: {e}")
+            return SyncResult(
+                success=False,
+                source_path=str(source),
+                destination_path=destination_remote,
+                error=str(e),
+            )
+
+    def _sync_download_generator(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        excludes: list[str] | None = None,
+        delete: bool = False,
+    ) -> Generator[dict[str, Any], httpx.Response, SyncResult]:
+        """Make a local directory match a remote directory.
+
+        Compares the remote manifest with the local one and requests the changed
+        files, with the local block hashes of large ones so only their differing
+        blocks come back, as one compressed stream.
+
+        Args:
+            source_dir: Path to the source directory on the remote system
+            destination_dir: Path to the local destination directory
+            excludes: Glob patterns of paths to leave alone on both sides
+            delete: Whether to delete local files the source does not have
+
+        Returns:
+            SyncResult: Result with success status and transfer counts
+        """
+        source_remote = _join_remote_path(self.working_dir, source_dir)
+        destination = Path(destination_dir)
+        excludes = excludes or []
+
+        _logger.debug(f"Remote directory sync: {source_remote} -> {destination}")
+
+        try:
+            manifest = yield from self._sync_manifest_generator(source_remote, excludes)
+            plan = plan_sync(
+                manifest.entries,
+                build_manifest(destination, excludes),
+                delete=delete,
+                block_size=manifest.block_size,
+            )
+            existing = block_hashes(destination, plan.delta_paths, manifest.block_size)
+            files = [
+                SyncFile(path=e.path, blocks=existing.get(e.path)) for e in plan.send
+            ]
+
+            stats = SyncStats()
+            size = 0
+            if files:
+                request = SyncDownloadRequest(
+                    path=source_remote, excludes=excludes, files=files
+                )
+                with tempfile.SpooledTemporaryFile(max_size=SYNC_SPOOL_SIZE) as archive:
+                    response = yield {
+                        "method": "POST",
+                        "url": f"{self.host}/api/file/sync/download",
+                        "json": request.model_dump(),
+                        "headers": self._headers,
+                        # The server writes the whole stream before it answers.
+                        "timeout": self.read_timeout,
+                        # The workspace writes the body here as it arrives.
+                        "stream_to": archive,
+                    }
+                    response.raise_for_status()
+                    size = archive.tell()
+                    archive.seek(0)
+                    stats = apply_sync_archive(archive, destination)
+            for path in plan.delete:
+                stats.files_deleted += delete_synced_file(destination, path)
+
+            return SyncResult(
+                success=True,
+                source_path=source_remote,
+                destination_path=str(destination),
+                files_transferred=stats.files_written,
+                files_deleted=stats.files_deleted,
+                bytes_transferred=size,
+            )
+
+        except Exception as e:
+            _logger.error(f"Remote directory sync failed: {e}")
+            return SyncResult(
+                success=False,
+                source_path=source_remote,
+                destination_path=str(destination),
+                error=str(e),
+            )
+
+    def _sync_manifest_generator(
+        self, path: str, excludes: list[str]
+    ) -> Generator[dict[str, Any], httpx.Response, SyncManifest]:
+        """List a remote directory's files for a sync."""
+        request = SyncManifestRequest(path=path, excludes=excludes)
+        response = yield {
+            "method": "POST",
+            "url": f"{self.host}/api/file/sync/manifest",
+            "json": request.model_dump(),
+            "headers": self._headers,
+            # The server walks the whole directory before it answers.
+            "timeout": self.read_timeout,
+        }
+        response.raise_for_status()
+        return SyncManifest.model_validate(response.json())
+
+    def _sync_block_hashes_generator(
+        self, path: str, paths: list[str], block_size: int
+    ) -> Generator[dict[str, Any], httpx.Response, dict[str, list[str]]]:
+        """Hash the blocks of some of a remote directory's files, by path."""
+        request = SyncBlocksRequest(path=path, paths=paths, block_size=block_size)
+        response = yield {
+            "method": "POST",
+            "url": f"{self.host}/api/file/sync/blocks",
+            "json": request.model_dump(),
+            "headers": self._headers,
+            # The server reads every file before it answers.
+            "timeout": self.read_timeout,
+        }
+        response.raise_for_status()
+        return response.json()
+
     def _git_changes_generator(
         self,
         path: str | Path,
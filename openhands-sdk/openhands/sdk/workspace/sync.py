@@ -0,0 +1,472 @@
+"""Incremental directory sync between workspaces.
+
+A directory is described by a manifest of its regular files: relative path,
+size, modification time and permission bits. Comparing the manifests of the
+two sides finds the files to send, with rsync's quick check: a file whose size
+and modification time match on both sides is not read at all. Synced files
+get their source's modification time, so an unchanged tree stays unchanged.
+
+Changed files go over as one gzip-compressed tar stream. For a changed file
+larger than a block that also exists on the receiving side, the receiver first
+reports the hashes of its fixed-size blocks and only blocks whose hash differs
+are sent; the rest are copied from the receiver's old copy. Sync metadata rides
+in PAX headers of the tar members.
+
+Both the SDK's workspaces and the agent server's file routes use this module,
+so the two sides agree on the manifest and the stream format.
+"""
+
+import fnmatch
+import hashlib
+import os
+import stat
+import tarfile
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO
+
+from pydantic import BaseModel, Field
+
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+SYNC_BLOCK_SIZE = 128 * 1024
+# Changes up to this size are streamed in memory before spilling to disk.
+SYNC_SPOOL_SIZE = 16 * 1024 * 1024
+
+_PAX_SIZE = "OPENHANDS.size"
+_PAX_MTIME_NS = "OPENHANDS.mtime_ns"
+_PAX_BLOCK_SIZE = "OPENHANDS.block_size"
+_PAX_BLOCKS = "OPENHANDS.blocks"
+_PAX_DELETE = "OPENHANDS.delete"
+
+
+class SyncEntry(BaseModel):
+    """A regular file in a synced directory."""
+
+    path: str = Field(description="Path relative to the directory, with / separators")
+    size: int = Field(description="Size in bytes")
+    mtime_ns: int = Field(description="Modification time in nanoseconds")
+    mode: int = Field(description="Permission bits")
+
+
+class SyncManifest(BaseModel):
+    """The regular files of a directory, sorted by path."""
+
+    block_size: int = Field(
+        default=SYNC_BLOCK_SIZE, description="Size in bytes of each hashed block"
+    )
+    entries: list[SyncEntry] = Field(default_factory=list)
+
+
+class SyncManifestRequest(BaseModel):
+    path: str = Field(description="Absolute path of the directory")
+    excludes: list[str] = Field(
+        default_factory=list, description="Glob patterns of paths to leave out"
+    )
+
+
+class SyncBlocksRequest(BaseModel):
+    path: str = Field(description="Absolute path of the directory")
+    paths: list[str] = Field(description="Relative paths of the files to hash")
+    block_size: int = Field(
+        default=SYNC_BLOCK_SIZE, description="Size in bytes of each hashed block"
+    )
+
+
+class SyncFile(BaseModel):
+    """A file to send, with the receiver's block hashes if it has a copy."""
+
+    path: str = Field(description="Path relative to the directory, with / separators")
+    blocks: list[str] | None = Field(
+        default=None,
+        description="Block hashes of the receiver's copy; only differing blocks "
+        "are sent. None sends the whole file.",
+    )
+
+
+class SyncDownloadRequest(BaseModel):
+    path: str = Field(description="Absolute path of the directory")
+    excludes: list[str] = Field(
+        default_factory=list, description="Glob patterns of paths to leave out"
+    )
+    files: list[SyncFile] = Field(description="The files to send")
+
+
+class SyncStats(BaseModel):
+    files_written: int = Field(default=0, description="Files created or updated")
+    files_deleted: int = Field(default=0, description="Files deleted")
+
+
+@dataclass(frozen=True)
+class SyncPlan:
+    """What to send to make a destination match a source."""
+
+    send: list[SyncEntry]
+    # Paths among ``send`` worth a block-level delta: both copies span a block.
+    delta_paths: list[str]
+    delete: list[str]
+
+
+def path_is_excluded(rel: PurePosixPath, patterns: list[str], is_dir: bool) -> bool:
+    """True if ``rel`` is excluded by any glob in ``patterns``.
+
+    Mirrors gitignore semantics, like the agent server's git-delta archives, so
+    archives and syncs leave out the same paths:
+
+    - A trailing ``/`` marks a directory-only pattern: it matches a directory but
+      never a file's own name, so a ``build/`` pattern prunes a ``build``
+      directory while keeping a file literally named ``build``.
+    - A multi-segment pattern (one containing ``/``, e.g. ``secrets/prod``)
+      matches the full relative path or any prefix of it, so it drops both
+      ``secrets/prod`` and everything beneath it.
+    - A bare-name pattern (no ``/``, e.g. ``node_modules`` or ``*.pyc``) matches
+      any single path component, at any depth.
+
+    Dependency-free so no new package is pulled in.
+    """
+    parts = rel.parts
+    for raw in patterns:
+        pattern = raw.rstrip("/")
+        dir_only = raw.endswith("/")
+        if "/" in pattern:
+            # Multi-segment: anchor against the relative path root and match
+            # per-segment so a ``*`` does NOT cross ``/`` (gitignore semantics,
+            # matching the git-delta path). The pattern matches the path itself
+            # or anything nested under it: ``secrets/prod`` drops ``secrets/prod``
+            # and ``secrets/prod/key``; ``*/test`` drops ``a/test`` but not
+            # ``a/b/test``; ``a/*/c`` drops ``a/x/c``.
+            pattern_parts = pattern.split("/")
+            if len(parts) >= len(pattern_parts) and all(
+                fnmatch.fnmatch(part, pat) for part, pat in zip(parts, pattern_parts)
+            ):
+                # A dir-only pattern matches the directory and anything nested
+                # under it, but not a file whose own path equals the pattern.
+                if dir_only and not is_dir and len(parts) == len(pattern_parts):
+                    continue
+                return True
+        else:
+            # Bare name: match any single component. For a dir-only pattern on a
+            # file, skip the basename so a file sharing a directory exclude's
+            # name is not dropped.
+            candidates = parts if (is_dir or not dir_only) else parts[:-1]
+            for part in candidates:
+                if fnmatch.fnmatch(part, pattern):
+                    return True
+    return False
+
+
+def file_block_hashes(f: IO[bytes], size: int, block_size: int) -> list[str]:
+    """Hash each ``block_size`` block of the first ``size`` bytes of ``f``."""
+    hashes = []
+    f.seek(0)
+    for _ in range(0, size, block_size):
+        hashes.append(hashlib.blake2b(f.read(block_size), digest_size=16).hexdigest())
+    return hashes
+
+
+def build_manifest(root: Path, excludes: list[str]) -> list[SyncEntry]:
+    """List the regular files under ``root``, sorted by path.
+
+    Walks without following symlinks and prunes excluded directories, like the
+    tar.gz archive. Symlinks and other special files are left out. A missing
+    ``root`` has no files.
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+        base = PurePosixPath(Path(dirpath).relative_to(root).as_posix())
+        dirnames[:] = [
+            d for d in dirnames if not path_is_excluded(base / d, excludes, is_dir=True)
+        ]
+        for name in filenames:
+            rel = base / name
+            if path_is_excluded(rel, excludes, is_dir=False):
+                continue
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError as e:
+                # The tree may be changing under the walk.
+                logger.warning(f"Skipping unreadable file {rel}: {e}")
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            entries.append(
+                SyncEntry(
+                    path=rel.as_posix(),
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    mode=stat.S_IMODE(st.st_mode),
+                )
+            )
+    entries.sort(key=lambda entry: entry.path)
+    return entries
+
+
+def plan_sync(
+    source: list[SyncEntry],
+    destination: list[SyncEntry],
+    *,
+    delete: bool = False,
+    block_size: int = SYNC_BLOCK_SIZE,
+) -> SyncPlan:
+    """Compare manifests: files whose size or modification time differ, or that
+    the destination lacks, are sent; with ``delete``, files only the destination
+    has are deleted."""
+    existing = {entry.path: entry for entry in destination}
+    send = []
+    delta_paths = []
+    for entry in source:
+        other = existing.get(entry.path)
+        if other is None:
+            send.append(entry)
+        elif other.size != entry.size or other.mtime_ns != entry.mtime_ns:
+            send.append(entry)
+            if entry.size > block_size and other.size >= block_size:
+                delta_paths.append(entry.path)
+    deletions = []
+    if delete:
+        paths = {entry.path for entry in source}
+        deletions = [path for path in existing if path not in paths]
+    return SyncPlan(send=send, delta_paths=delta_paths, delete=deletions)
+
+
+def resolve_sync_path(root: Path, path: str, checked: set[str] | None = None) -> Path:
+    """The file ``path`` names under ``root``.
+
+    ``checked`` holds the parent directories already verified, so resolving the
+    many files of a stream resolves each directory once.
+
+    Raises:
+        ValueError: If ``path`` is absolute or would leave ``root``, including
+            through a symlinked parent directory.
+    """
+    rel = PurePosixPath(path)
+    if rel.is_absolute() or not rel.parts or ".." in rel.parts:
+        raise ValueError(f"Invalid sync path: {path!r}")
+    target = root.joinpath(*rel.parts)
+    parent = str(rel.parent)
+    if checked is None or parent not in checked:
+        if not target.parent.resolve().is_relative_to(root.resolve()):
+            raise ValueError(f"Sync path leaves the directory: {path!r}")
+        if checked is not None:
+            checked.add(parent)
+    return target
+
+
+def block_hashes(
+    root: Path, paths: Iterable[str], block_size: int = SYNC_BLOCK_SIZE
+) -> dict[str, list[str]]:
+    """The block hashes of the files ``paths`` name under ``root``, by path.
+
+    Files that cannot be read are left out, and so are sent whole.
+    """
+    hashes = {}
+    for path in paths:
+        try:
+            with open(resolve_sync_path(root, path), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                hashes[path] = file_block_hashes(f, size, block_size)
+        except OSError as e:
+            logger.warning(f"Sending {path} whole, cannot hash it: {e}")
+    return hashes
+
+
+class _BlockReader:
+    """Reads the given (offset, length) spans of a file back to back.
+
+    A short read (the file shrank since it was sized) is padded with NULs so the
+    tar member always has the size its header declares, as in the archive
+    endpoint's ``_ExactSizeReader``.
+    """
+
+    def __init__(self, f: IO[bytes], spans: list[tuple[int, int]]) -> None:
+        self._f = f
+        self._spans = spans[::-1]
+        self._offset = 0
+        self._remaining = 0
+
+    def read(self, n: int = -1) -> bytes:
+        # tarfile expects every read but the last to be full, so reads continue
+        # across span boundaries.
+        chunks = []
+        while n != 0:
+            if self._remaining == 0:
+                if not self._spans:
+                    break
+                self._offset, self._remaining = self._spans.pop()
+                continue
+            length = self._remaining if n < 0 else min(n, self._remaining)
+            self._f.seek(self._offset)
+            data = self._f.read(length)
+            chunks.append(data + b"\x00" * (length - len(data)))
+            self._offset += length
+            self._remaining -= length
+            if n > 0:
+                n -= length
+        return b"".join(chunks)
+
+
+def write_sync_archive(
+    fileobj: IO[bytes],
+    root: Path,
+    files: Iterable[SyncFile],
+    deletions: Iterable[str] = (),
+    block_size: int = SYNC_BLOCK_SIZE,
+) -> int:
+    """Write the changes for ``files`` and ``deletions`` as a tar.gz stream.
+
+    A file with receiver block hashes gets only its differing blocks. Files
+    that vanished since they were listed are left out.
+
+    Returns:
+        int: The number of files written to the stream.
+    """
+    count = 0
+    checked: set[str] = set()
+    with tarfile.open(
+        fileobj=fileobj, mode="w:gz", format=tarfile.PAX_FORMAT, compresslevel=6
+    ) as tar:
+        for file in files:
+            try:
+                f = open(resolve_sync_path(root, file.path, checked), "rb")
+            except OSError as e:
+                logger.warning(f"Skipping unreadable file {file.path}: {e}")
+                continue
+            with f:
+                st = os.fstat(f.fileno())
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                size = st.st_size
+                offsets = range(0, size, block_size)
+                pax_headers = {
+                    _PAX_SIZE: str(size),
+                    _PAX_MTIME_NS: str(st.st_mtime_ns),
+                }
+                if file.blocks is None:
+                    spans = [(0, size)]
+                else:
+                    hashes = file_block_hashes(f, size, block_size)
+                    indices = [
+                        i
+                        for i, block_hash in enumerate(hashes)
+                        if i >= len(file.blocks) or file.blocks[i] != block_hash
+                    ]
+                    spans = [
+                        (offsets[i], min(block_size, size - offsets[i]))
+                        for i in indices
+                    ]
+                    pax_headers[_PAX_BLOCK_SIZE] = str(block_size)
+                    pax_headers[_PAX_BLOCKS] = ",".join(map(str, indices))
+                info = tarfile.TarInfo(file.path)
+                info.size = sum(length for _, length in spans)
+                info.mode = stat.S_IMODE(st.st_mode)
+                info.mtime = st.st_mtime
+                info.pax_headers = pax_headers
+                tar.addfile(info, _BlockReader(f, spans))
+                count += 1
+        for path in deletions:
+            info = tarfile.TarInfo(path)
+            info.pax_headers = {_PAX_DELETE: "1"}
+            tar.addfile(info)
+    return count
+
+
+def delete_synced_file(root: Path, path: str, checked: set[str] | None = None) -> bool:
+    """Delete the regular file ``path`` names under ``root``, if there is one."""
+    target = resolve_sync_path(root, path, checked)
+    if target.is_symlink() or not target.is_file():
+        return False
+    target.unlink()
+    return True
+
+
+def _write_synced_file(
+    root: Path, member: tarfile.TarInfo, data: IO[bytes] | None, checked: set[str]
+) -> None:
+    target = resolve_sync_path(root, member.name, checked)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    size = int(member.pax_headers.get(_PAX_SIZE, member.size))
+    mtime_ns = int(member.pax_headers.get(_PAX_MTIME_NS, member.mtime * 1e9))
+    blocks = member.pax_headers.get(_PAX_BLOCKS)
+    # Write beside the target and rename over it, so an interrupted sync never
+    # leaves a half-written file.
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            if blocks is None:
+                if data is not None:
+                    while chunk := data.read(SYNC_BLOCK_SIZE):
+                        out.write(chunk)
+            else:
+                block_size = int(member.pax_headers[_PAX_BLOCK_SIZE])
+                sent = {int(i) for i in blocks.split(",") if i}
+                with open(target, "rb") as old:
+                    for offset in range(0, size, block_size):
+                        length = min(block_size, size - offset)
+                        if offset // block_size in sent:
+                            assert data is not None
+                            chunk = data.read(length)
+                        else:
+                            old.seek(offset)
+                            chunk = old.read(length)
+                        if len(chunk) != length:
+                            raise ValueError(f"Sync block missing for {member.name}")
+                        out.write(chunk)
+        os.chmod(tmp_name, member.mode)
+        os.utime(tmp_name, ns=(mtime_ns, mtime_ns))
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def apply_sync_archive(fileobj: IO[bytes], root: Path) -> SyncStats:
+    """Apply a stream written by ``write_sync_archive`` to ``root``.
+
+    Raises:
+        ValueError: If a member's path would leave ``root``.
+    """
+    stats = SyncStats()
+    checked: set[str] = set()
+    root.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for member in tar:
+            if member.pax_headers.get(_PAX_DELETE):
+                stats.files_deleted += delete_synced_file(root, member.name, checked)
+            elif member.isreg():
+                data = tar.extractfile(member)
+                _write_synced_file(root, member, data, checked)
+                stats.files_written += 1
+    return stats
+
+
+def sync_directories(
+    source: Path,
+    destination: Path,
+    excludes: list[str],
+    delete: bool = False,
+) -> tuple[SyncStats, int]:
+    """Make ``destination`` match ``source``, both on this machine.
+
+    Returns:
+        tuple[SyncStats, int]: The changes made and the size of the stream of
+            changes.
+    """
+    plan = plan_sync(
+        build_manifest(source, excludes),
+        build_manifest(destination, excludes),
+        delete=delete,
+    )
+    if not plan.send and not plan.delete:
+        return SyncStats(), 0
+    existing = block_hashes(destination, plan.delta_paths)
+    files = [SyncFile(path=e.path, blocks=existing.get(e.path)) for e in plan.send]
+    with tempfile.SpooledTemporaryFile(max_size=SYNC_SPOOL_SIZE) as archive:
+        write_sync_archive(archive, source, files, plan.delete)
+        size = archive.tell()
+        archive.seek(0)
+        return apply_sync_archive(archive, destination), size
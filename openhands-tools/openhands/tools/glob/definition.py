@@ -85,6 +85,7 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
     def create(
         cls,
         conv_state: "ConversationState",
+        use_file_index: bool = False,
     ) -> Sequence["GlobTool"]:
         """Initialize GlobTool with a GlobExecutor.
 
@@ -92,6 +93,8 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
             conv_state: Conversation state to get working directory from.
                          If provided, working_dir will be taken from
                          conv_state.workspace
+            use_file_index: Serve searches from a warm, shared index of the
+                         workspace's files instead of walking it on every call
         """
         # Import here to avoid circular imports
         from openhands.tools.glob.impl import GlobExecutor
@@ -101,7 +104,7 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
             raise ValueError(f"working_dir '{working_dir}' is not a valid directory")
 
         # Initialize the executor
-        executor = GlobExecutor(working_dir=working_dir)
+        executor = GlobExecutor(working_dir=working_dir, use_file_index=use_file_index)
 
         # Add working directory information to the tool description
         enhanced_description = (
@@ -18,6 +18,11 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import (
+    WorkspaceFileIndex,
+    compile_glob,
+    get_workspace_file_index,
+)
 
 
 class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
@@ -27,15 +32,21 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
     Python's glob module if ripgrep is not available:
     - Primary: Uses rg --files to list all files, filters by glob pattern with -g flag
     - Fallback: Uses Python's glob.glob() for pattern matching
+    - Optional: With ``use_file_index``, matches against the workspace's shared
+      file index for searches inside the working directory
     """
 
-    def __init__(self, working_dir: str):
+    def __init__(self, working_dir: str, use_file_index: bool = False):
         """Initialize the glob executor.
 
         Args:
             working_dir: The working directory to use as the base for searches
+            use_file_index: Serve searches from the shared workspace file index
         """
         self.working_dir: Path = Path(working_dir).resolve()
+        self._file_index: WorkspaceFileIndex | None = (
+            get_workspace_file_index(self.working_dir) if use_file_index else None
+        )
         self._ripgrep_available: bool = _check_ripgrep_available()
         if not self._ripgrep_available:
             _log_ripgrep_fallback_warning("glob", "Python glob module")
@@ -84,7 +95,14 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
                     is_error=True,
                 )
 
-            if self._ripgrep_available:
+            indexed = (
+                self._execute_with_file_index(pattern, search_path)
+                if self._file_index is not None
+                else None
+            )
+            if indexed is not None:
+                files, truncated = indexed
+            elif self._ripgrep_available:
                 files, truncated = self._execute_with_ripgrep(pattern, search_path)
             else:
                 files, truncated = self._execute_with_glob(pattern, search_path)
@@ -182,6 +200,50 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
 
         return file_paths, truncated
 
+    def _execute_with_file_index(
+        self, pattern: str, search_path: Path
+    ) -> tuple[list[str], bool] | None:
+        """Execute glob pattern matching against the workspace file index.
+
+        Follows ripgrep's ``-g`` matching: a pattern without ``/`` matches file
+        names at any depth, other patterns match paths relative to
+        ``search_path``. Hidden files are skipped.
+
+        Args:
+            pattern: The glob pattern to match
+            search_path: The directory to search in
+
+        Returns:
+            Tuple of (file_paths, truncated) as for the other backends, or None
+            when the index does not cover ``search_path`` or the pattern
+        """
+        assert self._file_index is not None
+        if pattern.startswith("!"):
+            return None
+        search_path = search_path.resolve()
+        relative_paths = self._file_index.files(search_path)
+        if relative_paths is None:
+            return None
+
+        regex = compile_glob(pattern.lstrip("/"))
+        match_name = "/" not in pattern
+        file_paths = []
+        for relative_path in relative_paths:
+            name = relative_path.rpartition("/")[2]
+            if name.startswith("."):
+                continue
+            if not regex.fullmatch(name if match_name else relative_path):
+                continue
+            abs_path = str(search_path / relative_path)
+            try:
+                file_paths.append((abs_path, os.path.getmtime(abs_path)))
+            except OSError:
+                continue
+
+        file_paths.sort(key=lambda x: x[1], reverse=True)
+        truncated = len(file_paths) > 100
+        return [path for path, _ in file_paths[:100]], truncated
+
     def _execute_with_glob(
         self, pattern: str, search_path: Path
     ) -> tuple[list[str], bool]:
@@ -82,6 +82,7 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
     def create(
         cls,
         conv_state: "ConversationState",
+        use_file_index: bool = False,
     ) -> Sequence["GrepTool"]:
         """Initialize GrepTool with a GrepExecutor.
 
@@ -89,6 +90,8 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
             conv_state: Conversation state to get working directory from.
                          If provided, working_dir will be taken from
                          conv_state.workspace
+            use_file_index: Serve searches from a warm, shared index of the
+                         workspace's files instead of walking it on every call
         """
         # Import here to avoid circular imports
         from openhands.tools.grep.impl import GrepExecutor
@@ -98,7 +101,7 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
             raise ValueError(f"working_dir '{working_dir}' is not a valid directory")
 
         # Initialize the executor
-        executor = GrepExecutor(working_dir=working_dir)
+        executor = GrepExecutor(working_dir=working_dir, use_file_index=use_file_index)
 
         # Add working directory information to the tool description
         enhanced_description = (
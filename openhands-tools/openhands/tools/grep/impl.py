@@ -20,6 +20,10 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import (
+    WorkspaceFileIndex,
+    get_workspace_file_index,
+)
 
 
 logger = get_logger(__name__)
@@ -31,17 +35,26 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
     This implementation prefers ripgrep for performance, falls back to the
     system grep binary when available, and finally uses a Python recursive
     search when no grep binary is installed.
+
+    With ``use_file_index`` enabled, searches inside the working directory are
+    served from the workspace's shared file index instead: the cached file
+    list replaces the directory walk, and trigram signatures limit which
+    files are read and matched.
     """
 
     _MAX_MATCHES = 100
 
-    def __init__(self, working_dir: str):
+    def __init__(self, working_dir: str, use_file_index: bool = False):
         """Initialize the grep executor.
 
         Args:
             working_dir: The working directory to use as the base for searches
+            use_file_index: Serve searches from the shared workspace file index
         """
         self.working_dir: Path = Path(working_dir).resolve()
+        self._file_index: WorkspaceFileIndex | None = (
+            get_workspace_file_index(self.working_dir) if use_file_index else None
+        )
         self._search_backend = self._select_search_backend()
 
         if self._search_backend == "grep":
@@ -89,6 +102,15 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
                     is_error=True,
                 )
 
+            if self._file_index is not None:
+                candidates = self._file_index.search_candidates(
+                    search_path, action.pattern
+                )
+                if candidates is not None:
+                    return self._execute_with_file_index(
+                        action, search_path, regex, candidates
+                    )
+
             if self._search_backend == "ripgrep":
                 return self._execute_with_ripgrep(action, search_path)
             if self._search_backend == "grep":
@@ -155,11 +177,18 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
             relative_parts = path.resolve().relative_to(search_path.resolve()).parts
         except ValueError:
             relative_parts = (path.name,)
+        return self._relative_parts_match(relative_parts, path.name, include_pattern)
 
+    @staticmethod
+    def _relative_parts_match(
+        relative_parts: tuple[str, ...] | list[str],
+        name: str,
+        include_pattern: str | None,
+    ) -> bool:
         if any(part.startswith(".") for part in relative_parts[:-1]):
             return False
 
-        filename = relative_parts[-1] if relative_parts else path.name
+        filename = relative_parts[-1] if relative_parts else name
         if include_pattern:
             return fnmatch.fnmatch(filename, include_pattern)
         return not filename.startswith(".")
@@ -304,3 +333,26 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
                     matches.append(file_path)
 
         return self._build_observation(action, search_path, matches)
+
+    def _execute_with_file_index(
+        self,
+        action: GrepAction,
+        search_path: Path,
+        regex: re.Pattern[str],
+        candidates: list[str],
+    ) -> GrepObservation:
+        """Match the file index's candidate files against the regex."""
+        matches: list[Path] = []
+        for relative_path in candidates:
+            parts = relative_path.split("/")
+            if not self._relative_parts_match(parts, parts[-1], action.include):
+                continue
+            file_path = search_path / relative_path
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            if regex.search(content):
+                matches.append(file_path)
+
+        return self._build_observation(action, search_path, matches)
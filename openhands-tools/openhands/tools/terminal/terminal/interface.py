@@ -1,6 +1,7 @@
 """Abstract interface for terminal backends."""
 
 import os
+import time
 from abc import ABC, abstractmethod
 
 from openhands.tools.terminal.constants import (
@@ -128,6 +129,33 @@ class TerminalInterface(ABC):
             Current visible content of the terminal screen as a string.
         """
 
+    def output_version(self) -> int | None:
+        """Return a counter that increases whenever the terminal produces output.
+
+        Backends that capture output themselves (e.g. from a PTY reader
+        thread) can report it so the session reads the screen only when
+        something changed. The default ``None`` means the backend cannot tell,
+        and the session falls back to polling ``read_screen``.
+        """
+        return None
+
+    def wait_for_output(self, version: int, timeout: float) -> bool:  # noqa: ARG002
+        """Block until ``output_version()`` differs from ``version``.
+
+        Only called when ``output_version()`` returned an integer. The
+        default implementation cannot tell, so it sleeps for ``timeout`` and
+        reports True.
+
+        Args:
+            version: The output version the caller last observed.
+            timeout: Maximum time to wait, in seconds.
+
+        Returns:
+            True if new output arrived, False if the wait timed out.
+        """
+        time.sleep(timeout)
+        return True
+
     @abstractmethod
     def clear_screen(self) -> None:
         """Clear the terminal screen and history.
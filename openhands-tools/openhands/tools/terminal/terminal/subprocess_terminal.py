@@ -1,5 +1,6 @@
 """PTY-based terminal backend implementation (replaces pipe-based subprocess)."""
 
+import codecs
 import os
 import platform
 import re
@@ -61,6 +62,130 @@ _SUBPROCESS_SPECIALS: dict[str, bytes] = {
 }
 
 
+# Bytes requested per PTY read, and the most bytes the reader drains (without
+# waiting in select) before decoding them and publishing them to the buffer.
+# A quiet terminal publishes every read; a flood is batched into large reads
+# and few lock acquisitions and wake-ups.
+_READ_SIZE = 64 * 1024
+_READ_BATCH = 1024 * 1024
+
+
+class _OutputBuffer:
+    """Terminal output kept as text chunks, bounded by a number of lines.
+
+    Holds the last ``max_lines`` lines (the last one possibly unterminated),
+    like a ``deque`` of one string per line, but appending a chunk costs a
+    ``str.count`` instead of a split and one string per line. Lines past the
+    bound are trimmed lazily, once twice as many have accumulated, and
+    exactly before any read that can see them. ``text`` keeps the joined
+    result, so repeated reads without new output do not join again.
+    """
+
+    def __init__(self, max_lines: int):
+        self.max_lines = max_lines
+        self._chunks: deque[str] = deque()
+        # Newlines in each chunk, and across all chunks.
+        self._chunk_newlines: deque[int] = deque()
+        self._newlines = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of characters held."""
+        return self._size
+
+    def __iter__(self):
+        """Yield the held text, so ``"".join(buffer)`` returns it."""
+        if self._size:
+            yield self.text()
+
+    def append(self, text: str) -> None:
+        if not text:
+            return
+        newlines = text.count("\n")
+        self._chunks.append(text)
+        self._chunk_newlines.append(newlines)
+        self._newlines += newlines
+        self._size += len(text)
+        if self._newlines > 2 * self.max_lines:
+            self._trim()
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._chunk_newlines.clear()
+        self._newlines = 0
+        self._size = 0
+
+    def text(self) -> str:
+        """All held text."""
+        self._trim()
+        if len(self._chunks) > 1:
+            joined = "".join(self._chunks)
+            self._chunks = deque([joined])
+            self._chunk_newlines = deque([self._newlines])
+        return self._chunks[0] if self._chunks else ""
+
+    def tail(self, nchars: int) -> str:
+        """The last ``nchars`` characters of the held text."""
+        if nchars <= 0:
+            return ""
+        if nchars >= self._size:
+            return self.text()
+        parts: list[str] = []
+        size = 0
+        for chunk in reversed(self._chunks):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= nchars:
+                break
+        tail = "".join(reversed(parts))[-nchars:]
+        # The tail may reach into lines that are due to be trimmed.
+        if tail.count("\n") > self.max_lines - self._unterminated():
+            return self.text()[-nchars:]
+        return tail
+
+    def _unterminated(self) -> int:
+        """1 if the last held line has no newline yet, else 0."""
+        return int(bool(self._chunks) and not self._chunks[-1].endswith("\n"))
+
+    def _trim(self) -> None:
+        """Drop whole lines from the front down to ``max_lines`` lines."""
+        excess = self._newlines + self._unterminated() - self.max_lines
+        while excess > 0:
+            first = self._chunks[0]
+            newlines = self._chunk_newlines[0]
+            if newlines == 0 or (newlines <= excess and first.endswith("\n")):
+                # The whole chunk goes; a chunk without newlines is the start
+                # of a line that ends in a later chunk.
+                self._chunks.popleft()
+                self._chunk_newlines.popleft()
+                self._size -= len(first)
+                self._newlines -= newlines
+                excess -= newlines
+                continue
+            dropped = min(newlines, excess)
+            cut = self._after_nth_newline(first, dropped, newlines)
+            self._chunks[0] = first[cut:]
+            self._chunk_newlines[0] = newlines - dropped
+            self._size -= cut
+            self._newlines -= dropped
+            excess -= dropped
+
+    @staticmethod
+    def _after_nth_newline(text: str, n: int, total: int) -> int:
+        """Index just past the ``n``-th of the ``total`` newlines in ``text``."""
+        # Walk from whichever end is nearer, so a cut costs at most the
+        # length of the lines kept or dropped, not a scan per line.
+        if n <= total - n:
+            index = -1
+            for _ in range(n):
+                index = text.find("\n", index + 1)
+        else:
+            index = len(text)
+            for _ in range(total - n + 1):
+                index = text.rfind("\n", 0, index)
+        return index + 1
+
+
 def _normalize_eols(raw: bytes) -> bytes:
     # CRLF/LF/CR -> CR, so each logical line is terminated with \r for the TTY
     raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
@@ -78,8 +203,12 @@ class SubprocessTerminal(TerminalInterface):
     PS1: str
     process: subprocess.Popen | None
     _pty_master_fd: int | None
-    output_buffer: deque[str]
+    output_buffer: _OutputBuffer
     output_lock: threading.Lock
+    # Notified (with ``output_lock`` held) whenever the reader appends output.
+    _output_ready: threading.Condition
+    # Characters appended since start, reported by ``output_version``.
+    _output_total: int
     reader_thread: threading.Thread | None
     _current_command_running: bool
 
@@ -96,8 +225,12 @@ class SubprocessTerminal(TerminalInterface):
         self._pty_master_fd = None
         # Use a slightly larger buffer to match tmux behavior which seems to keep
         # ~10,001 lines instead of exactly 10,000
-        self.output_buffer = deque(maxlen=HISTORY_LIMIT + 50)  # Circular buffer
+        self.output_buffer = _OutputBuffer(max_lines=HISTORY_LIMIT + 50)
         self.output_lock = threading.Lock()
+        self._output_ready = threading.Condition(self.output_lock)
+        self._output_total = 0
+        # Keeps a UTF-8 sequence split across two PTY reads in one piece.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         self.reader_thread = None
         self._current_command_running = False
         self.shell_path = shell_path
@@ -273,45 +406,74 @@ class SubprocessTerminal(TerminalInterface):
                     continue
 
                 try:
-                    chunk = os.read(fd, 4096)
-                    if not chunk:
-                        break  # EOF
-                    # Normalize newlines; PTY typically uses \n already
-                    text = chunk.decode("utf-8", errors="replace")
-                    with self.output_lock:
-                        # Store one line per buffer item to make deque truncation work
-                        self._add_text_to_buffer(text)
-                except OSError:
-                    # Would-block or FD closed
-                    continue
+                    data, eof = self._drain_pty(fd)
+                    if data:
+                        self._ingest(data)
+                    if eof:
+                        break
                 except Exception as e:
                     logger.debug(f"Error reading PTY output: {e}")
                     break
         except Exception as e:
             logger.error(f"PTY reader thread error: {e}", exc_info=True)
 
-    def _add_text_to_buffer(self, text: str) -> None:
-        """Add text to buffer, ensuring one line per buffer item."""
-        # If there's a partial line in the last buffer item, combine with new text
-        if self.output_buffer and not self.output_buffer[-1].endswith("\n"):
-            combined_text = self.output_buffer[-1] + text
-            self.output_buffer.pop()  # Remove the partial line
-        else:
-            combined_text = text
+    @staticmethod
+    def _drain_pty(fd: int) -> tuple[bytes, bool]:
+        """Read what the PTY has buffered, up to ``_READ_BATCH`` bytes.
 
-        # Split into lines and add each line as a separate buffer item
-        lines = combined_text.split("\n")
+        Returns the bytes read and whether the PTY reached EOF. Stops at the
+        first read that would block, so a quiet terminal returns after one
+        read and a busy one is batched.
+        """
+        chunks: list[bytes] = []
+        size = 0
+        while size < _READ_BATCH:
+            try:
+                chunk = os.read(fd, _READ_SIZE)
+            except OSError:
+                # Would-block or FD closed
+                break
+            if not chunk:
+                return b"".join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b"".join(chunks), False
+
+    def _ingest(self, data: bytes) -> None:
+        """Decode PTY bytes into the buffer and wake waiters."""
+        text = self._decoder.decode(data)
+        if not text:
+            return
+        with self._output_ready:
+            self._add_text_to_buffer(text)
+            self._output_ready.notify_all()
 
-        # Add all complete lines (all but the last, which might be partial)
-        for line in lines[:-1]:
-            self.output_buffer.append(line + "\n")
+    def _add_text_to_buffer(self, text: str) -> None:
+        """Append decoded output to the buffer.
 
-        # Add the last part (might be partial line)
-        if lines[-1]:  # Only add if not empty
-            self.output_buffer.append(lines[-1])
+        Caller must hold ``output_lock``.
+        """
+        self._output_total += len(text)
+        self.output_buffer.append(text)
 
     # ------------------------- Readiness Helpers -------------------------
 
+    def _buffer_tail(self, nchars: int) -> str:
+        """Last ``nchars`` characters of buffered output.
+
+        Caller must hold ``output_lock``. Joins only the trailing chunks.
+        """
+        return self.output_buffer.tail(nchars)
+
+    def _buffer_text(self) -> str:
+        """All buffered output. Caller must hold ``output_lock``."""
+        return self.output_buffer.text()
+
+    def _reset_buffer(self, text: str = "") -> None:
+        """Replace buffered output with ``text``. Caller must hold ``output_lock``."""
+        self.output_buffer.clear()
+        self.output_buffer.append(text)
+
     def _wait_for_output(self, pattern: str | re.Pattern, timeout: float = 5.0) -> bool:
         """Wait until the output buffer contains pattern (regex or literal)."""
         deadline = time.time() + timeout
@@ -321,7 +483,7 @@ class SubprocessTerminal(TerminalInterface):
             if self._pty_master_fd is not None:
                 select.select([], [], [], 0.02)
             with self.output_lock:
-                data = "".join(self.output_buffer)
+                data = self._buffer_text()
             if is_regex:
                 assert isinstance(pattern, re.Pattern)
                 if pattern.search(data):
@@ -338,7 +500,7 @@ class SubprocessTerminal(TerminalInterface):
         deadline = time.time() + timeout
         while time.time() < deadline:
             with self.output_lock:
-                tail = "".join(self.output_buffer)[-4096:]
+                tail = self._buffer_tail(4096)
             if pat.search(tail):
                 return True
             time.sleep(0.05)
@@ -462,12 +624,26 @@ class SubprocessTerminal(TerminalInterface):
         time.sleep(0.01)
 
         with self.output_lock:
-            content = "".join(self.output_buffer)
-            lines = content.split("\n")
-            content = "\n".join(lines).replace("\r", "")
+            content = self._buffer_text().replace("\r", "")
             logger.debug("Read from subprocess PTY (content_length=%s)", len(content))
             return content
 
+    def output_version(self) -> int:
+        """Total characters captured by the reader thread so far."""
+        with self.output_lock:
+            return self._output_total
+
+    def wait_for_output(self, version: int, timeout: float) -> bool:
+        """Wait on the reader thread's notification for output past ``version``."""
+        deadline = time.monotonic() + timeout
+        with self._output_ready:
+            while self._output_total == version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._output_ready.wait(remaining)
+            return True
+
     def clear_screen(self) -> None:
         """Drop buffered output up to the most recent PS1 block; do not emit ^L."""
         if not self._initialized:
@@ -475,18 +651,16 @@ class SubprocessTerminal(TerminalInterface):
 
         need_prompt_nudge = False
         with self.output_lock:
-            if not self.output_buffer:
+            data = self._buffer_text()
+            if not data:
                 need_prompt_nudge = True
             else:
-                data = "".join(self.output_buffer)
                 start_idx = data.rfind(CMD_OUTPUT_PS1_BEGIN)
                 end_idx = data.rfind(CMD_OUTPUT_PS1_END)
                 if start_idx != -1 and end_idx != -1 and end_idx >= start_idx:
-                    tail = data[start_idx:]
-                    self.output_buffer.clear()
-                    self.output_buffer.append(tail)
+                    self._reset_buffer(data[start_idx:])
                 else:
-                    self.output_buffer.clear()
+                    self._reset_buffer()
                     need_prompt_nudge = True
 
         if need_prompt_nudge:
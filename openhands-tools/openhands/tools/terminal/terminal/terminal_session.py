@@ -32,6 +32,10 @@ from openhands.tools.terminal.utils.escape_filter import TerminalQueryFilter
 
 logger = get_logger(__name__)
 
+# First pause between screen reads while a command runs on a backend that
+# signals new output; doubles on each read up to POLL_INTERVAL.
+_MIN_READ_INTERVAL = 0.005
+
 
 class TerminalCommandStatus(Enum):
     """Status of a terminal command execution."""
@@ -137,6 +141,11 @@ class TerminalSession(TerminalSessionBase):
             TerminalCommandStatus.HARD_TIMEOUT,
         }
 
+    def _output_version(self) -> int | None:
+        version = self.terminal.output_version()
+        # Anything but an int (e.g. a mocked backend) means "cannot tell".
+        return version if isinstance(version, int) else None
+
     def _is_special_key(self, command: str) -> bool:
         """Check if the command is a special key."""
         # Special keys are of the form C-<key>
@@ -556,18 +565,32 @@ class TerminalSession(TerminalSessionBase):
                     enter=not is_special_key,
                 )
 
-        # Loop until the command completes or times out
+        # Loop until the command completes or times out. No backend reports
+        # version -1, so the first iteration always reads the screen.
+        read_version = -1
+        read_interval = _MIN_READ_INTERVAL
+        cur_terminal_output = ""
+        ps1_matches: list[re.Match[str]] = []
         while True:
             _start_time = time.time()
-            logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
-            cur_terminal_output = self.terminal.read_screen()
-            logger.debug(
-                f"TERMINAL CONTENT GOT after {time.time() - _start_time:.2f} seconds"
-            )
-            logger.debug(
-                "Terminal content read (content_length=%s)", len(cur_terminal_output)
-            )
-            ps1_matches = CmdOutputMetadata.matches_ps1_metadata(cur_terminal_output)
+            version = self._output_version()
+            # Backends that report output versions are re-read (and re-parsed)
+            # only when they produced something since the last read.
+            if version is None or version != read_version:
+                read_version = version
+                logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
+                cur_terminal_output = self.terminal.read_screen()
+                logger.debug(
+                    f"TERMINAL CONTENT GOT after "
+                    f"{time.time() - _start_time:.2f} seconds"
+                )
+                logger.debug(
+                    "Terminal content read (content_length=%s)",
+                    len(cur_terminal_output),
+                )
+                ps1_matches = CmdOutputMetadata.matches_ps1_metadata(
+                    cur_terminal_output
+                )
             current_ps1_count = len(ps1_matches)
             output_changed_since_command = (
                 cur_terminal_output != initial_terminal_output
@@ -634,5 +657,15 @@ class TerminalSession(TerminalSessionBase):
                     )
                     return obs
 
-            # Sleep before next check
-            time.sleep(POLL_INTERVAL)
+            # Wait before next check: backends that report output versions wake
+            # us when output arrives, others are polled every POLL_INTERVAL.
+            if version is None:
+                time.sleep(POLL_INTERVAL)
+                continue
+            # Coalesce bursts of output: a chatty command is re-read at most
+            # every read_interval, which backs off towards POLL_INTERVAL.
+            pause = _start_time + read_interval - time.time()
+            if pause > 0:
+                time.sleep(pause)
+            read_interval = min(read_interval * 2, POLL_INTERVAL)
+            self.terminal.wait_for_output(version, POLL_INTERVAL)
@@ -0,0 +1,495 @@
+"""Warm, incrementally refreshed workspace file index for the grep and glob tools.
+
+The index keeps the workspace's file list in memory, one listing per
+directory, and revalidates it on every query by re-statting directories:
+a directory whose mtime is unchanged is not listed again. Hidden
+directories are never entered, and ``.gitignore`` / ``.ignore`` rules are
+applied while listing, approximating ripgrep's default filtering.
+
+For content search the index also keeps a trigram signature per file: a
+small bitset with one bit per (hashed) lowercase trigram of the file's text.
+A regex's required literal substrings are turned into the same bits, and
+only files whose signature contains all of them are read and matched.
+Signatures are rebuilt for files whose size or mtime changed since they were
+last indexed.
+
+Indexes are shared per workspace root through ``get_workspace_file_index``.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Files larger than this are not signed; every content search reads them.
+MAX_SIGNED_FILE_SIZE = 1024 * 1024
+
+_IGNORE_FILE_NAMES = (".gitignore", ".ignore")
+
+# Characters that re.IGNORECASE matches against ASCII letters but that
+# str.lower() does not map onto them.
+_CASE_FOLDS = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a ripgrep/gitignore-style glob into a regex body.
+
+    ``*`` and ``?`` do not cross ``/``, ``**`` does (``**/`` also matches
+    nothing), ``[...]`` / ``[!...]`` are character classes and ``{a,b}``
+    are alternatives.
+    """
+    out: list[str] = []
+    i, n, depth = 0, len(pattern), 0
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                if pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                else:
+                    out.append(".*")
+                    i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            # A "]" right after "[" or "[!" is part of the class.
+            start = i + 3 if pattern[i + 1 : i + 2] in ("!", "^") else i + 2
+            end = pattern.find("]", start)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "{":
+            depth += 1
+            out.append("(?:")
+        elif c == "}" and depth:
+            depth -= 1
+            out.append(")")
+        elif c == "," and depth:
+            out.append("|")
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    out.append(")" * depth)
+    return "".join(out)
+
+
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob matched against ``/``-separated relative paths."""
+    return re.compile(_glob_to_regex(pattern))
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def _parse_ignore_file(path: str) -> tuple[_IgnoreRule, ...]:
+    """Parse the gitignore-syntax rules in ``path``."""
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return ()
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        body = _glob_to_regex(line.lstrip("/"))
+        if not anchored:
+            body = "(?:.*/)?" + body
+        rules.append(_IgnoreRule(re.compile(body), negated, dir_only))
+    return tuple(rules)
+
+
+# Ignore rules in effect for a directory's entries: (directory, rules) pairs
+# from the workspace root down, each applied to paths relative to its
+# directory. Later rules take precedence, as in git.
+_RuleStack = tuple[tuple[str, tuple[_IgnoreRule, ...]], ...]
+
+
+def _is_ignored(rel: str, is_dir: bool, rule_stack: _RuleStack) -> bool:
+    ignored = False
+    for base, rules in rule_stack:
+        relative = rel[len(base) + 1 :] if base else rel
+        for rule in rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(relative):
+                ignored = not rule.negated
+    return ignored
+
+
+def _required_literals(pattern: str) -> list[str]:
+    """Return lowercase ASCII substrings every match of ``pattern`` contains.
+
+    The scan is conservative: alternations, inline flags and group contents
+    contribute nothing, and any construct it does not understand just ends
+    the current literal. Returning too little only weakens the filter.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return []
+    literals: list[str] = []
+    current: list[str] = []
+
+    def flush() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    i, n, group_depth = 0, len(pattern), 0
+    while i < n:
+        c = pattern[i]
+        literal = None
+        if c == "\\":
+            nxt = pattern[i + 1 : i + 2]
+            if nxt and nxt.isascii() and not nxt.isalnum():
+                literal = nxt
+            i += 2
+        elif c == "[":
+            flush()
+            # Skip the character class, including a leading "]" or "^]".
+            j = i + 1
+            if pattern[j : j + 1] == "^":
+                j += 1
+            if pattern[j : j + 1] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            i = j + 1
+            continue
+        elif c in "*?{":
+            # The preceding atom may be absent: it is not required.
+            if current:
+                current.pop()
+            flush()
+            if c == "{":
+                end = pattern.find("}", i)
+                if end == -1:
+                    break
+                i = end
+            i += 1
+            continue
+        elif c == "+":
+            flush()
+            i += 1
+            continue
+        elif c == "(":
+            flush()
+            group_depth += 1
+            i += 1
+            continue
+        elif c == ")":
+            current.clear()
+            group_depth = max(group_depth - 1, 0)
+            i += 1
+            continue
+        elif c in ".^$":
+            i += 1
+        else:
+            literal = c
+            i += 1
+        if (
+            literal is not None
+            and group_depth == 0
+            and literal.isascii()
+            and literal.isprintable()
+        ):
+            current.append(literal.lower())
+        else:
+            flush()
+    flush()
+    return [literal for literal in literals if len(literal) >= 3]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _signature_bits(trigram_count: int) -> int:
+    """Signature size for a file: about 8 bits per trigram, a power of two."""
+    bits = 256
+    while bits < trigram_count * 8 and bits < 65536:
+        bits *= 2
+    return bits
+
+
+def _signature(trigrams: set[str], bits: int) -> int:
+    mask = bits - 1
+    signature = bytearray(bits // 8)
+    for trigram in trigrams:
+        h = hash(trigram) & mask
+        signature[h >> 3] |= 1 << (h & 7)
+    return int.from_bytes(signature, "little")
+
+
+@dataclass(slots=True)
+class _FileSignature:
+    mtime_ns: int
+    size: int
+    bits: int  # 0 when the file is not signed
+    signature: int
+
+
+@dataclass(slots=True)
+class _DirListing:
+    mtime_ns: int
+    ignore_files: tuple[tuple[str, int], ...]
+    rule_stack: _RuleStack
+    child_rule_stack: _RuleStack
+    files: list[str]
+    subdirs: list[str]
+    # Content signatures of ``files`` by name, filled in by content searches.
+    signatures: dict[str, _FileSignature]
+
+
+def _sign_file(path: str, st: os.stat_result) -> _FileSignature:
+    """Read and sign a file; large or unreadable files stay unsigned."""
+    entry = _FileSignature(st.st_mtime_ns, st.st_size, 0, 0)
+    if st.st_size <= MAX_SIGNED_FILE_SIZE:
+        try:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+        except OSError:
+            return entry
+        trigrams = _trigrams(text.translate(_CASE_FOLDS).lower())
+        entry.bits = _signature_bits(len(trigrams))
+        entry.signature = _signature(trigrams, entry.bits)
+    return entry
+
+
+class WorkspaceFileIndex:
+    """In-memory file list and content signatures for one workspace root.
+
+    Thread-safe; queries are serialized on an internal lock.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root: Path = Path(root).resolve()
+        self._root_str = str(self.root)
+        self._lock = threading.Lock()
+        self._dirs: dict[str, _DirListing] = {}
+
+    def files(self, search_path: Path) -> list[str] | None:
+        """List the indexed files under ``search_path``.
+
+        Returns ``/``-separated paths relative to ``search_path``, or None
+        when ``search_path`` is not an indexed directory (outside the root,
+        hidden or ignored) and the caller should search it directly.
+        """
+        with self._lock:
+            self._refresh()
+            dirs = self._dirs_under(search_path)
+            if dirs is None:
+                return None
+            return [
+                relative_dir + name
+                for _, relative_dir, listing in dirs
+                for name in listing.files
+            ]
+
+    def search_candidates(self, search_path: Path, pattern: str) -> list[str] | None:
+        """List the files under ``search_path`` that may match ``pattern``.
+
+        ``pattern`` is a case-insensitive regex. Files whose signature lacks
+        one of its required trigrams are left out; the rest still have to be
+        matched by the caller. Paths are returned as in ``files``.
+        """
+        trigrams = {
+            trigram
+            for literal in _required_literals(pattern)
+            for trigram in _trigrams(literal)
+        }
+        query_masks: dict[int, int] = {}
+        with self._lock:
+            self._refresh()
+            dirs = self._dirs_under(search_path)
+            if dirs is None:
+                return None
+            candidates = []
+            for path, relative_dir, listing in dirs:
+                dir_prefix = path + os.sep
+                signatures = listing.signatures
+                for name in listing.files:
+                    file_path = dir_prefix + name
+                    try:
+                        st = os.stat(file_path)
+                    except OSError:
+                        continue
+                    entry = signatures.get(name)
+                    if (
+                        entry is None
+                        or entry.mtime_ns != st.st_mtime_ns
+                        or entry.size != st.st_size
+                    ):
+                        entry = signatures[name] = _sign_file(file_path, st)
+                    if entry.bits and trigrams:
+                        mask = query_masks.get(entry.bits)
+                        if mask is None:
+                            mask = _signature(trigrams, entry.bits)
+                            query_masks[entry.bits] = mask
+                        if entry.signature & mask != mask:
+                            continue
+                    candidates.append(relative_dir + name)
+            return candidates
+
+    def _abs(self, rel: str) -> str:
+        return os.path.join(self._root_str, rel) if rel else self._root_str
+
+    def _relative(self, path: str) -> str | None:
+        """Return ``path`` relative to the root with ``/`` separators."""
+        if path == self._root_str:
+            return ""
+        root = self._root_str.rstrip(os.sep) + os.sep
+        if not path.startswith(root):
+            return None
+        return path[len(root) :].replace(os.sep, "/")
+
+    def _dirs_under(
+        self, search_path: Path
+    ) -> list[tuple[str, str, _DirListing]] | None:
+        """Return (path, ``/``-terminated path relative to ``search_path``,
+        listing) for each indexed directory under ``search_path``."""
+        prefix = self._relative(str(search_path))
+        if prefix is None or prefix not in self._dirs:
+            return None
+        strip = len(prefix) + 1 if prefix else 0
+        nested = prefix + "/"
+        dirs = []
+        for rel, listing in self._dirs.items():
+            if rel == prefix:
+                dirs.append((self._abs(rel), "", listing))
+            elif not prefix or rel.startswith(nested):
+                dirs.append((self._abs(rel), rel[strip:] + "/", listing))
+        return dirs
+
+    def _refresh(self) -> None:
+        """Bring the directory listings up to date with the filesystem."""
+        dirs: dict[str, _DirListing] = {}
+        stack: list[tuple[str, _RuleStack]] = [("", ())]
+        while stack:
+            rel, rule_stack = stack.pop()
+            path = self._abs(rel)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            listing = self._dirs.get(rel)
+            if (
+                listing is None
+                or listing.mtime_ns != mtime_ns
+                or listing.rule_stack != rule_stack
+                or listing.ignore_files != self._ignore_files(path, listing.files)
+            ):
+                listing = self._list_dir(rel, path, mtime_ns, rule_stack, listing)
+            dirs[rel] = listing
+            for name in listing.subdirs:
+                child = f"{rel}/{name}" if rel else name
+                stack.append((child, listing.child_rule_stack))
+        self._dirs = dirs
+
+    @staticmethod
+    def _ignore_files(path: str, names: list[str]) -> tuple[tuple[str, int], ...]:
+        found = []
+        for name in _IGNORE_FILE_NAMES:
+            if name in names:
+                try:
+                    found.append((name, os.stat(os.path.join(path, name)).st_mtime_ns))
+                except OSError:
+                    found.append((name, -1))
+        return tuple(found)
+
+    def _list_dir(
+        self,
+        rel: str,
+        path: str,
+        mtime_ns: int,
+        rule_stack: _RuleStack,
+        previous: _DirListing | None,
+    ) -> _DirListing:
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            entries = []
+        names = [entry.name for entry in entries]
+        ignore_files = self._ignore_files(path, names)
+        own_rules = tuple(
+            rule
+            for name, _ in ignore_files
+            for rule in _parse_ignore_file(os.path.join(path, name))
+        )
+        child_rule_stack = rule_stack + ((rel, own_rules),) if own_rules else rule_stack
+        files, subdirs = [], []
+        for entry in entries:
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and not _is_ignored(
+                        child, True, child_rule_stack
+                    ):
+                        subdirs.append(entry.name)
+                elif entry.is_file() and not _is_ignored(
+                    child, False, child_rule_stack
+                ):
+                    files.append(entry.name)
+            except OSError:
+                continue
+        return _DirListing(
+            mtime_ns=mtime_ns,
+            ignore_files=ignore_files,
+            rule_stack=rule_stack,
+            child_rule_stack=child_rule_stack,
+            files=files,
+            subdirs=subdirs,
+            signatures={
+                name: previous.signatures[name]
+                for name in files
+                if name in previous.signatures
+            }
+            if previous is not None
+            else {},
+        )
+
+
+_indexes: dict[Path, WorkspaceFileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workspace_file_index(root: str | Path) -> WorkspaceFileIndex:
+    """Return the shared file index for the workspace at ``root``."""
+    resolved = Path(root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(resolved)
+        if index is None:
+            index = _indexes[resolved] = WorkspaceFileIndex(resolved)
+            logger.debug("Created workspace file index for %s", resolved)
+        return index
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-step condensation-check cost vs. history length.
+
+Builds a synthetic conversation with the same shape as
+``bench_step_preparation.py`` and times the token-limit check that
+``LLMSummarizingCondenser`` runs before every LLM call, after appending one
+more action/observation pair:
+  - full:        ``get_total_token_count`` re-tokenizes the whole view, as before
+  - accounting:  a warm ``TokenAccounting`` only tokenizes the new events and
+                 adds them to its running total
+
+Usage:
+    python bench_condensation_check.py [--lengths 50,100,250,500,1000] [--repeat 10]
+"""
+
+import argparse
+import statistics
+import time
+
+from bench_step_preparation import history, tool_step
+from pydantic import SecretStr
+
+from openhands.sdk.context.condenser.token_accounting import TokenAccounting
+from openhands.sdk.context.condenser.utils import get_total_token_count
+from openhands.sdk.llm import LLM
+
+
+def measure(llm: LLM, steps: int, repeat: int, incremental: bool) -> float:
+    events = history(steps)
+    accounting = TokenAccounting(llm)
+    accounting.total(events)  # the previous step
+    timings = []
+    for r in range(repeat):
+        events += tool_step(steps + r)
+        start = time.perf_counter()
+        if incremental:
+            accounting.total(events)
+        else:
+            get_total_token_count(events, llm)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lengths", default="50,100,250,500,1000")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--model", default="gpt-4o")
+    args = parser.parse_args()
+
+    llm = LLM(model=args.model, api_key=SecretStr("unused"), usage_id="bench")
+    print(f"{'Messages':>8} | {'Full':>9} | {'Accounting':>10} | {'Speedup':>7}")
+    print("-" * 45)
+    for length in (int(n) for n in args.lengths.split(",")):
+        steps = max(length // 2 - 1, 1)
+        full = measure(llm, steps, args.repeat, incremental=False)
+        incremental = measure(llm, steps, args.repeat, incremental=True)
+        print(
+            f"{2 + 2 * steps:>8} | {full:>7.2f}ms | {incremental:>8.2f}ms | "
+            f"{full / incremental:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
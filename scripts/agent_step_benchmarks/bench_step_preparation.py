@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-step LLM message preparation time vs. history length.
+
+Builds a synthetic conversation (system prompt, a user task, then N tool
+calls with ~1.5 KB observations) and times one agent step's message
+preparation, ``events_to_messages`` followed by
+``LLM.format_messages_for_llm``, after appending one more action/observation
+pair:
+  - full:        converts and serializes the whole history, as before
+  - memoized:    passes a warm ``MessageProjectionCache``, so only the new tail
+                 and the prompt-caching breakpoints are re-rendered
+
+Usage:
+    python bench_step_preparation.py [--lengths 50,100,250,500,1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Sequence
+
+from pydantic import SecretStr
+
+from openhands.sdk.event import (
+    ActionEvent,
+    LLMConvertibleEvent,
+    MessageEvent,
+    MessageProjectionCache,
+    ObservationEvent,
+    SystemPromptEvent,
+)
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.tool import Action, Observation
+
+
+class BenchAction(Action):
+    command: str
+
+
+class BenchObservation(Observation):
+    output: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.output)]
+
+
+def tool_step(i: int) -> list[LLMConvertibleEvent]:
+    arguments = {"command": f"grep -rn pattern_{i} src/"}
+    action = ActionEvent(
+        source="agent",
+        thought=[TextContent(text=f"Looking for pattern_{i} in the sources. " * 4)],
+        action=BenchAction(command=arguments["command"]),
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+        tool_call=MessageToolCall(
+            id=f"call_{i}",
+            name="terminal",
+            arguments=json.dumps(arguments),
+            origin="completion",
+        ),
+        llm_response_id=f"resp_{i}",
+    )
+    observation = ObservationEvent(
+        source="environment",
+        observation=BenchObservation(output=f"src/module_{i}.py:42: match\n" * 50),
+        action_id=action.id,
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+    )
+    return [action, observation]
+
+
+def history(steps: int) -> list[LLMConvertibleEvent]:
+    events: list[LLMConvertibleEvent] = [
+        SystemPromptEvent(
+            source="agent",
+            system_prompt=TextContent(text="You are a helpful agent. " * 400),
+            tools=[],
+        ),
+        MessageEvent(
+            source="user",
+            llm_message=Message(role="user", content=[TextContent(text="Fix it.")]),
+        ),
+    ]
+    for i in range(steps):
+        events += tool_step(i)
+    return events
+
+
+def prepare(llm: LLM, events, cache: MessageProjectionCache | None) -> list[dict]:
+    messages = LLMConvertibleEvent.events_to_messages(events, cache=cache)
+    return llm.format_messages_for_llm(messages)
+
+
+def measure(llm: LLM, steps: int, repeat: int, memoized: bool) -> float:
+    events = history(steps)
+    cache = MessageProjectionCache() if memoized else None
+    prepare(llm, events, cache)  # the previous step
+    timings = []
+    for r in range(repeat):
+        events += tool_step(steps + r)
+        start = time.perf_counter()
+        prepare(llm, events, cache)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lengths", default="50,100,250,500,1000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--model", default="claude-sonnet-4-20250514")
+    args = parser.parse_args()
+
+    llm = LLM(model=args.model, api_key=SecretStr("unused"), usage_id="bench")
+    print(f"{'Messages':>8} | {'Full':>9} | {'Memoized':>9} | {'Speedup':>7}")
+    print("-" * 44)
+    for length in (int(n) for n in args.lengths.split(",")):
+        steps = max(length // 2 - 1, 1)
+        full = measure(llm, steps, args.repeat, memoized=False)
+        memo = measure(llm, steps, args.repeat, memoized=True)
+        print(
+            f"{2 + 2 * steps:>8} | {full:>7.2f}ms | {memo:>7.2f}ms | "
+            f"{full / memo:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
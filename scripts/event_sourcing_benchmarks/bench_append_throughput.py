@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: EventLog append throughput vs. log length.
+
+Seeds per-file event logs of increasing size and times appends through
+``EventLog.append`` in two modes:
+  - sequence: the ``.eventlog.seq`` sidecar is current, so appends skip the
+    directory listing (the normal single-writer path)
+  - listing: the sidecar is removed before every append, forcing the
+    cross-process sync check to list the events directory (the old behavior)
+
+With the sequence file, throughput should stay flat as the log grows.
+
+Usage:
+    python bench_append_throughput.py [--sizes 1000 10000 50000] [--appends 200]
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+from openhands.sdk.conversation.event_store import SEQUENCE_FILE_NAME, EventLog
+from openhands.sdk.conversation.persistence_const import (
+    EVENT_FILE_PATTERN,
+    EVENTS_DIR,
+)
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def make_event(i: int) -> MessageEvent:
+    return MessageEvent(
+        id=str(uuid.uuid4()),
+        llm_message=Message(role="user", content=[TextContent(text=f"event {i}")]),
+        source="user",
+    )
+
+
+def seed(fs: LocalFileStore, n: int) -> None:
+    """Write ``n`` event files directly, without going through append."""
+    for i in range(n):
+        event = make_event(i)
+        name = EVENT_FILE_PATTERN.format(idx=i, event_id=event.id)
+        fs.write(f"{EVENTS_DIR}/{name}", event.model_dump_json(exclude_none=True))
+
+
+def bench_one(n: int, appends: int, force_listing: bool) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench_append_")
+    try:
+        fs = LocalFileStore(tmpdir, cache_limit_size=0, cache_memory_size=0)
+        seed(fs, n)
+        log = EventLog(fs)
+        # Prime the sequence file so the timed appends start from steady state.
+        log.append(make_event(n))
+
+        seq_path = f"{EVENTS_DIR}/{SEQUENCE_FILE_NAME}"
+        latencies = []
+        for i in range(appends):
+            event = make_event(n + 1 + i)
+            if force_listing:
+                fs.delete(seq_path)
+            t0 = time.perf_counter()
+            log.append(event)
+            latencies.append((time.perf_counter() - t0) * 1000)
+        latencies.sort()
+        total_s = sum(latencies) / 1000
+        return {
+            "events": n,
+            "mode": "listing" if force_listing else "sequence",
+            "median_ms": statistics.median(latencies),
+            "p95_ms": latencies[int(len(latencies) * 0.95)],
+            "per_sec": appends / total_s if total_s else float("inf"),
+        }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main():
+    import logging
+
+    logging.getLogger("openhands").setLevel(logging.ERROR)
+
+    parser = argparse.ArgumentParser(
+        description="Measure EventLog append throughput against log length"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument(
+        "--appends", type=int, default=200, help="Timed appends per run"
+    )
+    args = parser.parse_args()
+
+    print(f"  {'Mode':<9} {'Events':>8} {'Median':>10} {'p95':>10} {'Appends/s':>10}")
+    print(f"  {'-' * 51}")
+    for n in args.sizes:
+        for force_listing in (False, True):
+            r = bench_one(n, args.appends, force_listing)
+            print(
+                f"  {r['mode']:<9} {r['events']:>8,}"
+                f" {r['median_ms']:>8.3f}ms"
+                f" {r['p95_ms']:>8.3f}ms"
+                f" {r['per_sec']:>10,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
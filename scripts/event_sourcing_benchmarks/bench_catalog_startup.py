@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent-server conversation catalog load time at startup.
+
+Seeds a conversations directory with N synthetic persisted conversations
+(``meta.json`` + a ``base_state.json`` whose stats carry ``--llm-calls`` worth
+of cost, latency and token-usage records, as a finished run's would) and times
+``ConversationService._load_catalog_sync`` under three regimes:
+  - serial:  the previous loader, one conversation at a time, fully parsing
+             every ``base_state.json`` for its ``execution_status``
+  - cold:    the thread-pool loader with no catalog index yet (first start
+             after upgrade); parses every base state and writes the index
+  - warm:    the thread-pool loader with an up-to-date catalog index (every
+             later start); base states are only ``stat()``-ed
+
+Usage:
+    python bench_catalog_startup.py [--sizes 1000 10000] [--llm-calls 100]
+"""
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from pydantic import SecretStr
+
+from openhands.agent_server.conversation_service import (
+    CATALOG_INDEX_FILE,
+    ConversationService,
+)
+from openhands.agent_server.models import StoredConversation
+from openhands.sdk import LLM, Agent
+from openhands.sdk.conversation.persistence_const import BASE_STATE
+from openhands.sdk.conversation.state import (
+    ConversationExecutionStatus,
+    ConversationState,
+)
+from openhands.sdk.security.confirmation_policy import NeverConfirm
+from openhands.sdk.workspace import LocalWorkspace
+
+
+def seed(
+    conversations_dir: Path, count: int, workspace_dir: str, llm_calls: int
+) -> None:
+    conversations_dir.mkdir(parents=True)
+    workspace = LocalWorkspace(working_dir=workspace_dir)
+    template_id = uuid.uuid4()
+    llm = LLM(model="gpt-4o-mini", api_key=SecretStr("x"), usage_id="bench")
+    state = ConversationState(
+        id=template_id,
+        agent=Agent(llm=llm, tools=[]),
+        workspace=workspace,
+        persistence_dir=str(conversations_dir / template_id.hex),
+    )
+    metrics = llm.metrics
+    for i in range(llm_calls):
+        response_id = f"resp-{i}"
+        metrics.add_cost(0.001)
+        metrics.add_response_latency(1.5, response_id)
+        metrics.add_token_usage(12000 + i, 300, 8000, 0, 128000, response_id)
+    state.stats.usage_to_metrics["bench"] = metrics
+    base_state = state.model_dump_json()
+    for _ in range(count):
+        conversation_id = uuid.uuid4()
+        target = conversations_dir / conversation_id.hex
+        target.mkdir()
+        stored = StoredConversation(
+            id=conversation_id,
+            workspace=workspace,
+            confirmation_policy=NeverConfirm(),
+        )
+        (target / "meta.json").write_text(stored.model_dump_json())
+        (target / BASE_STATE).write_text(
+            base_state.replace(template_id.hex, conversation_id.hex)
+        )
+
+
+def load_serial(svc: ConversationService) -> int:
+    loaded = 0
+    for conversation_dir in svc.conversations_dir.iterdir():
+        meta_file = conversation_dir / "meta.json"
+        if not meta_file.exists():
+            continue
+        StoredConversation.model_validate_json(
+            meta_file.read_text(), context={"cipher": svc.cipher}
+        )
+        payload = json.loads((conversation_dir / BASE_STATE).read_text())
+        ConversationExecutionStatus(payload.get("execution_status", "idle"))
+        loaded += 1
+    return loaded
+
+
+def clear_index(conversations_dir: Path) -> None:
+    (conversations_dir / CATALOG_INDEX_FILE).unlink(missing_ok=True)
+
+
+def timed(fn) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, len(result) if isinstance(result, dict) else result
+
+
+def bench_size(count: int, repeats: int, llm_calls: int) -> dict:
+    tmpdir = Path(tempfile.mkdtemp(prefix="bench_catalog_"))
+    try:
+        conversations_dir = tmpdir / "conversations"
+        seed(conversations_dir, count, str(tmpdir), llm_calls)
+        state_kb = (
+            next(conversations_dir.iterdir()) / BASE_STATE
+        ).stat().st_size / 1024
+        svc = ConversationService(conversations_dir=conversations_dir)
+
+        serial, cold, warm = [], [], []
+        for _ in range(repeats):
+            ms, loaded = timed(lambda: load_serial(svc))
+            assert loaded == count
+            serial.append(ms)
+
+            clear_index(conversations_dir)
+            ms, loaded = timed(svc._load_catalog_sync)
+            assert loaded == count
+            cold.append(ms)
+
+            ms, loaded = timed(svc._load_catalog_sync)
+            assert loaded == count
+            warm.append(ms)
+        return {
+            "count": count,
+            "state_kb": state_kb,
+            "serial_ms": min(serial),
+            "cold_ms": min(cold),
+            "warm_ms": min(warm),
+        }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--llm-calls", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'Conversations':>14} | {'State':>7} | {'Serial':>10} | "
+        f"{'Cold (pool)':>12} | {'Warm (pool)':>12} | {'Speedup':>8}"
+    )
+    print("-" * 78)
+    for count in args.sizes:
+        r = bench_size(count, args.repeats, args.llm_calls)
+        print(
+            f"{r['count']:>14,} | {r['state_kb']:>5.0f}KB | "
+            f"{r['serial_ms']:>8.0f}ms | {r['cold_ms']:>10.0f}ms | "
+            f"{r['warm_ms']:>10.0f}ms | "
+            f"{r['serial_ms'] / r['warm_ms']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent-server conversation search under concurrent sidebar polling.
+
+Seeds N persisted conversations, starts a ``ConversationService`` and runs P
+concurrent pollers, each repeatedly fetching the first page of the sidebar
+(``UPDATED_AT_DESC``) and following ``next_page_id`` for a few more pages.
+Every request is timed, under two implementations:
+  - sort:    the previous search, which listed and sorted every record per
+             request and found ``page_id`` by a linear scan
+  - keyset:  ``ConversationService.search_conversations`` with the catalog's
+             sorted indexes (bisect to the cursor, then ``limit`` steps)
+
+Page items come from the cached ``ConversationInfo`` rows in both cases, so
+the difference is the catalog ordering work alone.
+
+Usage:
+    python bench_conversation_search.py [--conversations 10000] [--pollers 50]
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from bench_catalog_startup import seed
+
+from openhands.agent_server.conversation_service import ConversationService
+from openhands.agent_server.models import ConversationInfo, ConversationSortOrder
+
+
+async def sort_search(
+    svc: ConversationService,
+    page_id: str | None,
+    limit: int,
+    sort_order: ConversationSortOrder,
+) -> tuple[list[ConversationInfo], str | None]:
+    """The search as it was before the sorted catalog indexes."""
+    records = list(svc._conversation_records.items())
+    field = "created_at" if sort_order.startswith("CREATED_AT") else "updated_at"
+    records.sort(
+        key=lambda item: getattr(item[1].stored, field),
+        reverse=sort_order.endswith("_DESC"),
+    )
+    start_index = 0
+    if page_id:
+        for i, (conversation_id, _) in enumerate(records):
+            if conversation_id.hex == page_id:
+                start_index = i
+                break
+    items: list[ConversationInfo] = []
+    next_page_id = None
+    children_index = svc._children_index()
+    for conversation_id, record in records[start_index:]:
+        if len(items) >= limit:
+            next_page_id = conversation_id.hex
+            break
+        info = await svc._conversation_info(conversation_id, record, children_index)
+        if info is not None:
+            items.append(info)
+    return items, next_page_id
+
+
+async def keyset_search(
+    svc: ConversationService,
+    page_id: str | None,
+    limit: int,
+    sort_order: ConversationSortOrder,
+) -> tuple[list[ConversationInfo], str | None]:
+    page = await svc.search_conversations(
+        page_id=page_id, limit=limit, sort_order=sort_order
+    )
+    return page.items, page.next_page_id
+
+
+async def poll(search, svc, rounds: int, pages: int, limit: int) -> list[float]:
+    latencies = []
+    for _ in range(rounds):
+        page_id = None
+        for _ in range(pages):
+            start = time.perf_counter()
+            _, page_id = await search(
+                svc, page_id, limit, ConversationSortOrder.UPDATED_AT_DESC
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+            if page_id is None:
+                break
+    return latencies
+
+
+async def bench(
+    conversations_dir: Path, pollers: int, rounds: int, pages: int, limit: int
+) -> dict[str, dict]:
+    results = {}
+    async with ConversationService(conversations_dir=conversations_dir) as svc:
+        for name, search in (("sort", sort_search), ("keyset", keyset_search)):
+            # Warm the cached ConversationInfo rows the pages will show.
+            await poll(search, svc, 1, pages, limit)
+            start = time.perf_counter()
+            per_poller = await asyncio.gather(
+                *(poll(search, svc, rounds, pages, limit) for _ in range(pollers))
+            )
+            wall = time.perf_counter() - start
+            latencies = sorted(ms for poller in per_poller for ms in poller)
+            results[name] = {
+                "requests": len(latencies),
+                "p50": statistics.median(latencies),
+                "p95": latencies[int(len(latencies) * 0.95) - 1],
+                "rps": len(latencies) / wall,
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--conversations", type=int, default=10000)
+    parser.add_argument("--pollers", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    tmpdir = Path(tempfile.mkdtemp(prefix="bench_search_"))
+    try:
+        conversations_dir = tmpdir / "conversations"
+        seed(conversations_dir, args.conversations, str(tmpdir), llm_calls=0)
+        results = asyncio.run(
+            bench(conversations_dir, args.pollers, args.rounds, args.pages, args.limit)
+        )
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    print(
+        f"{args.conversations:,} conversations, {args.pollers} pollers, "
+        f"limit={args.limit}, {args.pages} pages per poll"
+    )
+    print(f"{'Search':>8} | {'Requests':>8} | {'P50':>9} | {'P95':>9} | {'Req/s':>8}")
+    print("-" * 55)
+    for name, r in results.items():
+        print(
+            f"{name:>8} | {r['requests']:>8} | {r['p50']:>7.2f}ms | "
+            f"{r['p95']:>7.2f}ms | {r['rps']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark: remote conversation reconnect cost vs. history length.
+
+Seeds an ``EventLog`` of N events, serves it through the agent-server's
+``/events/search`` route in-process (Starlette's ``TestClient``, an
+``httpx.Client``), syncs a ``RemoteEventsList`` against it and times the
+reconciliation that runs on every WebSocket reconnect, after a few new events
+were logged, under two implementations:
+  - full:    the previous ``reconcile``, which paged through the whole history
+             and validated every item before deduplicating by id
+  - cursor:  ``RemoteEventsList.reconcile``, which asks only for the events
+             after the last one it holds in full, and validates only new ids
+
+Usage:
+    python bench_reconnect_reconcile.py [--sizes 1000 5000 20000] [--new 5]
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from openhands.agent_server.dependencies import get_event_service
+from openhands.agent_server.event_router import event_router
+from openhands.agent_server.event_service import EventService
+from openhands.agent_server.models import StoredConversation
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.impl.remote_conversation import (
+    RemoteEventsList,
+    _send_request,
+)
+from openhands.sdk.conversation.persistence_const import (
+    EVENT_FILE_PATTERN,
+    EVENTS_DIR,
+)
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+from openhands.sdk.workspace import LocalWorkspace
+
+
+def make_event(i: int) -> MessageEvent:
+    return MessageEvent(
+        id=str(uuid.uuid4()),
+        llm_message=Message(role="user", content=[TextContent(text=f"event {i}")]),
+        source="user",
+    )
+
+
+def seed(fs: LocalFileStore, n: int) -> None:
+    """Write ``n`` event files directly, without going through append."""
+    for i in range(n):
+        event = make_event(i)
+        name = EVENT_FILE_PATTERN.format(idx=i, event_id=event.id)
+        fs.write(f"{EVENTS_DIR}/{name}", event.model_dump_json(exclude_none=True))
+
+
+class CountingClient(TestClient):
+    """``TestClient`` that counts the requests sent through it."""
+
+    requests_sent = 0
+
+    def request(self, *args, **kwargs):
+        self.requests_sent += 1
+        return super().request(*args, **kwargs)
+
+
+def full_reconcile(events: RemoteEventsList) -> int:
+    """The reconciliation as it was before the cursor."""
+    fetched = []
+    page_id = None
+    while True:
+        params: dict = {"limit": 100}
+        if page_id:
+            params["page_id"] = page_id
+        resp = _send_request(
+            events._client,
+            "GET",
+            f"{events._events_base_path}/{events._conversation_id}/events/search",
+            params=params,
+        )
+        data = resp.json()
+        fetched.extend(Event.model_validate(item) for item in data["items"])
+        if not data.get("next_page_id"):
+            break
+        page_id = data["next_page_id"]
+    added = 0
+    with events._lock:
+        for event in fetched:
+            if event.id not in events._cached_event_ids:
+                events._add_event_unsafe(event)
+                added += 1
+    return added
+
+
+def bench_one(n: int, new: int, repeats: int) -> dict[str, dict]:
+    tmpdir = tempfile.mkdtemp(prefix="bench_reconnect_")
+    try:
+        fs = LocalFileStore(tmpdir)
+        seed(fs, n)
+        log = EventLog(fs)
+        service = EventService(
+            stored=StoredConversation(
+                id=uuid.uuid4(), workspace=LocalWorkspace(working_dir=tmpdir)
+            ),
+            conversations_dir=Path(tmpdir),
+        )
+        # search_events only reads the conversation's event log.
+        service._conversation = SimpleNamespace(  # pyright: ignore[reportAttributeAccessIssue]
+            _state=SimpleNamespace(events=log)
+        )
+
+        app = FastAPI()
+        app.include_router(event_router, prefix="/api")
+        app.dependency_overrides[get_event_service] = lambda: service
+        client = CountingClient(app)
+        conversation_id = uuid.uuid4().hex
+
+        results = {}
+        for name in ("full", "cursor"):
+            events = RemoteEventsList(client, conversation_id)
+            latencies = []
+            requests = []
+            for r in range(repeats):
+                for i in range(new):
+                    log.append(make_event(n + r * new + i))
+                sent_before = client.requests_sent
+                start = time.perf_counter()
+                if name == "full":
+                    added = full_reconcile(events)
+                else:
+                    added = events.reconcile()
+                latencies.append((time.perf_counter() - start) * 1000)
+                requests.append(client.requests_sent - sent_before)
+                assert added == new, (name, added)
+            results[name] = {
+                "median_ms": statistics.median(latencies),
+                "requests": max(requests),
+            }
+        return results
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--new", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.new} new events per reconnect, median of {args.repeats}")
+    print(f"{'Events':>8} | {'Reconcile':>9} | {'Requests':>8} | {'Latency':>10}")
+    print("-" * 46)
+    for n in args.sizes:
+        for name, r in bench_one(n, args.new, args.repeats).items():
+            print(
+                f"{n:>8,} | {name:>9} | {r['requests']:>8} | {r['median_ms']:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
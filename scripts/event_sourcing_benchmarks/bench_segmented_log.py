@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-file vs. segmented EventLog layout.
+
+Builds synthetic event logs of increasing size in both on-disk layouts and
+measures, for each:
+  - Open time (``EventLog(...)`` construction, i.e. index rebuild)
+  - Append latency of additional events through ``EventLog.append``
+  - Disk usage (apparent bytes, allocated blocks and file count)
+
+Logs are seeded directly through the storage layer so the seeding cost does
+not dominate the run; the measured appends go through the production path.
+
+Usage:
+    python bench_segmented_log.py [--sizes 1000 10000 100000] [--appends 200]
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+from openhands.sdk.conversation.event_segments import SegmentedEventStorage
+from openhands.sdk.conversation.event_store import EventLog, EventLogFormat
+from openhands.sdk.conversation.persistence_const import (
+    EVENT_FILE_PATTERN,
+    EVENTS_DIR,
+)
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def make_event(i: int, payload_bytes: int) -> MessageEvent:
+    text = f"event {i} " + "x" * payload_bytes
+    return MessageEvent(
+        id=str(uuid.uuid4()),
+        llm_message=Message(role="user", content=[TextContent(text=text)]),
+        source="user",
+    )
+
+
+def seed(fs: LocalFileStore, log_format: EventLogFormat, n: int, size: int) -> None:
+    """Write ``n`` events in the given layout without going through append."""
+    segments = (
+        SegmentedEventStorage(fs, EVENTS_DIR)
+        if log_format == EventLogFormat.SEGMENTED
+        else None
+    )
+    for i in range(n):
+        event = make_event(i, size)
+        payload = event.model_dump_json(exclude_none=True)
+        if segments is not None:
+            segments.append(i, event.id, payload)
+        else:
+            name = EVENT_FILE_PATTERN.format(idx=i, event_id=event.id)
+            fs.write(f"{EVENTS_DIR}/{name}", payload)
+
+
+def disk_usage(root: str) -> tuple[int, int, int]:
+    """Return (apparent bytes, allocated bytes, file count) under ``root``."""
+    apparent = allocated = files = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(dirpath, name))
+            apparent += st.st_size
+            allocated += getattr(st, "st_blocks", 0) * 512
+            files += 1
+    return apparent, allocated, files
+
+
+def bench_one(
+    log_format: EventLogFormat, n: int, appends: int, payload_bytes: int
+) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench_segmented_")
+    try:
+        fs = LocalFileStore(tmpdir, cache_limit_size=0, cache_memory_size=0)
+        seed(fs, log_format, n, payload_bytes)
+
+        gc.collect()
+        t0 = time.perf_counter()
+        log = EventLog(fs, log_format=log_format)
+        open_ms = (time.perf_counter() - t0) * 1000
+        assert len(log) == n and log.log_format == log_format
+
+        latencies = []
+        for i in range(appends):
+            event = make_event(n + i, payload_bytes)
+            t0 = time.perf_counter()
+            log.append(event)
+            latencies.append((time.perf_counter() - t0) * 1000)
+        latencies.sort()
+
+        apparent, allocated, files = disk_usage(tmpdir)
+        return {
+            "format": log_format.value,
+            "events": n,
+            "open_ms": open_ms,
+            "append_median_ms": statistics.median(latencies),
+            "append_p95_ms": latencies[int(len(latencies) * 0.95)],
+            "apparent_mb": apparent / 1e6,
+            "allocated_mb": allocated / 1e6,
+            "files": files,
+        }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main():
+    import logging
+
+    logging.getLogger("openhands").setLevel(logging.ERROR)
+
+    parser = argparse.ArgumentParser(
+        description="Compare per-file and segmented EventLog layouts"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--appends", type=int, default=200, help="Timed appends per run"
+    )
+    parser.add_argument(
+        "--payload-bytes", type=int, default=1_000, help="Text size per event"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"  {'Format':<10} {'Events':>8} {'Open':>10} {'Append p50':>11}"
+        f" {'Append p95':>11} {'Apparent':>10} {'Allocated':>10} {'Files':>8}"
+    )
+    print(f"  {'-' * 84}")
+    for n in args.sizes:
+        for log_format in (EventLogFormat.FILES, EventLogFormat.SEGMENTED):
+            r = bench_one(log_format, n, args.appends, args.payload_bytes)
+            print(
+                f"  {r['format']:<10} {r['events']:>8,}"
+                f" {r['open_ms']:>8.1f}ms"
+                f" {r['append_median_ms']:>9.3f}ms"
+                f" {r['append_p95_ms']:>9.3f}ms"
+                f" {r['apparent_mb']:>8.1f}MB"
+                f" {r['allocated_mb']:>8.1f}MB"
+                f" {r['files']:>8,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
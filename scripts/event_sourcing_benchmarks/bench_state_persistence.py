@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: base_state persistence cost per agent step, snapshot vs. journal.
+
+Drives a ``ConversationState`` through a synthetic agent loop and counts what
+its persistence path writes through a ``LocalFileStore``:
+  - bytes written to ``base_state.json`` / ``base_state.journal``
+  - write operations (full rewrites + journal appends)
+  - fsync calls (each atomic rewrite syncs the file and its directory)
+  - wall time spent persisting
+
+Each step mirrors what the agent loop does to the state: flip
+``execution_status`` inside a ``with state:`` block, append a few events (each
+advancing ``leaf_event_id`` outside the block) and update LLM metrics in place.
+Journal appends are not synced; only snapshot rewrites and compactions are.
+
+Usage:
+    python bench_state_persistence.py [--steps 200] [--events-per-step 3]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from pydantic import SecretStr
+
+from openhands.sdk import Agent
+from openhands.sdk.conversation.state import (
+    ConversationExecutionStatus,
+    ConversationState,
+    StatePersistenceMode,
+)
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import LLM, Message, TextContent
+from openhands.sdk.workspace import LocalWorkspace
+
+
+class CountingFileStore(LocalFileStore):
+    """LocalFileStore that tallies base_state writes."""
+
+    def __init__(self, root: str) -> None:
+        super().__init__(root)
+        self.bytes_written = 0
+        self.write_ops = 0
+
+    def _count(self, path: str, contents: str | bytes) -> None:
+        if path.startswith("base_state"):
+            self.bytes_written += len(
+                contents.encode() if isinstance(contents, str) else contents
+            )
+            self.write_ops += 1
+
+    def write(self, path: str, contents: str | bytes) -> None:
+        self._count(path, contents)
+        super().write(path, contents)
+
+    def write_atomic(self, path: str, contents: str | bytes) -> None:
+        self._count(path, contents)
+        super().write_atomic(path, contents)
+
+    def append(self, path: str, contents: str | bytes) -> int:
+        self._count(path, contents)
+        return super().append(path, contents)
+
+
+def bench_one(mode: StatePersistenceMode, steps: int, events_per_step: int) -> dict:
+    tmpdir = tempfile.mkdtemp(prefix="bench_state_")
+    fsync = os.fsync
+    fsyncs = 0
+
+    def counting_fsync(fd: int) -> None:
+        nonlocal fsyncs
+        fsyncs += 1
+        fsync(fd)
+
+    os.fsync = counting_fsync
+    try:
+        fs = CountingFileStore(tmpdir)
+        llm = LLM(model="gpt-4o-mini", api_key=SecretStr("x"), usage_id="bench")
+        state = ConversationState.create(
+            id=uuid.uuid4(),
+            agent=Agent(llm=llm, tools=[]),
+            workspace=LocalWorkspace(working_dir=tmpdir),
+            file_store=fs,
+            persistence_mode=mode,
+        )
+        metrics = llm.metrics
+        fs.bytes_written = fs.write_ops = fsyncs = 0
+
+        persist_s = 0.0
+        for step in range(steps):
+            t0 = time.perf_counter()
+            with state:
+                state.execution_status = ConversationExecutionStatus.RUNNING
+            persist_s += time.perf_counter() - t0
+            for i in range(events_per_step):
+                event = MessageEvent(
+                    llm_message=Message(
+                        role="assistant", content=[TextContent(text=f"{step}.{i}")]
+                    ),
+                    source="agent",
+                )
+                if metrics is not None:
+                    metrics.add_cost(0.001)
+                t0 = time.perf_counter()
+                state.append_event(event)
+                persist_s += time.perf_counter() - t0
+        return {
+            "mode": mode.value,
+            "bytes_per_step": fs.bytes_written / steps,
+            "writes_per_step": fs.write_ops / steps,
+            "fsyncs_per_step": fsyncs / steps,
+            "ms_per_step": persist_s * 1000 / steps,
+        }
+    finally:
+        os.fsync = fsync
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def main():
+    import logging
+
+    logging.getLogger("openhands").setLevel(logging.ERROR)
+
+    parser = argparse.ArgumentParser(
+        description="Compare snapshot and journal base_state persistence"
+    )
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--events-per-step", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"  {'Mode':<9} {'Bytes/step':>12} {'Writes/step':>12}"
+        f" {'Fsyncs/step':>12} {'Time/step':>11}"
+    )
+    print(f"  {'-' * 60}")
+    for mode in (StatePersistenceMode.SNAPSHOT, StatePersistenceMode.JOURNAL):
+        r = bench_one(mode, args.steps, args.events_per_step)
+        print(
+            f"  {r['mode']:<9} {r['bytes_per_step']:>12,.0f}"
+            f" {r['writes_per_step']:>12.2f}"
+            f" {r['fsyncs_per_step']:>12.2f}"
+            f" {r['ms_per_step']:>9.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: transient memory of formatting one agent step's messages.
+
+Builds a history of N tool turns, every tenth carrying a base64 screenshot,
+and records the ``tracemalloc`` peak and wall time of one
+``LLM.format_messages_for_llm`` / ``format_messages_for_responses`` call:
+  - deepcopy:  the previous preparation, which deep-copied every message
+               before applying prompt-caching flags or stripping reasoning
+               items
+  - overlay:   the current preparation, which copies only the messages it
+               changes and shares the rest with the caller
+
+The messages are not frozen by the event projection, so every message goes
+through the preparation passes.
+
+Usage:
+    python bench_format_memory.py [--turns 100,500,1000] [--image-kb 200]
+"""
+
+import argparse
+import base64
+import copy
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from unittest.mock import patch
+
+from pydantic import SecretStr
+
+from openhands.sdk.llm import (
+    LLM,
+    ImageContent,
+    Message,
+    MessageToolCall,
+    TextContent,
+)
+from openhands.sdk.llm.utils.image_inline import _CACHE
+
+
+def history(turns: int, image_kb: int) -> list[Message]:
+    image = (
+        "data:image/png;base64,"
+        + base64.b64encode(os.urandom(image_kb * 1024)).decode()
+    )
+    messages = [
+        Message(
+            role="system",
+            content=[TextContent(text="static " * 500), TextContent(text="dynamic")],
+        ),
+        Message(role="user", content=[TextContent(text="Fix the failing test.")]),
+    ]
+    for i in range(turns):
+        messages.append(
+            Message(
+                role="assistant",
+                content=[TextContent(text=f"Step {i}: checking the output.")],
+                tool_calls=[
+                    MessageToolCall(
+                        id=f"call_{i}",
+                        name="terminal",
+                        arguments='{"command": "pytest -q"}',
+                        origin="completion",
+                    )
+                ],
+            )
+        )
+        content: list[TextContent | ImageContent] = [
+            TextContent(text=f"output {i}\n" + "x" * 2000)
+        ]
+        if i % 10 == 0:
+            content.append(ImageContent(image_urls=[image]))
+        messages.append(
+            Message(
+                role="tool",
+                content=content,
+                tool_call_id=f"call_{i}",
+                name="terminal",
+            )
+        )
+    return messages
+
+
+def deepcopy_begin_chat_messages(self: LLM, messages: list[Message]):
+    messages = copy.deepcopy(messages)
+    if self.is_caching_prompt_active():
+        for message in messages[:1]:
+            for block, flag in zip(message.content, (True, False)):
+                block.cache_prompt = flag
+        for message in reversed(messages):
+            if message.role in ("user", "tool"):
+                message.content[-1].cache_prompt = True
+                break
+    return messages, self.vision_is_active()
+
+
+def deepcopy_prepare_responses_messages(_self: LLM, messages: list[Message]):
+    return copy.deepcopy(messages)
+
+
+def measure(fn: Callable[[], object]) -> tuple[float, float]:
+    _CACHE.clear()  # both modes pay for the same image passes
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--turns", default="100,500,1000")
+    parser.add_argument("--image-kb", type=int, default=200)
+    parser.add_argument("--model", default="anthropic/claude-sonnet-4-20250514")
+    args = parser.parse_args()
+
+    llm = LLM(
+        model=args.model,
+        api_key=SecretStr("unused"),
+        usage_id="bench",
+        caching_prompt=True,
+    )
+    print(f"{'Turns':>6} | {'Path':<10} | {'Mode':<9} | {'Peak':>9} | {'Time':>9}")
+    print("-" * 56)
+    for turns in (int(n) for n in args.turns.split(",")):
+        messages = history(turns, args.image_kb)
+        for path, call in (
+            ("chat", lambda: llm.format_messages_for_llm(messages)),
+            ("responses", lambda: llm.format_messages_for_responses(messages)),
+        ):
+            with (
+                patch.object(LLM, "_begin_chat_messages", deepcopy_begin_chat_messages),
+                patch.object(
+                    LLM,
+                    "_prepare_responses_messages",
+                    deepcopy_prepare_responses_messages,
+                ),
+            ):
+                old_peak, old_time = measure(call)
+            new_peak, new_time = measure(call)
+            for mode, peak, elapsed in (
+                ("deepcopy", old_peak, old_time),
+                ("overlay", new_peak, new_time),
+            ):
+                print(
+                    f"{turns:>6} | {path:<10} | {mode:<9} | {peak:>7.1f}MB"
+                    f" | {elapsed:>7.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-turn image resizing cost for screenshot-heavy histories.
+
+Builds a browsing-style history where every tool observation carries a
+2560x1600 PNG screenshot, then times ``LLM.format_messages_for_llm`` for an
+Anthropic model, which scales every image down once the request carries more
+than 20 of them:
+  - cold:  the shared image cache is cleared before each turn, so every
+           screenshot is decoded, resized and re-encoded, as before
+  - warm:  screenshots resized on earlier turns are served from the cache and
+           only the new screenshot is resized
+
+Usage:
+    python bench_image_resize.py [--screenshots 30,60,100] [--repeat 5]
+"""
+
+import argparse
+import base64
+import io
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+from PIL import Image
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM, ImageContent, Message, TextContent
+from openhands.sdk.llm.utils.image_inline import _CACHE
+
+
+def screenshot(seed: int) -> str:
+    rng = random.Random(seed)
+    image = Image.new("RGB", (2560, 1600), color=(250, 250, 250))
+    # Blocks of colour stand in for page content and keep images distinct.
+    for _ in range(40):
+        x, y = rng.randrange(2400), rng.randrange(1500)
+        block = Image.new("RGB", (160, 100), color=tuple(rng.choices(range(256), k=3)))
+        image.paste(block, (x, y))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def history(screenshots: list[str]) -> list[Message]:
+    messages = [
+        Message(role="system", content=[TextContent(text="You browse the web.")]),
+        Message(role="user", content=[TextContent(text="Find the pricing page.")]),
+    ]
+    for i, url in enumerate(screenshots):
+        messages.append(
+            Message(
+                role="user",
+                content=[
+                    TextContent(text=f"Screenshot after step {i}."),
+                    ImageContent(image_urls=[url]),
+                ],
+            )
+        )
+    return messages
+
+
+def measure(llm: LLM, screenshots: list[str], repeat: int, warm: bool) -> float:
+    _CACHE.clear()
+    llm.format_messages_for_llm(history(screenshots[:-repeat]))  # earlier turns
+    timings = []
+    for r in range(repeat):
+        messages = history(screenshots[: len(screenshots) - repeat + r + 1])
+        if not warm:
+            _CACHE.clear()
+        start = time.perf_counter()
+        llm.format_messages_for_llm(messages)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--screenshots", default="30,60,100")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--model", default="anthropic/claude-sonnet-4-20250514")
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.screenshots.split(",")]
+    pool = [screenshot(i) for i in range(max(counts) + args.repeat)]
+    llm = LLM(model=args.model, api_key=SecretStr("unused"), usage_id="bench")
+    print(f"{'Images':>6} | {'Cold':>10} | {'Warm':>10} | {'Speedup':>7}")
+    print("-" * 44)
+    with (
+        patch.object(LLM, "vision_is_active", return_value=True),
+        patch.object(LLM, "_infer_litellm_provider", return_value="anthropic"),
+    ):
+        for count in counts:
+            screenshots = pool[: count + args.repeat]
+            cold = measure(llm, screenshots, args.repeat, warm=False)
+            warm = measure(llm, screenshots, args.repeat, warm=True)
+            print(
+                f"{count:>6} | {cold:>8.1f}ms | {warm:>8.1f}ms | {cold / warm:>6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark: redaction helpers on log lines and JSON payloads.
+
+Times the helpers in ``openhands.sdk.utils.redact`` against copies of their
+previous implementations:
+  - redact_text_secrets on log lines, most of which hold no secret, vs. one
+    ``re.sub`` per pattern on every line
+  - sanitize_dict on JSON payloads that need little or no redaction, vs. the
+    recursive walk that copied every dict and list
+
+Each comparison also checks that both versions return equal results.
+
+Usage:
+    python bench_redaction.py [--lines 100000] [--secret-ratio 0.01]
+        [--payloads 2000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import string
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from openhands.sdk.utils.redact import (
+    _API_KEY_LITERAL_RE,
+    REDACT_ALL_VALUES_KEYS,
+    is_secret_key,
+    redact_text_secrets,
+    sanitize_dict,
+)
+
+
+def sequential_redact_text_secrets(text: str) -> str:
+    text = re.sub(r"api_key='[^']*'", "api_key='<redacted>'", text)
+    text = re.sub(r'api_key="[^"]*"', 'api_key="<redacted>"', text)
+    text = re.sub(
+        r"('[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*':\s*')[^']*(')",
+        r"\g<1><redacted>\2",
+        text,
+        flags=re.IGNORECASE,
+    )
+    text = re.sub(
+        r'("[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)[A-Z_]*":\s*")[^"]*(")',
+        r"\g<1><redacted>\2",
+        text,
+        flags=re.IGNORECASE,
+    )
+    text = re.sub(
+        r"((?:tavilyApiKey|apiKey|api_key|token|access_token|secret|key)=)"
+        r"[^&\s'\")\]]+",
+        r"\g<1><redacted>",
+        text,
+        flags=re.IGNORECASE,
+    )
+    text = re.sub(r"('Authorization':\s*')[^']*(')", r"\g<1><redacted>\2", text)
+    text = re.sub(r"('X-Session-API-Key':\s*')[^']*(')", r"\g<1><redacted>\2", text)
+    return _API_KEY_LITERAL_RE.sub("<redacted>", text)
+
+
+def _redact_all_values(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _redact_all_values(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact_all_values(item) for item in value]
+    return "<redacted>"
+
+
+def recursive_sanitize_dict(content: Any) -> Any:
+    if isinstance(content, Mapping):
+        sanitized = {}
+        for key, value in content.items():
+            key_str = str(key)
+            if key_str.lower() in REDACT_ALL_VALUES_KEYS:
+                sanitized[key] = _redact_all_values(value)
+            elif is_secret_key(key_str):
+                sanitized[key] = "<redacted>"
+            else:
+                sanitized[key] = recursive_sanitize_dict(value)
+        return sanitized
+    if isinstance(content, list):
+        return [recursive_sanitize_dict(item) for item in content]
+    return content
+
+
+def make_lines(count: int, secret_ratio: float, rng: random.Random) -> list[str]:
+    secrets = [
+        "api_key='sk-proj-" + "a" * 32 + "'",
+        "{'Authorization': 'Bearer " + "b" * 32 + "'}",
+        "GET https://api.example.com/search?q=x&apiKey=abc123",
+        "ghp_" + "c" * 36,
+    ]
+    lines = []
+    for i in range(count):
+        words = " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+            for _ in range(rng.randint(6, 16))
+        )
+        line = f"2026-10-17 12:00:{i % 60:02d} INFO [agent.step] {words}"
+        if rng.random() < secret_ratio:
+            line += " " + rng.choice(secrets)
+        lines.append(line)
+    return lines
+
+
+def make_payloads(count: int, rng: random.Random) -> list[Any]:
+    payloads = []
+    for i in range(count):
+        events = [
+            {
+                "id": f"evt-{i}-{j}",
+                "kind": "ObservationEvent",
+                "source": "environment",
+                "content": [{"type": "text", "text": "x" * rng.randint(10, 200)}],
+                "metadata": {"tool": "terminal", "exit_code": 0, "tags": ["a", "b"]},
+            }
+            for j in range(20)
+        ]
+        payload: dict[str, Any] = {"conversation_id": str(i), "events": events}
+        if i % 10 == 0:
+            payload["agent"] = {"llm": {"model": "gpt-4o", "api_key": "sk-123"}}
+        payloads.append(payload)
+    return payloads
+
+
+def timed(fn, items: list, repeat: int) -> tuple[float, list]:
+    times = []
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(item) for item in items]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--secret-ratio", type=float, default=0.01)
+    parser.add_argument("--payloads", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    lines = make_lines(args.lines, args.secret_ratio, rng)
+    payloads = make_payloads(args.payloads, rng)
+
+    print(f"redact_text_secrets: {args.lines} log lines, median of {args.repeat}")
+    old_time, old = timed(sequential_redact_text_secrets, lines, args.repeat)
+    new_time, new = timed(redact_text_secrets, lines, args.repeat)
+    print(f"  sequential passes  {old_time:8.3f}s")
+    print(f"  gated passes       {new_time:8.3f}s  equal={old == new}")
+
+    print(f"sanitize_dict: {args.payloads} payloads, median of {args.repeat}")
+    old_time, old = timed(recursive_sanitize_dict, payloads, args.repeat)
+    new_time, new = timed(sanitize_dict, payloads, args.repeat)
+    print(f"  recursive copy     {old_time:8.3f}s")
+    print(f"  shared rebuild     {new_time:8.3f}s  equal={old == new}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: repeated grep / glob tool calls on a large synthetic workspace.
+
+Generates a tree of N small source files (default 200,000) spread over
+nested packages and times a sequence of queries through ``GrepExecutor``
+and ``GlobExecutor``:
+  - baseline: the executors' regular backends (ripgrep when installed, or the
+              Python fallbacks with ``--python-fallback``), which walk the
+              tree on every call
+  - indexed:  ``use_file_index=True``, serving queries from the warm
+              workspace file index (first call builds it)
+
+Between rounds a handful of files are edited so the index has to revalidate.
+
+Usage:
+    python bench_file_index.py [--files 200000] [--rounds 5] [--python-fallback]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from openhands.tools.glob import GlobAction
+from openhands.tools.glob.impl import GlobExecutor
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+
+
+WORDS = ["alpha", "beta", "gamma", "delta", "parse", "render", "client", "cache"]
+
+GREP_QUERIES = ["def handle_request", r"class \w+Cache", "TODO\\(perf\\)"]
+GLOB_QUERIES = ["**/*_cache.py", "pkg_7/**/*.py", "*.md"]
+
+
+def build_tree(root: Path, files: int, seed: int = 0) -> list[Path]:
+    """Write ``files`` small files under ``root``, 100 per directory."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        directory = root / f"pkg_{i % 10}" / f"mod_{i // 1000}" / f"sub_{i // 100}"
+        directory.mkdir(parents=True, exist_ok=True)
+        word = rng.choice(WORDS)
+        suffix = ".md" if i % 50 == 0 else ".py"
+        path = directory / f"{word}_{i}{suffix}"
+        body = [f"def {word}_{i}(value):", f"    return value * {i}"]
+        if i % 997 == 0:
+            body.append("def handle_request(req):  # TODO(perf)")
+        if word == "cache":
+            body.append(f"class Lru{i}Cache:\n    pass")
+        path.write_text("\n".join(body) + "\n")
+        paths.append(path)
+    (root / ".gitignore").write_text("*.pyc\nbuild/\n")
+    return paths
+
+
+def run(root: Path, paths: list[Path], indexed: bool, args) -> dict:
+    grep = GrepExecutor(working_dir=str(root), use_file_index=indexed)
+    glob = GlobExecutor(working_dir=str(root), use_file_index=indexed)
+    if args.python_fallback:
+        grep._search_backend = "python"
+        glob._ripgrep_available = False
+    rng = random.Random(1)
+    timings: dict[str, list[float]] = {"grep": [], "glob": []}
+    first_call = None
+    for round_ in range(args.rounds):
+        for path in rng.sample(paths, 5):
+            path.write_text(path.read_text() + f"# edit {round_}\n")
+        for pattern in GREP_QUERIES:
+            start = time.perf_counter()
+            obs = grep(GrepAction(pattern=pattern))
+            elapsed = time.perf_counter() - start
+            assert not obs.is_error, obs.text
+            timings["grep"].append(elapsed)
+            first_call = first_call if first_call is not None else elapsed
+        for pattern in GLOB_QUERIES:
+            start = time.perf_counter()
+            obs = glob(GlobAction(pattern=pattern))
+            assert not obs.is_error, obs.text
+            timings["glob"].append(time.perf_counter() - start)
+    # The first query of the indexed run also builds the index.
+    return {
+        "first": first_call,
+        "grep": statistics.median(timings["grep"][1:]),
+        "glob": statistics.median(timings["glob"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--python-fallback",
+        action="store_true",
+        help="use the Python grep/glob backends as the baseline",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        root = Path(work_dir).resolve()
+        start = time.perf_counter()
+        paths = build_tree(root, args.files)
+        print(f"Built {args.files} files in {time.perf_counter() - start:.1f}s")
+        os.sync()
+
+        results = {
+            "baseline": run(root, paths, indexed=False, args=args),
+            "indexed": run(root, paths, indexed=True, args=args),
+        }
+
+    print(f"{'Mode':>9} | {'First grep':>10} | {'Grep P50':>9} | {'Glob P50':>9}")
+    print("-" * 46)
+    for name, r in results.items():
+        print(
+            f"{name:>9} | {r['first']:>9.2f}s | {r['grep']:>8.3f}s | {r['glob']:>8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bash event search latency against a long command history.
+
+Stores N commands with one ``BashOutput`` each in a ``BashEventService`` and
+times the search a remote workspace polls with while a command runs (that
+command's outputs, oldest first) and a walk of the last few pages of all
+``BashCommand`` events newest first, reporting P50/P99 per search under two
+lookups:
+  - directory scan:  the previous path, which listed the bash events directory,
+                     filtered and sorted the names and walked them to find the
+                     ``page_id`` on every search
+  - index:           ``BashEventService``'s path, which bisects the sorted
+                     in-memory name lists for the time window and ``page_id``
+
+Usage:
+    python bench_bash_event_search.py [--commands 20000] [--searches 200]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from uuid import UUID
+
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.models import (
+    BashCommand,
+    BashEventPage,
+    BashEventSortOrder,
+    BashOutput,
+)
+
+
+def scan_search(
+    service: BashEventService,
+    kind: str | None,
+    command_id: UUID | None,
+    sort_order: BashEventSortOrder,
+    page_id: str | None,
+    limit: int,
+) -> BashEventPage:
+    """The previous ``_search_bash_events_sync``, without its time filters."""
+    matched = []
+    with os.scandir(service.bash_events_dir) as it:
+        for entry in it:
+            parts = entry.name.split("_")
+            if entry.name.startswith(".") or (kind and parts[1] != kind):
+                continue
+            if command_id and (len(parts) != 4 or parts[2] != command_id.hex):
+                continue
+            matched.append(entry.name)
+    matched.sort(reverse=sort_order == BashEventSortOrder.TIMESTAMP_DESC)
+    start = matched.index(page_id) if page_id in matched else 0
+    names = matched[start : start + limit + 1]
+    items = [
+        service._load_event_from_file(service.bash_events_dir / name)
+        for name in names[:limit]
+    ]
+    return BashEventPage(
+        items=[item for item in items if item is not None],
+        next_page_id=names[limit] if len(names) > limit else None,
+    )
+
+
+def index_search(
+    service: BashEventService,
+    kind: str | None,
+    command_id: UUID | None,
+    sort_order: BashEventSortOrder,
+    page_id: str | None,
+    limit: int,
+) -> BashEventPage:
+    return service._search_bash_events_sync(
+        kind, command_id, None, None, None, sort_order, page_id, limit
+    )
+
+
+def time_searches(search, service: BashEventService, last: UUID, n: int) -> dict:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        page = search(
+            service, "BashOutput", last, BashEventSortOrder.TIMESTAMP, None, 100
+        )
+        assert len(page.items) == 1
+        page_id = None
+        for _ in range(3):
+            page = search(
+                service,
+                "BashCommand",
+                None,
+                BashEventSortOrder.TIMESTAMP_DESC,
+                page_id,
+                20,
+            )
+            page_id = page.next_page_id
+        latencies.append((time.perf_counter() - start) * 1000 / 4)
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--searches", type=int, default=200)
+    args = parser.parse_args()
+
+    bash_events_dir = Path(tempfile.mkdtemp(prefix="bench_bash_search_"))
+    try:
+        service = BashEventService(bash_events_dir=bash_events_dir)
+        for _ in range(args.commands):
+            command = BashCommand(command="true")
+            service._save_event_to_file(command)
+            service._save_event_to_file(
+                BashOutput(command_id=command.id, order=0, exit_code=0)
+            )
+
+        print(f"{args.commands} stored commands, {args.searches} searches each")
+        print(f"{'Lookup':>14} | {'P50':>8} | {'P99':>8}")
+        print("-" * 36)
+        for name, search in (("directory scan", scan_search), ("index", index_search)):
+            r = time_searches(search, service, command.id, args.searches)
+            print(f"{name:>14} | {r['p50']:>6.2f}ms | {r['p99']:>6.2f}ms")
+    finally:
+        shutil.rmtree(bash_events_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: agent-server event-loop stalls while a bash command floods output.
+
+Runs ``head -c N /dev/zero | tr '\\0' x`` through ``BashEventService`` while a
+probe task on the same event loop sleeps 1 ms at a time and records how late
+each wake-up is, reporting the loop lag (P99/max), wall time and the number of
+files left in the bash events directory, under two persistence paths:
+  - per-event files:  the previous path, which wrote every ``BashOutput`` to
+                      its own ``json.dumps(..., indent=2)`` file from the
+                      coroutine reading the command's output
+  - output log:       ``BashEventService``'s path, which indexes each event in
+                      memory and appends it to the command's output log from a
+                      background writer that commits everything queued at once
+
+Usage:
+    python bench_bash_output_flood.py [--megabytes 200]
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.models import BashOutput, ExecuteBashRequest
+
+
+class PerEventFileService(BashEventService):
+    """``BashEventService`` persisting output as it did before."""
+
+    def _persist_output(self, event: BashOutput) -> None:
+        self._save_event_to_file(event)
+
+
+async def probe_loop_lag(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run(cls: type[BashEventService], megabytes: int) -> dict:
+    bash_events_dir = Path(tempfile.mkdtemp(prefix="bench_bash_flood_"))
+    try:
+        async with cls(bash_events_dir=bash_events_dir) as service:
+            lags: list[float] = []
+            stop = asyncio.Event()
+            probe = asyncio.create_task(probe_loop_lag(lags, stop))
+            request = ExecuteBashRequest(
+                command=f"head -c {megabytes * 1024 * 1024} /dev/zero | tr '\\0' x",
+                timeout=3600,
+            )
+            start = time.perf_counter()
+            async for event in service.stream_bash_command(request):
+                pass
+            wall = time.perf_counter() - start
+            stop.set()
+            await probe
+        files = sum(1 for p in bash_events_dir.rglob("*") if p.is_file())
+    finally:
+        shutil.rmtree(bash_events_dir, ignore_errors=True)
+    lags.sort()
+    return {
+        "wall": wall,
+        "p99": statistics.quantiles(lags, n=100)[98] * 1000,
+        "max": lags[-1] * 1000,
+        "files": files,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--megabytes", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.megabytes} MB of output from one command")
+    print(
+        f"{'Persistence':>15} | {'Wall':>7} | {'Lag P99':>8} | {'Lag max':>8} | "
+        f"{'Files':>5}"
+    )
+    print("-" * 56)
+    paths = (("per-event files", PerEventFileService), ("output log", BashEventService))
+    for name, cls in paths:
+        r = asyncio.run(run(cls, args.megabytes))
+        print(
+            f"{name:>15} | {r['wall']:>6.2f}s | {r['p99']:>6.1f}ms | "
+            f"{r['max']:>6.1f}ms | {r['files']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TerminalSession round-trip latency of trivial commands.
+
+Runs N short commands (``ls``, ``pwd``, ``echo``, ``true``, ``cd .``) through a
+``TerminalSession`` on a live PTY-backed ``SubprocessTerminal`` and reports
+per-command latency (from ``execute`` to its observation) and the process CPU
+time spent, under two completion waits:
+  - poll:    the previous loop, re-reading the screen and sleeping
+             ``POLL_INTERVAL`` between checks (what backends that do not
+             report output versions, like tmux, still do)
+  - event:   the session waiting on the terminal's output notifications and
+             re-reading the screen only when new output arrived
+
+The poll loop costs about ``POLL_INTERVAL`` per command, so it runs a smaller
+sample by default (``--poll-commands``).
+
+Usage:
+    python bench_command_latency.py [--commands 1000] [--poll-commands 50]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal.subprocess_terminal import SubprocessTerminal
+from openhands.tools.terminal.terminal.terminal_session import TerminalSession
+
+
+COMMANDS = ["ls", "pwd", "echo hello", "true", "cd ."]
+
+
+class PollingSubprocessTerminal(SubprocessTerminal):
+    """A SubprocessTerminal that does not report output versions."""
+
+    def output_version(self) -> None:  # type: ignore[override]
+        return None
+
+
+def run(terminal_cls: type[SubprocessTerminal], commands: int) -> dict:
+    with tempfile.TemporaryDirectory() as work_dir:
+        session = TerminalSession(terminal_cls(work_dir=work_dir))
+        session.initialize()
+        try:
+            session.execute(TerminalAction(command="true"))  # warm up
+            latencies = []
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            for i in range(commands):
+                start = time.perf_counter()
+                obs = session.execute(TerminalAction(command=COMMANDS[i % 5]))
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert obs.metadata.exit_code == 0, obs.text
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+        finally:
+            session.close()
+    latencies.sort()
+    return {
+        "commands": commands,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "wall": wall,
+        "cpu_ms": cpu / commands * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--commands", type=int, default=1000)
+    parser.add_argument("--poll-commands", type=int, default=50)
+    args = parser.parse_args()
+
+    results = {
+        "poll": run(PollingSubprocessTerminal, args.poll_commands),
+        "event": run(SubprocessTerminal, args.commands),
+    }
+    print(
+        f"{'Wait':>6} | {'Commands':>8} | {'P50':>9} | {'P95':>9} | {'Max':>9} | "
+        f"{'Total':>8} | {'CPU/cmd':>8}"
+    )
+    print("-" * 76)
+    for name, r in results.items():
+        print(
+            f"{name:>6} | {r['commands']:>8} | {r['p50']:>7.1f}ms | "
+            f"{r['p95']:>7.1f}ms | {r['max']:>7.1f}ms | {r['wall']:>7.1f}s | "
+            f"{r['cpu_ms']:>6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SubprocessTerminal PTY reader throughput.
+
+Runs ``yes | head -c N`` in a live PTY-backed ``SubprocessTerminal`` and waits
+for a completion marker printed after the output, reporting:
+  - throughput: MB of output per second of wall time
+  - CPU time of the whole process (the PTY reader thread plus the waiter)
+
+under two readers:
+  - line deque:  the previous reader, which read 4 KB per wake-up, decoded
+                 each read on its own and split the text into one buffer item
+                 per line
+  - batched:     ``SubprocessTerminal``'s reader, which drains up to 1 MB in
+                 64 KB reads per wake-up, decodes incrementally and appends the
+                 text as one chunk
+
+``yes`` prints two-byte lines, the worst case for a per-line buffer.
+
+Usage:
+    python bench_pty_throughput.py [--megabytes 500] [--repeats 3]
+"""
+
+import argparse
+import os
+import re
+import select
+import tempfile
+import time
+from collections import deque
+
+from openhands.tools.terminal.constants import HISTORY_LIMIT
+from openhands.tools.terminal.terminal.subprocess_terminal import SubprocessTerminal
+
+
+class LineDequeTerminal(SubprocessTerminal):
+    """``SubprocessTerminal`` with the reader and buffer as they were before."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.output_buffer = deque(  # pyright: ignore[reportAttributeAccessIssue]
+            maxlen=HISTORY_LIMIT + 50
+        )
+
+    def _read_output_continuously_pty(self) -> None:
+        fd = self._pty_master_fd
+        if fd is None:
+            return
+        while True:
+            if self.process and self.process.poll() is not None:
+                break
+            r, _, _ = select.select([fd], [], [], 0.1)
+            if not r:
+                continue
+            try:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                text = chunk.decode("utf-8", errors="replace")
+                with self._output_ready:
+                    self._add_text_to_buffer(text)
+                    self._output_ready.notify_all()
+            except OSError:
+                continue
+
+    def _add_text_to_buffer(self, text: str) -> None:
+        self._output_total += len(text)
+        buffer = self.output_buffer
+        if buffer and not buffer[-1].endswith("\n"):
+            text = buffer.pop() + text
+        lines = text.split("\n")
+        for line in lines[:-1]:
+            buffer.append(line + "\n")
+        if lines[-1]:
+            buffer.append(lines[-1])
+
+    def _buffer_tail(self, nchars: int) -> str:
+        if nchars <= 0:
+            return ""
+        parts: list[str] = []
+        size = 0
+        for item in reversed(self.output_buffer):
+            parts.append(item)
+            size += len(item)
+            if size >= nchars:
+                break
+        return "".join(reversed(parts))[-nchars:]
+
+    def _buffer_text(self) -> str:
+        return "".join(self.output_buffer)
+
+    def _reset_buffer(self, text: str = "") -> None:
+        self.output_buffer.clear()
+        if text:
+            self.output_buffer.append(text)
+
+
+def run_once(terminal: SubprocessTerminal, megabytes: int) -> dict:
+    terminal.clear_screen()
+    # The marker is computed by the shell so the echoed command line itself
+    # does not match.
+    marker = re.compile(r"BENCH_DONE_(\d+)")
+    command = f"yes | head -c {megabytes * 1024 * 1024}; echo BENCH_DONE_$((40+2))"
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    terminal.send_keys(command)
+    found = terminal._wait_for_output(marker, timeout=3600)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    assert found, "completion marker not seen"
+    return {"wall": wall, "cpu": cpu}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--megabytes", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.megabytes} MB of `yes` output, best of {args.repeats}")
+    print(f"{'Reader':>10} | {'Wall':>8} | {'MB/s':>7} | {'CPU':>8} | {'CPU/MB':>8}")
+    print("-" * 53)
+    readers = (("line deque", LineDequeTerminal), ("batched", SubprocessTerminal))
+    for name, cls in readers:
+        terminal = cls(work_dir=tempfile.mkdtemp(prefix="bench_term_"))
+        terminal.initialize()
+        try:
+            runs = [run_once(terminal, args.megabytes) for _ in range(args.repeats)]
+        finally:
+            terminal.close()
+        best = min(runs, key=lambda r: r["wall"])
+        print(
+            f"{name:>10} | {best['wall']:>7.2f}s | "
+            f"{args.megabytes / best['wall']:>7.1f} | {best['cpu']:>7.2f}s | "
+            f"{best['cpu'] * 1000 / args.megabytes:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RemoteWorkspace.execute_command latency for trivial commands.
+
+Serves the agent-server's bash routes in-process (Starlette's ``TestClient``,
+an ``httpx.Client``, so no socket is involved) and runs N ``true`` commands
+through a ``RemoteWorkspace`` under two transports, reporting per-command
+latency (P50/P99/max) and the HTTP requests each command took:
+  - polling:    the previous path, which starts the command and then searches
+                its ``BashOutput`` events every 100 ms until one has an exit
+                code
+  - streaming:  ``/api/bash/stream_bash_command``, which answers with the
+                command's events as NDJSON as soon as they are published
+
+Usage:
+    python bench_remote_command_latency.py [--commands 1000]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from openhands.agent_server.bash_router import bash_router
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.dependencies import get_bash_event_service
+from openhands.sdk.workspace import RemoteWorkspace
+
+
+class CountingClient(TestClient):
+    """``TestClient`` that counts the requests sent through it."""
+
+    requests_sent = 0
+
+    def request(self, *args, **kwargs):
+        self.requests_sent += 1
+        return super().request(*args, **kwargs)
+
+
+def run(client: CountingClient, streaming: bool, commands: int) -> dict:
+    workspace = RemoteWorkspace(host="http://testserver", working_dir="/tmp")
+    workspace._client = client
+    workspace._command_streaming = streaming
+    workspace.execute_command("true")  # warm up
+
+    latencies = []
+    sent_before = client.requests_sent
+    for _ in range(commands):
+        start = time.perf_counter()
+        result = workspace.execute_command("true")
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.exit_code == 0, result
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1],
+        "requests": (client.requests_sent - sent_before) / commands,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--commands", type=int, default=1000)
+    args = parser.parse_args()
+
+    service = BashEventService(
+        bash_events_dir=Path(tempfile.mkdtemp(prefix="bench_remote_cmd_"))
+    )
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        async with service:
+            yield
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(bash_router, prefix="/api")
+    app.dependency_overrides[get_bash_event_service] = lambda: service
+
+    print(f"{args.commands} `true` commands through RemoteWorkspace.execute_command")
+    print(
+        f"{'Transport':>9} | {'P50':>8} | {'P99':>8} | {'Max':>8} | "
+        f"{'Requests/cmd':>12}"
+    )
+    print("-" * 57)
+    with CountingClient(app) as client:
+        for name, streaming in (("polling", False), ("streaming", True)):
+            r = run(client, streaming, args.commands)
+            print(
+                f"{name:>9} | {r['p50']:>6.1f}ms | {r['p99']:>6.1f}ms | "
+                f"{r['max']:>6.1f}ms | {r['requests']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
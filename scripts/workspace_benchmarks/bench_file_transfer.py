@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RemoteWorkspace file upload/download throughput against a local server.
+
+Serves the agent-server's file routes with uvicorn in a child process on
+127.0.0.1, then uploads and downloads one N MB file through a
+``RemoteWorkspace`` under three transfer settings, reporting throughput
+(MB/s) and the client's peak Python heap allocation (``tracemalloc``) for each
+direction:
+  - single request:  ``transfer_chunk_size`` above the file size, the previous
+                     path, which holds the whole file in memory on both ways
+  - ranges:          8 MB byte ranges sent one at a time
+  - ranges x4:       8 MB byte ranges, four in parallel
+
+A final upload of the unchanged file shows the cost of the SHA-256 check that
+lets identical files be skipped.
+
+Usage:
+    python bench_file_transfer.py [--megabytes 1024]
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import socket
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+
+def serve(port: int) -> None:
+    import uvicorn
+    from fastapi import FastAPI
+
+    from openhands.agent_server.file_router import file_router
+
+    app = FastAPI()
+    app.include_router(file_router, prefix="/api")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(transfer) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = transfer()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result.success, result.error
+    return elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--megabytes", type=int, default=1024)
+    args = parser.parse_args()
+
+    from openhands.sdk.workspace import RemoteWorkspace
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    host = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            httpx.get(f"{host}/api/file/checksum", params={"path": "/"})
+            break
+        except httpx.TransportError:
+            time.sleep(0.1)
+
+    root = Path(tempfile.mkdtemp(prefix="bench_file_transfer_"))
+    try:
+        source = root / "source.bin"
+        with open(source, "wb") as f:
+            for _ in range(args.megabytes):
+                f.write(os.urandom(1024 * 1024))
+
+        print(f"{args.megabytes} MB file through RemoteWorkspace on {host}")
+        print(
+            f"{'Transfer':>14} | {'Upload':>10} | {'Peak':>8} | "
+            f"{'Download':>10} | {'Peak':>8}"
+        )
+        print("-" * 62)
+        settings = (
+            ("single request", args.megabytes * 1024 * 1024 + 1, 1),
+            ("ranges", 8 * 1024 * 1024, 1),
+            ("ranges x4", 8 * 1024 * 1024, 4),
+        )
+        for name, chunk_size, streams in settings:
+            workspace = RemoteWorkspace(
+                host=host,
+                working_dir=str(root),
+                transfer_chunk_size=chunk_size,
+                transfer_streams=streams,
+            )
+            remote = root / f"remote-{streams}-{chunk_size}.bin"
+            downloaded = root / f"downloaded-{streams}-{chunk_size}.bin"
+            up, up_peak = measure(lambda: workspace.file_upload(source, remote))
+            down, down_peak = measure(
+                lambda: workspace.file_download(remote, downloaded)
+            )
+            print(
+                f"{name:>14} | {args.megabytes / up:>6.0f}MB/s | {up_peak:>6.1f}MB | "
+                f"{args.megabytes / down:>6.0f}MB/s | {down_peak:>6.1f}MB"
+            )
+            remote.unlink()
+            downloaded.unlink()
+
+        workspace = RemoteWorkspace(host=host, working_dir=str(root))
+        remote = root / "remote.bin"
+        workspace.file_upload(source, remote)
+        unchanged, _ = measure(lambda: workspace.file_upload(source, remote))
+        print(f"\nUpload of an unchanged file (checksums only): {unchanged:.2f}s")
+    finally:
+        server.terminate()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark: re-syncing a large repository after a one-line change.
+
+Serves the agent-server's file routes with uvicorn in a child process on
+127.0.0.1, generates a repository of N small source files, mirrors it to the
+server once, then changes one line of one file and reports wall time and bytes
+sent over the wire to bring the other side up to date, in each direction:
+  - full tar.gz:  the previous path, which moved the whole tree again: a tar.gz
+                  of the local tree through ``file_upload`` (extraction not
+                  counted) to push, ``/api/file/archive?format=tar.gz`` to pull
+  - sync:         ``RemoteWorkspace.sync_upload`` / ``sync_download``, which
+                  exchange manifests and send only the changed file
+
+Usage:
+    python bench_workspace_sync.py [--files 50000]
+"""
+
+import argparse
+import multiprocessing
+import shutil
+import socket
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+
+def serve(port: int) -> None:
+    import uvicorn
+    from fastapi import FastAPI
+
+    from openhands.agent_server.file_router import file_router
+
+    app = FastAPI()
+    app.include_router(file_router, prefix="/api")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_repo(root: Path, files: int) -> list[Path]:
+    paths = []
+    for i in range(files):
+        path = root / f"pkg{i // 1000}" / f"sub{i // 100 % 10}" / f"module{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(f"def f_{i}_{j}(x):\n    return x + {j}\n" for j in range(40))
+        )
+        paths.append(path)
+    return paths
+
+
+def change_one_line(path: Path) -> None:
+    lines = path.read_text().splitlines(keepends=True)
+    lines[1] = lines[1].replace("x +", "x -")
+    path.write_text("".join(lines))
+
+
+def push_tar_gz(workspace, local: Path, scratch: Path) -> int:
+    archive = scratch / "repo.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(local, arcname=".")
+    result = workspace.file_upload(archive, scratch / "uploaded.tar.gz")
+    assert result.success, result.error
+    return archive.stat().st_size
+
+
+def pull_tar_gz(host: str, remote: Path) -> int:
+    response = httpx.get(
+        f"{host}/api/file/archive",
+        params={
+            "path": str(remote),
+            "format": "tar.gz",
+            "use_default_excludes": False,
+        },
+        timeout=600,
+    )
+    response.raise_for_status()
+    return len(response.content)
+
+
+def timed(transfer) -> tuple[float, int]:
+    start = time.perf_counter()
+    size = transfer()
+    return time.perf_counter() - start, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=50000)
+    args = parser.parse_args()
+
+    from openhands.sdk.workspace import RemoteWorkspace
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    host = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            httpx.get(f"{host}/api/file/checksum", params={"path": "/"})
+            break
+        except httpx.TransportError:
+            time.sleep(0.1)
+
+    root = Path(tempfile.mkdtemp(prefix="bench_workspace_sync_"))
+    try:
+        local = root / "local"
+        remote = root / "remote"
+        scratch = root / "scratch"
+        scratch.mkdir()
+        paths = make_repo(local, args.files)
+        workspace = RemoteWorkspace(host=host, working_dir=str(root))
+
+        start = time.perf_counter()
+        result = workspace.sync_upload(local, remote)
+        assert result.success, result.error
+        initial = time.perf_counter() - start
+        print(f"{args.files} files, mirrored to {host} in {initial:.2f}s")
+        print(f"{'Transfer':>16} | {'Wall':>8} | {'Sent':>10}")
+        print("-" * 40)
+
+        def sync_push() -> int:
+            result = workspace.sync_upload(local, remote)
+            assert result.success and result.files_transferred == 1, result
+            return result.bytes_transferred
+
+        def sync_pull() -> int:
+            result = workspace.sync_download(remote, local)
+            assert result.success and result.files_transferred == 1, result
+            return result.bytes_transferred
+
+        change_one_line(paths[len(paths) // 2])
+        pushes = (
+            ("full tar.gz push", lambda: push_tar_gz(workspace, local, scratch)),
+            ("sync push", sync_push),
+        )
+        for name, transfer in pushes:
+            elapsed, size = timed(transfer)
+            print(f"{name:>16} | {elapsed:>7.2f}s | {size / 1024:>8.1f}KB")
+
+        change_one_line(remote / paths[0].relative_to(local))
+        pulls = (
+            ("full tar.gz pull", lambda: pull_tar_gz(host, remote)),
+            ("sync pull", sync_pull),
+        )
+        for name, transfer in pulls:
+            elapsed, size = timed(transfer)
+            print(f"{name:>16} | {elapsed:>7.2f}s | {size / 1024:>8.1f}KB")
+    finally:
+        server.terminate()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
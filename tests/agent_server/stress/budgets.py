@@ -103,6 +103,19 @@ class SlowWebsocketConsumerBudget:
     max_rss_delta_mb: float = 150.0
 
 
+@dataclass(frozen=True, slots=True)
+class WebsocketFanoutBudget:
+    n_clients: int = 200
+    n_events: int = 300
+    # Per-client send queue; well below n_events so the stalled client
+    # overflows it.
+    send_queue_size: int = 64
+    # Publishing only encodes once and appends to queues; it never awaits a
+    # socket. 20 ms p99 at 200 clients fires on a regression to awaiting
+    # sends or to serializing per client, both of which cost far more.
+    publish_p99_s: float = 0.02
+
+
 @dataclass(frozen=True, slots=True)
 class WebsocketReconnectStormBudget:
     cycles: int = 100
@@ -142,6 +155,7 @@ LONG_RUNNING_COMMAND = LongRunningCommandBudget()
 EVENT_LOOP_RESPONSIVENESS = EventLoopResponsivenessBudget()
 SLOW_WEBHOOK = SlowWebhookBudget()
 SLOW_WEBSOCKET_CONSUMER = SlowWebsocketConsumerBudget()
+WEBSOCKET_FANOUT = WebsocketFanoutBudget()
 WEBSOCKET_RECONNECT_STORM = WebsocketReconnectStormBudget()
 HIGH_VOLUME_BASH_OUTPUT = HighVolumeBashOutputBudget()
 LEASE_CONTENTION = LeaseContentionBudget()
@@ -0,0 +1,136 @@
+"""Stress test: fan-out of one conversation's events to 200 websocket clients.
+
+Bug class this catches:
+    - Per-client serialization: N clients must not cost N ``model_dump``
+      calls per event.
+    - Head-of-line blocking: one client that stops reading must delay
+      neither the publisher nor the other clients.
+    - Unbounded per-client buffering: a client that stops reading is
+      disconnected once its send queue is full, instead of buffering every
+      event published after it stalled.
+
+White-box, not real WS:
+    The subscribers are the server's real ``_QueuedWebSocketSubscriber``s,
+    registered on a ``PubSub`` like the one each conversation owns, but over
+    in-memory sockets: real websockets through ASGITransport are awkward to
+    drive, and a conversation's ``EventService`` caps subscribers well below
+    200.
+"""
+
+import asyncio
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from openhands.agent_server.pub_sub import PubSub
+from openhands.agent_server.sockets import _QueuedWebSocketSubscriber
+from openhands.sdk.event import Event, StreamingDeltaEvent
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from tests.agent_server.stress.budgets import WEBSOCKET_FANOUT
+
+
+pytestmark = [pytest.mark.stress, pytest.mark.timeout(60)]
+
+
+class _MemoryWebSocket:
+    """The parts of a starlette WebSocket the subscriber uses."""
+
+    application_state = WebSocketState.CONNECTED
+    client_state = WebSocketState.CONNECTED
+
+    def __init__(self, stalled: bool = False):
+        self.stalled = stalled
+        self.frames: list[str] = []
+        self.close_code: int | None = None
+
+    async def send_text(self, data: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.close_code = code
+        self.application_state = WebSocketState.DISCONNECTED
+
+
+def _make_event(i: int) -> Event:
+    if i % 3:
+        return StreamingDeltaEvent(content=f"token-{i} ")
+    return ConversationStateUpdateEvent(
+        key="execution_status", value=f"running-{i}", source="environment"
+    )
+
+
+async def test_fanout_to_many_clients_with_one_stalled():
+    budget = WEBSOCKET_FANOUT
+    pub_sub = PubSub[Event]()
+    sockets = [_MemoryWebSocket() for _ in range(budget.n_clients - 1)]
+    stalled_socket = _MemoryWebSocket(stalled=True)
+    subscribers = [
+        _QueuedWebSocketSubscriber(
+            websocket,  # type: ignore[arg-type]
+            max_queue_size=budget.send_queue_size,
+            policy="coalesce",
+        )
+        for websocket in [*sockets, stalled_socket]
+    ]
+    subscriber_ids = [pub_sub.subscribe(subscriber) for subscriber in subscribers]
+    stalled_id = subscriber_ids[-1]
+
+    encode = _QueuedWebSocketSubscriber.encode
+    encode_calls = 0
+
+    def counting_encode(event: Event) -> str:
+        nonlocal encode_calls
+        encode_calls += 1
+        return encode(event)
+
+    events = [_make_event(i) for i in range(budget.n_events)]
+    publish_latencies = []
+    with patch.object(
+        _QueuedWebSocketSubscriber, "encode", staticmethod(counting_encode)
+    ):
+        for event in events:
+            start = time.perf_counter()
+            await pub_sub(event)
+            publish_latencies.append(time.perf_counter() - start)
+            # Let the writers run between events, as the agent's own awaits
+            # would; the fast clients then never have more than one queued.
+            await asyncio.sleep(0)
+
+        deadline = time.monotonic() + 10
+        while any(len(s.frames) < budget.n_events for s in sockets):
+            assert time.monotonic() < deadline, "fast clients did not catch up"
+            await asyncio.sleep(0.01)
+
+    publish_p99 = statistics.quantiles(publish_latencies, n=100)[98]
+    assert publish_p99 < budget.publish_p99_s, (
+        f"publish p99 {publish_p99 * 1000:.1f} ms to {budget.n_clients} "
+        f"clients exceeds {budget.publish_p99_s * 1000:.0f} ms. Is publish "
+        "awaiting sockets or serializing per client again?"
+    )
+
+    queue_stats = pub_sub.queue_stats()
+    stalled_stats = queue_stats.pop(stalled_id)
+    assert stalled_stats.disconnected
+    assert stalled_stats.depth == 0
+    assert stalled_stats.max_depth == budget.send_queue_size
+    assert stalled_stats.coalesced > 0
+    assert stalled_socket.close_code == 1013
+    assert all(
+        not stats.disconnected and stats.max_depth <= 2
+        for stats in queue_stats.values()
+    )
+
+    # Every event was serialized once, whatever the number of clients; only
+    # the deltas merged for the stalled client were encoded again.
+    assert encode_calls == budget.n_events + stalled_stats.coalesced
+
+    # Every fast client received every event, in order.
+    expected = [encode(event) for event in events]
+    assert all(websocket.frames == expected for websocket in sockets)
+
+    await pub_sub.close()
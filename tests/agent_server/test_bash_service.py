@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import json
 import logging
 import time
 from collections.abc import AsyncIterator
@@ -18,7 +19,12 @@ from fastapi import FastAPI
 from openhands.agent_server import bash_router as bash_router_module
 from openhands.agent_server.bash_service import BashEventService
 from openhands.agent_server.config import Config
-from openhands.agent_server.models import BashCommand, BashEventSortOrder, BashOutput
+from openhands.agent_server.models import (
+    BashCommand,
+    BashEventSortOrder,
+    BashOutput,
+    ExecuteBashRequest,
+)
 from openhands.agent_server.server_details_router import (
     mark_initialization_complete,
     server_details_router,
@@ -110,6 +116,47 @@ async def test_bash_execution_error_log_omits_command(
     assert secret not in caplog.text
 
 
+@pytest.mark.timeout(30)
+async def test_stream_bash_command_returns_output_and_exit_code(
+    client: httpx.AsyncClient, bash_service: BashEventService
+):
+    resp = await client.post(
+        "/api/bash/stream_bash_command",
+        json={"command": "echo out; echo err >&2; exit 3"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[0]["kind"] == "BashCommand"
+    outputs = events[1:]
+    assert all(e["kind"] == "BashOutput" for e in outputs)
+    assert all(e["command_id"] == events[0]["id"] for e in outputs)
+    assert [e.get("exit_code") for e in outputs][-1] == 3
+    assert "".join(e.get("stdout") or "" for e in outputs) == "out\n"
+    assert "".join(e.get("stderr") or "" for e in outputs) == "err\n"
+    # The stream's subscription is released once the command finished.
+    assert bash_service._pub_sub.subscriber_ids() == set()
+
+
+@pytest.mark.timeout(30)
+async def test_stream_bash_command_without_free_subscriber_slot(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    service._pub_sub.max_subscribers = 0
+
+    events = [
+        event
+        async for event in service.stream_bash_command(
+            ExecuteBashRequest(command="echo fallback")
+        )
+    ]
+
+    assert isinstance(events[0], BashCommand)
+    assert isinstance(events[-1], BashOutput)
+    assert events[-1].exit_code == 0
+    assert events[-1].stdout == "fallback\n"
+
+
 # ---------------------------------------------------------------------------
 # search_bash_events
 # ---------------------------------------------------------------------------
@@ -162,6 +209,81 @@ async def test_search_bash_events_filters_and_paginates(tmp_path: Path):
     assert second_page.next_page_id is None
 
 
+async def test_search_bash_events_pages_by_kind_in_both_orders(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    commands = [
+        BashCommand(command=f"echo {i}", timestamp=_OLD.replace(microsecond=2 * i))
+        for i in range(5)
+    ]
+    for i, command in enumerate(commands):
+        service._save_event_to_file(command)
+        service._save_event_to_file(
+            BashOutput(
+                command_id=command.id,
+                order=0,
+                timestamp=_OLD.replace(microsecond=2 * i + 1),
+            )
+        )
+
+    for sort_order, expected in (
+        (BashEventSortOrder.TIMESTAMP, commands),
+        (BashEventSortOrder.TIMESTAMP_DESC, commands[::-1]),
+    ):
+        ids = []
+        page_id = None
+        while True:
+            page = await service.search_bash_events(
+                kind__eq="BashCommand",
+                sort_order=sort_order,
+                page_id=page_id,
+                limit=2,
+            )
+            ids.extend(event.id for event in page.items)
+            if (page_id := page.next_page_id) is None:
+                break
+        assert ids == [command.id for command in expected]
+
+    # An unknown page_id starts from the first page.
+    page = await service.search_bash_events(
+        kind__eq="BashCommand", page_id="unknown", limit=2
+    )
+    assert [event.id for event in page.items] == [c.id for c in commands[:2]]
+
+    # A command's outputs never match another kind.
+    page = await service.search_bash_events(
+        kind__eq="BashCommand", command_id__eq=commands[0].id
+    )
+    assert page.items == []
+
+
+async def test_search_bash_events_uses_index_not_directory(tmp_path: Path):
+    bash_events_dir = tmp_path / "bash_events"
+    old = BashCommand(command="echo old", timestamp=_OLD)
+    BashEventService(bash_events_dir=bash_events_dir)._save_event_to_file(old)
+
+    async with BashEventService(bash_events_dir=bash_events_dir) as service:
+        new = BashCommand(command="echo new")
+        service._save_event_to_file(new)
+        with (
+            patch(
+                "openhands.agent_server.bash_service.os.scandir",
+                side_effect=AssertionError("searches must not scan the directory"),
+            ),
+            patch(
+                "openhands.agent_server.bash_service.glob.glob",
+                side_effect=AssertionError("searches must not scan the directory"),
+            ),
+        ):
+            page = await service.search_bash_events()
+            assert [event.id for event in page.items] == [old.id, new.id]
+            assert await service.get_bash_event(old.id.hex) is not None
+
+            assert service.delete_events_older_than(_CUTOFF) == 1
+            page = await service.search_bash_events()
+            assert [event.id for event in page.items] == [new.id]
+            assert await service.get_bash_event(old.id.hex) is None
+
+
 async def test_search_bash_events_runs_blocking_scan_off_event_loop(
     tmp_path: Path,
 ):
@@ -225,6 +347,104 @@ async def test_concurrent_searches_serialize_filesystem_scans(tmp_path: Path):
     assert max_active == 1
 
 
+# ---------------------------------------------------------------------------
+# output logs
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.timeout(30)
+async def test_command_output_is_appended_to_one_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        "openhands.agent_server.bash_service.MAX_CONTENT_CHAR_LENGTH", 1000
+    )
+    bash_events_dir = tmp_path / "bash_events"
+    async with BashEventService(bash_events_dir=bash_events_dir) as service:
+        events = [
+            event
+            async for event in service.stream_bash_command(
+                ExecuteBashRequest(command="printf 'x%.0s' $(seq 3500)")
+            )
+        ]
+    command = events[0]
+    outputs = [event for event in events if isinstance(event, BashOutput)]
+    assert [len(event.stdout or "") for event in outputs] == [1000, 1000, 1000, 500]
+
+    # One file for the command, one log for all of its output.
+    assert sorted(p.name for p in bash_events_dir.iterdir()) == [
+        ".outputs",
+        service._get_event_filename(command),
+    ]
+    assert [p.name for p in (bash_events_dir / ".outputs").iterdir()] == [
+        f"{command.id.hex}.log"
+    ]
+
+    # A fresh service rebuilds its index from disk.
+    reloaded = BashEventService(bash_events_dir=bash_events_dir)
+    page = await reloaded.search_bash_events(
+        kind__eq="BashOutput", command_id__eq=command.id, limit=2
+    )
+    assert [event.id for event in page.items] == [e.id for e in outputs[:2]]
+    assert page.next_page_id is not None
+    page = await reloaded.search_bash_events(
+        command_id__eq=command.id, page_id=page.next_page_id
+    )
+    assert [event.id for event in page.items] == [e.id for e in outputs[2:]]
+    assert await reloaded.get_bash_event(outputs[3].id.hex) == outputs[3]
+
+
+async def test_output_is_searchable_before_it_is_written(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    command_id = uuid4()
+    output = BashOutput(command_id=command_id, stdout="pending")
+
+    service._persist_output(output)
+    page = await service.search_bash_events(command_id__eq=command_id)
+    assert page.items == [output]
+
+    await service._flush_outputs()
+    log = service._output_log_path(command_id)
+    assert log.exists()
+    index = service._index
+    assert index is not None
+    assert isinstance(index[service._get_event_filename(output)], tuple)
+
+
+async def test_torn_output_record_is_skipped_on_reload(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    command_id = uuid4()
+    first = BashOutput(command_id=command_id, order=0, stdout="kept")
+    second = BashOutput(command_id=command_id, order=1, stdout="cut short")
+    service._persist_output(first)
+    service._persist_output(second)
+    await service._flush_outputs()
+
+    log = service._output_log_path(command_id)
+    log.write_bytes(log.read_bytes()[:-5])
+
+    reloaded = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    page = await reloaded.search_bash_events(command_id__eq=command_id)
+    assert [event.id for event in page.items] == [first.id]
+
+
+async def test_delete_events_older_than_removes_finished_output_logs(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    old_command, new_command = uuid4(), uuid4()
+    service._persist_output(BashOutput(command_id=old_command, timestamp=_OLD))
+    service._persist_output(BashOutput(command_id=new_command, timestamp=_OLD))
+    service._persist_output(BashOutput(command_id=new_command, timestamp=_NEW))
+    await service._flush_outputs()
+
+    assert service.delete_events_older_than(_CUTOFF) == 1
+
+    assert not service._output_log_path(old_command).exists()
+    # A log still receiving recent output is kept whole.
+    assert service._output_log_path(new_command).exists()
+    page = await service.search_bash_events(kind__eq="BashOutput")
+    assert len(page.items) == 2
+
+
 # ---------------------------------------------------------------------------
 # delete_events_older_than
 # ---------------------------------------------------------------------------
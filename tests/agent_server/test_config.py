@@ -67,3 +67,16 @@ def test_conversation_idle_ttl_can_be_disabled_and_overridden(monkeypatch, tmp_p
 def test_conversation_idle_ttl_rejects_non_positive_values():
     with pytest.raises(ValidationError):
         Config(conversation_idle_ttl_seconds=0)
+
+
+def test_websocket_backpressure_policy_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(CONFIG_PATH_ENV, str(tmp_path / "missing.json"))
+    monkeypatch.setenv("OH_WEBSOCKET_SEND_QUEUE_SIZE", "0")
+    monkeypatch.setenv("OH_WEBSOCKET_BACKPRESSURE_POLICY", "drop_oldest")
+
+    config = load_config()
+
+    assert config.websocket_send_queue_size == 0
+    assert config.websocket_backpressure_policy == "drop_oldest"
+    with pytest.raises(ValidationError):
+        Config(websocket_backpressure_policy="block")  # type: ignore[arg-type]
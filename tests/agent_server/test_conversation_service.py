@@ -19,6 +19,7 @@ from openhands.agent_server.conversation_lease import (
     ConversationOwnershipLostError,
 )
 from openhands.agent_server.conversation_service import (
+    CATALOG_INDEX_FILE,
     AutoTitleSubscriber,
     ConversationService,
     _compose_conversation_info,
@@ -3824,6 +3825,81 @@ class TestConversationSearchScaling:
                 == 2
             )
 
+    @pytest.mark.asyncio
+    async def test_catalog_reload_reads_status_from_index(self, tmp_path):
+        """A restart answers status from the catalog index, not base state."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 5, workspace_dir)
+
+        async with ConversationService(conversations_dir=conversations_dir):
+            pass
+        index = json.loads((conversations_dir / CATALOG_INDEX_FILE).read_text())
+        assert set(index) == {conversation_id.hex for conversation_id in ids}
+
+        real_open = open
+
+        def _no_base_state_open(file, *args, **kwargs):
+            assert not str(file).endswith("base_state.json")
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=_no_base_state_open):
+            async with ConversationService(conversations_dir=conversations_dir) as svc:
+                assert set(svc._conversation_records) == set(ids)
+                assert (
+                    await svc.count_conversations(
+                        execution_status=ConversationExecutionStatus.IDLE
+                    )
+                    == 5
+                )
+
+    @pytest.mark.asyncio
+    async def test_catalog_ignores_stale_or_corrupt_index(self, tmp_path):
+        """An index entry for another base state signature is never trusted."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 2, workspace_dir)
+
+        async with ConversationService(conversations_dir=conversations_dir):
+            pass
+
+        # Another process finishes one conversation while this server is down.
+        base_state = conversations_dir / ids[0].hex / "base_state.json"
+        payload = json.loads(base_state.read_text())
+        payload["execution_status"] = ConversationExecutionStatus.FINISHED.value
+        payload["max_iterations"] = 1234567
+        base_state.write_text(json.dumps(payload))
+
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            records = svc._conversation_records
+            assert (
+                records[ids[0]].execution_status == ConversationExecutionStatus.FINISHED
+            )
+            assert records[ids[1]].execution_status == ConversationExecutionStatus.IDLE
+
+        (conversations_dir / CATALOG_INDEX_FILE).write_text("{not json")
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            assert set(svc._conversation_records) == set(ids)
+        index = json.loads((conversations_dir / CATALOG_INDEX_FILE).read_text())
+        assert index[ids[0].hex][2] == ConversationExecutionStatus.FINISHED.value
+
+    @pytest.mark.asyncio
+    async def test_catalog_load_skips_broken_conversations(self, tmp_path):
+        """Parallel loading still drops unreadable entries individually."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 6, workspace_dir)
+        (conversations_dir / ids[0].hex / "meta.json").write_text("{broken")
+        (conversations_dir / ids[1].hex / "base_state.json").write_text("{broken")
+        (conversations_dir / "stray-file.txt").write_text("not a conversation")
+        (conversations_dir / "no-meta").mkdir()
+
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            assert set(svc._conversation_records) == set(ids[2:])
+
     @pytest.mark.asyncio
     async def test_live_conversation_status_is_read_from_memory(self, tmp_path):
         """A live conversation answers the filter from its in-memory state."""
@@ -3898,6 +3974,91 @@ class TestConversationSearchScaling:
 
             assert [item.id for item in page.items] == [target]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_order", list(ConversationSortOrder))
+    async def test_pages_walk_catalog_in_sort_order(self, tmp_path, sort_order):
+        """Keyset pages cover every conversation once, in sort order."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 7, workspace_dir)
+        expected = ids[::-1] if sort_order.endswith("_DESC") else ids
+
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            seen: list[UUID] = []
+            page_id = None
+            while True:
+                page = await svc.search_conversations(
+                    page_id=page_id, limit=3, sort_order=sort_order
+                )
+                seen.extend(item.id for item in page.items)
+                page_id = page.next_page_id
+                if page_id is None:
+                    break
+            assert seen == expected
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_catalog_changes(self, tmp_path):
+        """Sorted indexes track records that are updated, added and removed."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 5, workspace_dir)
+
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            first = await svc.search_conversations(
+                limit=2, sort_order=ConversationSortOrder.UPDATED_AT_DESC
+            )
+            assert [item.id for item in first.items] == [ids[4], ids[3]]
+
+            # Bump the oldest conversation to the top and drop another.
+            record = svc._conversation_records[ids[0]]
+            record.stored = record.stored.model_copy(
+                update={"updated_at": datetime(2026, 2, 1, tzinfo=UTC)}
+            )
+            svc._conversation_records.pop(ids[3])
+
+            page = await svc.search_conversations(
+                limit=10, sort_order=ConversationSortOrder.UPDATED_AT_DESC
+            )
+            assert [item.id for item in page.items] == [ids[0], ids[4], ids[2], ids[1]]
+            assert await svc.count_conversations() == 4
+
+            # A stored object mutated in place is re-keyed once touched.
+            record.stored.updated_at = datetime(2025, 1, 1, tzinfo=UTC)
+            catalog = svc._catalog()
+            catalog.touch(ids[0])
+            assert [
+                key[2]
+                for key in catalog.range(
+                    ConversationSortOrder.UPDATED_AT, None, count=2
+                )
+            ] == [ids[0], ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_page_cursor_resumes_from_removed_position(self, tmp_path):
+        """Keys past a cursor are found by position, not by list membership."""
+        workspace_dir = tmp_path / "workspace"
+        workspace_dir.mkdir()
+        conversations_dir = tmp_path / "conversations"
+        ids = self._seed(conversations_dir, 6, workspace_dir)
+
+        async with ConversationService(conversations_dir=conversations_dir) as svc:
+            catalog = svc._catalog()
+            cursor = catalog.sort_key(ids[2], ConversationSortOrder.CREATED_AT)
+            assert cursor is not None
+            catalog.pop(ids[2])
+
+            after = catalog.range(
+                ConversationSortOrder.CREATED_AT, None, count=10, start=cursor
+            )
+            assert [key[2] for key in after] == ids[3:]
+            before = catalog.range(
+                ConversationSortOrder.CREATED_AT_DESC, None, count=10, start=cursor
+            )
+            assert [key[2] for key in before] == [ids[1], ids[0]]
+            assert catalog.count(ConversationExecutionStatus.IDLE) == len(ids) - 1
+
 
 @pytest.mark.asyncio
 async def test_search_composes_conversation_info_off_event_loop(persisted_conversation):
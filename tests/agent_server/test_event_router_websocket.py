@@ -1,5 +1,6 @@
 """Tests for websocket functionality in event_router.py"""
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import cast
@@ -12,9 +13,13 @@ from starlette.websockets import WebSocketState
 
 from openhands.agent_server.event_service import EventService
 from openhands.agent_server.models import BashCommand, BashOutput, EventPage
-from openhands.agent_server.sockets import _send_bash_event, _WebSocketSubscriber
+from openhands.agent_server.sockets import (
+    _QueuedWebSocketSubscriber,
+    _send_bash_event,
+    _WebSocketSubscriber,
+)
 from openhands.sdk import Message
-from openhands.sdk.event import Event
+from openhands.sdk.event import Event, StreamingDeltaEvent
 from openhands.sdk.event.llm_convertible import MessageEvent
 from openhands.sdk.llm.message import TextContent
 
@@ -178,6 +183,44 @@ async def test_send_bash_event_error_logs_omit_output_and_exception(
     assert exception_secret not in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_queued_websocket_subscriber_sends_encoded_event(mock_websocket):
+    mock_websocket.send_text = AsyncMock()
+    subscriber = _QueuedWebSocketSubscriber(mock_websocket)
+    event = MessageEvent(
+        id="test_event",
+        source="user",
+        llm_message=Message(role="user", content=[TextContent(text="test")]),
+    )
+
+    await subscriber(event)
+    await asyncio.sleep(0)
+
+    mock_websocket.send_json.assert_not_called()
+    mock_websocket.send_text.assert_awaited_once_with(
+        event.model_dump_json(exclude_none=True)
+    )
+    await subscriber.close()
+
+
+def test_queued_websocket_subscriber_coalesces_streaming_deltas(mock_websocket):
+    subscriber = _QueuedWebSocketSubscriber(mock_websocket)
+    first = StreamingDeltaEvent(content="Hel", reasoning_content="thinking")
+    second = StreamingDeltaEvent(content="lo", reasoning_content=None)
+
+    merged = subscriber.coalesce(first, second)
+
+    assert isinstance(merged, StreamingDeltaEvent)
+    assert merged.content == "Hello"
+    assert merged.reasoning_content == "thinking"
+    assert merged.id == first.id
+    message = MessageEvent(
+        source="agent",
+        llm_message=Message(role="assistant", content=[TextContent(text="Hello")]),
+    )
+    assert subscriber.coalesce(first, message) is None
+
+
 @pytest.mark.asyncio
 async def test_websocket_disconnect_breaks_loop(
     mock_websocket, mock_event_service, sample_conversation_id
@@ -369,6 +369,49 @@ class TestEventServiceSearchEvents:
         assert len(result.items) == 5
         assert result.next_page_id is None
 
+    @pytest.mark.asyncio
+    async def test_search_events_after_event_id(
+        self, event_service, mock_conversation_with_events
+    ):
+        """after_event_id starts just past that event, in either order."""
+        event_service._conversation = mock_conversation_with_events
+        ids = [e.id for e in mock_conversation_with_events._state.events]
+
+        result = await event_service.search_events(after_event_id=ids[1])
+        assert [e.id for e in result.items] == ids[2:]
+
+        result = await event_service.search_events(after_event_id=ids[1], limit=1)
+        assert [e.id for e in result.items] == [ids[2]]
+        result = await event_service.search_events(
+            page_id=result.next_page_id, after_event_id=ids[1]
+        )
+        assert [e.id for e in result.items] == ids[3:]
+
+        result = await event_service.search_events(after_event_id=ids[-1])
+        assert result.items == []
+        assert result.next_page_id is None
+
+        result = await event_service.search_events(
+            after_event_id=ids[2], sort_order=EventSortOrder.TIMESTAMP_DESC
+        )
+        assert [e.id for e in result.items] == [ids[1], ids[0]]
+
+        # An unknown cursor falls back to the whole log.
+        result = await event_service.search_events(after_event_id="unknown")
+        assert [e.id for e in result.items] == ids
+
+    @pytest.mark.asyncio
+    async def test_search_events_after_event_id_uses_event_log_index(
+        self, event_service
+    ):
+        fs = InMemoryFileStore()
+        event_log, event0, event2, _ = _event_log_with_unreadable_middle(fs, "{}")
+        _attach_event_log(event_service, event_log)
+
+        result = await event_service.search_events(after_event_id=event0.id)
+
+        assert [event.id for event in result.items] == [event2.id]
+
     @pytest.mark.asyncio
     async def test_search_events_large_limit(
         self, event_service, mock_conversation_with_events
@@ -726,6 +769,37 @@ class TestEventServiceCountEvents:
         assert await event_service.count_events() == 3
         assert await event_service.count_events(source="user") == 2
 
+    @pytest.mark.asyncio
+    async def test_count_events_answers_filters_from_search_index(self, event_service):
+        fs = InMemoryFileStore()
+        writer = EventLog(fs)
+        for i in range(4):
+            writer.append(
+                _message_event(
+                    f"00000000-0000-0000-0000-00000000000{i}",
+                    "hello world" if i % 2 else "goodbye",
+                    f"2026-06-16T09:00:0{i}",
+                )
+            )
+        event_log = EventLog(fs)
+        event_log.search_index  # load the sidecar before counting reads
+        _attach_event_log(event_service, event_log)
+
+        with patch.object(
+            EventLog, "_get_single_item", side_effect=AssertionError("hydrated")
+        ):
+            assert await event_service.count_events(source="user") == 4
+            assert await event_service.count_events(source="agent") == 0
+            assert (
+                await event_service.count_events(
+                    timestamp__gte=datetime(2026, 6, 16, 9, 0, 2)
+                )
+                == 2
+            )
+        # Body searches hydrate only the token-index candidates.
+        assert await event_service.count_events(body="lo wor") == 2
+        assert await event_service.count_events(body="nothing") == 0
+
     @pytest.mark.asyncio
     async def test_count_events_timestamp_gte_filter(
         self, event_service, mock_conversation_with_timestamped_events
@@ -1,6 +1,7 @@
 """Tests for file_router.py endpoints."""
 
 import asyncio
+import hashlib
 import io
 import json
 import os
@@ -22,6 +23,8 @@ from openhands.agent_server import file_router as file_router_module
 from openhands.agent_server.api import create_app
 from openhands.agent_server.config import Config
 from openhands.agent_server.file_router import ARCHIVE_MANIFEST_NAME, _upload_file
+from openhands.sdk.workspace import RemoteWorkspace
+from openhands.sdk.workspace.sync import SYNC_BLOCK_SIZE
 
 
 @pytest.fixture
@@ -170,6 +173,270 @@ def test_download_file_query_param_missing_path(client):
     assert response.status_code == 422
 
 
+# =============================================================================
+# Ranged Transfer Tests - PUT /api/file/upload_range, GET /api/file/checksum
+# =============================================================================
+
+
+def test_download_file_returns_requested_range(client, tmp_path):
+    """Test that download honors Range headers for resumable transfers."""
+    test_file = tmp_path / "ranged.bin"
+    test_file.write_bytes(b"0123456789")
+
+    response = client.get(
+        "/api/file/download",
+        params={"path": str(test_file)},
+        headers={"Range": "bytes=4-7"},
+    )
+
+    assert response.status_code == 206
+    assert response.content == b"4567"
+    assert response.headers["content-range"] == "bytes 4-7/10"
+
+
+def test_upload_file_range_writes_ranges_in_any_order(client, tmp_path):
+    """Test that ranges land at their offsets and the file gets the given size."""
+    target_path = tmp_path / "nested" / "ranged.bin"
+    target_path.parent.mkdir()
+    target_path.write_bytes(b"stale content longer than the new file")
+
+    for offset, content in ((8, b"89"), (0, b"0123"), (4, b"4567")):
+        response = client.put(
+            "/api/file/upload_range",
+            params={"path": str(target_path), "offset": offset, "size": 10},
+            content=content,
+        )
+        assert response.status_code == 200
+        assert response.json() == {"success": True}
+
+    assert target_path.read_bytes() == b"0123456789"
+
+
+def test_upload_file_range_past_file_size_fails(client, tmp_path):
+    """Test that a range extending past the declared size returns 400."""
+    response = client.put(
+        "/api/file/upload_range",
+        params={"path": str(tmp_path / "ranged.bin"), "offset": 8, "size": 10},
+        content=b"too long",
+    )
+
+    assert response.status_code == 400
+    assert "past the file size" in response.json()["detail"]
+
+
+def test_upload_file_range_relative_path_fails(client):
+    """Test that ranged upload with a relative path returns 400."""
+    response = client.put(
+        "/api/file/upload_range",
+        params={"path": "relative/path.bin", "offset": 0, "size": 1},
+        content=b"x",
+    )
+
+    assert response.status_code == 400
+    assert "must be absolute" in response.json()["detail"]
+
+
+def test_get_file_checksum(client, tmp_path):
+    """Test that checksum returns the size and SHA-256 of a file."""
+    test_file = tmp_path / "checksummed.bin"
+    test_file.write_bytes(b"0123456789")
+
+    response = client.get("/api/file/checksum", params={"path": str(test_file)})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "size": 10,
+        "sha256": hashlib.sha256(b"0123456789").hexdigest(),
+    }
+
+    response = client.get(
+        "/api/file/checksum", params={"path": str(tmp_path / "missing.bin")}
+    )
+    assert response.status_code == 404
+
+
+def test_remote_workspace_transfers_large_file_in_parallel_ranges(client, tmp_path):
+    """Test a RemoteWorkspace round trip in ranges, skipping identical files."""
+    workspace = RemoteWorkspace(
+        host="http://testserver",
+        working_dir=str(tmp_path),
+        transfer_chunk_size=1000,
+        transfer_streams=3,
+    )
+    workspace._client = client
+    content = os.urandom(10_500)
+    source = tmp_path / "source.bin"
+    source.write_bytes(content)
+    remote = tmp_path / "remote" / "copy.bin"
+    downloaded = tmp_path / "downloaded" / "copy.bin"
+
+    upload = workspace.file_upload(source, remote)
+    assert upload.success, upload.error
+    assert remote.read_bytes() == content
+
+    download = workspace.file_download(remote, downloaded)
+    assert download.success, download.error
+    assert download.file_size == len(content)
+    assert downloaded.read_bytes() == content
+
+    # Identical files are not sent again.
+    remote_mtime = remote.stat().st_mtime_ns
+    assert workspace.file_upload(source, remote).success
+    assert remote.stat().st_mtime_ns == remote_mtime
+
+
+# =============================================================================
+# Directory Sync Tests - POST /api/file/sync/{manifest,blocks,upload,download}
+# =============================================================================
+
+
+def _sync_tree(root: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in root.rglob("*")
+        if p.is_file() and not p.is_symlink()
+    }
+
+
+def test_sync_manifest_lists_files(client, tmp_path):
+    """Test that the manifest honors excludes and leaves out symlinks."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "big.bin").write_bytes(os.urandom(SYNC_BLOCK_SIZE + 1))
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("x")
+    (tmp_path / "link").symlink_to(tmp_path / "big.bin")
+
+    response = client.post(
+        "/api/file/sync/manifest",
+        json={"path": str(tmp_path), "excludes": ["node_modules/"]},
+    )
+
+    assert response.status_code == 200
+    manifest = response.json()
+    assert manifest["block_size"] == SYNC_BLOCK_SIZE
+    entries = {entry["path"]: entry for entry in manifest["entries"]}
+    assert list(entries) == ["big.bin", "src/app.py"]
+    assert entries["big.bin"]["size"] == SYNC_BLOCK_SIZE + 1
+    assert entries["src/app.py"]["size"] == 12
+    stat_result = (tmp_path / "src" / "app.py").stat()
+    assert entries["src/app.py"]["mtime_ns"] == stat_result.st_mtime_ns
+
+
+def test_sync_manifest_of_missing_directory_is_empty(client, tmp_path):
+    """Test that a directory not created yet has no files, and a file is 400."""
+    response = client.post(
+        "/api/file/sync/manifest", json={"path": str(tmp_path / "missing")}
+    )
+    assert response.status_code == 200
+    assert response.json()["entries"] == []
+
+    (tmp_path / "file.txt").write_text("x")
+    response = client.post(
+        "/api/file/sync/manifest", json={"path": str(tmp_path / "file.txt")}
+    )
+    assert response.status_code == 400
+
+
+def test_sync_blocks_hashes_only_requested_files(client, tmp_path):
+    """Test that block hashes come back for the requested readable files."""
+    (tmp_path / "big.bin").write_bytes(os.urandom(SYNC_BLOCK_SIZE + 1))
+    (tmp_path / "other.bin").write_bytes(os.urandom(SYNC_BLOCK_SIZE + 1))
+
+    response = client.post(
+        "/api/file/sync/blocks",
+        json={"path": str(tmp_path), "paths": ["big.bin", "missing.bin"]},
+    )
+
+    assert response.status_code == 200
+    hashes = response.json()
+    assert list(hashes) == ["big.bin"]
+    assert len(hashes["big.bin"]) == 2
+
+    response = client.post(
+        "/api/file/sync/blocks",
+        json={"path": str(tmp_path), "paths": ["../secret.txt"]},
+    )
+    assert response.status_code == 400
+
+
+def test_sync_download_rejects_paths_outside_directory(client, tmp_path):
+    """Test that requested files cannot escape the synced directory."""
+    (tmp_path / "root").mkdir()
+    (tmp_path / "secret.txt").write_text("secret")
+
+    for path in ("../secret.txt", "/etc/passwd"):
+        response = client.post(
+            "/api/file/sync/download",
+            json={"path": str(tmp_path / "root"), "files": [{"path": path}]},
+        )
+        assert response.status_code == 400, path
+
+
+def test_sync_upload_rejects_invalid_stream(client, tmp_path):
+    """Test that a stream that is not a sync archive returns 400."""
+    response = client.post(
+        "/api/file/sync/upload",
+        params={"path": str(tmp_path)},
+        files={"file": ("sync.tar.gz", b"not a tarball")},
+    )
+
+    assert response.status_code == 400
+    assert "Invalid sync stream" in response.json()["detail"]
+
+
+def test_remote_workspace_syncs_directory_incrementally(client, tmp_path):
+    """Test a RemoteWorkspace sync round trip sending only what changed."""
+    workspace = RemoteWorkspace(host="http://testserver", working_dir=str(tmp_path))
+    workspace._client = client
+    local = tmp_path / "local"
+    (local / "pkg").mkdir(parents=True)
+    for i in range(20):
+        (local / "pkg" / f"mod{i}.py").write_text(f"VALUE = {i}\n")
+    (local / "data.bin").write_bytes(os.urandom(4 * SYNC_BLOCK_SIZE))
+    (local / ".venv").mkdir()
+    (local / ".venv" / "python").write_text("binary")
+    remote = tmp_path / "remote"
+    excludes = [".venv/"]
+
+    result = workspace.sync_upload(local, remote, excludes=excludes)
+    assert result.success, result.error
+    assert result.files_transferred == 21
+    assert _sync_tree(remote) == {
+        k: v for k, v in _sync_tree(local).items() if not k.startswith(".venv")
+    }
+
+    # A one-line change sends one file; a one-byte change sends one block.
+    (local / "pkg" / "mod3.py").write_text("VALUE = 'three'\n")
+    data = bytearray((local / "data.bin").read_bytes())
+    data[SYNC_BLOCK_SIZE + 1] ^= 0xFF
+    (local / "data.bin").write_bytes(data)
+    # Same size, so make sure the quick check sees a new mtime on coarse clocks.
+    mtime_ns = (local / "data.bin").stat().st_mtime_ns + 1_000_000_000
+    os.utime(local / "data.bin", ns=(mtime_ns, mtime_ns))
+    result = workspace.sync_upload(local, remote, excludes=excludes)
+    assert result.success, result.error
+    assert result.files_transferred == 2
+    assert result.bytes_transferred < 2 * SYNC_BLOCK_SIZE
+    assert (remote / "pkg" / "mod3.py").read_text() == "VALUE = 'three'\n"
+    assert (remote / "data.bin").read_bytes() == data
+
+    result = workspace.sync_upload(local, remote, excludes=excludes)
+    assert result.success and result.files_transferred == 0
+
+    # Back the other way, deleting what the remote side no longer has.
+    (remote / "pkg" / "mod0.py").unlink()
+    (remote / "pkg" / "new.py").write_text("NEW = True\n")
+    result = workspace.sync_download(remote, local, excludes=excludes, delete=True)
+    assert result.success, result.error
+    assert result.files_transferred == 1
+    assert result.files_deleted == 1
+    assert (local / ".venv" / "python").exists()
+    assert {
+        k: v for k, v in _sync_tree(local).items() if not k.startswith(".venv")
+    } == _sync_tree(remote)
+
+
 # =============================================================================
 # Create Directory Tests - POST /api/file/create_directory
 # =============================================================================
@@ -902,3 +902,143 @@ class TestPubSubMaxSubscribers:
         for _ in range(100):
             pubsub.subscribe(_Sub())
         assert len(pubsub._subscribers) == 100
+
+
+def _recording_queued_subscriber():
+    """Build a QueuedSubscriber over strings that records what it sends."""
+    from openhands.agent_server.pub_sub import QueuedSubscriber
+
+    @dataclass
+    class _Recording(QueuedSubscriber[str]):
+        sent: list[str] = field(default_factory=list)
+        gate: asyncio.Event | None = None
+        disconnected: bool = False
+        encode_calls = 0
+
+        @staticmethod
+        def encode(event: str) -> str:
+            _Recording.encode_calls += 1
+            return event.upper()
+
+        async def send(self, event: str, payload: str) -> None:
+            if self.gate is not None:
+                await self.gate.wait()
+            self.sent.append(payload)
+
+        async def disconnect(self) -> None:
+            self.disconnected = True
+
+        def coalesce(self, queued: str, event: str) -> str | None:
+            if queued.startswith("delta:") and event.startswith("delta:"):
+                return queued + event.removeprefix("delta:")
+            return None
+
+    return _Recording
+
+
+async def _drain(subscriber) -> None:
+    while subscriber._queue:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestQueuedSubscriber:
+    """Tests for queued fan-out using the real PubSub class."""
+
+    async def test_event_encoded_once_for_all_subscribers(self):
+        from openhands.agent_server.pub_sub import PubSub
+
+        recording = _recording_queued_subscriber()
+        pubsub: PubSub[str] = PubSub()
+        subscribers = [recording() for _ in range(20)]
+        for subscriber in subscribers:
+            pubsub.subscribe(subscriber)
+
+        for event in ("a", "b", "c"):
+            await pubsub(event)
+        for subscriber in subscribers:
+            await _drain(subscriber)
+
+        assert recording.encode_calls == 3
+        assert all(s.sent == ["A", "B", "C"] for s in subscribers)
+        await pubsub.close()
+
+    async def test_stalled_subscriber_does_not_block_publish(self):
+        from openhands.agent_server.pub_sub import PubSub
+
+        recording = _recording_queued_subscriber()
+        pubsub: PubSub[str] = PubSub()
+        stalled = recording(
+            gate=asyncio.Event(), policy="drop_oldest", max_queue_size=3
+        )
+        fast = recording()
+        stalled_id = pubsub.subscribe(stalled)
+        pubsub.subscribe(fast)
+
+        await pubsub("e0")
+        await asyncio.sleep(0)  # the stalled writer takes e0 and blocks on it
+        for i in range(1, 10):
+            await asyncio.wait_for(pubsub(f"e{i}"), timeout=1)
+        await _drain(fast)
+
+        assert fast.sent == [f"E{i}" for i in range(10)]
+        stats = pubsub.queue_stats()[stalled_id]
+        assert stats.depth == 3 and stats.max_depth == 3
+        assert stats.dropped == 6
+
+        assert stalled.gate is not None
+        stalled.gate.set()
+        await _drain(stalled)
+        assert stalled.sent == ["E0", "E7", "E8", "E9"]
+        await pubsub.close()
+
+    async def test_coalesce_merges_deltas_then_disconnects_when_full(self):
+        recording = _recording_queued_subscriber()
+        subscriber = recording(gate=asyncio.Event(), max_queue_size=2)
+
+        await subscriber("first")  # taken by the writer, which blocks
+        await asyncio.sleep(0)
+        await subscriber("delta:a")
+        await subscriber("delta:b")
+        await subscriber("delta:c")
+        await subscriber("durable")
+        assert [event for event, _ in subscriber._queue] == ["delta:abc", "durable"]
+        assert subscriber.stats.coalesced == 2
+        assert not subscriber.disconnected
+
+        await subscriber("another")
+        await asyncio.sleep(0.01)
+        assert subscriber.disconnected
+        assert subscriber.stats.disconnected
+        assert subscriber.sent == []
+
+        # Nothing is delivered or queued once disconnected.
+        await subscriber("late")
+        assert subscriber.stats.depth == 0
+        await subscriber.close()
+
+    async def test_close_delivers_queued_events(self):
+        recording = _recording_queued_subscriber()
+        subscriber = recording()
+        for event in ("a", "b", "final"):
+            await subscriber(event)
+        writer = subscriber._writer
+        assert writer is not None
+
+        await subscriber.close()
+
+        assert subscriber.sent == ["A", "B", "FINAL"]
+        assert writer.done() and not writer.cancelled()
+
+    async def test_close_stops_writer(self):
+        recording = _recording_queued_subscriber()
+        subscriber = recording(gate=asyncio.Event(), close_timeout=0.01)
+        await subscriber("pending")
+        await asyncio.sleep(0)
+        writer = subscriber._writer
+        assert writer is not None
+
+        await subscriber.close()
+
+        assert writer.cancelled()
+        assert subscriber.sent == []
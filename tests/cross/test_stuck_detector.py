@@ -622,3 +622,80 @@ def test_reset_after_user_message():
 
     # Still not stuck with just one action after user message
     assert stuck_detector.is_stuck() is False
+
+
+def _ls_pair(i: int, output: str = "file1.txt\nfile2.txt") -> list:
+    action = ActionEvent(
+        source="agent",
+        thought=[TextContent(text="I need to run ls command")],
+        action=TerminalAction(command="ls"),
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+        tool_call=MessageToolCall(
+            id=f"call_{i}",
+            name="terminal",
+            arguments='{"command": "ls"}',
+            origin="completion",
+        ),
+        llm_response_id=f"response_{i}",
+    )
+    observation = ObservationEvent(
+        source="environment",
+        observation=TerminalObservation.from_text(
+            text=output, command="ls", exit_code=0
+        ),
+        action_id=action.id,
+        tool_name="terminal",
+        tool_call_id=f"call_{i}",
+    )
+    return [action, observation]
+
+
+def test_later_checks_only_fetch_and_compare_new_events(monkeypatch):
+    comparisons = []
+    original_event_eq = StuckDetector._event_eq
+
+    def counting_event_eq(self, event1, event2):
+        comparisons.append((event1.id, event2.id))
+        return original_event_eq(self, event1, event2)
+
+    monkeypatch.setattr(StuckDetector, "_event_eq", counting_event_eq)
+
+    user = MessageEvent(
+        source="user",
+        llm_message=Message(role="user", content=[TextContent(text="start")]),
+    )
+    spy_events = _SpySequence([user, *_ls_pair(0), *_ls_pair(1, "other"), *_ls_pair(2)])
+    stuck_detector = StuckDetector(_SpyState(spy_events))  # pyright: ignore[reportArgumentType]
+    assert stuck_detector.is_stuck() is False
+
+    for i in range(3, 6):
+        spy_events._items.extend(_ls_pair(i))
+        compared = len(comparisons)
+        assert stuck_detector.is_stuck() is (i == 5)
+        # Only the probe is fetched, and earlier pairs are not compared again.
+        assert spy_events.slice_requests[-1].start < 0
+        assert -spy_events.slice_requests[-1].start < (
+            MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION
+        )
+        assert len(set(comparisons[compared:])) == len(comparisons[compared:])
+        assert all(
+            spy_events._items[-2].id in pair or spy_events._items[-1].id in pair
+            for pair in comparisons[compared:]
+        )
+
+
+def test_branch_switch_refetches_window():
+    loop = [event for i in range(4) for event in _ls_pair(i)]
+    spy_events = _SpySequence(loop)
+    stuck_detector = StuckDetector(_SpyState(spy_events))  # pyright: ignore[reportArgumentType]
+    assert stuck_detector.is_stuck() is True
+
+    # Navigate to a branch that shares the first pair and then diverges.
+    spy_events._items = loop[:2] + [
+        event for i in range(4, 7) for event in _ls_pair(i, f"output {i}")
+    ]
+    assert stuck_detector.is_stuck() is False
+    assert spy_events.slice_requests[-1].start == (
+        -MAX_EVENTS_TO_SCAN_FOR_STUCK_DETECTION
+    )
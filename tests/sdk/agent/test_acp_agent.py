@@ -9227,6 +9227,30 @@ class TestACPBridgeMasking:
         assert tokens == ["the token is <secret-hidden>"]
         assert client.accumulated_text == ["the token is <secret-hidden>"]
 
+    @pytest.mark.asyncio
+    async def test_secret_split_across_chunks_masked_in_relay(self):
+        from acp.schema import AgentMessageChunk, TextContentBlock
+
+        from openhands.sdk.conversation.secret_registry import SecretRegistry
+
+        registry = SecretRegistry()
+        registry.update_secrets({"TOKEN": "SEKRET"})
+        client = _OpenHandsACPBridge()
+        client.mask = registry.mask_secrets_in_output
+        client.stream_masker = registry.streaming_masker
+        tokens: list[str] = []
+        client.on_token = tokens.append
+
+        for text in ("the token is SEK", "RET, done"):
+            chunk = MagicMock(spec=AgentMessageChunk)
+            chunk.content = MagicMock(spec=TextContentBlock)
+            chunk.content.text = text
+            await client.session_update("sess-1", chunk)
+        client.flush_token_stream()
+
+        assert "".join(tokens) == "the token is <secret-hidden>, done"
+        assert "SEK" not in tokens[0]
+
     @pytest.mark.asyncio
     async def test_thought_chunk_masked(self):
         from acp.schema import AgentThoughtChunk, TextContentBlock
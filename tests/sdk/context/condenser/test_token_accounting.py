@@ -0,0 +1,155 @@
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk.context.condenser.llm_summarizing_condenser import (
+    LLMSummarizingCondenser,
+    Reason,
+)
+from openhands.sdk.context.condenser.token_accounting import TokenAccounting
+from openhands.sdk.context.condenser.utils import (
+    get_shortest_prefix_above_token_count,
+    get_suffix_length_for_token_reduction,
+    get_total_token_count,
+)
+from openhands.sdk.context.view import View
+from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.event.llm_convertible.system import SystemPromptEvent
+from openhands.sdk.llm import LLM, Message, TextContent
+from openhands.sdk.tool import ToolDefinition
+from openhands.sdk.tool.builtins.finish import FinishTool
+
+
+REQUEST_OVERHEAD = 3
+TOOLS_TOKENS = 50
+
+
+def message_event(content: str) -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+@pytest.fixture
+def mock_llm() -> LLM:
+    """A mock LLM whose counts are additive apart from a per-request overhead."""
+    mock_llm = MagicMock(spec=LLM)
+
+    def mock_token_count(messages, tools=None, **_kwargs):
+        total_chars = sum(
+            len(content.text)
+            for msg in messages
+            for content in msg.content
+            if hasattr(content, "text")
+        )
+        return REQUEST_OVERHEAD + total_chars // 4 + (TOOLS_TOKENS if tools else 0)
+
+    mock_llm.get_token_count.side_effect = mock_token_count
+    return mock_llm
+
+
+def token_count_calls(llm: LLM) -> int:
+    return cast(MagicMock, llm.get_token_count).call_count
+
+
+def test_total_matches_full_count(mock_llm: LLM):
+    tools = cast(list[ToolDefinition], list(FinishTool.create()))
+    events: list[LLMConvertibleEvent] = [
+        SystemPromptEvent(
+            source="agent", system_prompt=TextContent(text="S" * 40), tools=tools
+        ),
+        *(message_event(c * 40) for c in "ABCD"),
+    ]
+    accounting = TokenAccounting(mock_llm)
+
+    assert accounting.total(events) == get_total_token_count(events, mock_llm)
+    assert accounting.total([]) == REQUEST_OVERHEAD
+
+
+def test_growing_view_only_counts_new_events(mock_llm: LLM):
+    accounting = TokenAccounting(mock_llm)
+    events: list[LLMConvertibleEvent] = [message_event("A" * 40) for _ in range(10)]
+    assert accounting.total(events) == REQUEST_OVERHEAD + 100
+
+    for step in range(1, 6):
+        calls = token_count_calls(mock_llm)
+        events.append(message_event("B" * 40))
+        assert accounting.total(events) == REQUEST_OVERHEAD + 100 + 10 * step
+        assert token_count_calls(mock_llm) == calls + 1
+
+    assert len(accounting) == 15
+
+
+def test_condensed_view_reuses_counts(mock_llm: LLM):
+    accounting = TokenAccounting(mock_llm)
+    events: list[LLMConvertibleEvent] = [message_event("A" * 40) for _ in range(10)]
+    accounting.total(events)
+    calls = token_count_calls(mock_llm)
+
+    # Forget a middle range and insert a summary in its place.
+    condensed = [*events[:2], message_event("S" * 20), *events[7:]]
+    assert accounting.total(condensed) == REQUEST_OVERHEAD + 5 * 10 + 5
+    assert token_count_calls(mock_llm) == calls + 1
+
+
+def test_tool_schemas_are_counted_once(mock_llm: LLM):
+    tools = cast(list[ToolDefinition], list(FinishTool.create()))
+    system = SystemPromptEvent(
+        source="agent", system_prompt=TextContent(text="system"), tools=tools
+    )
+    accounting = TokenAccounting(mock_llm)
+
+    event = message_event("A" * 40)
+    first = accounting.total([system, event])
+    calls = token_count_calls(mock_llm)
+    second = accounting.total([system, event, message_event("")])
+
+    assert first == second
+    assert first == REQUEST_OVERHEAD + TOOLS_TOKENS + 1 + 10
+    assert token_count_calls(mock_llm) == calls + 1
+
+
+@pytest.mark.parametrize("threshold", [0, 5, 10, 15, 25, 40, 100])
+def test_prefix_and_suffix_queries_match_utils(mock_llm: LLM, threshold: int):
+    base_events = [message_event("kept system-like prefix")]
+    events = [message_event(c * 40) for c in "ABCD"]
+    accounting = TokenAccounting(mock_llm)
+
+    assert accounting.shortest_prefix_above(
+        events, threshold, base_events=base_events
+    ) == get_shortest_prefix_above_token_count(
+        events, mock_llm, threshold, base_events=base_events
+    )
+    assert accounting.suffix_length_for_reduction(
+        events, threshold, base_events=base_events
+    ) == get_suffix_length_for_token_reduction(
+        events, mock_llm, threshold, base_events=base_events
+    )
+
+
+def test_condenser_keeps_accounting_per_agent_llm(mock_llm: LLM):
+    condenser = LLMSummarizingCondenser(
+        llm=LLM(model="gpt-4o", api_key=SecretStr("fake-key"), usage_id="condenser"),
+        max_size=1000,
+        max_tokens=100,
+        keep_first=2,
+    )
+    cast(MagicMock, mock_llm).effective_max_input_tokens = None
+    events = [message_event("A" * 40) for _ in range(9)]
+
+    assert not condenser.get_condensation_reasons(View.from_events(events), mock_llm)
+    calls = token_count_calls(mock_llm)
+    events.append(message_event("A" * 40))
+    reasons = condenser.get_condensation_reasons(View.from_events(events), mock_llm)
+    assert reasons == {Reason.TOKENS}
+    assert token_count_calls(mock_llm) == calls + 1
+
+    other_llm = MagicMock(spec=LLM)
+    other_llm.effective_max_input_tokens = None
+    other_llm.get_token_count.return_value = 0
+    condenser.get_condensation_reasons(View.from_events(events), other_llm)
+    assert other_llm.get_token_count.call_count == len(events) + 1
@@ -6,6 +6,7 @@ We keep these tests focused on behavior and avoid "tests that test that code exi
 High-value behavior:
 - WebSocketCallbackClient.wait_until_ready() obeys timeout and unblocks on signals.
 - RemoteEventsList.reconcile() deduplicates events by id and is idempotent.
+- RemoteEventsList.reconcile() fetches only events after its synced prefix.
 """
 
 import threading
@@ -15,6 +16,7 @@ from openhands.sdk.conversation.impl.remote_conversation import (
     RemoteEventsList,
     WebSocketCallbackClient,
 )
+from openhands.sdk.event.base import Event
 from openhands.sdk.event.conversation_state import FULL_STATE_KEY
 
 
@@ -192,3 +194,64 @@ class TestRemoteEventsListReconciliation:
 
             assert events_list.reconcile() == 0
             assert [e.id for e in events_list] == ["event-1", "event-2"]
+
+    def test_reconcile_fetches_only_events_after_synced_prefix(self):
+        mock_client = MagicMock()
+
+        def make_state_event(event_id: str, timestamp: str) -> dict:
+            return {
+                "kind": "ConversationStateUpdateEvent",
+                "id": event_id,
+                "timestamp": timestamp,
+                "source": "environment",
+                "key": FULL_STATE_KEY,
+                "value": {"execution_status": "idle"},
+            }
+
+        event_2 = make_state_event("event-2", "2024-01-01T00:00:02Z")
+        event_3 = make_state_event("event-3", "2024-01-01T00:00:03Z")
+        with patch(
+            "openhands.sdk.conversation.impl.remote_conversation._send_request"
+        ) as mock_send:
+            mock_response = MagicMock()
+            mock_response.json.side_effect = [
+                {
+                    "items": [
+                        make_state_event("event-1", "2024-01-01T00:00:01Z"),
+                        event_2,
+                    ],
+                    "next_page_id": None,
+                },
+                {"items": [event_3], "next_page_id": "event-4"},
+                {"items": [], "next_page_id": None},
+                {"items": [], "next_page_id": None},
+            ]
+            mock_send.return_value = mock_response
+
+            events_list = RemoteEventsList(mock_client, "test-conv-id")
+            assert "after_event_id" not in mock_send.call_args.kwargs["params"]
+
+            # A WebSocket event does not move the cursor: events logged
+            # before it may not have been delivered.
+            events_list.add_event(
+                Event.model_validate(
+                    make_state_event("event-5", "2024-01-01T00:00:05Z")
+                )
+            )
+
+            assert events_list.reconcile() == 1
+            params = [call.kwargs["params"] for call in mock_send.call_args_list]
+            assert params[1] == {"limit": 100, "after_event_id": "event-2"}
+            assert params[2] == {"limit": 100, "page_id": "event-4"}
+
+            assert events_list.reconcile() == 0
+            assert mock_send.call_args.kwargs["params"] == {
+                "limit": 100,
+                "after_event_id": "event-3",
+            }
+            assert [e.id for e in events_list] == [
+                "event-1",
+                "event-2",
+                "event-3",
+                "event-5",
+            ]
@@ -0,0 +1,145 @@
+"""Tests for the EventLog secondary search index."""
+
+import threading
+
+import pytest
+
+from openhands.sdk.conversation.event_index import EventSearchIndex
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.persistence_const import EVENT_SEARCH_INDEX
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import InMemoryFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+MESSAGE_KIND = "openhands.sdk.event.llm_convertible.message.MessageEvent"
+
+
+def _message(i: int, text: str, source: str = "user") -> MessageEvent:
+    return MessageEvent(
+        id=f"00000000-0000-0000-0000-{i:012d}",
+        llm_message=Message(
+            role="user" if source == "user" else "assistant",
+            content=[TextContent(text=text)],
+        ),
+        source=source,  # type: ignore[arg-type]
+        timestamp=f"2026-01-01T00:00:{i:02d}",
+    )
+
+
+@pytest.fixture
+def fs():
+    return InMemoryFileStore()
+
+
+def test_append_maintains_index_rows(fs):
+    log = EventLog(fs)
+    log.append(_message(0, "Hello World"))
+    log.append(_message(1, "bye", source="agent"))
+
+    index = EventLog(fs).search_index
+    assert len(index) == 2
+    assert index.matches(0, kind=MESSAGE_KIND, source="user") is True
+    assert index.matches(1, source="user") is False
+    assert index.matches(1, timestamp_gte="2026-01-01T00:00:01") is True
+    assert index.matches(0, timestamp_lt="2026-01-01T00:00:00") is False
+    assert index.matches(5) is None
+
+
+def test_append_indexes_only_once_search_index_is_used(fs):
+    sidecar = f"events/{EVENT_SEARCH_INDEX}"
+    log = EventLog(fs)
+    log.append(_message(0, "not indexed yet"))
+    assert not fs.exists(sidecar)
+
+    assert len(log.search_index) == 1
+    log.append(_message(1, "indexed on append"))
+    # A log opened over an existing sidecar keeps it up to date.
+    EventLog(fs).append(_message(2, "from another instance"))
+
+    index = EventSearchIndex(fs, sidecar)
+    index.refresh()
+    assert len(index) == 3
+
+
+def test_index_backfills_legacy_log(fs):
+    log = EventLog(fs)
+    log.append(_message(0, "one"))
+    log.append(_message(1, "two"))
+    fs.delete(f"events/{EVENT_SEARCH_INDEX}")
+
+    index = EventLog(fs).search_index
+    assert len(index) == 2
+    # The backfilled rows are persisted for the next reader.
+    assert len(EventLog(fs).search_index) == 2
+
+
+def test_index_picks_up_rows_from_other_writer(fs):
+    reader = EventLog(fs)
+    assert len(reader.search_index) == 0
+    writer = EventLog(fs)
+    writer.search_index  # enable recording on append
+    writer.append(_message(0, "from elsewhere"))
+
+    index = EventSearchIndex(fs, f"events/{EVENT_SEARCH_INDEX}")
+    index.refresh()
+    assert index.matches(0, source="user") is True
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("hello", {0}),
+        ("ELL", {0}),
+        ("lo wor", {0}),
+        ("hello world again", {0}),
+        ("world", {0, 1}),
+        ("orl", {0, 1}),
+        ("missing", set()),
+    ],
+)
+def test_body_candidates(fs, query, expected):
+    log = EventLog(fs)
+    log.append(_message(0, "Hello world again"))
+    log.append(_message(1, "the world"))
+
+    assert log.search_index.body_candidates(query) == expected
+
+
+def test_body_candidates_without_word_characters(fs):
+    log = EventLog(fs)
+    log.append(_message(0, "a - b"))
+    assert log.search_index.body_candidates(" - ") is None
+
+
+def test_body_token_index_can_be_disabled(fs):
+    log = EventLog(fs, index_body=False)
+    log.append(_message(0, "hello"))
+    index = log.search_index
+    row = index.get(0)
+    assert row is not None and row.searchable
+    assert index.body_candidates("hello") is None
+
+
+def test_search_while_appending_from_another_thread(fs):
+    log = EventLog(fs)
+    index = log.search_index
+    errors: list[BaseException] = []
+
+    def append_events() -> None:
+        try:
+            for i in range(200):
+                log.append(_message(i, f"word{i} shared"))
+        except BaseException as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=append_events)
+    writer.start()
+    while writer.is_alive():
+        # Iterating the postings and rows must not race the appender.
+        index.body_candidates("word")
+        list(index.searchable())
+    writer.join()
+
+    assert not errors
+    assert index.body_candidates("shared") == set(range(200))
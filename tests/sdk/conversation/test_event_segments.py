@@ -0,0 +1,147 @@
+"""Tests for the segmented EventLog storage backend."""
+
+import uuid
+
+import pytest
+
+from openhands.sdk.conversation.event_segments import (
+    SegmentedEventStorage,
+    migrate_to_segments,
+)
+from openhands.sdk.conversation.event_store import EventLog, EventLogFormat
+from openhands.sdk.conversation.persistence_const import EVENT_SEGMENT_INDEX
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import InMemoryFileStore, LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def _event(content: str = "hello", parent_id: str | None = None) -> MessageEvent:
+    return MessageEvent(
+        id=str(uuid.uuid4()),
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+        parent_id=parent_id,
+    )
+
+
+@pytest.fixture(params=["memory", "local"])
+def fs(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryFileStore()
+    return LocalFileStore(str(tmp_path))
+
+
+def test_segmented_log_round_trip(fs):
+    log = EventLog(fs, log_format=EventLogFormat.SEGMENTED)
+    events = [_event(f"event {i}") for i in range(20)]
+    for event in events:
+        log.append(event)
+
+    reopened = EventLog(fs)
+    assert reopened.log_format == EventLogFormat.SEGMENTED
+    assert len(reopened) == 20
+    assert [e.id for e in reopened] == [e.id for e in events]
+    assert reopened.get_index(events[7].id) == 7
+    assert reopened.get_id(-1) == events[-1].id
+    assert [e.id for e in reopened[3:6]] == [e.id for e in events[3:6]]
+    # No per-event files are created.
+    assert not any("event-" in p for p in fs.list("events"))
+
+
+def test_segmented_log_rolls_segments(fs):
+    log = EventLog(fs, log_format=EventLogFormat.SEGMENTED, max_segment_bytes=1024)
+    for i in range(30):
+        log.append(_event("x" * 200 + str(i)))
+
+    segments = [p for p in fs.list("events") if "segment-" in p]
+    assert len(segments) > 1
+
+    reopened = EventLog(fs, max_segment_bytes=1024)
+    assert [e.id for e in reopened] == [e.id for e in log]
+
+
+def test_segmented_log_path_to_root(fs):
+    log = EventLog(fs, log_format=EventLogFormat.SEGMENTED)
+    root = _event("root")
+    log.append(root)
+    child = _event("child", parent_id=root.id)
+    log.append(child)
+    sibling = _event("sibling", parent_id=root.id)
+    log.append(sibling)
+
+    reopened = EventLog(fs)
+    assert [e.id for e in reopened.path_to_root(sibling.id)] == [root.id, sibling.id]
+    assert [e.id for e in reopened.path_to_root(child.id)] == [root.id, child.id]
+
+
+def test_segmented_log_syncs_writes_from_other_instance(fs):
+    log1 = EventLog(fs, log_format=EventLogFormat.SEGMENTED)
+    log1.append(_event("first"))
+    log2 = EventLog(fs)
+    log1.append(_event("second"))
+
+    log2.append(_event("third"))
+
+    assert len(log2) == 3
+    assert log2[1].id == log1[1].id
+    log1.append(_event("fourth"))
+    assert len(log1) == 4
+
+
+def test_segmented_log_ignores_torn_index_tail(fs):
+    log = EventLog(fs, log_format=EventLogFormat.SEGMENTED)
+    first = _event("first")
+    log.append(first)
+    # Simulate a crash in the middle of writing the next index line.
+    fs.append(f"events/{EVENT_SEGMENT_INDEX}", b"1\t0\t12")
+
+    reopened = EventLog(fs)
+    assert len(reopened) == 1
+    second = _event("second")
+    reopened.append(second)
+
+    again = EventLog(fs)
+    assert [e.id for e in again] == [first.id, second.id]
+
+
+def test_existing_per_file_log_stays_readable(fs):
+    legacy = EventLog(fs, log_format=EventLogFormat.FILES)
+    events = [_event(f"legacy {i}") for i in range(3)]
+    for event in events:
+        legacy.append(event)
+
+    # Requesting the segmented format does not hide per-file history.
+    log = EventLog(fs, log_format=EventLogFormat.SEGMENTED)
+    assert log.log_format == EventLogFormat.FILES
+    assert [e.id for e in log] == [e.id for e in events]
+
+
+def test_migrate_to_segments(fs):
+    legacy = EventLog(fs, log_format=EventLogFormat.FILES)
+    events = [_event(f"legacy {i}") for i in range(5)]
+    for event in events:
+        legacy.append(event)
+
+    assert migrate_to_segments(fs, "events") == 5
+
+    assert not any("event-" in p for p in fs.list("events"))
+    log = EventLog(fs)
+    assert log.log_format == EventLogFormat.SEGMENTED
+    assert [e.id for e in log] == [e.id for e in events]
+    log.append(_event("after migration"))
+    assert len(EventLog(fs)) == 6
+
+
+def test_migrate_refuses_segmented_directory(fs):
+    EventLog(fs, log_format=EventLogFormat.SEGMENTED).append(_event())
+    assert SegmentedEventStorage.exists(fs, "events")
+    with pytest.raises(ValueError, match="already holds a segmented event log"):
+        migrate_to_segments(fs, "events")
+
+
+def test_log_format_from_environment(fs, monkeypatch):
+    monkeypatch.setenv("OPENHANDS_EVENT_LOG_FORMAT", "segmented")
+    log = EventLog(fs)
+    log.append(_event())
+    assert log.log_format == EventLogFormat.SEGMENTED
+    assert SegmentedEventStorage.exists(fs, "events")
@@ -5,13 +5,14 @@ from unittest.mock import Mock
 
 import pytest
 
-from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.event_store import SEQUENCE_FILE_NAME, EventLog
 from openhands.sdk.conversation.persistence_const import (
     EVENT_FILE_PATTERN,
     EVENT_NAME_RE,
     EVENTS_DIR,
 )
 from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io.local import LocalFileStore
 from openhands.sdk.io.memory import InMemoryFileStore
 from openhands.sdk.llm import Message, TextContent
 
@@ -413,7 +414,7 @@ def test_event_log_concurrent_writes_serialized():
         assert log1._length == 1
         assert log2._length == 2
 
-        files = [f for f in fs.list("events") if not f.endswith(".lock")]
+        files = [f for f in fs.list("events") if "/event-" in f]
         assert len(files) == 2
 
 
@@ -544,3 +545,116 @@ def test_event_log_cold_reload_past_100k_events():
     # Appending after reload keeps length accounting consistent.
     log.append(create_test_event("after-reload", "after"))
     assert len(log) == n + 1
+
+
+def test_append_skips_directory_listing_for_single_writer():
+    """With an up-to-date sequence file, append never lists the directory."""
+    fs = InMemoryFileStore()
+    log = EventLog(fs)
+    log.append(create_test_event("first", "First"))
+
+    fs.list = Mock(side_effect=AssertionError("unexpected directory listing"))
+    for i in range(5):
+        log.append(create_test_event(f"event-{i}", "More"))
+
+    assert len(log) == 6
+    assert fs.read(f"{EVENTS_DIR}/{SEQUENCE_FILE_NAME}") == "6"
+
+
+def test_append_syncs_when_sequence_file_advanced():
+    """A foreign append bumps the sequence, forcing a sync before writing."""
+    fs = InMemoryFileStore()
+    log1 = EventLog(fs)
+    log2 = EventLog(fs)
+    log1.append(create_test_event("00000000-0000-0000-0000-000000000001", "First"))
+    log1.append(create_test_event("00000000-0000-0000-0000-000000000002", "Second"))
+
+    log2.append(create_test_event("00000000-0000-0000-0000-000000000003", "Third"))
+
+    assert len(log2) == 3
+    assert log2.get_index("00000000-0000-0000-0000-000000000002") == 1
+    assert len(EventLog(fs)) == 3
+
+
+def test_append_lists_directory_without_sequence_file():
+    """Logs written before the sequence file existed fall back to listing."""
+    fs = InMemoryFileStore()
+    log = EventLog(fs)
+    legacy_id = "00000000-0000-0000-0000-00000000000a"
+    payload = create_test_event(legacy_id, "Legacy").model_dump_json(exclude_none=True)
+    # Another (older) writer adds an event without touching the sequence file.
+    fs.write(f"{EVENTS_DIR}/event-00000-{legacy_id}.json", payload)
+
+    log.append(create_test_event("00000000-0000-0000-0000-00000000000b", "New"))
+
+    assert len(log) == 2
+    assert log.get_index(legacy_id) == 0
+
+
+def test_event_cache_bounded_by_entry_count(tmp_path):
+    """Old events are evicted beyond the limit and re-read from disk."""
+    fs = LocalFileStore(str(tmp_path))
+    log = EventLog(fs, cache_max_events=4)
+    log._event_cache.pin_recent = 2
+
+    for i in range(10):
+        log.append(create_test_event(f"evt-{i}", f"Content {i}"))
+
+    assert len(log._event_cache) == 4
+    stats = log.cache_stats
+    assert stats.evictions == 6
+    assert stats.entries == 4
+
+    # Evicted events hydrate lazily from disk.
+    assert log[0].id == "evt-0"
+    assert log.cache_stats.misses == stats.misses + 1
+    assert [e.id for e in log] == [f"evt-{i}" for i in range(10)]
+
+
+def test_event_cache_bounded_by_bytes_keeps_recent_pinned(tmp_path):
+    """The byte budget evicts older events but never the pinned tail."""
+    fs = LocalFileStore(str(tmp_path))
+    log = EventLog(fs, cache_max_bytes=2_000)
+    log._event_cache.pin_recent = 3
+
+    for i in range(8):
+        log.append(create_test_event(f"evt-{i}", "x" * 400))
+
+    assert all(i in log._event_cache for i in (5, 6, 7))
+    assert 0 not in log._event_cache
+    assert log.cache_stats.bytes <= 2_000
+
+
+def test_event_cache_counts_hits_and_misses():
+    fs = InMemoryFileStore()
+    EventLog(fs).append(
+        create_test_event("00000000-0000-0000-0000-000000000001", "Hello")
+    )
+
+    log = EventLog(fs)
+    log[0]
+    log[0]
+    stats = log.cache_stats
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_event_cache_limits_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENHANDS_EVENT_CACHE_MAX_EVENTS", "7")
+    monkeypatch.setenv("OPENHANDS_EVENT_CACHE_MAX_BYTES", "1234")
+    log = EventLog(LocalFileStore(str(tmp_path)))
+    assert log._event_cache.max_events == 7
+    assert log._event_cache.max_bytes == 1234
+
+
+def test_event_cache_keeps_events_the_in_memory_store_evicted():
+    """An in-memory store drops files itself, so the cache must not."""
+    fs = InMemoryFileStore(max_memory=20_000)
+    log = EventLog(fs, cache_max_events=4, cache_max_bytes=2_000)
+
+    for i in range(100):
+        log.append(create_test_event(f"evt-{i}", "x" * 1_000))
+
+    assert not fs.exists(log._path(0))
+    assert [log[i].id for i in range(100)] == [f"evt-{i}" for i in range(100)]
+    assert [e.id for e in log] == [f"evt-{i}" for i in range(100)]
+    assert log.cache_stats.evictions == 0
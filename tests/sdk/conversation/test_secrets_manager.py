@@ -451,3 +451,68 @@ def test_mask_secrets_retries_until_source_succeeds():
     assert secret_registry.mask_secrets_in_output("leak: recovered-value") == (
         "leak: <secret-hidden>"
     )
+
+
+def test_mask_secrets_masks_overlapping_values_whole():
+    """A value containing another is masked whole, whatever the key order."""
+    secret_registry = SecretRegistry()
+    secret_registry.update_secrets({"SHORT": "abc123", "LONG": "abc123-extended"})
+
+    masked = secret_registry.mask_secrets_in_output("a=abc123-extended b=abc123")
+    assert masked == "a=<secret-hidden> b=<secret-hidden>"
+
+
+def test_matcher_is_cached_per_registry_and_rebuilt_on_change():
+    secret_registry = SecretRegistry()
+    secret_registry.update_secrets({"TOKEN": "first-secret"})
+    matcher = secret_registry._current_matcher()
+    assert secret_registry._current_matcher() is matcher
+    # Another registry with the same values does not share it.
+    other = SecretRegistry()
+    other.update_secrets({"TOKEN": "first-secret"})
+    assert other._current_matcher() is not matcher
+
+    secret_registry.update_secrets({"OTHER": "second-secret"})
+    assert secret_registry._current_matcher() is not matcher
+    assert secret_registry.mask_secrets_in_output("second-secret") == (
+        "<secret-hidden>"
+    )
+
+
+def test_streaming_masker_masks_secrets_split_across_chunks():
+    secret_registry = SecretRegistry()
+    secret_registry.update_secrets({"TOKEN": "ghp_streamedsecret"})
+    masker = secret_registry.streaming_masker()
+
+    chunks = ["token: ghp_str", "eamed", "secret and ", "ghp_streamedsecret", "!"]
+    emitted = [masker.feed(chunk) for chunk in chunks]
+    emitted.append(masker.flush())
+
+    assert "".join(emitted) == "token: <secret-hidden> and <secret-hidden>!"
+    assert all("ghp_" not in piece for piece in emitted)
+
+
+def test_streaming_masker_picks_up_secrets_added_mid_stream():
+    secret_registry = SecretRegistry()
+    masker = secret_registry.streaming_masker()
+    assert masker.feed("before ") == "before "
+
+    secret_registry.update_secrets({"LATE": "late-secret"})
+    emitted = masker.feed("late-sec") + masker.feed("ret after") + masker.flush()
+    assert emitted == "<secret-hidden> after"
+
+
+def test_find_secrets_in_text_lowercases_text_once():
+    secret_registry = SecretRegistry()
+    secret_registry.update_secrets({f"KEY_{i}": f"value-{i}" for i in range(20)})
+
+    class CountingText(str):
+        lowered = 0
+
+        def lower(self):
+            CountingText.lowered += 1
+            return super().lower()
+
+    found = secret_registry.find_secrets_in_text(CountingText("echo $key_3 $KEY_7"))
+    assert found == {"KEY_3", "KEY_7"}
+    assert CountingText.lowered == 1
@@ -6,7 +6,7 @@ from typing import cast
 
 import pytest
 
-from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.event.base import LLMConvertibleEvent, MessageProjectionCache
 from openhands.sdk.event.condenser import CondensationSummaryEvent
 from openhands.sdk.event.llm_convertible import (
     ActionEvent,
@@ -23,6 +23,7 @@ from openhands.sdk.llm import (
     TextContent,
     ThinkingBlock,
 )
+from openhands.sdk.llm.utils.message_cache import is_frozen
 from openhands.sdk.tool import Action, Observation
 
 
@@ -737,3 +738,74 @@ class TestEventsToMessages:
         assert msgs[0].role == "assistant"
         assert msgs[1].role == "tool"
         assert msgs[1].tool_call_id == "call_ne"
+
+
+class TestEventsToMessagesCache:
+    """events_to_messages with a per-conversation MessageProjectionCache."""
+
+    @staticmethod
+    def _history() -> list[LLMConvertibleEvent]:
+        return [
+            MessageEvent(
+                source="user",
+                llm_message=Message(role="user", content=[TextContent(text="hi")]),
+            ),
+            create_action_event("Checking", "terminal", "call_1", "resp_1", {}),
+            ActionEvent(
+                source="agent",
+                thought=[],
+                action=EventsToMessagesMockAction(command="test"),
+                tool_name="terminal",
+                tool_call_id="call_2",
+                tool_call=create_tool_call("call_2", "terminal", {}),
+                llm_response_id="resp_1",
+            ),
+            ObservationEvent(
+                source="environment",
+                observation=EventsToMessagesMockObservation(result="done"),
+                action_id="action_1",
+                tool_name="terminal",
+                tool_call_id="call_1",
+            ),
+        ]
+
+    def test_cached_projection_matches_and_reuses_messages(self):
+        events = self._history()
+        cache = MessageProjectionCache()
+
+        first = LLMConvertibleEvent.events_to_messages(events, cache=cache)
+        assert first == LLMConvertibleEvent.events_to_messages(events)
+        assert all(is_frozen(message) for message in first)
+        # The two ActionEvents of one response share a single entry.
+        assert len(cache) == 3
+
+        tail = MessageEvent(
+            source="agent",
+            llm_message=Message(role="assistant", content=[TextContent(text="ok")]),
+        )
+        second = LLMConvertibleEvent.events_to_messages([*events, tail], cache=cache)
+        assert all(a is b for a, b in zip(first, second[:3]))
+        assert second[3].content[0] == TextContent(text="ok")
+
+        # Entries of events that left the projection are dropped.
+        LLMConvertibleEvent.events_to_messages(events[3:], cache=cache)
+        assert len(cache) == 1
+
+    def test_merging_does_not_mutate_cached_messages(self):
+        events = cast(
+            list[LLMConvertibleEvent],
+            [
+                MessageEvent(
+                    source="user",
+                    llm_message=Message(role="user", content=[TextContent(text=t)]),
+                )
+                for t in ("task", "context")
+            ],
+        )
+        cache = MessageProjectionCache()
+
+        merged = LLMConvertibleEvent.events_to_messages(events, cache=cache)
+        assert len(merged) == 1 and len(merged[0].content) == 2
+
+        alone = LLMConvertibleEvent.events_to_messages(events[:1], cache=cache)
+        assert alone[0].content == [TextContent(text="task")]
@@ -0,0 +1,39 @@
+"""Tests for InMemoryFileStore append and ranged reads."""
+
+import pytest
+
+from openhands.sdk.io import InMemoryFileStore
+
+
+def test_append_returns_offsets_and_reads_back():
+    fs = InMemoryFileStore()
+    assert fs.append("log", b"abc") == 0
+    assert fs.append("log", "déf") == 3
+    assert fs.read("log") == "abcdéf"
+    assert fs.read_range("log", 3) == "déf".encode()
+    assert fs.read_range("log", 1, 2) == b"b"
+
+
+def test_append_to_written_file_and_overwrite():
+    fs = InMemoryFileStore()
+    fs.write("log", "head\n")
+    assert fs.append("log", b"tail\n") == 5
+    assert fs.read("log") == "head\ntail\n"
+    fs.write("log", "new")
+    assert fs.read_range("log") == b"new"
+
+
+def test_append_keeps_memory_accounting():
+    fs = InMemoryFileStore(max_memory=100)
+    for _ in range(10):
+        fs.append("log", b"x" * 10)
+    assert fs.files.current_memory == 100
+    # Growing past the limit drops the file rather than exceeding it.
+    fs.append("log", b"x")
+    assert not fs.exists("log")
+    assert fs.files.current_memory == 0
+
+
+def test_read_range_missing_file():
+    with pytest.raises(FileNotFoundError):
+        InMemoryFileStore().read_range("missing")
@@ -0,0 +1,141 @@
+"""Tests for the copy-free message formatting path of format_messages_for_llm."""
+
+import copy
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.llm.utils.message_cache import freeze_message, is_frozen
+
+
+def _history(turns: int) -> list[Message]:
+    messages = [
+        Message(
+            role="system",
+            content=[TextContent(text="static"), TextContent(text="dynamic")],
+        ),
+        Message(role="user", content=[TextContent(text="fix the bug")]),
+    ]
+    for i in range(turns):
+        messages.append(
+            Message(
+                role="assistant",
+                content=[TextContent(text=f"step {i}")],
+                tool_calls=[
+                    MessageToolCall(
+                        id=f"call_{i}",
+                        name="terminal",
+                        arguments='{"command": "ls"}',
+                        origin="completion",
+                    )
+                ],
+            )
+        )
+        messages.append(
+            Message(
+                role="tool",
+                content=[TextContent(text=f"output {i}")],
+                tool_call_id=f"call_{i}",
+                name="terminal",
+            )
+        )
+    return messages
+
+
+@pytest.mark.parametrize("caching_prompt", [True, False])
+def test_frozen_messages_format_like_fresh_ones(caching_prompt):
+    llm = LLM(
+        model="claude-sonnet-4-20250514",
+        api_key=SecretStr("fake-key"),
+        usage_id="test",
+        caching_prompt=caching_prompt,
+    )
+    frozen = [freeze_message(m) for m in _history(3)]
+
+    for turns in (3, 4, 5):
+        # Each step appends to the same frozen prefix, as the event projection
+        # does, so the previous breakpoint message becomes a cached one.
+        frozen += [freeze_message(m) for m in _history(turns)[len(frozen) :]]
+        expected = llm.format_messages_for_llm(copy.deepcopy(frozen))
+        assert llm.format_messages_for_llm(frozen) == expected
+        assert llm.format_messages_for_llm(frozen) == expected
+
+    # Only the last tool message carries the cache breakpoint.
+    formatted = llm.format_messages_for_llm(frozen)
+    marked = [i for i, m in enumerate(formatted) if "cache_control" in m]
+    assert marked == ([len(frozen) - 1] if caching_prompt else [])
+
+
+def test_reused_chat_dicts_are_copies():
+    llm = LLM(model="gpt-4o", api_key=SecretStr("fake-key"), usage_id="test")
+    messages = [freeze_message(m) for m in _history(2)]
+
+    first = llm.format_messages_for_llm(messages)
+    first[2]["content"][0]["text"] = "mutated"
+    first[2]["tool_calls"].clear()
+
+    assert llm.format_messages_for_llm(messages) == llm.format_messages_for_llm(
+        copy.deepcopy(messages)
+    )
+
+
+def test_copies_and_image_messages_are_not_reused():
+    llm = LLM(model="gpt-4o", api_key=SecretStr("fake-key"), usage_id="test")
+    message = freeze_message(
+        Message(
+            role="user",
+            content=[
+                TextContent(text="look"),
+                ImageContent(image_urls=["data:image/png;base64,AAAA"]),
+            ],
+        )
+    )
+    assert is_frozen(message)
+    assert not is_frozen(copy.deepcopy(message))
+    assert not is_frozen(message.model_copy())
+
+    messages = [freeze_message(m) for m in _history(1)]
+    messages.insert(2, message)
+    reused, pending = llm._reuse_chat_dicts(messages)
+    # Re-rendered: the system message, the image message and the last tool
+    # message (prompt-caching breakpoint); reused: the earlier user and
+    # assistant messages.
+    assert [d is None for d in reused] == [True, False, True, False, True]
+    assert pending == [messages[0], message, messages[4]]
+
+
+def test_prompt_caching_flags_do_not_modify_input_messages():
+    llm = LLM(
+        model="claude-sonnet-4-20250514",
+        api_key=SecretStr("fake-key"),
+        usage_id="test",
+        caching_prompt=True,
+    )
+    messages = _history(2)
+    before = copy.deepcopy(messages)
+
+    prepared = llm._prepare_chat_messages(messages)
+    formatted = llm.format_messages_for_llm(messages)
+
+    assert messages == before
+    # Only the two prompt-caching breakpoints are copied.
+    shared = [p is m for p, m in zip(prepared, messages)]
+    assert shared == [False, True, True, True, True, False]
+    assert prepared[0].content[0].cache_prompt is True
+    assert prepared[-1].content[-1].cache_prompt is True
+    assert formatted == llm.format_messages_for_llm(copy.deepcopy(messages))
+
+
+def test_chat_template_messages_do_not_modify_input_dicts():
+    llm = LLM(model="gpt-4o", api_key=SecretStr("fake-key"), usage_id="test")
+    formatted = llm.format_messages_for_llm(_history(1))
+    before = copy.deepcopy(formatted)
+
+    template_messages = LLM._messages_for_chat_template(formatted)
+
+    assert formatted == before
+    assert template_messages[1]["content"] == "fix the bug"
+    assert template_messages[2]["tool_calls"][0]["function"]["arguments"] == {
+        "command": "ls"
+    }
@@ -634,7 +634,7 @@ def test_ssrf_blocks_redirect_to_private_ip(monkeypatch: pytest.MonkeyPatch):
 def test_sync_and_async_formatters_produce_identical_output():
     """``aformat_messages_for_llm`` must match ``format_messages_for_llm``.
 
-    The async path duplicates ``_prepare_chat_messages`` (deepcopy + caching +
+    The async path duplicates ``_prepare_chat_messages`` (list copy + caching +
     inline + resize) so it can ``await`` the inline pass. This test guards
     against silent drift if a future preparation pass is added to one path
     and not the other.
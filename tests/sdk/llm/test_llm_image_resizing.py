@@ -2,13 +2,23 @@ import base64
 import io
 from unittest.mock import patch
 
+import pytest
 from PIL import Image
 from pydantic import SecretStr
 
 from openhands.sdk.llm import LLM, ImageContent, Message, TextContent
+from openhands.sdk.llm.utils import image_resize
+from openhands.sdk.llm.utils.image_inline import _CACHE, _DataUrlCache
 from openhands.sdk.llm.utils.image_resize import maybe_resize_messages_for_provider
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _CACHE.clear()
+    yield
+    _CACHE.clear()
+
+
 def _make_png_data_url(width: int, height: int) -> str:
     image = Image.new("RGB", (width, height), color="red")
     buffer = io.BytesIO()
@@ -223,3 +233,61 @@ def test_non_anthropic_many_image_requests_do_not_resize():
     image_urls = _image_urls_from_chat_message(formatted[0])
     assert len(image_urls) == 25
     assert _data_url_dimensions(image_urls[0]) == (2400, 1200)
+
+
+def test_resized_images_are_cached_by_content_and_limit():
+    original_url = _make_png_data_url(2400, 1200)
+    messages = [
+        Message(role="user", content=[ImageContent(image_urls=[original_url] * 21)])
+    ]
+
+    with patch.object(
+        image_resize,
+        "_resize_base64_image",
+        wraps=image_resize._resize_base64_image,
+    ) as resize:
+        first = maybe_resize_messages_for_provider(
+            messages, provider="anthropic", vision_enabled=True
+        )
+        second = maybe_resize_messages_for_provider(
+            messages, provider="anthropic", vision_enabled=True
+        )
+        # A different limit is a different cache entry.
+        smaller = image_resize._resize_base64_data_url(original_url, max_dimension=1000)
+
+    # Once for the 21 copies of the image across both calls, once for the
+    # smaller limit.
+    assert resize.call_count == 2
+    assert _data_url_dimensions(smaller) == (1000, 500)
+    assert first[0].content == second[0].content
+    first_content = first[0].content[0]
+    assert isinstance(first_content, ImageContent)
+    assert _data_url_dimensions(first_content.image_urls[0]) == (2000, 1000)
+
+
+def test_messages_without_resized_images_are_not_copied():
+    small_url = _make_png_data_url(100, 100)
+    text_message = Message(role="user", content=[TextContent(text="hi")])
+    image_message = Message(
+        role="user", content=[ImageContent(image_urls=[small_url] * 21)]
+    )
+    messages = [text_message, image_message]
+
+    for _ in range(2):
+        resized = maybe_resize_messages_for_provider(
+            messages, provider="anthropic", vision_enabled=True
+        )
+        assert resized is messages
+
+
+def test_image_cache_budget_counts_keys_and_values():
+    cache = _DataUrlCache(max_bytes=20)
+    cache.put("key-1", "x" * 5)
+    cache.put("key-2", "y" * 5)
+    assert cache.get("key-1") == "x" * 5
+
+    cache.put("key-3", "z" * 5)
+    # key-2 is the least recently used entry and goes first.
+    assert cache.get("key-2") is None
+    assert cache.get("key-1") == "x" * 5
+    assert cache.get("key-3") == "z" * 5
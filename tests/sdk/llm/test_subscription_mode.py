@@ -408,6 +408,19 @@ def test_format_messages_reasoning_item_handling(
     assert ("rs_should_be_stripped" in serialized) == reasoning_id_present
 
 
+def test_subscription_strip_does_not_modify_messages():
+    llm = LLM(model="openai/gpt-5.2-codex")
+    llm.is_subscription = True
+    messages = list(_make_conversation_messages())
+
+    prepared = llm._prepare_responses_messages(messages)
+
+    assert prepared[2].responses_reasoning_item is None
+    assert messages[2].responses_reasoning_item is not None
+    # Messages without a reasoning item are shared, not copied.
+    assert [p is m for p, m in zip(prepared, messages)] == [True, True, False, True]
+
+
 def test_is_subscription_survives_serialization_round_trip():
     """is_subscription must survive model_dump -> model_validate.
 
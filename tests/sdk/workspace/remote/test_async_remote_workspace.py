@@ -102,6 +102,45 @@ async def test_async_execute_method():
     mock_client.request.assert_called_once_with(method="GET", url="http://test.com")
 
 
+@pytest.mark.asyncio
+async def test_async_execute_method_sends_request_lists_concurrently():
+    """Test _execute sends a yielded list of requests in parallel, returning each
+    response or the exception its request raised."""
+    workspace = AsyncRemoteWorkspace(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+
+    in_flight = 0
+    max_in_flight = 0
+    error = httpx.ReadError("connection lost")
+
+    async def request(method, url):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if url == "http://test.com/fail":
+            raise error
+        return url
+
+    mock_client = AsyncMock()
+    mock_client.request.side_effect = request
+    workspace._client = mock_client
+
+    def test_generator():
+        responses = yield [
+            {"method": "GET", "url": "http://test.com/ok"},
+            {"method": "GET", "url": "http://test.com/fail"},
+        ]
+        return responses
+
+    result = await workspace._execute(test_generator())
+
+    assert result == ["http://test.com/ok", error]
+    assert max_in_flight == 2
+
+
 @pytest.mark.asyncio
 @patch(
     "openhands.sdk.workspace.remote.async_remote_workspace.AsyncRemoteWorkspace._execute"
@@ -33,7 +33,7 @@ def test_multiple_commands_use_different_command_ids():
     start_response_1.raise_for_status = Mock()
     start_response_1.json.return_value = {"id": "cmd-001"}
 
-    generator_1 = mixin._execute_command_generator("ls -l /workspace", None, 30.0)
+    generator_1 = mixin._poll_command_generator("ls -l /workspace", None, 30.0)
 
     # Start first command
     start_kwargs_1 = next(generator_1)
@@ -54,7 +54,7 @@ def test_multiple_commands_use_different_command_ids():
     start_response_2.raise_for_status = Mock()
     start_response_2.json.return_value = {"id": "cmd-002"}
 
-    generator_2 = mixin._execute_command_generator("ls -l ./", None, 30.0)
+    generator_2 = mixin._poll_command_generator("ls -l ./", None, 30.0)
 
     # Start second command
     start_kwargs_2 = next(generator_2)
@@ -93,7 +93,7 @@ def test_command_id_filter_params_structure():
     start_response.raise_for_status = Mock()
     start_response.json.return_value = {"id": "cmd-123"}
 
-    generator = mixin._execute_command_generator("echo test", None, 30.0)
+    generator = mixin._poll_command_generator("echo test", None, 30.0)
 
     # Start command
     start_kwargs = next(generator)
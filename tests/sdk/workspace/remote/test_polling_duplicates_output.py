@@ -105,7 +105,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator("test_command", None, 30.0)
+        generator = mixin._poll_command_generator("test_command", None, 30.0)
 
         next(generator)
         generator.send(start_response)
@@ -205,7 +205,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator(
+        generator = mixin._poll_command_generator(
             "tar -czf - workspace | base64", None, 30.0
         )
 
@@ -312,7 +312,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator(
+        generator = mixin._poll_command_generator(
             "tar -czf - workspace | base64", None, 30.0
         )
 
@@ -398,7 +398,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator("test_command", None, 30.0)
+        generator = mixin._poll_command_generator("test_command", None, 30.0)
 
         next(generator)
         generator.send(start_response)
@@ -465,7 +465,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator("fast_command", None, 30.0)
+        generator = mixin._poll_command_generator("fast_command", None, 30.0)
 
         next(generator)
         generator.send(start_response)
@@ -547,7 +547,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator("echo test", None, 30.0)
+        generator = mixin._poll_command_generator("echo test", None, 30.0)
 
         next(generator)
         generator.send(start_response)
@@ -605,7 +605,7 @@ class TestPollingDeduplication:
             ]
         }
 
-        generator = mixin._execute_command_generator("ls -la", None, 30.0)
+        generator = mixin._poll_command_generator("ls -la", None, 30.0)
 
         next(generator)
         generator.send(start_response)
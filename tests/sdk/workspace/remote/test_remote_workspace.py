@@ -1,5 +1,6 @@
 """Unit tests for RemoteWorkspace class."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -106,6 +107,35 @@ def test_execute_method():
     mock_client.request.assert_called_once_with(method="GET", url="http://test.com")
 
 
+def test_execute_method_sends_request_lists_concurrently():
+    """Test _execute sends a yielded list of requests in parallel, returning each
+    response or the exception its request raised."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+
+    barrier = threading.Barrier(2, timeout=5)
+    error = httpx.ReadError("connection lost")
+
+    def request(method, url):
+        # Both requests must be in flight at once to pass the barrier.
+        barrier.wait()
+        if url == "http://test.com/fail":
+            raise error
+        return url
+
+    mock_client = MagicMock()
+    mock_client.request.side_effect = request
+    workspace._client = mock_client
+
+    def test_generator():
+        responses = yield [
+            {"method": "GET", "url": "http://test.com/ok"},
+            {"method": "GET", "url": "http://test.com/fail"},
+        ]
+        return responses
+
+    assert workspace._execute(test_generator()) == ["http://test.com/ok", error]
+
+
 @patch("openhands.sdk.workspace.remote.base.RemoteWorkspace._execute")
 def test_execute_command(mock_execute):
     """Test execute_command method calls _execute with correct generator."""
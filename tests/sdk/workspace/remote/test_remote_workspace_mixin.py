@@ -1,6 +1,11 @@
 """Unit tests for RemoteWorkspaceMixin class."""
 
+import hashlib
+import io
+import json
 import logging
+import os
+import tarfile
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -9,6 +14,12 @@ import pytest
 
 from openhands.sdk.workspace.models import CommandResult, FileOperationResult
 from openhands.sdk.workspace.remote.remote_workspace_mixin import RemoteWorkspaceMixin
+from openhands.sdk.workspace.sync import (
+    SYNC_BLOCK_SIZE,
+    SyncFile,
+    file_block_hashes,
+    write_sync_archive,
+)
 
 
 class RemoteWorkspaceMixinHelper(RemoteWorkspaceMixin):
@@ -69,7 +80,7 @@ def test_headers_property_without_api_key():
 
 
 def test_execute_command_generator_basic_flow():
-    """Test _execute_command_generator basic successful flow."""
+    """Test _poll_command_generator basic successful flow."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", api_key="test-key", working_dir="workspace"
     )
@@ -87,7 +98,7 @@ def test_execute_command_generator_basic_flow():
         ]
     }
 
-    generator = mixin._execute_command_generator("echo hello", "/tmp", 30.0)
+    generator = mixin._poll_command_generator("echo hello", "/tmp", 30.0)
 
     # First yield - start command
     start_kwargs = next(generator)
@@ -117,6 +128,101 @@ def test_execute_command_generator_basic_flow():
         assert result.timeout_occurred is False
 
 
+def _ndjson_response(*events: dict) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.raise_for_status = Mock()
+    response.text = "".join(json.dumps(event) + "\n" for event in events)
+    return response
+
+
+def test_execute_command_generator_streams_output():
+    """The command runs in one streaming request, without polling."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", api_key="test-key", working_dir="workspace"
+    )
+
+    generator = mixin._execute_command_generator("echo hello", "/tmp", 30.0)
+
+    stream_kwargs = next(generator)
+    assert stream_kwargs["method"] == "POST"
+    assert stream_kwargs["url"] == "http://localhost:8000/api/bash/stream_bash_command"
+    assert stream_kwargs["json"] == {
+        "command": "echo hello",
+        "cwd": "/tmp",
+        "timeout": 30,
+    }
+    assert stream_kwargs["headers"] == {"X-Session-API-Key": "test-key"}
+
+    response = _ndjson_response(
+        {"kind": "BashCommand", "id": "cmd-1", "command": "echo hello"},
+        {"kind": "BashOutput", "command_id": "cmd-1", "order": 0, "stdout": "hel"},
+        {
+            "kind": "BashOutput",
+            "command_id": "cmd-1",
+            "order": 1,
+            "stdout": "lo\n",
+            "stderr": "warn\n",
+            "exit_code": 0,
+        },
+    )
+    with pytest.raises(StopIteration) as stop:
+        generator.send(response)
+    result = stop.value.value
+    assert result.exit_code == 0
+    assert result.stdout == "hello\n"
+    assert result.stderr == "warn\n"
+    assert result.timeout_occurred is False
+
+
+def test_execute_command_generator_falls_back_to_polling():
+    """Servers without the streaming endpoint are polled, from then on directly."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+
+    generator = mixin._execute_command_generator("echo hello", None, 30.0)
+    next(generator)
+    not_found = Mock()
+    not_found.status_code = 404
+    start_kwargs = generator.send(not_found)
+    assert start_kwargs["url"] == "http://localhost:8000/api/bash/start_bash_command"
+
+    generator = mixin._execute_command_generator("echo again", None, 30.0)
+    start_kwargs = next(generator)
+    assert start_kwargs["url"] == "http://localhost:8000/api/bash/start_bash_command"
+    assert start_kwargs["json"]["command"] == "echo again"
+
+
+def test_execute_command_generator_polls_after_truncated_stream():
+    """A stream that ends before the exit code resumes by polling."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+
+    generator = mixin._execute_command_generator("long_command", None, 30.0)
+    next(generator)
+    poll_kwargs = generator.send(
+        _ndjson_response(
+            {"kind": "BashCommand", "id": "cmd-1", "command": "long_command"},
+            {"kind": "BashOutput", "command_id": "cmd-1", "order": 0, "stdout": "a"},
+        )
+    )
+    assert poll_kwargs["url"] == "http://localhost:8000/api/bash/bash_events/search"
+    assert poll_kwargs["params"]["command_id__eq"] == "cmd-1"
+    assert poll_kwargs["params"]["order__gt"] == 0
+
+    poll_response = Mock()
+    poll_response.raise_for_status = Mock()
+    poll_response.json.return_value = {
+        "items": [{"kind": "BashOutput", "order": 1, "stdout": "b", "exit_code": 0}]
+    }
+    with pytest.raises(StopIteration) as stop:
+        generator.send(poll_response)
+    assert stop.value.value.stdout == "ab"
+    assert stop.value.value.exit_code == 0
+
+
 def test_execute_command_generator_without_cwd():
     """Test _execute_command_generator works without cwd parameter."""
     mixin = RemoteWorkspaceMixinHelper(
@@ -146,7 +252,7 @@ def test_execute_command_generator_with_path_cwd():
 @patch("time.sleep")
 @patch("time.time")
 def test_execute_command_generator_polling_loop(mock_time, mock_sleep):
-    """Test _execute_command_generator polling loop behavior."""
+    """Test _poll_command_generator polling loop behavior."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
@@ -182,7 +288,7 @@ def test_execute_command_generator_polling_loop(mock_time, mock_sleep):
         ]
     }
 
-    generator = mixin._execute_command_generator("long_command", None, 30.0)
+    generator = mixin._poll_command_generator("long_command", None, 30.0)
 
     # Start command
     next(generator)
@@ -208,7 +314,7 @@ def test_execute_command_generator_polling_loop(mock_time, mock_sleep):
 
 @patch("openhands.sdk.workspace.remote.remote_workspace_mixin.time")
 def test_execute_command_generator_timeout(mock_time, caplog):
-    """Test _execute_command_generator handles timeout correctly."""
+    """Test _poll_command_generator handles timeout correctly."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
@@ -240,7 +346,7 @@ def test_execute_command_generator_timeout(mock_time, caplog):
         ]
     }
 
-    generator = mixin._execute_command_generator(
+    generator = mixin._poll_command_generator(
         f"curl -H 'Authorization: Bearer {secret}' example.test",
         None,
         30.0,
@@ -268,7 +374,7 @@ def test_execute_command_generator_timeout(mock_time, caplog):
 def test_execute_command_generator_exception_handling(
     caplog: pytest.LogCaptureFixture,
 ):
-    """Test _execute_command_generator handles exceptions correctly."""
+    """Test _poll_command_generator handles exceptions correctly."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
@@ -283,7 +389,7 @@ def test_execute_command_generator_exception_handling(
         response=Mock(),
     )
 
-    generator = mixin._execute_command_generator(
+    generator = mixin._poll_command_generator(
         f"curl -H 'Authorization: Bearer {secret}' example.test",
         None,
         30.0,
@@ -424,7 +530,10 @@ def test_file_download_generator_basic_flow(temp_dir):
     assert download_kwargs["method"] == "GET"
     assert download_kwargs["url"] == "/api/file/download"
     assert download_kwargs["params"] == {"path": "/remote/file.txt"}
-    assert download_kwargs["headers"] == {"X-Session-API-Key": "test-key"}
+    assert download_kwargs["headers"] == {
+        "X-Session-API-Key": "test-key",
+        "Range": f"bytes=0-{mixin.transfer_chunk_size - 1}",
+    }
 
     # Send response and get result
     try:
@@ -516,6 +625,343 @@ def test_file_download_generator_http_error():
         assert "File not found" in result.error
 
 
+def _response(
+    status_code: int,
+    content: bytes | None = None,
+    headers: dict | None = None,
+    **kwargs,
+) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers=headers,
+        request=httpx.Request("GET", "http://localhost:8000"),
+        **kwargs,
+    )
+
+
+def test_file_upload_generator_sends_large_files_as_ranges(tmp_path):
+    """Large uploads go out as byte ranges, and a failed range is sent again."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000",
+        working_dir="workspace",
+        transfer_chunk_size=4,
+        transfer_streams=2,
+    )
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"0123456789")
+
+    generator = mixin._file_upload_generator(source, "/remote/large.bin")
+
+    checksum_kwargs = next(generator)
+    assert checksum_kwargs["url"] == "http://localhost:8000/api/file/checksum"
+    assert checksum_kwargs["params"] == {"path": "/remote/large.bin"}
+
+    batch = generator.send(_response(404))
+    assert [(r["method"], r["url"]) for r in batch] == [
+        ("PUT", "http://localhost:8000/api/file/upload_range")
+    ] * 2
+    assert [r["params"] for r in batch] == [
+        {"path": "/remote/large.bin", "offset": 0, "size": 10},
+        {"path": "/remote/large.bin", "offset": 4, "size": 10},
+    ]
+    assert [r["content"] for r in batch] == [b"0123", b"4567"]
+
+    # The connection for the first range drops; it is sent again.
+    batch = generator.send([httpx.ReadError("connection lost"), _response(200)])
+    assert [(r["params"]["offset"], r["content"]) for r in batch] == [
+        (0, b"0123"),
+        (8, b"89"),
+    ]
+
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send([_response(200), _response(200)])
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.file_size == 10
+
+
+def test_file_upload_generator_gives_up_on_a_range_after_repeated_failures(
+    tmp_path,
+):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace", transfer_chunk_size=4
+    )
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"0123456789")
+
+    generator = mixin._file_upload_generator(source, "/remote/large.bin")
+    next(generator)
+    generator.send(_response(404))
+    generator.send([_response(503)])
+    generator.send([_response(503)])
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send([_response(503)])
+    result = exc_info.value.value
+    assert result.success is False
+    assert "503" in result.error
+
+
+def test_file_upload_generator_skips_identical_remote_file(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace", transfer_chunk_size=4
+    )
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"0123456789")
+
+    generator = mixin._file_upload_generator(source, "/remote/large.bin")
+    next(generator)
+    checksum = {"size": 10, "sha256": hashlib.sha256(b"0123456789").hexdigest()}
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(200, json=checksum))
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.file_size == 10
+
+
+def test_file_upload_generator_streams_file_without_range_endpoint(tmp_path):
+    """Servers without ranged uploads get the file in one streamed request."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000",
+        working_dir="workspace",
+        transfer_chunk_size=4,
+        transfer_streams=2,
+    )
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"0123456789")
+
+    generator = mixin._file_upload_generator(source, "/remote/large.bin")
+    next(generator)
+    generator.send(_response(404))
+    upload_kwargs = generator.send([_response(404), _response(404)])
+
+    assert upload_kwargs["method"] == "POST"
+    assert upload_kwargs["url"] == "http://localhost:8000/api/file/upload"
+    name, file = upload_kwargs["files"]["file"]
+    assert name == "large.bin"
+    assert file.read() == b"0123456789"
+
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(200, json={"success": True}))
+    assert exc_info.value.value.success is True
+
+
+def test_file_download_generator_fetches_large_files_as_ranges(tmp_path):
+    """Large downloads arrive as byte ranges, and a failed range is fetched again."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000",
+        working_dir="workspace",
+        transfer_chunk_size=4,
+        transfer_streams=2,
+    )
+    destination = tmp_path / "large.bin"
+
+    generator = mixin._file_download_generator("/remote/large.bin", destination)
+
+    first_kwargs = next(generator)
+    assert first_kwargs["headers"] == {"Range": "bytes=0-3"}
+
+    batch = generator.send(
+        _response(
+            206, b"0123", headers={"content-range": "bytes 0-3/10", "etag": '"v1"'}
+        )
+    )
+    assert [r["headers"] for r in batch] == [
+        {"If-Range": '"v1"', "Range": "bytes=4-7"},
+        {"If-Range": '"v1"', "Range": "bytes=8-9"},
+    ]
+
+    # The connection for the first range drops; it is fetched again.
+    batch = generator.send([httpx.ReadError("connection lost"), _response(206, b"89")])
+    assert [r["headers"]["Range"] for r in batch] == ["bytes=4-7"]
+
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send([_response(206, b"4567")])
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.file_size == 10
+    assert destination.read_bytes() == b"0123456789"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+def test_file_download_generator_fails_if_file_changes_between_ranges(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace", transfer_chunk_size=4
+    )
+    destination = tmp_path / "large.bin"
+    destination.write_bytes(b"old")
+
+    generator = mixin._file_download_generator("/remote/large.bin", destination)
+    next(generator)
+    generator.send(
+        _response(
+            206, b"0123", headers={"content-range": "bytes 0-3/10", "etag": '"v1"'}
+        )
+    )
+    # The ETag no longer matches, so the server answers with the whole file.
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send([_response(200, b"changed file")])
+    result = exc_info.value.value
+    assert result.success is False
+    assert "changed during the download" in result.error
+    assert destination.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+def test_file_download_generator_skips_identical_local_file(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace", transfer_chunk_size=4
+    )
+    destination = tmp_path / "large.bin"
+    destination.write_bytes(b"0123456789")
+
+    generator = mixin._file_download_generator("/remote/large.bin", destination)
+    checksum_kwargs = next(generator)
+    assert checksum_kwargs["url"] == "http://localhost:8000/api/file/checksum"
+
+    checksum = {"size": 10, "sha256": hashlib.sha256(b"0123456789").hexdigest()}
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(200, json=checksum))
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.file_size == 10
+
+
+def test_file_download_generator_empty_file(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    destination = tmp_path / "empty.txt"
+
+    generator = mixin._file_download_generator("/remote/empty.txt", destination)
+    next(generator)
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(416, headers={"content-range": "*/0"}))
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.file_size == 0
+    assert destination.read_bytes() == b""
+
+
+def test_sync_upload_generator_sends_only_changed_files(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="/workspace"
+    )
+    (tmp_path / "same.txt").write_text("same")
+    (tmp_path / "changed.txt").write_text("changed")
+    same = tmp_path.joinpath("same.txt").stat()
+
+    generator = mixin._sync_upload_generator(tmp_path, "project", delete=True)
+
+    manifest_kwargs = next(generator)
+    assert manifest_kwargs["url"] == "http://localhost:8000/api/file/sync/manifest"
+    assert manifest_kwargs["json"]["path"] == "/workspace/project"
+    entries = [
+        {"path": "changed.txt", "size": 3, "mtime_ns": 1, "mode": 0o644},
+        {"path": "gone.txt", "size": 3, "mtime_ns": 1, "mode": 0o644},
+        {
+            "path": "same.txt",
+            "size": same.st_size,
+            "mtime_ns": same.st_mtime_ns,
+            "mode": 0o644,
+        },
+    ]
+    upload_kwargs = generator.send(_response(200, json={"entries": entries}))
+    assert upload_kwargs["url"] == "http://localhost:8000/api/file/sync/upload"
+    assert upload_kwargs["params"] == {"path": "/workspace/project"}
+    archive = upload_kwargs["files"]["file"][1]
+    with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+        assert tar.getnames() == ["changed.txt", "gone.txt"]
+        assert tar.getmember("gone.txt").pax_headers["OPENHANDS.delete"] == "1"
+    archive.seek(0)
+
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(200, json={"files_written": 1, "files_deleted": 1}))
+    result = exc_info.value.value
+    assert result.success is True
+    assert result.files_transferred == 1
+    assert result.files_deleted == 1
+    assert result.bytes_transferred > 0
+
+
+def test_sync_upload_generator_asks_block_hashes_of_large_changed_files(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="/workspace"
+    )
+    content = bytearray(os.urandom(2 * SYNC_BLOCK_SIZE))
+    remote_blocks = file_block_hashes(
+        io.BytesIO(content), len(content), SYNC_BLOCK_SIZE
+    )
+    content[-1] ^= 0xFF
+    (tmp_path / "data.bin").write_bytes(content)
+    (tmp_path / "small.txt").write_text("small")
+
+    generator = mixin._sync_upload_generator(tmp_path, "/remote/project")
+
+    next(generator)
+    entries = [
+        {"path": "data.bin", "size": len(content), "mtime_ns": 1, "mode": 0o644},
+        {"path": "small.txt", "size": 3, "mtime_ns": 1, "mode": 0o644},
+    ]
+    blocks_kwargs = generator.send(_response(200, json={"entries": entries}))
+    assert blocks_kwargs["url"] == "http://localhost:8000/api/file/sync/blocks"
+    assert blocks_kwargs["json"] == {
+        "path": "/remote/project",
+        "paths": ["data.bin"],
+        "block_size": SYNC_BLOCK_SIZE,
+    }
+
+    upload_kwargs = generator.send(_response(200, json={"data.bin": remote_blocks}))
+    archive = upload_kwargs["files"]["file"][1]
+    with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+        assert tar.getnames() == ["data.bin", "small.txt"]
+        # Only the last block of data.bin differs.
+        assert tar.getmember("data.bin").size == SYNC_BLOCK_SIZE
+    archive.seek(0)
+
+
+def test_sync_download_generator_sends_local_block_hashes(tmp_path):
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="/workspace"
+    )
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    content = bytearray(os.urandom(2 * SYNC_BLOCK_SIZE))
+    (remote / "data.bin").write_bytes(content)
+    local = tmp_path / "local"
+    local.mkdir()
+    content[-1] ^= 0xFF
+    (local / "data.bin").write_bytes(content)
+    remote_stat = (remote / "data.bin").stat()
+
+    generator = mixin._sync_download_generator("/remote/project", local)
+
+    next(generator)
+    entry = {
+        "path": "data.bin",
+        "size": remote_stat.st_size,
+        "mtime_ns": remote_stat.st_mtime_ns + 1,
+        "mode": 0o644,
+    }
+    download_kwargs = generator.send(_response(200, json={"entries": [entry]}))
+    assert download_kwargs["url"] == "http://localhost:8000/api/file/sync/download"
+    files = download_kwargs["json"]["files"]
+    assert [f["path"] for f in files] == ["data.bin"]
+    assert len(files[0]["blocks"]) == 2
+
+    # The workspace streams the body into the given file, not into memory.
+    write_sync_archive(
+        download_kwargs["stream_to"], remote, [SyncFile.model_validate(files[0])]
+    )
+    with pytest.raises(StopIteration) as exc_info:
+        generator.send(_response(200))
+    result = exc_info.value.value
+    assert result.success is True, result.error
+    assert result.files_transferred == 1
+    assert result.bytes_transferred < len(content)
+    assert (local / "data.bin").read_bytes() == (remote / "data.bin").read_bytes()
+
+
 def test_multiple_bash_output_events():
     """Test handling multiple BashOutput events in polling."""
     mixin = RemoteWorkspaceMixinHelper(
@@ -548,7 +994,7 @@ def test_multiple_bash_output_events():
         ]
     }
 
-    generator = mixin._execute_command_generator("multi_output_command", None, 30.0)
+    generator = mixin._poll_command_generator("multi_output_command", None, 30.0)
 
     # Start command
     next(generator)
@@ -593,7 +1039,7 @@ def test_non_bash_output_events_ignored():
         ]
     }
 
-    generator = mixin._execute_command_generator("test_command", None, 30.0)
+    generator = mixin._poll_command_generator("test_command", None, 30.0)
 
     # Start command
     next(generator)
@@ -643,7 +1089,7 @@ def test_start_bash_command_endpoint_used():
 
     # Create generator for command similar to the one in issue #866
     command = "echo 'Hello from sandboxed environment!' && pwd"
-    generator = mixin._execute_command_generator(command, None, 30.0)
+    generator = mixin._poll_command_generator(command, None, 30.0)
 
     # Verify the correct endpoint is used for starting the command
     start_kwargs = next(generator)
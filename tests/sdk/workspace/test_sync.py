@@ -0,0 +1,169 @@
+"""Tests for incremental directory sync between workspaces."""
+
+import io
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from openhands.sdk.workspace import LocalWorkspace
+from openhands.sdk.workspace.sync import (
+    SYNC_BLOCK_SIZE,
+    apply_sync_archive,
+    block_hashes,
+    build_manifest,
+    plan_sync,
+    resolve_sync_path,
+    sync_directories,
+)
+
+
+def _tree(root: Path) -> dict[str, tuple[bytes, int, int]]:
+    return {
+        p.relative_to(root).as_posix(): (
+            p.read_bytes(),
+            p.stat().st_mtime_ns,
+            p.stat().st_mode & 0o777,
+        )
+        for p in root.rglob("*")
+        if p.is_file() and not p.is_symlink()
+    }
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "source"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "README.md").write_text("# Project\n")
+    (root / "src" / "pkg" / "data.bin").write_bytes(os.urandom(3 * SYNC_BLOCK_SIZE))
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    (root / "run.sh").chmod(0o755)
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / "node_modules" / "dep" / "index.js").write_text("x")
+    (root / "link").symlink_to(root / "README.md")
+    return root
+
+
+def test_build_manifest_skips_excluded_and_special_files(source):
+    entries = build_manifest(source, ["node_modules/"])
+
+    assert [e.path for e in entries] == ["README.md", "run.sh", "src/pkg/data.bin"]
+    assert entries[1].mode == 0o755
+    assert entries[2].size == 3 * SYNC_BLOCK_SIZE
+
+
+def test_block_hashes_skips_unreadable_and_rejects_escaping_paths(source):
+    hashes = block_hashes(source, ["src/pkg/data.bin", "missing.bin"])
+
+    assert list(hashes) == ["src/pkg/data.bin"]
+    assert len(hashes["src/pkg/data.bin"]) == 3
+    with pytest.raises(ValueError):
+        block_hashes(source, ["../outside.bin"])
+
+
+def test_plan_sync_uses_size_and_mtime_quick_check(source):
+    entries = build_manifest(source, ["node_modules/"])
+    by_path = {e.path: e.model_copy() for e in entries}
+    by_path["README.md"].mtime_ns += 1
+    by_path["src/pkg/data.bin"].size += 1
+    del by_path["run.sh"]
+    stale = entries[0].model_copy(update={"path": "stale.txt"})
+    destination = [*by_path.values(), stale]
+
+    plan = plan_sync(entries, destination, delete=True)
+
+    assert [e.path for e in plan.send] == ["README.md", "run.sh", "src/pkg/data.bin"]
+    # Only a file spanning a block on both sides is worth a block-level delta.
+    assert plan.delta_paths == ["src/pkg/data.bin"]
+    assert plan.delete == ["stale.txt"]
+    assert plan_sync(entries, destination).delete == []
+    assert plan_sync(entries, entries).send == []
+
+
+def test_sync_directories_copies_then_sends_only_changes(source, tmp_path):
+    destination = tmp_path / "destination"
+
+    stats, _ = sync_directories(source, destination, ["node_modules/"])
+
+    assert stats.files_written == 3
+    assert _tree(destination) == {
+        k: v for k, v in _tree(source).items() if not k.startswith("node_modules")
+    }
+    assert not (destination / "link").exists()
+
+    stats, size = sync_directories(source, destination, ["node_modules/"])
+    assert stats.files_written == 0 and size == 0
+
+    data = bytearray((source / "src" / "pkg" / "data.bin").read_bytes())
+    data[SYNC_BLOCK_SIZE + 7] ^= 0xFF
+    (source / "src" / "pkg" / "data.bin").write_bytes(data)
+    mtime_ns = (source / "src" / "pkg" / "data.bin").stat().st_mtime_ns + 10**9
+    os.utime(source / "src" / "pkg" / "data.bin", ns=(mtime_ns, mtime_ns))
+
+    stats, size = sync_directories(source, destination, ["node_modules/"])
+
+    assert stats.files_written == 1
+    # One changed block crosses over, not the whole file.
+    assert size < 2 * SYNC_BLOCK_SIZE
+    assert (destination / "src" / "pkg" / "data.bin").read_bytes() == data
+
+
+def test_sync_directories_handles_resized_files_and_deletes(source, tmp_path):
+    destination = tmp_path / "destination"
+    sync_directories(source, destination, [])
+    data = source / "src" / "pkg" / "data.bin"
+    data.write_bytes(data.read_bytes()[: SYNC_BLOCK_SIZE + 10] + b"tail")
+    (source / "README.md").unlink()
+    (destination / "local.txt").write_text("keep me")
+
+    stats, _ = sync_directories(source, destination, ["local.txt"], delete=True)
+
+    assert stats.files_written == 1
+    assert stats.files_deleted == 1
+    assert (destination / "src" / "pkg" / "data.bin").read_bytes() == data.read_bytes()
+    assert not (destination / "README.md").exists()
+    assert (destination / "local.txt").exists()
+    # Files are written beside their target and renamed, leaving nothing behind.
+    assert sorted(p.name for p in (destination / "src" / "pkg").iterdir()) == [
+        "data.bin"
+    ]
+
+
+def test_apply_sync_archive_rejects_paths_leaving_the_directory(tmp_path):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz", format=tarfile.PAX_FORMAT) as tar:
+        info = tarfile.TarInfo("../escaped.txt")
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"x"))
+    archive.seek(0)
+
+    with pytest.raises(ValueError):
+        apply_sync_archive(archive, tmp_path / "root")
+    assert not (tmp_path / "escaped.txt").exists()
+
+    (tmp_path / "root" / "out").symlink_to(tmp_path)
+    with pytest.raises(ValueError):
+        resolve_sync_path(tmp_path / "root", "out/escaped.txt")
+    with pytest.raises(ValueError):
+        resolve_sync_path(tmp_path / "root", "/etc/passwd")
+
+
+def test_local_workspace_sync(source, tmp_path):
+    workspace = LocalWorkspace(working_dir=str(tmp_path))
+    destination = tmp_path / "destination"
+
+    result = workspace.sync_upload(source, destination, excludes=["node_modules/"])
+    assert result.success, result.error
+    assert result.files_transferred == 3
+    assert result.bytes_transferred > 0
+
+    (destination / "README.md").write_text("# Changed remotely\n")
+    result = workspace.sync_download(destination, source)
+    assert result.success, result.error
+    assert result.files_transferred == 1
+    assert (source / "README.md").read_text() == "# Changed remotely\n"
+
+    result = workspace.sync_upload(tmp_path / "missing", destination)
+    assert result.success is False
+    assert result.error is not None
@@ -0,0 +1,133 @@
+"""Tests for SubprocessTerminal's output buffer and output waits."""
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def terminal(tmp_path):
+    from openhands.tools.terminal.terminal.subprocess_terminal import (
+        SubprocessTerminal,
+    )
+
+    # Not initialized: output is fed straight into the buffer, as the PTY
+    # reader thread would.
+    return SubprocessTerminal(work_dir=str(tmp_path))
+
+
+def _feed(terminal, text: str) -> None:
+    with terminal._output_ready:
+        terminal._add_text_to_buffer(text)
+        terminal._output_ready.notify_all()
+
+
+def _feed_later(terminal, chunks: list[str], delay: float = 0.05) -> threading.Thread:
+    def _run():
+        for chunk in chunks:
+            time.sleep(delay)
+            _feed(terminal, chunk)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_buffer_tail_matches_joined_buffer(terminal):
+    _feed(terminal, "".join(f"line {i}\n" for i in range(500)) + "partial")
+    with terminal.output_lock:
+        joined = "".join(terminal.output_buffer)
+        for n in (0, 1, 7, 100, len(joined), len(joined) + 10):
+            assert terminal._buffer_tail(n) == (joined[-n:] if n else "")
+
+
+def test_output_buffer_keeps_last_lines():
+    from openhands.tools.terminal.terminal.subprocess_terminal import _OutputBuffer
+
+    buffer = _OutputBuffer(max_lines=3)
+    for chunk in ["a\nb", "b\nc\n", "", "d\ne", "e\nf\ng", "g"]:
+        buffer.append(chunk)
+    assert buffer.tail(4) == "f\ngg"
+    assert buffer.tail(100) == "ee\nf\ngg"
+    assert buffer.text() == "ee\nf\ngg"
+    assert len(buffer) == len("ee\nf\ngg")
+
+    buffer.append("\n" + "".join(f"line {i}\n" for i in range(1000)))
+    assert buffer.text() == "line 997\nline 998\nline 999\n"
+
+
+def test_pty_bytes_split_inside_a_character_decode_once(terminal):
+    euro = "€".encode()
+    terminal._ingest(b"price: " + euro[:2])
+    terminal._ingest(euro[2:] + b"\n")
+    with terminal.output_lock:
+        assert terminal._buffer_text() == "price: €\n"
+    assert terminal.output_version() == len("price: €\n")
+
+
+def test_drain_pty_batches_available_output(monkeypatch):
+    import os
+
+    from openhands.tools.terminal.terminal import subprocess_terminal
+
+    monkeypatch.setattr(subprocess_terminal, "_READ_SIZE", 1024)
+    read_fd, write_fd = os.pipe()
+    try:
+        os.set_blocking(read_fd, False)
+        os.write(write_fd, b"x" * 5000)
+        data, eof = subprocess_terminal.SubprocessTerminal._drain_pty(read_fd)
+        assert data == b"x" * 5000 and not eof
+
+        os.close(write_fd)
+        write_fd = None
+        assert subprocess_terminal.SubprocessTerminal._drain_pty(read_fd) == (
+            b"",
+            True,
+        )
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+
+def test_output_version_wait_wakes_on_new_output(terminal):
+    version = terminal.output_version()
+    assert not terminal.wait_for_output(version, timeout=0.05)
+
+    feeder = _feed_later(terminal, ["chunk\n"])
+    start = time.monotonic()
+    assert terminal.wait_for_output(version, timeout=5)
+    assert time.monotonic() - start < 2
+    assert terminal.output_version() == version + len("chunk\n")
+    feeder.join()
+
+
+def test_session_returns_short_commands_without_polling(tmp_path):
+    from openhands.tools.terminal.constants import POLL_INTERVAL
+    from openhands.tools.terminal.definition import TerminalAction
+    from openhands.tools.terminal.terminal import create_terminal_session
+
+    session = create_terminal_session(
+        work_dir=str(tmp_path), terminal_type="subprocess"
+    )
+    session.initialize()
+    try:
+        session.execute(TerminalAction(command="true"))  # warm up the shell
+        latencies = []
+        for i in range(5):
+            start = time.monotonic()
+            obs = session.execute(TerminalAction(command=f"echo quick-{i}"))
+            latencies.append(time.monotonic() - start)
+            assert f"quick-{i}" in obs.text
+            assert obs.metadata.exit_code == 0
+        assert min(latencies) < POLL_INTERVAL / 2
+
+        # Output arriving in bursts is still collected in full.
+        obs = session.execute(
+            TerminalAction(command="for i in 1 2 3; do echo burst-$i; sleep 0.2; done")
+        )
+        assert [f"burst-{i}" in obs.text for i in (1, 2, 3)] == [True] * 3
+        assert obs.metadata.exit_code == 0
+    finally:
+        session.close()
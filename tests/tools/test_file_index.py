@@ -0,0 +1,159 @@
+"""Tests for the shared workspace file index used by the grep and glob tools."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from openhands.tools.glob import GlobAction
+from openhands.tools.glob.impl import GlobExecutor
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+from openhands.tools.utils.file_index import (
+    WorkspaceFileIndex,
+    _required_literals,
+    compile_glob,
+    get_workspace_file_index,
+)
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def main():\n    return 1\n")
+    (tmp_path / "src" / "util.py").write_text("def helper():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Project\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config.py").write_text("def main(): pass\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.py").write_text("def main(): pass\n")
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    (tmp_path / "debug.log").write_text("def main\n")
+    return tmp_path.resolve()
+
+
+def _touch_later(path: Path, content: str) -> None:
+    """Rewrite a file with an mtime the index cannot mistake for the old one."""
+    path.write_text(content)
+    future = time.time() + 5
+    os.utime(path, (future, future))
+
+
+def test_files_skip_hidden_and_ignored_paths(workspace):
+    index = WorkspaceFileIndex(workspace)
+
+    assert sorted(index.files(workspace)) == [
+        ".gitignore",
+        "README.md",
+        "src/app.py",
+        "src/util.py",
+    ]
+    assert sorted(index.files(workspace / "src")) == ["app.py", "util.py"]
+    assert index.files(workspace / "build") is None
+    assert index.files(workspace.parent) is None
+
+
+def test_files_pick_up_changes(workspace):
+    index = WorkspaceFileIndex(workspace)
+    index.files(workspace)
+
+    (workspace / "src" / "new.py").write_text("x = 1\n")
+    (workspace / "src" / "util.py").unlink()
+    _touch_later(workspace / ".gitignore", "*.log\n")
+
+    assert sorted(index.files(workspace)) == [
+        ".gitignore",
+        "README.md",
+        "build/out.py",
+        "src/app.py",
+        "src/new.py",
+    ]
+
+
+def test_search_candidates_filter_by_content_and_follow_edits(workspace):
+    index = WorkspaceFileIndex(workspace)
+
+    assert index.search_candidates(workspace, "DEF MAIN") == ["src/app.py"]
+    # Patterns without usable literals keep every file as a candidate.
+    assert len(index.search_candidates(workspace, "m|h")) == 4
+
+    _touch_later(workspace / "src" / "util.py", "def main_helper(): pass\n")
+    assert sorted(index.search_candidates(workspace, "def main")) == [
+        "src/app.py",
+        "src/util.py",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("def main", ["def main"]),
+        (r"foo\.bar", ["foo.bar"]),
+        ("ab?cdef", ["cdef"]),
+        ("(abc)?defg", ["defg"]),
+        ("foo|barbaz", []),
+        ("(?i)foobar", []),
+        (r"\w+hello", ["hello"]),
+    ],
+)
+def test_required_literals(pattern, expected):
+    assert _required_literals(pattern) == expected
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "matches"),
+    [
+        ("**/*.py", "app.py", True),
+        ("**/*.py", "src/deep/app.py", True),
+        ("src/*.py", "src/deep/app.py", False),
+        ("src/**/test_*.{ts,tsx}", "src/a/test_x.tsx", True),
+        ("*.[!p]y", "app.py", False),
+    ],
+)
+def test_compile_glob(pattern, path, matches):
+    assert bool(compile_glob(pattern).fullmatch(path)) is matches
+
+
+def test_indexes_are_shared_per_workspace(workspace):
+    assert get_workspace_file_index(workspace) is get_workspace_file_index(
+        str(workspace / "src" / "..")
+    )
+
+
+def test_grep_executor_with_file_index(workspace):
+    executor = GrepExecutor(working_dir=str(workspace), use_file_index=True)
+
+    observation = executor(GrepAction(pattern="def main"))
+    assert not observation.is_error
+    assert observation.matches == [str(workspace / "src" / "app.py")]
+
+    observation = executor(GrepAction(pattern="def", include="util.py"))
+    assert observation.matches == [str(workspace / "src" / "util.py")]
+
+    # Searches outside the index fall back to the regular backends.
+    executor._search_backend = "python"
+    observation = executor(
+        GrepAction(pattern="def main", path=str(workspace / "build"))
+    )
+    assert observation.matches == [str(workspace / "build" / "out.py")]
+
+
+def test_glob_executor_with_file_index(workspace):
+    executor = GlobExecutor(working_dir=str(workspace), use_file_index=True)
+
+    expected = {
+        "*.py": ["src/app.py", "src/util.py"],
+        "**/*.py": ["src/app.py", "src/util.py"],
+        "src/*.py": ["src/app.py", "src/util.py"],
+        "*.{md,log}": ["README.md"],
+        "build/*.py": [],
+    }
+    for pattern, paths in expected.items():
+        observation = executor(GlobAction(pattern=pattern))
+        assert not observation.is_error
+        assert sorted(observation.files) == [str(workspace / p) for p in paths]
+
+    executor._ripgrep_available = False
+    observation = executor(GlobAction(pattern="*.py", path=str(workspace / "build")))
+    assert observation.files == [str(workspace / "build" / "out.py")]